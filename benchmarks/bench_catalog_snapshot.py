@@ -0,0 +1,99 @@
+"""
+bench_catalog_snapshot.py
+Микро-бенчмарк чтения сетки товаров: старый extract_product_data (2N+1 вызова)
+против snapshot_catalog (один evaluate_all). Каталог нужного размера отдает
+локальный стенд swaglabs.standin.
+
+Запуск:
+    python -m benchmarks.bench_catalog_snapshot --sizes 6 100 1000 5000 --rounds 5
+"""
+
+import argparse
+import statistics
+import time
+from contextlib import contextmanager
+from typing import Dict, Iterator, List, Tuple
+
+from playwright.sync_api import Locator, Page, sync_playwright
+
+from swaglabs import settings
+from swaglabs.catalog import parse_price, snapshot_catalog
+from swaglabs.standin import StandIn
+
+
+def legacy_extract(page: Page) -> List[Tuple[str, float]]:
+    """Старая реализация TestProductSorting.extract_product_data"""
+    products = []
+    for product in page.locator(".inventory_item").all():
+        name = product.locator(".inventory_item_name").text_content().strip()
+        price_text = product.locator(".inventory_item_price").text_content().strip()
+        products.append((name, parse_price(price_text)))
+    return products
+
+
+@contextmanager
+def count_round_trips() -> Iterator[Dict[str, int]]:
+    """Считает вызовы Locator, каждый из которых — отдельный запрос к браузеру"""
+    counter = {"calls": 0}
+    originals = {name: getattr(Locator, name) for name in ("all", "text_content", "evaluate_all")}
+
+    def wrap(original):
+        def wrapper(self, *args, **kwargs):
+            counter["calls"] += 1
+            return original(self, *args, **kwargs)
+        return wrapper
+
+    for name, original in originals.items():
+        setattr(Locator, name, wrap(original))
+    try:
+        yield counter
+    finally:
+        for name, original in originals.items():
+            setattr(Locator, name, original)
+
+
+def measure(page: Page, extract, rounds: int) -> Tuple[int, float]:
+    """Возвращает (число round trip за один вызов, медиана латентности в мс)"""
+    with count_round_trips() as counter:
+        extract(page)
+    timings = []
+    for _ in range(rounds):
+        started = time.perf_counter()
+        extract(page)
+        timings.append((time.perf_counter() - started) * 1000)
+    return counter["calls"], statistics.median(timings)
+
+
+def main() -> None:
+    parser = argparse.ArgumentParser(description=__doc__, formatter_class=argparse.RawDescriptionHelpFormatter)
+    parser.add_argument("--sizes", type=int, nargs="+", default=[6, 100, 1000, 5000])
+    parser.add_argument("--rounds", type=int, default=5)
+    parser.add_argument("--legacy-limit", type=int, default=2000,
+                        help="не гонять старую реализацию на каталогах больше этого размера")
+    args = parser.parse_args()
+
+    print(f"{'товаров':>8} | {'старый: вызовы':>14} | {'старый, мс':>10} | {'снимок: вызовы':>14} | {'снимок, мс':>10} | {'ускорение':>9}")
+    print("-" * 80)
+    with sync_playwright() as p:
+        browser = p.chromium.launch()
+        for size in args.sizes:
+            with StandIn(catalog_size=size) as stand_in:
+                context = browser.new_context()
+                context.add_cookies([{"name": "session-username", "value": settings.VALID_USERNAME, "url": stand_in.url}])
+                page = context.new_page()
+                page.goto(stand_in.url + "inventory.html")
+                page.locator(".inventory_item").first.wait_for()
+
+                snap_calls, snap_ms = measure(page, snapshot_catalog, args.rounds)
+                if size <= args.legacy_limit:
+                    legacy_calls, legacy_ms = measure(page, legacy_extract, args.rounds)
+                    assert [(product.name, product.price) for product in snapshot_catalog(page)] == legacy_extract(page)
+                    print(f"{size:>8} | {legacy_calls:>14} | {legacy_ms:>10.1f} | {snap_calls:>14} | {snap_ms:>10.1f} | {legacy_ms / snap_ms:>8.1f}x")
+                else:
+                    print(f"{size:>8} | {'—':>14} | {'—':>10} | {snap_calls:>14} | {snap_ms:>10.1f} | {'—':>9}")
+                context.close()
+        browser.close()
+
+
+if __name__ == "__main__":
+    main()
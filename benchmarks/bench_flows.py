@@ -0,0 +1,242 @@
+"""
+bench_flows.py
+Бенчмарк основных сценариев на локальном стенде: вход и выход
+(TestAuthFlow), цикл корзины и оформление заказа (TestCartAndCheckout),
+смена сортировки с чтением сетки (TestProductSorting).
+
+Каждый раунд проходит все сценарии (в случайном порядке, чтобы порядок
+не давал систематической ошибки) iterations раз, каждый проход — в новом
+контексте. Первые warmup раундов не учитываются: прогрев JIT, кэшей
+и стенда. По сценариям и шагам печатаются медиана, IQR и p95 (мс),
+замеры сохраняются в JSON — это базовая линия для сравнения.
+
+Запуск:
+    python -m benchmarks.bench_flows run --warmup 1 --rounds 5 --iterations 3 --save benchmarks/baseline.json
+    python -m benchmarks.bench_flows run --save reports/bench/current.json --compare benchmarks/baseline.json
+    python -m benchmarks.bench_flows compare benchmarks/baseline.json reports/bench/current.json
+
+compare завершается с кодом 1, если есть статистически значимая
+регрессия (swaglabs.benchmark.compare): так проверку можно ставить
+в CI перед слиянием.
+"""
+
+import argparse
+import platform
+import random
+import re
+import sys
+import time
+from collections import defaultdict
+from importlib import metadata
+from pathlib import Path
+from typing import Callable, Dict, List, NamedTuple, Optional, Sequence, Tuple
+
+from playwright.sync_api import Browser, Page, expect, sync_playwright
+
+from swaglabs import settings
+from swaglabs.benchmark import (
+    ALPHA,
+    MIN_DELTA_MS,
+    THRESHOLD,
+    compare,
+    format_table,
+    load_baseline,
+    save_baseline,
+)
+from swaglabs.catalog import snapshot_catalog
+from swaglabs.flows import CART_CYCLE, CHECKOUT_FLOW, OPEN_INVENTORY, FlowStep, random_customer, run_step
+from swaglabs.readiness import select_sort, wait_for_login_page, wait_for_page
+from swaglabs.seeding import seeded_state
+from swaglabs.standin import StandIn
+
+INVENTORY_URL = re.compile(r".*inventory\.html")
+SORT_OPTIONS = ("za", "lohi", "hilo", "az")
+
+# Шаг сценария: (page, base_url, данные покупателя)
+StepAction = Callable[[Page, str, Dict[str, str]], None]
+
+
+class BenchFlow(NamedTuple):
+    name: str
+    steps: Tuple[Tuple[str, StepAction], ...]
+    seeded: bool = True     # сессия standard_user засеивается, без логина через UI
+
+
+def _flow_step(flow_step: FlowStep) -> Tuple[str, StepAction]:
+    return flow_step.name, lambda page, base_url, data: run_step(page, flow_step, data, base_url)
+
+
+def _open_login(page: Page, base_url: str, data: Dict[str, str]) -> None:
+    page.goto(base_url)
+    wait_for_login_page(page, base_url)
+
+
+def _login(page: Page, base_url: str, data: Dict[str, str]) -> None:
+    page.locator("#user-name").fill(settings.VALID_USERNAME)
+    page.locator("#password").fill(settings.VALID_PASSWORD)
+    page.locator("#login-button").click()
+    wait_for_page(page, INVENTORY_URL, "Products")
+
+
+def _open_menu(page: Page, base_url: str, data: Dict[str, str]) -> None:
+    page.locator("#react-burger-menu-btn").click()
+    expect(page.locator("#logout_sidebar_link")).to_be_visible()
+
+
+def _logout(page: Page, base_url: str, data: Dict[str, str]) -> None:
+    page.locator("#logout_sidebar_link").click()
+    wait_for_login_page(page, base_url)
+
+
+def _sort_and_extract(option: str) -> Tuple[str, StepAction]:
+    def action(page: Page, base_url: str, data: Dict[str, str]) -> None:
+        select_sort(page, option)
+        if not snapshot_catalog(page):
+            raise AssertionError(f"пустая сетка товаров после сортировки {option}")
+    return f"Сортировка {option} и чтение сетки", action
+
+
+FLOWS: Dict[str, BenchFlow] = {flow.name: flow for flow in (
+    BenchFlow("auth", (
+        ("Открыли страницу входа", _open_login),
+        ("Вошли", _login),
+        ("Открыли меню", _open_menu),
+        ("Вышли", _logout),
+    ), seeded=False),
+    BenchFlow("cart", tuple(_flow_step(flow_step) for flow_step in (OPEN_INVENTORY,) + CART_CYCLE)),
+    BenchFlow("checkout", tuple(_flow_step(flow_step) for flow_step in (OPEN_INVENTORY,) + CHECKOUT_FLOW)),
+    BenchFlow("sorting", (_flow_step(OPEN_INVENTORY),) + tuple(_sort_and_extract(option) for option in SORT_OPTIONS)),
+)}
+
+
+def run_once(browser: Browser, flow: BenchFlow, base_url: str) -> Dict[str, float]:
+    """Один проход сценария в новом контексте: шаг → мс (и сценарий целиком)"""
+    storage_state = seeded_state(base_url, settings.VALID_USERNAME) if flow.seeded else None
+    context = browser.new_context(**settings.CONTEXT_ARGS, storage_state=storage_state)
+    try:
+        page = context.new_page()
+        data = random_customer()
+        timings: Dict[str, float] = {}
+        for name, action in flow.steps:
+            started = time.perf_counter()
+            action(page, base_url, data)
+            timings[f"{flow.name} / {name}"] = (time.perf_counter() - started) * 1000
+        timings[flow.name] = sum(timings.values())
+        return timings
+    finally:
+        context.close()
+
+
+def run_benchmark(browser: Browser, flows: Sequence[BenchFlow], base_url: str, warmup: int, rounds: int,
+                  iterations: int, seed: int = 0) -> Dict[str, List[float]]:
+    series: Dict[str, List[float]] = defaultdict(list)
+    shuffle = random.Random(seed)
+    for round_index in range(warmup + rounds):
+        measured = round_index >= warmup
+        order = list(flows)
+        shuffle.shuffle(order)
+        for flow in order:
+            for _ in range(iterations):
+                timings = run_once(browser, flow, base_url)
+                if measured:
+                    for key, value in timings.items():
+                        series[key].append(value)
+        label = "прогрев" if not measured else f"раунд {round_index - warmup + 1}/{rounds}"
+        print(f"  {label}: готово", file=sys.stderr)
+    # Сценарий, затем его шаги — в порядке FLOWS
+    ordered = {}
+    for flow in flows:
+        ordered[flow.name] = series[flow.name]
+        for name, _ in flow.steps:
+            ordered[f"{flow.name} / {name}"] = series[f"{flow.name} / {name}"]
+    return ordered
+
+
+def print_comparison(baseline: Dict[str, List[float]], current: Dict[str, List[float]], args) -> int:
+    rows = compare(baseline, current, alpha=args.alpha, threshold=args.threshold, min_delta_ms=args.min_delta_ms)
+    print(f"\nСравнение с базовой линией (alpha={args.alpha}, порог {args.threshold:.0%} и {args.min_delta_ms} мс):")
+    for row in rows:
+        print(row.describe())
+    regressions = [row for row in rows if row.regressed]
+    missing = sorted(set(baseline) - set(current))
+    if missing:
+        print(f"нет в текущем прогоне: {', '.join(missing)}")
+    if regressions:
+        print(f"❌ Регрессии: {len(regressions)}")
+        return 1
+    print("✅ Значимых регрессий нет")
+    return 0
+
+
+def command_run(args) -> int:
+    flows = [FLOWS[name] for name in args.flows]
+    stand_in = StandIn(catalog_size=args.catalog_size).start()
+    try:
+        with sync_playwright() as p:
+            browser = getattr(p, args.browser).launch()
+            try:
+                series = run_benchmark(browser, flows, stand_in.url, args.warmup, args.rounds,
+                                       args.iterations, args.seed)
+            finally:
+                browser.close()
+    finally:
+        stand_in.stop()
+
+    print("\n".join(format_table(series)))
+    if args.save:
+        meta = {
+            "run_id": settings.run_id(),
+            "created": time.strftime("%Y-%m-%dT%H:%M:%S"),
+            "browser": args.browser,
+            "playwright": metadata.version("playwright"),
+            "python": platform.python_version(),
+            "warmup": args.warmup,
+            "rounds": args.rounds,
+            "iterations": args.iterations,
+            "catalog_size": args.catalog_size,
+        }
+        print(f"Замеры: {save_baseline(Path(args.save), series, meta)}")
+    if args.compare:
+        return print_comparison(load_baseline(Path(args.compare)), series, args)
+    return 0
+
+
+def command_compare(args) -> int:
+    return print_comparison(load_baseline(Path(args.baseline)), load_baseline(Path(args.current)), args)
+
+
+def _add_compare_options(parser: argparse.ArgumentParser) -> None:
+    parser.add_argument("--alpha", type=float, default=ALPHA, help="уровень значимости критерия Манна — Уитни")
+    parser.add_argument("--threshold", type=float, default=THRESHOLD, help="минимальный рост медианы, доля")
+    parser.add_argument("--min-delta-ms", type=float, default=MIN_DELTA_MS, help="минимальный рост медианы, мс")
+
+
+def main(argv: Optional[Sequence[str]] = None) -> int:
+    parser = argparse.ArgumentParser(description=__doc__, formatter_class=argparse.RawDescriptionHelpFormatter)
+    commands = parser.add_subparsers(dest="command", required=True)
+
+    run = commands.add_parser("run", help="прогнать сценарии и напечатать статистику")
+    run.add_argument("--flows", nargs="+", choices=sorted(FLOWS), default=list(FLOWS))
+    run.add_argument("--browser", choices=("chromium", "firefox", "webkit"), default="chromium")
+    run.add_argument("--warmup", type=int, default=1, help="раундов прогрева (не учитываются)")
+    run.add_argument("--rounds", type=int, default=5)
+    run.add_argument("--iterations", type=int, default=3, help="проходов каждого сценария за раунд")
+    run.add_argument("--catalog-size", type=int, default=6, help="товаров на стенде")
+    run.add_argument("--seed", type=int, default=0, help="seed порядка сценариев в раундах")
+    run.add_argument("--save", help="сохранить замеры в JSON (базовая линия)")
+    run.add_argument("--compare", help="сравнить с базовой линией из JSON")
+    _add_compare_options(run)
+    run.set_defaults(handler=command_run)
+
+    diff = commands.add_parser("compare", help="сравнить два сохраненных прогона")
+    diff.add_argument("baseline")
+    diff.add_argument("current")
+    _add_compare_options(diff)
+    diff.set_defaults(handler=command_compare)
+
+    args = parser.parse_args(argv)
+    return args.handler(args)
+
+
+if __name__ == "__main__":
+    sys.exit(main())
@@ -0,0 +1,117 @@
+"""
+bench_readiness.py
+Сравнение времени ожиданий: wait_for_load_state("networkidle") против
+событийных ожиданий из swaglabs.readiness на тех же шагах, что в тестах
+(логин, смена сортировки, перезагрузка, выход).
+
+Запуск:
+    python -m benchmarks.bench_readiness --rounds 3
+    python -m benchmarks.bench_readiness --offline   # против локального стенда
+"""
+
+import argparse
+import re
+import statistics
+import time
+from typing import Callable, Dict, List
+
+from playwright.sync_api import Page, sync_playwright
+
+from swaglabs import settings
+from swaglabs.standin import StandIn
+from swaglabs.readiness import (
+    select_sort,
+    wait_for_login_page,
+    wait_for_page,
+)
+
+INVENTORY_URL = re.compile(r".*inventory\.html")
+SORT_OPTIONS = ["za", "lohi", "hilo", "az"]
+
+
+def run_flow(page: Page, base_url: str, waits: Dict[str, Callable]) -> Dict[str, float]:
+    """Проходит сценарий и возвращает время каждого ожидания в мс"""
+    timings: Dict[str, float] = {}
+
+    def timed(name: str, wait: Callable) -> None:
+        started = time.perf_counter()
+        wait()
+        timings[name] = (time.perf_counter() - started) * 1000
+
+    page.goto(base_url)
+    page.locator("#user-name").fill(settings.VALID_USERNAME)
+    page.locator("#password").fill(settings.VALID_PASSWORD)
+    page.locator("#login-button").click()
+    timed("login", waits["login"])
+
+    # Смена сортировки меряется вместе с select_option: событийному ожиданию
+    # нужен MutationObserver, поставленный до действия
+    for option in SORT_OPTIONS:
+        timed(f"sort:{option}", lambda: waits["sort"](option))
+
+    page.reload()
+    timed("reload", waits["reload"])
+
+    page.locator("#react-burger-menu-btn").click()
+    page.locator("#logout_sidebar_link").click()
+    timed("logout", waits["logout"])
+    return timings
+
+
+def main() -> None:
+    parser = argparse.ArgumentParser(description=__doc__, formatter_class=argparse.RawDescriptionHelpFormatter)
+    parser.add_argument("--base-url", default=settings.BASE_URL)
+    parser.add_argument("--rounds", type=int, default=3)
+    parser.add_argument("--offline", action="store_true", help="поднять локальный стенд и мерить на нем")
+    args = parser.parse_args()
+
+    stand_in = None
+    if args.offline:
+        stand_in = StandIn().start()
+        args.base_url = stand_in.url
+
+    with sync_playwright() as p:
+        browser = p.chromium.launch()
+        results: Dict[str, List[Dict[str, float]]] = {"networkidle": [], "readiness": []}
+
+        for _ in range(args.rounds):
+            for mode in results:
+                context = browser.new_context()
+                page = context.new_page()
+                if mode == "networkidle":
+                    idle = lambda *_: page.wait_for_load_state("networkidle")
+
+                    def sort_idle(option, page=page):
+                        page.locator(".product_sort_container").select_option(option)
+                        page.wait_for_load_state("networkidle")
+
+                    waits = {"login": idle, "sort": sort_idle, "reload": idle, "logout": idle}
+                else:
+                    waits = {
+                        "login": lambda: wait_for_page(page, INVENTORY_URL, "Products"),
+                        "sort": lambda option: select_sort(page, option),
+                        "reload": lambda: wait_for_page(page, INVENTORY_URL, "Products"),
+                        "logout": lambda: wait_for_login_page(page, args.base_url),
+                    }
+                results[mode].append(run_flow(page, args.base_url, waits))
+                context.close()
+        browser.close()
+    if stand_in is not None:
+        stand_in.stop()
+
+    steps = list(results["networkidle"][0])
+    print(f"{'ожидание':<12} | {'networkidle, мс':>15} | {'readiness, мс':>13} | {'экономия, мс':>12}")
+    print("-" * 62)
+    total_idle = total_ready = 0.0
+    for step in steps:
+        idle_ms = statistics.median(run[step] for run in results["networkidle"])
+        ready_ms = statistics.median(run[step] for run in results["readiness"])
+        total_idle += idle_ms
+        total_ready += ready_ms
+        print(f"{step:<12} | {idle_ms:>15.1f} | {ready_ms:>13.1f} | {idle_ms - ready_ms:>12.1f}")
+    print("-" * 62)
+    print(f"{'итого':<12} | {total_idle:>15.1f} | {total_ready:>13.1f} | {total_idle - total_ready:>12.1f}")
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,5 @@
+"""
+swaglabs
+Вспомогательный код для автотестов Swag Labs: авторизация, работа со страницами,
+инфраструктура запуска. Сами тесты лежат в каталоге tests/.
+"""
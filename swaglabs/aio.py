@@ -0,0 +1,173 @@
+"""
+aio.py
+Асинхронные тесты (async def test_...): один цикл событий и один браузер
+на процесс (воркер xdist), у каждого теста свой контекст.
+
+    class TestCartAsync:
+        async def test_badge(self, async_page):
+            await async_page.goto(...)
+
+Асинхронным тестам доступны только фикстуры из ASYNC_FIXTURES:
+    async_browser  — браузер процесса, общий для всех тестов
+    async_context  — новый контекст теста (settings.CONTEXT_ARGS + storage_state)
+    async_page     — страница в этом контексте
+
+Запуск, одновременность и отчеты — плагин swaglabs.plugins.aio.
+"""
+
+import asyncio
+import threading
+import time
+from concurrent.futures import Future
+from contextlib import AsyncExitStack
+from typing import Awaitable, Callable, Dict, List, NamedTuple, Optional, Sequence
+
+from playwright.async_api import Browser, BrowserContext, Playwright, async_playwright
+
+from swaglabs import settings
+from swaglabs.load import login_state
+
+ASYNC_FIXTURES = ("async_browser", "async_context", "async_page")
+
+
+class Phase(NamedTuple):
+    """Фаза теста (setup, call, teardown) с ошибкой, если она была"""
+    when: str
+    error: Optional[BaseException]
+    start: float     # time.time(): интервалы тестов из разных воркеров сравнимы
+    stop: float
+    duration: float
+
+
+class EventLoopThread:
+    """Цикл событий в отдельном потоке: основной поток pytest отдает в него корутины"""
+
+    def __init__(self):
+        self.loop = asyncio.new_event_loop()
+        self._thread = threading.Thread(target=self.loop.run_forever, name="swaglabs-aio", daemon=True)
+        self._thread.start()
+
+    def submit(self, coro: Awaitable) -> Future:
+        return asyncio.run_coroutine_threadsafe(coro, self.loop)
+
+    def close(self) -> None:
+        self.loop.call_soon_threadsafe(self.loop.stop)
+        self._thread.join()
+        self.loop.close()
+
+
+class AsyncBrowserSession:
+    """
+    async_playwright и браузер, запускаются при первом обращении.
+    Сессия standard_user (маркер authenticated) — один логин через UI на процесс.
+    """
+
+    def __init__(self, browser_name: str = "chromium", launch_args: Optional[Dict] = None,
+                 context_args: Optional[Dict] = None):
+        self.browser_name = browser_name
+        self.launch_args = dict(launch_args or {})
+        self.context_args = dict(context_args or {})
+        self._playwright: Optional[Playwright] = None
+        self._browser: Optional[Browser] = None
+        self._state: Optional[Dict] = None
+        self._lock: Optional[asyncio.Lock] = None
+
+    def _get_lock(self) -> asyncio.Lock:
+        # Lock создается уже внутри цикла событий
+        if self._lock is None:
+            self._lock = asyncio.Lock()
+        return self._lock
+
+    async def browser(self) -> Browser:
+        async with self._get_lock():
+            if self._browser is None:
+                self._playwright = await async_playwright().start()
+                self._browser = await self._playwright[self.browser_name].launch(**self.launch_args)
+        return self._browser
+
+    async def storage_state(self) -> Dict:
+        browser = await self.browser()
+        async with self._get_lock():
+            if self._state is None:
+                self._state = await login_state(
+                    browser, settings.BASE_URL, settings.VALID_USERNAME, settings.VALID_PASSWORD
+                )
+        return self._state
+
+    async def new_context(self, storage_state: Optional[Dict] = None) -> BrowserContext:
+        browser = await self.browser()
+        return await browser.new_context(**self.context_args, storage_state=storage_state)
+
+    async def close(self) -> None:
+        if self._browser is not None:
+            await self._browser.close()
+        if self._playwright is not None:
+            await self._playwright.stop()
+        self._browser = self._playwright = None
+
+
+async def _phase(when: str, action: Callable[[], Awaitable], phases: List[Phase]) -> bool:
+    start = time.time()
+    started = time.perf_counter()
+    error = None
+    try:
+        await action()
+    except (KeyboardInterrupt, SystemExit, asyncio.CancelledError):
+        raise
+    except BaseException as exc:  # pytest.skip/fail тоже BaseException
+        error = exc
+    phases.append(Phase(when, error, start, time.time(), time.perf_counter() - started))
+    return error is None
+
+
+async def run_test(session: AsyncBrowserSession, func: Callable[..., Awaitable], argnames: Sequence[str],
+                   params: Optional[Dict] = None, storage_state: Optional[Dict] = None,
+                   authenticated: bool = False) -> List[Phase]:
+    """
+    Выполняет async-тест: setup (фикстуры), call, teardown (закрытие контекста).
+    params — значения из parametrize. Ошибки не выбрасываются,
+    а возвращаются в фазах — отчеты строит плагин.
+    """
+    phases: List[Phase] = []
+    kwargs: Dict = dict(params or {})
+    resources = AsyncExitStack()
+
+    async def setup() -> None:
+        unknown = [name for name in argnames if name not in ASYNC_FIXTURES and name not in kwargs]
+        if unknown:
+            raise LookupError(
+                f"фикстуры недоступны async-тестам: {', '.join(unknown)} (есть: {', '.join(ASYNC_FIXTURES)})"
+            )
+        if "async_browser" in argnames:
+            kwargs["async_browser"] = await session.browser()
+        if "async_context" in argnames or "async_page" in argnames:
+            state = await session.storage_state() if authenticated else storage_state
+            context = await session.new_context(state)
+            resources.push_async_callback(context.close)
+            kwargs["async_context"] = context
+            if "async_page" in argnames:
+                kwargs["async_page"] = await context.new_page()
+
+    async def call() -> None:
+        await func(**{name: kwargs[name] for name in argnames})
+
+    if await _phase("setup", setup, phases):
+        await _phase("call", call, phases)
+    await _phase("teardown", resources.aclose, phases)
+    return phases
+
+
+def busy_time(spans: Sequence[Sequence[float]]) -> float:
+    """Длина объединения интервалов [start, stop]: сколько времени шел хотя бы один тест"""
+    total = 0.0
+    current_start = current_stop = None
+    for start, stop in sorted(spans):
+        if current_stop is None or start > current_stop:
+            if current_stop is not None:
+                total += current_stop - current_start
+            current_start, current_stop = start, stop
+        else:
+            current_stop = max(current_stop, stop)
+    if current_stop is not None:
+        total += current_stop - current_start
+    return total
@@ -0,0 +1,98 @@
+"""
+artifacts.py
+Артефакты упавших тестов: трассировка Playwright чанками и скриншоты.
+
+Трассировка контекста запускается один раз, дальше на каждый тест
+открывается свой чанк. Чанк прошедшего теста отбрасывается без записи
+на диск (stop_chunk без path), чанк упавшего сохраняется в trace.zip
+вместе со скриншотами открытых страниц (JPEG). Каталог артефактов
+ограничен по размеру: старые прогоны удаляются первыми.
+"""
+
+import re
+import shutil
+import weakref
+from pathlib import Path
+from typing import List, Optional
+
+from playwright.sync_api import BrowserContext
+from playwright.sync_api import Error as PlaywrightError
+
+SCREENSHOT_QUALITY = 60
+
+# Контексты, у которых трассировка уже запущена (пул контекстов живет весь сеанс)
+_tracing = weakref.WeakSet()
+
+
+def artifact_dir(root: Path, name: str) -> Path:
+    """Каталог артефактов теста; повторные попытки (reruns) получают суффикс -2, -3..."""
+    base = re.sub(r"[^\w.-]+", "_", name).strip("_")[-120:]
+    directory = root / base
+    attempt = 1
+    while directory.exists():
+        attempt += 1
+        directory = root / f"{base}-{attempt}"
+    return directory
+
+
+class ChunkedTrace:
+    """Чанк трассировки одного теста в контексте"""
+
+    def __init__(self, context: BrowserContext):
+        self.context = context
+
+    def start(self, title: str) -> None:
+        if self.context in _tracing:
+            self.context.tracing.start_chunk(title=title)
+            return
+        # Снимки DOM без скринкаста: скриншоты снимаются только при падении
+        self.context.tracing.start(title=title, snapshots=True, screenshots=False, sources=False)
+        _tracing.add(self.context)
+
+    def stop(self, directory: Optional[Path] = None) -> List[Path]:
+        """Без directory чанк отбрасывается; с ним — trace.zip и скриншоты страниц"""
+        if directory is None:
+            try:
+                self.context.tracing.stop_chunk()
+            except PlaywrightError:
+                pass  # контекст уже закрыт (например, упал браузер)
+            return []
+
+        directory.mkdir(parents=True, exist_ok=True)
+        saved: List[Path] = []
+        for index, page in enumerate(self.context.pages):
+            path = directory / f"page-{index}.jpg"
+            try:
+                page.screenshot(path=str(path), type="jpeg", quality=SCREENSHOT_QUALITY)
+                saved.append(path)
+            except PlaywrightError:
+                pass
+        try:
+            self.context.tracing.stop_chunk(path=str(directory / "trace.zip"))
+            saved.append(directory / "trace.zip")
+        except PlaywrightError:
+            pass
+        return saved
+
+
+def directory_size(path: Path) -> int:
+    return sum(entry.stat().st_size for entry in path.rglob("*") if entry.is_file())
+
+
+def enforce_size_cap(root: Path, max_bytes: int, keep: Optional[Path] = None) -> List[Path]:
+    """Удаляет самые старые прогоны (подкаталоги root), пока размер больше max_bytes"""
+    if not root.exists():
+        return []
+    runs = sorted((entry for entry in root.iterdir() if entry.is_dir()), key=lambda entry: entry.stat().st_mtime)
+    sizes = {run: directory_size(run) for run in runs}
+    total = sum(sizes.values())
+    removed: List[Path] = []
+    for run in runs:
+        if total <= max_bytes:
+            break
+        if keep is not None and run.resolve() == keep.resolve():
+            continue
+        shutil.rmtree(run, ignore_errors=True)
+        total -= sizes[run]
+        removed.append(run)
+    return removed
@@ -0,0 +1,91 @@
+"""
+auth.py
+Авторизация в Swag Labs один раз на воркер и переиспользование storage_state
+"""
+
+import re
+from pathlib import Path
+from typing import Dict, Optional, Union
+
+from playwright.sync_api import Browser, Page, expect
+
+INVENTORY_URL = re.compile(r".*inventory\.html")
+
+
+def login_via_ui(page: Page, base_url: str, username: str, password: str) -> None:
+    """Полная авторизация через форму входа с ожиданием страницы товаров"""
+    page.goto(base_url)
+    page.locator("#user-name").fill(username)
+    page.locator("#password").fill(password)
+    page.locator("#login-button").click()
+
+    expect(page).to_have_url(INVENTORY_URL)
+    expect(page.locator("span.title")).to_have_text("Products")
+
+
+class AuthSession:
+    """
+    Сохраненная сессия пользователя (cookie session-username + localStorage).
+
+    Логин через UI выполняется один раз, результат пишется в state_path
+    и подставляется в новые контексты через storage_state. Если сайт
+    отклонил сессию (например, истекла cookie), open_inventory логинится
+    заново и обновляет файл.
+    """
+
+    def __init__(
+        self,
+        browser: Browser,
+        context_args: Dict,
+        state_path: Path,
+        base_url: str,
+        username: str,
+        password: str,
+    ):
+        self.browser = browser
+        self.context_args = context_args
+        self.state_path = Path(state_path)
+        self.base_url = base_url
+        self.username = username
+        self.password = password
+        self.logins = 0
+
+    @property
+    def inventory_url(self) -> str:
+        return self.base_url.rstrip("/") + "/inventory.html"
+
+    def storage_state(self) -> str:
+        """Путь к файлу storage_state; при первом обращении выполняет логин"""
+        if not self.state_path.exists():
+            self.refresh()
+        return str(self.state_path)
+
+    def refresh(self) -> None:
+        """Логин через UI в отдельном контексте и сохранение storage_state"""
+        context = self.browser.new_context(**self.context_args)
+        try:
+            page = context.new_page()
+            login_via_ui(page, self.base_url, self.username, self.password)
+            self.logins += 1
+            context.storage_state(path=str(self.state_path))
+        finally:
+            context.close()
+
+    def open_inventory(self, page: Page) -> None:
+        """
+        Открывает inventory.html в уже авторизованном контексте.
+        При редиректе на страницу входа логинится заново прямо в этой вкладке.
+        """
+        page.goto(self.inventory_url)
+
+        if not INVENTORY_URL.match(page.url):
+            login_via_ui(page, self.base_url, self.username, self.password)
+            self.logins += 1
+            page.context.storage_state(path=str(self.state_path))
+
+        expect(page.locator("span.title")).to_have_text("Products")
+
+
+def merge_context_args(existing: Optional[Dict], storage_state: Union[str, Dict]) -> Dict:
+    """Аргументы для маркера browser_context_args с подставленным storage_state"""
+    return {**(existing or {}), "storage_state": storage_state}
@@ -0,0 +1,161 @@
+"""
+benchmark.py
+Статистика бенчмарков сценариев (benchmarks/bench_flows.py): медиана,
+межквартильный размах (IQR) и p95 по сценариям и шагам, базовая линия
+в JSON и сравнение с ней.
+
+Регрессия — это рост медианы больше порога (в процентах и в мс),
+который подтверждает односторонний критерий Манна — Уитни (p < alpha).
+Критерий ранговый: не требует нормальности и устойчив к единичным
+выбросам, которых в замерах браузера хватает. В базовой линии хранятся
+сами замеры, а не только сводка, поэтому критерий считается честно.
+"""
+
+import json
+import math
+import statistics
+from pathlib import Path
+from typing import Dict, List, Mapping, NamedTuple, Optional, Sequence
+
+from swaglabs.timeouts import quantile
+
+ALPHA = 0.01
+THRESHOLD = 0.05     # рост медианы на 5%...
+MIN_DELTA_MS = 1.0   # ...и хотя бы на 1 мс: на быстрых шагах проценты ничего не значат
+
+FORMAT_VERSION = 1
+
+
+class Stats(NamedTuple):
+    n: int
+    median: float
+    iqr: float
+    p25: float
+    p75: float
+    p95: float
+
+    def describe(self) -> str:
+        return f"{self.median:>9.1f} | {self.iqr:>7.1f} | {self.p95:>9.1f} | {self.n:>4}"
+
+
+def stats(samples: Sequence[float]) -> Stats:
+    if not samples:
+        raise ValueError("нет замеров")
+    if len(samples) == 1:
+        value = samples[0]
+        return Stats(1, value, 0.0, value, value, value)
+    p25, _, p75 = statistics.quantiles(samples, n=4, method="inclusive")
+    return Stats(len(samples), statistics.median(samples), p75 - p25, p25, p75, quantile(samples, 0.95))
+
+
+def summarize(series: Mapping[str, Sequence[float]]) -> Dict[str, Stats]:
+    return {key: stats(samples) for key, samples in series.items() if samples}
+
+
+def format_table(series: Mapping[str, Sequence[float]]) -> List[str]:
+    lines = [f"{'медиана':>9} | {'IQR':>7} | {'p95':>9} | {'n':>4} | сценарий / шаг (мс)"]
+    for key, summary in summarize(series).items():
+        indent = "    " if " / " in key else ""
+        lines.append(f"{summary.describe()} | {indent}{key}")
+    return lines
+
+
+def _ranks(values: Sequence[float]) -> List[float]:
+    """Ранги с усреднением для одинаковых значений"""
+    order = sorted(range(len(values)), key=lambda index: values[index])
+    ranks = [0.0] * len(values)
+    start = 0
+    while start < len(order):
+        end = start
+        while end + 1 < len(order) and values[order[end + 1]] == values[order[start]]:
+            end += 1
+        for position in range(start, end + 1):
+            ranks[order[position]] = (start + end) / 2 + 1
+        start = end + 1
+    return ranks
+
+
+def mann_whitney_greater(current: Sequence[float], baseline: Sequence[float]) -> float:
+    """
+    p-значение гипотезы "current больше baseline" (U-критерий Манна — Уитни,
+    нормальное приближение с поправками на одинаковые значения и непрерывность)
+    """
+    n1, n2 = len(current), len(baseline)
+    if not n1 or not n2:
+        return 1.0
+    combined = list(current) + list(baseline)
+    ranks = _ranks(combined)
+    u = sum(ranks[:n1]) - n1 * (n1 + 1) / 2
+    n = n1 + n2
+    ties = sum(count ** 3 - count for count in _tie_counts(combined))
+    variance = n1 * n2 / 12 * ((n + 1) - ties / (n * (n - 1)))
+    if variance <= 0:
+        return 1.0
+    z = (u - n1 * n2 / 2 - 0.5) / math.sqrt(variance)
+    return 0.5 * math.erfc(z / math.sqrt(2))
+
+
+def _tie_counts(values: Sequence[float]) -> List[int]:
+    counts: Dict[float, int] = {}
+    for value in values:
+        counts[value] = counts.get(value, 0) + 1
+    return [count for count in counts.values() if count > 1]
+
+
+class Comparison(NamedTuple):
+    key: str
+    baseline: Stats
+    current: Stats
+    p_slower: float
+    p_faster: float
+    regressed: bool
+    improved: bool
+
+    @property
+    def change(self) -> float:
+        return self.current.median / self.baseline.median - 1 if self.baseline.median else 0.0
+
+    def describe(self) -> str:
+        mark = "❌" if self.regressed else "🚀" if self.improved else "  "
+        return (f"{mark} {self.baseline.median:>9.1f} → {self.current.median:>9.1f} мс "
+                f"({self.change:+.1%}, p={min(self.p_slower, self.p_faster):.3f}) | {self.key}")
+
+
+def compare(baseline: Mapping[str, Sequence[float]], current: Mapping[str, Sequence[float]],
+            alpha: float = ALPHA, threshold: float = THRESHOLD, min_delta_ms: float = MIN_DELTA_MS) -> List[Comparison]:
+    """Сравнение рядов, которые есть и в базовой линии, и в текущем прогоне"""
+    rows = []
+    for key, samples in current.items():
+        base = baseline.get(key)
+        if not base or not samples:
+            continue
+        before, after = stats(base), stats(samples)
+        delta = after.median - before.median
+        significant = abs(delta) > max(threshold * before.median, min_delta_ms)
+        p_slower = mann_whitney_greater(samples, base)
+        p_faster = mann_whitney_greater(base, samples)
+        rows.append(Comparison(key, before, after, p_slower, p_faster,
+                               significant and delta > 0 and p_slower < alpha,
+                               significant and delta < 0 and p_faster < alpha))
+    return rows
+
+
+def save_baseline(path: Path, series: Mapping[str, Sequence[float]], meta: Optional[Dict] = None) -> Path:
+    """JSON: замеры (для критерия) и сводка (для чтения глазами и графиков)"""
+    path = Path(path)
+    path.parent.mkdir(parents=True, exist_ok=True)
+    data = {
+        "version": FORMAT_VERSION,
+        "meta": dict(meta or {}),
+        "stats": {key: summary._asdict() for key, summary in summarize(series).items()},
+        "samples": {key: [round(value, 3) for value in samples] for key, samples in series.items()},
+    }
+    path.write_text(json.dumps(data, ensure_ascii=False, indent=2), encoding="utf-8")
+    return path
+
+
+def load_baseline(path: Path) -> Dict[str, List[float]]:
+    data = json.loads(Path(path).read_text(encoding="utf-8"))
+    if data.get("version") != FORMAT_VERSION:
+        raise ValueError(f"{path}: неизвестная версия формата {data.get('version')!r}")
+    return data["samples"]
@@ -0,0 +1,108 @@
+"""
+blocking.py
+Профили блокировки ресурсов для контекстов браузера: картинки, шрифты,
+медиа и сторонняя телеметрия (backtrace/analytics) не нужны проверкам
+в test_cart_checkout.py и test_sorting.py, но съедают время загрузки.
+"""
+
+import re
+from collections import Counter
+from typing import Dict, Iterable, Optional, Pattern
+
+from playwright.sync_api import BrowserContext, Response, Route
+
+# Регулярки передаются в драйвер Playwright, поэтому запросы, которые
+# под них не подходят, не делают лишний круг через Python
+CATEGORIES: Dict[str, Pattern[str]] = {
+    "image": re.compile(r"\.(?:png|jpe?g|gif|webp|avif|svg|ico|bmp)(?:[?#]|$)", re.IGNORECASE),
+    "font": re.compile(r"\.(?:woff2?|ttf|otf|eot)(?:[?#]|$)", re.IGNORECASE),
+    "media": re.compile(r"\.(?:mp4|webm|ogg|mp3|wav|m4a)(?:[?#]|$)", re.IGNORECASE),
+    "analytics": re.compile(
+        r"^https?://(?:[^/]*\.)?(?:backtrace\.io|google-analytics\.com|googletagmanager\.com|"
+        r"analytics\.google\.com|segment\.(?:io|com)|hotjar\.com|doubleclick\.net|"
+        r"nr-data\.net|newrelic\.com|sentry\.io)(?::\d+)?/",
+        re.IGNORECASE,
+    ),
+}
+
+PROFILES: Dict[str, tuple] = {
+    "full": (),
+    "functional": ("analytics",),
+    "minimal": ("image", "font", "media", "analytics"),
+}
+
+DEFAULT_PROFILE = "functional"
+
+
+def categories_for(profile: str, allowed: Iterable[str] = ()) -> tuple:
+    """Категории, которые блокирует профиль, за вычетом разрешенных тесту"""
+    if profile not in PROFILES:
+        raise ValueError(f"Неизвестный профиль блокировки: {profile!r} (есть: {', '.join(PROFILES)})")
+    allowed = set(allowed)
+    unknown = allowed - set(CATEGORIES)
+    if unknown:
+        raise ValueError(f"Неизвестные категории ресурсов: {', '.join(sorted(unknown))}")
+    return tuple(category for category in PROFILES[profile] if category not in allowed)
+
+
+class ResourceBlocker:
+    """
+    Ставит route-обработчики на контекст и считает, сколько запросов
+    и байт удалось не загружать. Размер заблокированного ответа берется
+    из known_sizes (URL -> байты), которые собираются в прогонах, где
+    ресурс не блокировался.
+    """
+
+    def __init__(self, categories: Iterable[str], known_sizes: Optional[Dict[str, int]] = None):
+        self.categories = tuple(categories)
+        self.known_sizes = known_sizes if known_sizes is not None else {}
+        self.learned_sizes: Dict[str, int] = {}
+        self.blocked: Counter = Counter()
+        self.blocked_bytes = 0
+        self.unknown_size = 0
+        self._routes: list = []
+        self._learning = False
+
+    def install(self, context: BrowserContext) -> None:
+        for category in self.categories:
+            handler = lambda route, category=category: self._handle(route, category)
+            context.route(CATEGORIES[category], handler)
+            self._routes.append((CATEGORIES[category], handler))
+        if set(self.categories) != set(CATEGORIES):
+            context.on("response", self._learn)
+            self._learning = True
+
+    def uninstall(self, context: BrowserContext) -> None:
+        """Снимает обработчики (контекст переживает тест в режиме --context-pool)"""
+        for pattern, handler in self._routes:
+            context.unroute(pattern, handler)
+        self._routes.clear()
+        if self._learning:
+            context.remove_listener("response", self._learn)
+            self._learning = False
+
+    def _handle(self, route: Route, category: str) -> None:
+        url = route.request.url
+        self.blocked[category] += 1
+        if url in self.known_sizes:
+            self.blocked_bytes += self.known_sizes[url]
+        else:
+            self.unknown_size += 1
+
+        if category == "analytics":
+            # Телеметрию подменяем пустым ответом, чтобы скрипты сайта не падали
+            route.fulfill(status=204, body="")
+        else:
+            route.abort("blockedbyclient")
+
+    def _learn(self, response: Response) -> None:
+        url = response.url
+        if not any(CATEGORIES[c].search(url) for c in CATEGORIES if c not in self.categories):
+            return
+        length = response.headers.get("content-length")
+        if length and length.isdigit():
+            self.learned_sizes[url] = int(length)
+
+    @property
+    def blocked_requests(self) -> int:
+        return sum(self.blocked.values())
@@ -0,0 +1,273 @@
+"""
+browser_server.py
+Долгоживущий сервер браузера для локальных прогонов (pytest --browser-server).
+
+Сервер запускает отдельный процесс-хранитель: он поднимает launch-server
+драйвера Playwright (в Python API нет launch_server, но он есть в CLI
+драйвера) и пишет WebSocket-адрес в файл состояния. Следующие прогоны
+подключаются к браузеру через browser_type.connect(). Пока есть живые
+сессии pytest (файлы в <состояние>.leases/), сервер считается занятым;
+после idle_timeout секунд без сессий хранитель его останавливает.
+
+    python -m swaglabs.browser_server status
+    python -m swaglabs.browser_server stop
+"""
+
+import argparse
+import hashlib
+import json
+import os
+import re
+import signal
+import subprocess
+import sys
+import time
+from contextlib import contextmanager
+from pathlib import Path
+from typing import Dict, Iterator, List, NamedTuple, Optional, Sequence, Tuple
+
+from playwright._impl._driver import compute_driver_executable, get_driver_env
+
+STATE_DIR = Path(".swaglabs/browser-server")
+# Сервер останавливается через 15 минут без прогонов
+IDLE_TIMEOUT = 900
+# Сколько ждать запуска сервера, секунды
+START_TIMEOUT = 30
+
+
+class ServerState(NamedTuple):
+    ws_endpoint: str
+    pid: int            # процесс-хранитель
+    browser: str
+    launch_args: Dict
+    started: float
+
+
+def state_path(state_dir: Path, browser_name: str, launch_args: Dict) -> Path:
+    """Свой сервер на каждый набор параметров запуска (--headed, --browser-channel и т.п.)"""
+    digest = hashlib.sha1(json.dumps(launch_args, sort_keys=True, default=str).encode()).hexdigest()[:8]
+    return Path(state_dir) / f"{browser_name}-{digest}.json"
+
+
+def _alive(pid: int) -> bool:
+    if os.name != "posix":
+        return True  # на Windows os.kill(pid, 0) завершает процесс, а не проверяет его
+    try:
+        os.kill(pid, 0)
+    except ProcessLookupError:
+        return False
+    except PermissionError:
+        return True
+    return True
+
+
+def read_state(path: Path) -> Optional[ServerState]:
+    """Состояние работающего сервера; файл умершего сервера удаляется"""
+    try:
+        state = ServerState(**json.loads(Path(path).read_text(encoding="utf-8")))
+    except (OSError, ValueError, TypeError):
+        return None
+    if not _alive(state.pid):
+        Path(path).unlink(missing_ok=True)
+        return None
+    return state
+
+
+def _to_camel(key: str) -> str:
+    return re.sub(r"_(\w)", lambda match: match.group(1).upper(), key)
+
+
+def driver_command() -> List[str]:
+    driver = compute_driver_executable()
+    # В новых версиях Playwright это пара (node, cli.js), в старых — путь к playwright.sh
+    return [str(part) for part in driver] if isinstance(driver, tuple) else [str(driver)]
+
+
+def _leases(path: Path) -> Path:
+    return path.with_suffix(".leases")
+
+
+@contextmanager
+def lease(path: Path) -> Iterator[None]:
+    """Сессия pytest пользуется сервером: пока файл есть, сервер не простаивает"""
+    leases = _leases(path)
+    leases.mkdir(parents=True, exist_ok=True)
+    own = leases / str(os.getpid())
+    own.touch()
+    try:
+        yield
+    finally:
+        own.unlink(missing_ok=True)
+
+
+def _busy(path: Path) -> bool:
+    leases = _leases(path)
+    if not leases.exists():
+        return False
+    busy = False
+    for entry in leases.iterdir():
+        if entry.name.isdigit() and _alive(int(entry.name)):
+            busy = True
+        else:
+            entry.unlink(missing_ok=True)
+    return busy
+
+
+def serve(path: Path, browser_name: str, launch_args: Dict, idle_timeout: float) -> int:
+    """Процесс-хранитель: launch-server драйвера, файл состояния и остановка по простою"""
+    path = Path(path)
+    path.parent.mkdir(parents=True, exist_ok=True)
+    config = path.with_suffix(".config.json")
+    log = path.with_suffix(".log")
+    config.write_text(json.dumps({_to_camel(key): value for key, value in launch_args.items()}, default=str),
+                      encoding="utf-8")
+    with log.open("w", encoding="utf-8") as log_file:
+        driver = subprocess.Popen(
+            driver_command() + ["launch-server", "--browser", browser_name, "--config", str(config)],
+            stdin=subprocess.DEVNULL, stdout=log_file, stderr=subprocess.STDOUT, env=get_driver_env(),
+        )
+    signal.signal(signal.SIGTERM, lambda *_: sys.exit(0))
+    try:
+        ws_endpoint = None
+        deadline = time.time() + START_TIMEOUT
+        while ws_endpoint is None and driver.poll() is None and time.time() < deadline:
+            ws_endpoint = next((line.strip() for line in log.read_text(encoding="utf-8").splitlines()
+                                if line.startswith("ws://")), None)
+            time.sleep(0.05)
+        if ws_endpoint is None:
+            return 1
+
+        state = ServerState(ws_endpoint, os.getpid(), browser_name, launch_args, time.time())
+        tmp = path.with_suffix(".tmp")
+        tmp.write_text(json.dumps(state._asdict(), default=str), encoding="utf-8")
+        tmp.replace(path)
+
+        last_busy = time.time()
+        while driver.poll() is None:
+            if _busy(path):
+                last_busy = time.time()
+            elif time.time() - last_busy > idle_timeout:
+                break
+            time.sleep(1)
+        return 0
+    finally:
+        if driver.poll() is None:
+            driver.terminate()
+            try:
+                driver.wait(10)
+            except subprocess.TimeoutExpired:
+                driver.kill()
+        state = read_state(path)
+        if state is not None and state.pid == os.getpid():
+            path.unlink(missing_ok=True)
+        config.unlink(missing_ok=True)
+
+
+@contextmanager
+def _start_lock(path: Path) -> Iterator[bool]:
+    """Сервер запускает один процесс (воркеры xdist стартуют одновременно)"""
+    lock = path.with_suffix(".lock")
+    try:
+        if time.time() - lock.stat().st_mtime > START_TIMEOUT:
+            lock.unlink(missing_ok=True)  # остался от упавшего запуска
+    except FileNotFoundError:
+        pass
+    try:
+        os.close(os.open(lock, os.O_CREAT | os.O_EXCL))
+    except FileExistsError:
+        yield False
+        return
+    try:
+        yield True
+    finally:
+        lock.unlink(missing_ok=True)
+
+
+def _wait_for_state(path: Path, keeper: Optional[subprocess.Popen] = None) -> ServerState:
+    deadline = time.time() + START_TIMEOUT
+    while time.time() < deadline:
+        state = read_state(path)
+        if state is not None:
+            return state
+        if keeper is not None and keeper.poll() is not None:
+            break
+        time.sleep(0.05)
+    log = path.with_suffix(".log")
+    details = log.read_text(encoding="utf-8")[-2000:] if log.exists() else ""
+    raise RuntimeError(f"сервер браузера не запустился (лог: {log})\n{details}")
+
+
+def start_server(path: Path, browser_name: str, launch_args: Dict, idle_timeout: float) -> ServerState:
+    path.parent.mkdir(parents=True, exist_ok=True)
+    env = dict(os.environ)
+    # Хранитель импортирует swaglabs из любого рабочего каталога
+    package_root = str(Path(__file__).resolve().parent.parent)
+    env["PYTHONPATH"] = os.pathsep.join(filter(None, [package_root, env.get("PYTHONPATH")]))
+    detach = {"start_new_session": True} if os.name == "posix" else {
+        "creationflags": subprocess.DETACHED_PROCESS | subprocess.CREATE_NEW_PROCESS_GROUP,
+    }
+    keeper = subprocess.Popen(
+        [sys.executable, "-m", "swaglabs.browser_server", "serve", "--state", str(path),
+         "--browser", browser_name, "--launch-args", json.dumps(launch_args, default=str),
+         "--idle-timeout", str(idle_timeout)],
+        stdin=subprocess.DEVNULL, stdout=subprocess.DEVNULL, stderr=subprocess.DEVNULL, env=env, **detach,
+    )
+    return _wait_for_state(path, keeper)
+
+
+def ensure_server(state_dir: Path, browser_name: str, launch_args: Dict,
+                  idle_timeout: float = IDLE_TIMEOUT) -> Tuple[ServerState, bool]:
+    """Работающий сервер для этих параметров запуска и признак, что он только что запущен"""
+    path = state_path(state_dir, browser_name, launch_args)
+    state = read_state(path)
+    if state is not None:
+        return state, False
+    path.parent.mkdir(parents=True, exist_ok=True)
+    with _start_lock(path) as owner:
+        if not owner:
+            return _wait_for_state(path), False
+        return start_server(path, browser_name, launch_args, idle_timeout), True
+
+
+def stop_server(path: Path) -> bool:
+    state = read_state(path)
+    if state is None:
+        return False
+    os.kill(state.pid, signal.SIGTERM)
+    return True
+
+
+def main(argv: Sequence[str] = None) -> int:
+    parser = argparse.ArgumentParser(description="Долгоживущий сервер браузера для локальных прогонов")
+    parser.add_argument("--dir", type=Path, default=STATE_DIR, help="каталог файлов состояния")
+    commands = parser.add_subparsers(dest="command", required=True)
+    commands.add_parser("status", help="показать работающие серверы")
+    commands.add_parser("stop", help="остановить все серверы")
+    serve_parser = commands.add_parser("serve", help="процесс-хранитель (запускается плагином)")
+    serve_parser.add_argument("--state", type=Path, required=True)
+    serve_parser.add_argument("--browser", required=True)
+    serve_parser.add_argument("--launch-args", type=json.loads, default={})
+    serve_parser.add_argument("--idle-timeout", type=float, default=IDLE_TIMEOUT)
+    args = parser.parse_args(argv)
+
+    if args.command == "serve":
+        return serve(args.state, args.browser, args.launch_args, args.idle_timeout)
+
+    states = [(path, read_state(path)) for path in sorted(args.dir.glob("*.json"))
+              if not path.name.endswith(".config.json")]
+    running = [(path, state) for path, state in states if state is not None]
+    if not running:
+        print("Серверы браузера не запущены")
+    for path, state in running:
+        if args.command == "stop":
+            stop_server(path)
+            print(f"🛑 Остановлен {state.browser} ({state.ws_endpoint})")
+        else:
+            uptime = time.time() - state.started
+            print(f"✅ {state.browser}: {state.ws_endpoint}, pid {state.pid}, работает {uptime / 60:.0f} мин, "
+                  f"параметры {state.launch_args}")
+    return 0
+
+
+if __name__ == "__main__":
+    sys.exit(main())
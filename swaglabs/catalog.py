@@ -0,0 +1,70 @@
+"""
+catalog.py
+Снимок каталога товаров со страницы inventory.html за один запрос к браузеру
+"""
+
+from typing import List, NamedTuple, Optional, Sequence
+
+from playwright.async_api import Page as AsyncPage
+from playwright.sync_api import Page
+
+INVENTORY_ITEM = ".inventory_item"
+
+# Выполняется в браузере над всеми .inventory_item сразу (Locator.evaluate_all).
+# Возвращает компактные массивы [название, цена, id товара, текст кнопки],
+# чтобы не гонять через IPC лишние ключи словарей.
+CATALOG_SNAPSHOT_JS = """
+items => items.map(item => {
+    const text = selector => {
+        const el = item.querySelector(selector);
+        return el ? el.textContent.trim() : "";
+    };
+    const link = item.querySelector("a[id^='item_']");
+    const match = link ? /^item_(\\d+)_/.exec(link.id) : null;
+    return [
+        text(".inventory_item_name"),
+        text(".inventory_item_price"),
+        match ? Number(match[1]) : -1,
+        text("button.btn_inventory, .pricebar button"),
+    ];
+})
+"""
+
+
+class Product(NamedTuple):
+    """Товар в том виде, в каком он отрисован на странице"""
+
+    name: str
+    price: float
+    item_id: int
+    in_cart: bool
+
+
+def parse_price(price_text: str) -> float:
+    """Конвертирует цену вида "$29.99" в число (0.0, если разобрать не удалось)"""
+    try:
+        return float(price_text.replace("$", ""))
+    except ValueError:
+        return 0.0
+
+
+def _to_product(row: Sequence) -> Product:
+    name, price_text, item_id, button_text = row
+    return Product(name, parse_price(price_text), int(item_id), button_text == "Remove")
+
+
+def snapshot_catalog(page: Page, root: Optional[str] = None) -> List[Product]:
+    """
+    Читает название, цену, id и состояние кнопки всех товаров
+    одним вызовом evaluate_all вместо 2N+1 вызовов text_content.
+    """
+    selector = f"{root} {INVENTORY_ITEM}" if root else INVENTORY_ITEM
+    rows = page.locator(selector).evaluate_all(CATALOG_SNAPSHOT_JS)
+    return [_to_product(row) for row in rows]
+
+
+async def snapshot_catalog_async(page: AsyncPage, root: Optional[str] = None) -> List[Product]:
+    """snapshot_catalog для асинхронного API"""
+    selector = f"{root} {INVENTORY_ITEM}" if root else INVENTORY_ITEM
+    rows = await page.locator(selector).evaluate_all(CATALOG_SNAPSHOT_JS)
+    return [_to_product(row) for row in rows]
@@ -0,0 +1,162 @@
+"""
+checks.py
+Пакетные проверки: несколько условий по CSS-селекторам проверяются
+одним wait_for_function вместо отдельного expect(...) на каждое.
+
+    expect_all(page, [
+        visible("#login-button"),
+        text("span.title", "Products"),
+        hidden("#react-burger-menu-btn"),
+        attribute("#password", "type", "password"),
+    ])
+
+Условия перепроверяются в браузере, пока не выполнятся все сразу или не
+истечет таймаут. При падении в сообщении перечислены все невыполненные
+проверки с фактическими значениями. Селекторы — обычный CSS
+(document.querySelectorAll); проверки text/value/attribute/visible смотрят
+на первый найденный элемент, hidden выполняется и когда элемента нет.
+"""
+
+from typing import List, NamedTuple, Optional, Sequence, Union
+
+from playwright.async_api import Page as AsyncPage
+from playwright.sync_api import Page
+from playwright.sync_api import TimeoutError as PlaywrightTimeoutError
+
+from swaglabs.timeouts import adaptive
+
+# Таймаут expect() в Playwright по умолчанию
+DEFAULT_TIMEOUT = 5000
+
+# [checks, report]: при report=false — true/false для wait_for_function,
+# при report=true — список невыполненных проверок с фактическими значениями
+CHECKS_JS = """
+([checks, report]) => {
+    const isVisible = el => {
+        if (!el) return false;
+        if (getComputedStyle(el).visibility !== "visible") return false;
+        const rect = el.getBoundingClientRect();
+        return rect.width > 0 && rect.height > 0;
+    };
+    const normalize = value => (value || "").replace(/\\s+/g, " ").trim();
+    const failures = [];
+    for (const check of checks) {
+        const elements = document.querySelectorAll(check.selector);
+        const el = elements[0] || null;
+        let actual;
+        let ok;
+        switch (check.kind) {
+            case "visible":
+            case "hidden":
+                actual = el ? (isVisible(el) ? "visible" : "hidden") : "не найден";
+                ok = check.kind === "visible" ? actual === "visible" : actual !== "visible";
+                break;
+            case "text":
+                actual = el ? normalize(el.textContent) : null;
+                ok = actual === check.expected;
+                break;
+            case "value":
+                actual = el ? el.value : null;
+                ok = actual === check.expected;
+                break;
+            case "attribute":
+                actual = el ? el.getAttribute(check.name) : null;
+                ok = actual === check.expected;
+                break;
+            case "count":
+                actual = elements.length;
+                ok = actual === check.expected;
+                break;
+            default:
+                actual = "неизвестная проверка";
+                ok = false;
+        }
+        if (!ok) {
+            if (!report) return false;
+            failures.push({ ...check, actual });
+        }
+    }
+    return report ? failures : true;
+}
+"""
+
+
+class Check(NamedTuple):
+    kind: str
+    selector: str
+    expected: Union[str, int, None] = None
+    name: Optional[str] = None  # имя атрибута для attribute
+
+    def describe(self) -> str:
+        if self.kind in ("visible", "hidden"):
+            return f"{self.selector}: {self.kind}"
+        what = f"attribute {self.name}" if self.kind == "attribute" else self.kind
+        return f"{self.selector}: {what} = {self.expected!r}"
+
+
+def visible(selector: str) -> Check:
+    return Check("visible", selector)
+
+
+def hidden(selector: str) -> Check:
+    """Элемент не отображается или отсутствует"""
+    return Check("hidden", selector)
+
+
+def text(selector: str, expected: str) -> Check:
+    """Полный текст элемента (пробелы схлопываются, как в to_have_text)"""
+    return Check("text", selector, expected)
+
+
+def value(selector: str, expected: str) -> Check:
+    return Check("value", selector, expected)
+
+
+def attribute(selector: str, name: str, expected: str) -> Check:
+    return Check("attribute", selector, expected, name)
+
+
+def count(selector: str, expected: int) -> Check:
+    return Check("count", selector, expected)
+
+
+def failed_checks(page: Page, checks: Sequence[Check]) -> List[dict]:
+    """Невыполненные проверки на текущий момент (без ожидания)"""
+    return page.evaluate(CHECKS_JS, [[check._asdict() for check in checks], True])
+
+
+def _failure_message(checks: Sequence[Check], failures: List[dict], timeout: float) -> str:
+    lines = [f"Не выполнено проверок: {len(failures)} из {len(checks)} (ожидание {timeout:g} мс)"]
+    for failure in failures:
+        check = Check(failure["kind"], failure["selector"], failure.get("expected"), failure.get("name"))
+        lines.append(f"  {check.describe()} — получено: {failure['actual']!r}")
+    return "\n".join(lines)
+
+
+def expect_all(page: Page, checks: Sequence[Check], timeout: Optional[float] = None) -> None:
+    """
+    Ждет, пока выполнятся все проверки; иначе AssertionError со списком невыполненных.
+    Без timeout ожидание берется из истории (--adaptive-timeouts) или DEFAULT_TIMEOUT
+    """
+    payload = [check._asdict() for check in checks]
+    try:
+        with adaptive("expect_all", timeout, DEFAULT_TIMEOUT) as timeout:
+            page.wait_for_function(CHECKS_JS, arg=[payload, False], timeout=timeout)
+        return
+    except PlaywrightTimeoutError:
+        failures = failed_checks(page, checks)
+    if failures:  # пусто, если все выполнилось к моменту повторной проверки
+        raise AssertionError(_failure_message(checks, failures, timeout))
+
+
+async def expect_all_async(page: AsyncPage, checks: Sequence[Check], timeout: Optional[float] = None) -> None:
+    """expect_all для асинхронного API"""
+    payload = [check._asdict() for check in checks]
+    try:
+        with adaptive("expect_all", timeout, DEFAULT_TIMEOUT) as timeout:
+            await page.wait_for_function(CHECKS_JS, arg=[payload, False], timeout=timeout)
+        return
+    except PlaywrightTimeoutError:
+        failures = await page.evaluate(CHECKS_JS, [payload, True])
+    if failures:
+        raise AssertionError(_failure_message(checks, failures, timeout))
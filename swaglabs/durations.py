@@ -0,0 +1,88 @@
+"""
+durations.py
+История длительности тестов (nodeid → последние замеры, оценка по медиане)
+и распределение тестов по исполнителям "сначала самые длинные" (LPT).
+
+Файл истории — обычный JSON, его можно хранить в кэше CI и передавать
+между машинами: при одинаковом файле распределение получается одинаковым.
+"""
+
+import heapq
+import json
+import statistics
+import time
+from pathlib import Path
+from typing import Dict, List, Sequence, Tuple
+
+# Сколько последних замеров хранить на тест
+KEEP_SAMPLES = 9
+# Оценка для новых тестов, пока история пустая (секунды)
+DEFAULT_ESTIMATE = 5.0
+
+
+class DurationHistory:
+    def __init__(self, path: Path):
+        self.path = Path(path)
+        self.samples: Dict[str, List[float]] = {}
+        # Когда тест замерялся последний раз: по нему сливаются истории шардов
+        self.updated: Dict[str, float] = {}
+        if self.path.exists():
+            data = json.loads(self.path.read_text(encoding="utf-8"))
+            self.samples = {nodeid: list(values) for nodeid, values in data.get("tests", {}).items()}
+            self.updated = dict(data.get("updated", {}))
+
+    def add(self, nodeid: str, seconds: float) -> None:
+        values = self.samples.setdefault(nodeid, [])
+        values.append(round(seconds, 3))
+        del values[:-KEEP_SAMPLES]
+        self.updated[nodeid] = round(time.time(), 3)
+
+    def update_from(self, other: "DurationHistory") -> None:
+        """Берет из other замеры тестов, которые там обновлялись позже"""
+        for nodeid, values in other.samples.items():
+            if other.updated.get(nodeid, 0) >= self.updated.get(nodeid, 0):
+                self.samples[nodeid] = list(values)
+                self.updated[nodeid] = other.updated.get(nodeid, 0)
+
+    def save(self) -> None:
+        self.path.parent.mkdir(parents=True, exist_ok=True)
+        data = {
+            "version": 1,
+            "tests": dict(sorted(self.samples.items())),
+            "updated": dict(sorted(self.updated.items())),
+        }
+        self.path.write_text(json.dumps(data, ensure_ascii=False, indent=1), encoding="utf-8")
+
+    def default_estimate(self) -> float:
+        """Для новых тестов: медиана известных оценок"""
+        known = [statistics.median(values) for values in self.samples.values() if values]
+        return statistics.median(known) if known else DEFAULT_ESTIMATE
+
+    def estimates(self, nodeids: Sequence[str]) -> Dict[str, float]:
+        default = self.default_estimate()
+        return {
+            nodeid: statistics.median(self.samples[nodeid]) if self.samples.get(nodeid) else default
+            for nodeid in nodeids
+        }
+
+
+def longest_first(nodeids: Sequence[str], estimates: Dict[str, float]) -> List[str]:
+    """Порядок по убыванию оценки; при равенстве — по nodeid, чтобы не зависеть от порядка сбора"""
+    return sorted(nodeids, key=lambda nodeid: (-estimates[nodeid], nodeid))
+
+
+def lpt_assign(nodeids: Sequence[str], estimates: Dict[str, float], groups: int) -> Tuple[List[List[str]], List[float]]:
+    """
+    Жадное LPT-распределение: очередной самый длинный тест уходит в наименее
+    загруженную группу. Возвращает группы (в исходном порядке nodeids) и их суммарные оценки.
+    """
+    order = {nodeid: index for index, nodeid in enumerate(nodeids)}
+    heap = [(0.0, index) for index in range(groups)]
+    assigned: List[List[str]] = [[] for _ in range(groups)]
+    loads = [0.0] * groups
+    for nodeid in longest_first(nodeids, estimates):
+        load, index = heapq.heappop(heap)
+        assigned[index].append(nodeid)
+        loads[index] = load + estimates[nodeid]
+        heapq.heappush(heap, (loads[index], index))
+    return [sorted(group, key=order.__getitem__) for group in assigned], loads
@@ -0,0 +1,205 @@
+"""
+flows.py
+Сценарии как данные: шаги из простых действий (клик, ввод, проверка URL
+или текста), которые выполняются и синхронным API (функциональные тесты),
+и асинхронным (нагрузочный прогон swaglabs.load). Так тест и нагрузка
+проходят один и тот же путь и не расходятся при правках.
+"""
+
+import random
+import re
+import string
+from typing import Dict, NamedTuple, Optional, Tuple
+from urllib.parse import urljoin
+
+from playwright.async_api import Page as AsyncPage
+from playwright.async_api import expect as async_expect
+from playwright.sync_api import Page, expect
+
+from swaglabs.readiness import wait_for_cart_badge, wait_for_cart_badge_async
+from swaglabs.standin.products import SWAG_LABS_PRODUCTS
+
+
+class Action(NamedTuple):
+    """
+    Одно действие шага:
+        goto         — переход на путь относительно base_url (или текущей страницы)
+        click        — клик по селектору
+        fill         — ввод value (можно с подстановками {first_name} и т.п.)
+        expect_url   — URL совпадает с регулярным выражением value
+        expect_text  — у селектора текст value
+        expect_count — элементов по селектору ровно value (0 — элемента нет)
+        expect_min_count — элементов по селектору не меньше value
+        expect_cart  — счетчик корзины равен value (swaglabs.readiness.wait_for_cart_badge)
+    """
+    kind: str
+    selector: str = ""
+    value: str = ""
+
+
+class FlowStep(NamedTuple):
+    name: str
+    actions: Tuple[Action, ...]
+    # Состояние к началу шага: с него можно стартовать, засеяв его (swaglabs.seeding)
+    page: str = "inventory.html"
+    cart: Tuple[int, ...] = ()
+
+    @property
+    def navigates(self) -> bool:
+        """Шаг заканчивается на новой странице (после него имеет смысл снимать метрики)"""
+        return any(action.kind == "expect_url" for action in self.actions)
+
+
+def _first_ids(count: int) -> Tuple[int, ...]:
+    """
+    id первых count товаров каталога в сортировке A→Z (по умолчанию).
+    Товары Swag Labs у стенда те же и идут первыми, синтетические
+    (Sauce Labs Item ...) в начало сортировки не попадают.
+    """
+    ordered = sorted(SWAG_LABS_PRODUCTS, key=lambda product: product["name"].lower())
+    return tuple(product["id"] for product in ordered[:count])
+
+
+def _add_to_cart(index: int) -> Action:
+    return Action("click", f".inventory_item >> nth={index} >> button:has-text('Add to cart')")
+
+
+OPEN_INVENTORY = FlowStep("Открыли каталог", (
+    Action("goto", "inventory.html"),
+    Action("expect_url", r".*inventory\.html"),
+))
+
+# Товары, которые добавляет шаг 1: первые два в сортировке A→Z (Backpack, Bike Light)
+CHECKOUT_CART = _first_ids(2)
+
+# TestCartAndCheckout.test_add_products_and_checkout и сценарий нагрузки
+CHECKOUT_FLOW: Tuple[FlowStep, ...] = (
+    FlowStep("Шаг 1: Добавили 2 товара", (
+        Action("expect_min_count", ".inventory_item", "2"),
+        _add_to_cart(0),
+        _add_to_cart(1),
+    )),
+    FlowStep("Шаг 2: В корзине 2 товара", (
+        Action("expect_cart", value="2"),
+    ), cart=CHECKOUT_CART),
+    FlowStep("Шаг 3: Перешли в корзину", (
+        Action("click", ".shopping_cart_link"),
+        Action("expect_url", r".*cart\.html"),
+    ), cart=CHECKOUT_CART),
+    FlowStep("Шаг 4: Перешли к оформлению", (
+        Action("click", "#checkout"),
+        Action("expect_url", r".*checkout-step-one\.html"),
+    ), "cart.html", CHECKOUT_CART),
+    FlowStep("Шаг 5: Заполнили форму покупателя", (
+        Action("fill", "#first-name", "{first_name}"),
+        Action("fill", "#last-name", "{last_name}"),
+        Action("fill", "#postal-code", "{zip_code}"),
+    ), "checkout-step-one.html", CHECKOUT_CART),
+    FlowStep("Шаг 6: Перешли к обзору заказа", (
+        Action("click", "#continue"),
+        Action("expect_url", r".*checkout-step-two\.html"),
+    ), "checkout-step-one.html", CHECKOUT_CART),
+    FlowStep("Шаг 7: Заказ оформлен", (
+        Action("click", "#finish"),
+        Action("expect_url", r".*checkout-complete\.html"),
+    ), "checkout-step-two.html", CHECKOUT_CART),
+    FlowStep("Шаг 8: Подтверждение получено", (
+        Action("expect_text", ".complete-header", "Thank you for your order!"),
+    ), "checkout-complete.html"),
+    FlowStep("Шаг 9: Вернулись на главную", (
+        Action("click", "#back-to-products"),
+        Action("expect_url", r".*inventory\.html"),
+    ), "checkout-complete.html"),
+)
+
+
+# Цикл корзины из TestCartAndCheckout.test_add_and_remove_product_from_cart:
+# повторяется тысячи раз на одной странице в soak-режиме (swaglabs.soak)
+CART_CYCLE: Tuple[FlowStep, ...] = (
+    FlowStep("Добавили товар", (
+        _add_to_cart(0),
+        Action("expect_cart", value="1"),
+    )),
+    FlowStep("Перешли в корзину", (
+        Action("click", ".shopping_cart_link"),
+        Action("expect_url", r".*cart\.html"),
+        Action("expect_count", ".cart_item", "1"),
+    ), cart=_first_ids(1)),
+    FlowStep("Удалили товар", (
+        Action("click", ".cart_item >> nth=0 >> button:has-text('Remove')"),
+        Action("expect_count", ".cart_item", "0"),
+        Action("expect_cart", value="0"),
+    ), "cart.html", _first_ids(1)),
+    FlowStep("Вернулись к покупкам", (
+        Action("click", "#continue-shopping"),
+        Action("expect_url", r".*inventory\.html"),
+    ), "cart.html"),
+)
+
+
+def seed_for(flow: Tuple[FlowStep, ...], first_ui_step: int) -> Dict:
+    """
+    Аргументы маркера seeded для старта с шага first_ui_step:
+    шаги до него не проходятся через UI, их результат засеивается
+    """
+    flow_step = flow[first_ui_step]
+    return {"start": flow_step.page, "cart": flow_step.cart}
+
+
+def random_customer() -> Dict[str, str]:
+    """Данные покупателя для формы checkout-step-one"""
+    return {
+        "first_name": "Иван" + str(random.randint(1, 100)),
+        "last_name": "Иванов" + str(random.randint(1, 100)),
+        "zip_code": "".join(random.choices(string.digits, k=6)),
+    }
+
+
+def run_step(page: Page, flow_step: FlowStep, data: Optional[Dict[str, str]] = None,
+             base_url: Optional[str] = None) -> None:
+    """Выполняет шаг синхронным API"""
+    for action in flow_step.actions:
+        value = action.value.format(**(data or {}))
+        if action.kind == "goto":
+            page.goto(urljoin(base_url or page.url, value))
+        elif action.kind == "click":
+            page.locator(action.selector).click()
+        elif action.kind == "fill":
+            page.locator(action.selector).fill(value)
+        elif action.kind == "expect_url":
+            expect(page).to_have_url(re.compile(value))
+        elif action.kind == "expect_text":
+            expect(page.locator(action.selector)).to_have_text(value)
+        elif action.kind == "expect_count":
+            expect(page.locator(action.selector)).to_have_count(int(value))
+        elif action.kind == "expect_min_count":
+            expect(page.locator(action.selector).nth(int(value) - 1)).to_be_attached()
+        elif action.kind == "expect_cart":
+            wait_for_cart_badge(page, int(value))
+        else:
+            raise ValueError(f"неизвестное действие {action.kind!r} в шаге {flow_step.name!r}")
+
+
+async def run_step_async(page: AsyncPage, flow_step: FlowStep, data: Optional[Dict[str, str]] = None,
+                         base_url: Optional[str] = None) -> None:
+    """Выполняет шаг асинхронным API (та же семантика, что у run_step)"""
+    for action in flow_step.actions:
+        value = action.value.format(**(data or {}))
+        if action.kind == "goto":
+            await page.goto(urljoin(base_url or page.url, value))
+        elif action.kind == "click":
+            await page.locator(action.selector).click()
+        elif action.kind == "fill":
+            await page.locator(action.selector).fill(value)
+        elif action.kind == "expect_url":
+            await async_expect(page).to_have_url(re.compile(value))
+        elif action.kind == "expect_text":
+            await async_expect(page.locator(action.selector)).to_have_text(value)
+        elif action.kind == "expect_count":
+            await async_expect(page.locator(action.selector)).to_have_count(int(value))
+        elif action.kind == "expect_min_count":
+            await async_expect(page.locator(action.selector).nth(int(value) - 1)).to_be_attached()
+        elif action.kind == "expect_cart":
+            await wait_for_cart_badge_async(page, int(value))
+        else:
+            raise ValueError(f"неизвестное действие {action.kind!r} в шаге {flow_step.name!r}")
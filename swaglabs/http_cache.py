@@ -0,0 +1,273 @@
+"""
+http_cache.py
+HTTP-кэш статики (JS, CSS, картинки, шрифты) на диске, общий для всех
+тестов и прогонов: context.route отдает ресурс из локального хранилища
+вместо загрузки в каждом новом контексте.
+
+Хранилище адресуется содержимым: objects/<sha256> — тело ответа,
+entries/<хэш URL>.json — URL, заголовки и валидаторы (ETag,
+Last-Modified). Время изменения файла записи — время последнего
+использования: по нему вытесняются давно не нужные записи (LRU), как
+только новая запись выводит хранилище за лимит. Файлы пишутся атомарно
+(os.replace), поэтому воркеры xdist работают с одним каталогом без
+блокировок.
+
+Пока max-age ответа не истек, ресурс отдается без сети, потом —
+условным запросом (If-None-Match / If-Modified-Since); на 304 тело
+берется из хранилища. Кэшируются только публичные ответы 200 на GET без
+Set-Cookie и Authorization, с Vary не шире Accept-Encoding (запись
+ищется только по URL, варианты по Cookie и т.п. не различаются): cookies
+и localStorage (сессия, корзина) остаются в контексте теста, который
+создается заново.
+"""
+
+import hashlib
+import json
+import os
+import re
+import tempfile
+import time
+from collections import Counter
+from pathlib import Path
+from typing import Dict, List, Mapping, NamedTuple, Optional, Set, Tuple
+
+from playwright.sync_api import BrowserContext, Route
+from playwright.sync_api import Error as PlaywrightError
+
+# Регулярка передается в драйвер: остальные запросы не идут через Python
+STATIC = re.compile(r"\.(?:js|mjs|css|png|jpe?g|gif|webp|avif|svg|ico|woff2?|ttf|otf)(?:[?#]|$)", re.IGNORECASE)
+
+# Заголовки ответа, которые сохраняются вместе с телом
+KEPT_HEADERS = ("content-type", "cache-control", "etag", "last-modified", "content-language", "vary",
+                "timing-allow-origin")
+# ...и все access-control-*: без них шрифты и скрипты с crossorigin с другого домена не пройдут CORS
+KEPT_PREFIXES = ("access-control-",)
+
+MAX_AGE = re.compile(r"max-age=(\d+)")
+
+# Vary, при котором вариант ответа не зависит от сессии: браузер всегда шлет один Accept-Encoding
+SAFE_VARY = {"accept-encoding"}
+
+# Объект без записи младше этого возраста может дописываться другим воркером
+ORPHAN_AGE_S = 60
+
+
+class CachedResponse(NamedTuple):
+    url: str
+    digest: str
+    size: int
+    headers: Dict[str, str]
+    stored_at: float
+
+    @property
+    def etag(self) -> Optional[str]:
+        return self.headers.get("etag")
+
+    @property
+    def last_modified(self) -> Optional[str]:
+        return self.headers.get("last-modified")
+
+    def validators(self) -> Dict[str, str]:
+        """Заголовки условного запроса"""
+        headers = {}
+        if self.etag:
+            headers["if-none-match"] = self.etag
+        if self.last_modified:
+            headers["if-modified-since"] = self.last_modified
+        return headers
+
+    def is_fresh(self, now: Optional[float] = None) -> bool:
+        """max-age еще не истек: ресурс можно отдать без запроса к серверу"""
+        control = self.headers.get("cache-control", "")
+        match = MAX_AGE.search(control)
+        if match is None or "no-cache" in control:
+            return False
+        return (now if now is not None else time.time()) - self.stored_at < int(match.group(1))
+
+
+def _vary(headers: Mapping[str, str]) -> Set[str]:
+    return {name.strip().lower() for name in headers.get("vary", "").split(",") if name.strip()}
+
+
+def cacheable(method: str, status: int, request_headers: Mapping[str, str],
+              response_headers: Mapping[str, str]) -> bool:
+    """Ответ можно класть в общее хранилище (он одинаков для всех тестов)"""
+    control = response_headers.get("cache-control", "")
+    return (
+        method == "GET"
+        and status == 200
+        and "authorization" not in request_headers
+        and "set-cookie" not in response_headers
+        and "no-store" not in control
+        and "private" not in control
+        and _vary(response_headers) <= SAFE_VARY
+        and ("etag" in response_headers or "last-modified" in response_headers or MAX_AGE.search(control) is not None)
+    )
+
+
+def _write_atomic(path: Path, data: bytes) -> None:
+    path.parent.mkdir(parents=True, exist_ok=True)
+    fd, temp = tempfile.mkstemp(dir=path.parent, prefix=".tmp-")
+    with os.fdopen(fd, "wb") as fh:
+        fh.write(data)
+    os.replace(temp, path)
+
+
+class AssetStore:
+    """Хранилище тел ответов (по sha256) и записей URL с вытеснением LRU"""
+
+    def __init__(self, root: Path, max_bytes: int):
+        self.root = Path(root)
+        self.max_bytes = max_bytes
+        self.objects = self.root / "objects"
+        self.entries = self.root / "entries"
+        self.evicted = 0
+        # Оценка размера objects этим процессом: другие воркеры тоже пишут,
+        # поэтому после вытеснения размер пересчитывается с диска
+        self._size: Optional[int] = None
+
+    def _entry_path(self, url: str) -> Path:
+        return self.entries / (hashlib.sha256(url.encode("utf-8")).hexdigest()[:32] + ".json")
+
+    def get(self, url: str) -> Optional[Tuple[CachedResponse, bytes]]:
+        path = self._entry_path(url)
+        try:
+            entry = CachedResponse(**json.loads(path.read_text(encoding="utf-8")))
+            body = (self.objects / entry.digest).read_bytes()
+        except (OSError, ValueError, TypeError):
+            return None  # нет записи, запись повреждена или объект вытеснен другим воркером
+        if entry.url != url:
+            return None
+        os.utime(path)  # последнее использование — для LRU
+        return entry, body
+
+    def put(self, url: str, headers: Mapping[str, str], body: bytes) -> CachedResponse:
+        digest = hashlib.sha256(body).hexdigest()
+        obj = self.objects / digest
+        added = 0
+        if not obj.exists():
+            _write_atomic(obj, body)
+            added = len(body)
+        entry = CachedResponse(url, digest, len(body),
+                               {name: value for name, value in headers.items()
+                                if name in KEPT_HEADERS or name.startswith(KEPT_PREFIXES)}, time.time())
+        _write_atomic(self._entry_path(url), json.dumps(entry._asdict(), ensure_ascii=False).encode("utf-8"))
+        if added:
+            self._grow(added)
+        return entry
+
+    def _grow(self, added: int) -> None:
+        self._size = self.size() if self._size is None else self._size + added
+        if self._size > self.max_bytes:
+            self.evicted += self.evict()
+            self._size = self.size()
+
+    def refresh(self, entry: CachedResponse) -> None:
+        """Сервер подтвердил запись (304): отсчет max-age начинается заново"""
+        refreshed = entry._replace(stored_at=time.time())
+        _write_atomic(self._entry_path(entry.url), json.dumps(refreshed._asdict(), ensure_ascii=False).encode("utf-8"))
+
+    def _listing(self) -> List[Tuple[float, Path, CachedResponse]]:
+        rows = []
+        for path in self.entries.glob("*.json"):
+            try:
+                rows.append((path.stat().st_mtime, path, CachedResponse(**json.loads(path.read_text(encoding="utf-8")))))
+            except (OSError, ValueError, TypeError):
+                continue
+        return sorted(rows, key=lambda row: row[0])
+
+    def size(self) -> int:
+        """Байт в объектах (одинаковое содержимое под разными URL считается один раз)"""
+        return sum(path.stat().st_size for path in self.objects.glob("*") if not path.name.startswith("."))
+
+    def evict(self) -> int:
+        """Удаляет давно не использованные записи, пока хранилище больше лимита; возвращает число записей"""
+        rows = self._listing()
+        sizes = {entry.digest: entry.size for _, _, entry in rows}
+        refs = Counter(entry.digest for _, _, entry in rows)
+        total = sum(sizes.values())
+        removed = 0
+        for _, path, entry in rows:
+            if total <= self.max_bytes:
+                break
+            path.unlink(missing_ok=True)
+            removed += 1
+            refs[entry.digest] -= 1
+            if refs[entry.digest] == 0:
+                (self.objects / entry.digest).unlink(missing_ok=True)
+                total -= sizes[entry.digest]
+        # Объекты без записей (запись перезаписана новым содержимым)
+        stale = time.time() - ORPHAN_AGE_S
+        for path in self.objects.glob("*"):
+            if not path.name.startswith(".") and refs.get(path.name, 0) == 0 and path.stat().st_mtime < stale:
+                path.unlink(missing_ok=True)
+        return removed
+
+
+class HttpCache:
+    """
+    Route-обработчик статики одного теста поверх общего AssetStore.
+    stats: hit — без сети (max-age), revalidated — 304, miss — загружено,
+    bypass — ответ нельзя кэшировать, evicted — записей вытеснено за тест
+    """
+
+    def __init__(self, store: AssetStore):
+        self.store = store
+        self.stats: Counter = Counter()
+        self.saved_bytes = 0
+        self._context: Optional[BrowserContext] = None
+
+    def attach(self, context: BrowserContext) -> None:
+        self._context = context
+        context.route(STATIC, self._handle)
+
+    def detach(self) -> None:
+        """Снимает обработчик (контекст переживает тест в режиме --context-pool)"""
+        if self._context is not None:
+            try:
+                self._context.unroute(STATIC, self._handle)
+            except PlaywrightError:
+                pass  # контекст уже закрыт
+            self._context = None
+
+    def _handle(self, route: Route) -> None:
+        request = route.request
+        if request.method != "GET":
+            route.fallback()
+            return
+        cached = self.store.get(request.url)
+        if cached is not None:
+            entry, body = cached
+            if entry.is_fresh():
+                self._serve(route, entry, body, "hit")
+                return
+            response = route.fetch(headers={**request.headers, **entry.validators()})
+            if response.status == 304:
+                self.store.refresh(entry)
+                self._serve(route, entry, body, "revalidated")
+                return
+        else:
+            response = route.fetch()
+        body = response.body()
+        if cacheable(request.method, response.status, request.headers, response.headers):
+            self.store.put(request.url, response.headers, body)
+            self.stats["miss"] += 1
+        else:
+            self.stats["bypass"] += 1
+        route.fulfill(response=response)
+
+    def _serve(self, route: Route, entry: CachedResponse, body: bytes, kind: str) -> None:
+        self.stats[kind] += 1
+        self.saved_bytes += entry.size
+        route.fulfill(status=200, headers=entry.headers, body=body)
+
+    def summary(self) -> Dict[str, int]:
+        return {**{kind: self.stats[kind] for kind in ("hit", "revalidated", "miss", "bypass")},
+                "saved_bytes": self.saved_bytes, "evicted": self.stats["evicted"]}
+
+
+def hit_rate(summary: Mapping[str, int]) -> float:
+    """Доля запросов статики, тело которых не загружалось по сети"""
+    served = summary.get("hit", 0) + summary.get("revalidated", 0)
+    total = served + summary.get("miss", 0) + summary.get("bypass", 0)
+    return served / total if total else 0.0
@@ -0,0 +1,93 @@
+"""
+instrument.py
+Перехват вызовов синхронного API Playwright (Page, Locator, BrowserContext,
+expect) для подсчета и замера времени.
+
+Методы подменяются только пока есть хотя бы один подписчик, поэтому
+без включенных отчетов накладных расходов нет.
+"""
+
+import functools
+import time
+from typing import Callable, Dict, List, Tuple
+
+from playwright.sync_api import (
+    BrowserContext,
+    ElementHandle,
+    Frame,
+    FrameLocator,
+    Keyboard,
+    Locator,
+    LocatorAssertions,
+    Mouse,
+    Page,
+    PageAssertions,
+)
+
+# (имя вызова "Locator.click", длительность в секундах)
+Listener = Callable[[str, float], None]
+
+INSTRUMENTED_CLASSES = (
+    Page,
+    Frame,
+    Locator,
+    FrameLocator,
+    ElementHandle,
+    BrowserContext,
+    Keyboard,
+    Mouse,
+    PageAssertions,
+    LocatorAssertions,
+)
+
+# Построители локаторов не обращаются к браузеру
+LOCAL_METHODS = {
+    "locator", "frame_locator", "first", "last", "nth", "filter", "and_", "or_",
+    "get_by_alt_text", "get_by_label", "get_by_placeholder", "get_by_role",
+    "get_by_test_id", "get_by_text", "get_by_title", "on", "once",
+    "remove_listener", "is_closed", "expect_event", "expect_navigation",
+}
+
+_listeners: List[Listener] = []
+_originals: Dict[Tuple[type, str], Callable] = {}
+
+
+def _wrap(qualname: str, method: Callable) -> Callable:
+    @functools.wraps(method)
+    def wrapper(*args, **kwargs):
+        started = time.perf_counter()
+        try:
+            return method(*args, **kwargs)
+        finally:
+            elapsed = time.perf_counter() - started
+            for listener in list(_listeners):
+                listener(qualname, elapsed)
+    return wrapper
+
+
+def _patch() -> None:
+    for cls in INSTRUMENTED_CLASSES:
+        for name, member in list(vars(cls).items()):
+            if name.startswith("_") or name in LOCAL_METHODS or not callable(member):
+                continue
+            _originals[(cls, name)] = member
+            setattr(cls, name, _wrap(f"{cls.__name__}.{name}", member))
+
+
+def _unpatch() -> None:
+    for (cls, name), member in _originals.items():
+        setattr(cls, name, member)
+    _originals.clear()
+
+
+def subscribe(listener: Listener) -> None:
+    if not _listeners:
+        _patch()
+    _listeners.append(listener)
+
+
+def unsubscribe(listener: Listener) -> None:
+    if listener in _listeners:
+        _listeners.remove(listener)
+    if not _listeners:
+        _unpatch()
@@ -0,0 +1,192 @@
+"""
+load.py
+Нагрузочный режим для сценария оформления заказа (swaglabs.flows.CHECKOUT_FLOW,
+те же шаги, что в TestCartAndCheckout.test_add_products_and_checkout).
+
+N виртуальных пользователей работают параллельно в одном процессе браузера,
+у каждого свой контекст. Пользователи стартуют равномерно за время разгона,
+между шагами выдерживают паузу (think time), и повторяют сценарий до конца
+прогона. По умолчанию цель — локальный стенд (swaglabs.standin).
+
+    python -m swaglabs.load --users 20 --ramp-up 10 --duration 60 --think-time 1
+    python -m swaglabs.load --base-url https://www.saucedemo.com --users 5 --json reports/load.json
+"""
+
+import argparse
+import asyncio
+import json
+import math
+import random
+import time
+from collections import defaultdict
+from pathlib import Path
+from typing import Dict, List, NamedTuple, Optional
+
+from playwright.async_api import Browser
+from playwright.async_api import Error as PlaywrightError
+from playwright.async_api import async_playwright
+
+from swaglabs import settings
+from swaglabs.auth import INVENTORY_URL
+from swaglabs.flows import CHECKOUT_FLOW, OPEN_INVENTORY, random_customer, run_step_async
+from swaglabs.standin import StandIn
+
+SCENARIO = (OPEN_INVENTORY,) + CHECKOUT_FLOW
+
+
+class LoadProfile(NamedTuple):
+    users: int = 10
+    ramp_up: float = 0.0     # секунды до старта последнего пользователя
+    duration: float = 30.0   # секунды полной нагрузки после разгона
+    think_time: float = 0.0  # средняя пауза между шагами, секунды (±50%)
+
+
+def percentile(values: List[float], q: float) -> float:
+    """Перцентиль по ближайшему рангу (q от 0 до 100)"""
+    ordered = sorted(values)
+    return ordered[max(0, math.ceil(q / 100 * len(ordered)) - 1)]
+
+
+class LoadResult:
+    """Замеры прогона: время шагов, ошибки и число оформленных заказов"""
+
+    def __init__(self):
+        self.latencies: Dict[str, List[float]] = defaultdict(list)
+        self.errors: Dict[str, int] = defaultdict(int)
+        self.checkouts = 0
+        self.elapsed = 0.0
+
+    @property
+    def throughput(self) -> float:
+        return self.checkouts / self.elapsed if self.elapsed else 0.0
+
+    def summary(self) -> Dict:
+        steps = {}
+        for flow_step in SCENARIO:
+            samples = self.latencies.get(flow_step.name, [])
+            steps[flow_step.name] = {
+                "count": len(samples),
+                "errors": self.errors.get(flow_step.name, 0),
+                **{
+                    f"p{q}_ms": round(percentile(samples, q), 1) if samples else None
+                    for q in (50, 95, 99)
+                },
+            }
+        return {
+            "checkouts": self.checkouts,
+            "elapsed_s": round(self.elapsed, 2),
+            "checkouts_per_s": round(self.throughput, 3),
+            "steps": steps,
+        }
+
+
+async def login_state(browser: Browser, base_url: str, username: str, password: str) -> Dict:
+    """Один логин через UI на весь прогон, дальше пользователи стартуют с storage_state"""
+    context = await browser.new_context()
+    try:
+        page = await context.new_page()
+        await page.goto(base_url)
+        await page.locator("#user-name").fill(username)
+        await page.locator("#password").fill(password)
+        await page.locator("#login-button").click()
+        await page.wait_for_url(INVENTORY_URL)
+        return await context.storage_state()
+    finally:
+        await context.close()
+
+
+async def virtual_user(index: int, browser: Browser, state: Dict, base_url: str,
+                       profile: LoadProfile, result: LoadResult, deadline: float) -> None:
+    await asyncio.sleep(index * profile.ramp_up / profile.users)
+    context = page = None
+    while time.perf_counter() < deadline:
+        if context is None:
+            context = await browser.new_context(storage_state=state)
+            page = await context.new_page()
+        customer = random_customer()
+        current = SCENARIO[0].name
+        try:
+            for flow_step in SCENARIO:
+                current = flow_step.name
+                started = time.perf_counter()
+                await run_step_async(page, flow_step, customer, base_url)
+                result.latencies[flow_step.name].append((time.perf_counter() - started) * 1000)
+                if profile.think_time:
+                    await asyncio.sleep(profile.think_time * random.uniform(0.5, 1.5))
+            result.checkouts += 1
+        except (PlaywrightError, AssertionError):
+            result.errors[current] += 1
+            # Состояние корзины после сбоя неизвестно: следующий заход с чистого контекста
+            await context.close()
+            context = None
+    if context is not None:
+        await context.close()
+
+
+async def run_load(base_url: str, profile: LoadProfile, browser_name: str = "chromium",
+                   headless: bool = True) -> LoadResult:
+    result = LoadResult()
+    async with async_playwright() as playwright:
+        browser = await playwright[browser_name].launch(headless=headless)
+        try:
+            state = await login_state(browser, base_url, settings.VALID_USERNAME, settings.VALID_PASSWORD)
+            started = time.perf_counter()
+            deadline = started + profile.ramp_up + profile.duration
+            await asyncio.gather(*(
+                virtual_user(index, browser, state, base_url, profile, result, deadline)
+                for index in range(profile.users)
+            ))
+            result.elapsed = time.perf_counter() - started
+        finally:
+            await browser.close()
+    return result
+
+
+def print_report(result: LoadResult, profile: LoadProfile) -> None:
+    summary = result.summary()
+    print(f"\nОформлено заказов: {summary['checkouts']} за {summary['elapsed_s']:.1f} с "
+          f"→ {summary['checkouts_per_s']:.2f} заказов/с ({profile.users} пользователей)")
+    print(f"{'шаг':<36} | {'n':>6} | {'ошибки':>6} | {'p50, мс':>9} | {'p95, мс':>9} | {'p99, мс':>9}")
+    for name, row in summary["steps"].items():
+        cells = [f"{row[key]:>9.1f}" if row[key] is not None else f"{'—':>9}" for key in ("p50_ms", "p95_ms", "p99_ms")]
+        print(f"{name:<36} | {row['count']:>6} | {row['errors']:>6} | " + " | ".join(cells))
+
+
+def main() -> None:
+    parser = argparse.ArgumentParser(description="Нагрузочный прогон сценария оформления заказа")
+    parser.add_argument("--users", type=int, default=LoadProfile.users)
+    parser.add_argument("--ramp-up", type=float, default=LoadProfile.ramp_up, help="секунды")
+    parser.add_argument("--duration", type=float, default=LoadProfile.duration, help="секунды после разгона")
+    parser.add_argument("--think-time", type=float, default=LoadProfile.think_time, help="секунды между шагами")
+    parser.add_argument("--base-url", help="цель нагрузки (по умолчанию локальный стенд)")
+    parser.add_argument("--browser", default="chromium", choices=["chromium", "firefox", "webkit"])
+    parser.add_argument("--headed", action="store_true")
+    parser.add_argument("--json", type=Path, help="сохранить сводку в JSON")
+    args = parser.parse_args()
+
+    profile = LoadProfile(args.users, args.ramp_up, args.duration, args.think_time)
+    stand_in: Optional[StandIn] = None
+    base_url = args.base_url
+    if base_url is None:
+        stand_in = StandIn(catalog_size=settings.STAND_IN_CATALOG_SIZE).start()
+        base_url = stand_in.url
+    base_url = base_url.rstrip("/") + "/"
+
+    print(f"🚀 Нагрузка: {profile.users} пользователей, разгон {profile.ramp_up:g} с, "
+          f"длительность {profile.duration:g} с, пауза {profile.think_time:g} с → {base_url}")
+    try:
+        result = asyncio.run(run_load(base_url, profile, args.browser, headless=not args.headed))
+    finally:
+        if stand_in is not None:
+            stand_in.stop()
+
+    print_report(result, profile)
+    if args.json:
+        args.json.parent.mkdir(parents=True, exist_ok=True)
+        payload = {"base_url": base_url, "browser": args.browser, "profile": profile._asdict(), **result.summary()}
+        args.json.write_text(json.dumps(payload, ensure_ascii=False, indent=2), encoding="utf-8")
+        print(f"Сводка: {args.json}")
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,146 @@
+"""
+matrix.py
+Матрица браузеров в одном прогоне: один браузер на движок в каждом
+процессе (воркере), запущенный в начале и живущий до конца сессии, и
+сводка результатов и длительностей по браузерам.
+
+pytest-playwright параметризует тесты по browser_name и закрывает
+браузер, когда следующему тесту нужен другой движок. BrowserMatrix
+держит все браузеры открытыми, поэтому пары (тест, браузер) можно
+раздавать воркерам в любом порядке без повторных запусков.
+
+Session-фикстуры, зависящие от browser (сессия входа, пул контекстов),
+pytest тоже пересоздает при каждой смене движка. Они берут свои объекты
+из BrowserMatrix.resource: один на движок в процессе, закрываются
+вместе с матрицей.
+"""
+
+import statistics
+import time
+from typing import Any, Callable, Dict, Iterable, List, NamedTuple, Optional, Sequence, Tuple
+
+from playwright.sync_api import Browser, Playwright
+from playwright.sync_api import Error as PlaywrightError
+
+ENGINES = ("chromium", "firefox", "webkit")
+
+
+def parse_engines(value: str) -> List[str]:
+    """'chromium, firefox' → ['chromium', 'firefox']; 'all' — все движки"""
+    names = [name.strip() for name in value.split(",") if name.strip()]
+    if names == ["all"]:
+        return list(ENGINES)
+    unknown = [name for name in names if name not in ENGINES]
+    if unknown:
+        raise ValueError(f"неизвестные браузеры: {', '.join(unknown)} (есть: {', '.join(ENGINES)}, all)")
+    return list(dict.fromkeys(names))
+
+
+class BrowserMatrix:
+    """Браузеры всех движков матрицы одного процесса"""
+
+    def __init__(self, playwright: Playwright, engines: Sequence[str], launch_args: Optional[Dict] = None):
+        self.playwright = playwright
+        self.engines = list(engines)
+        self.launch_args = dict(launch_args or {})
+        self.browsers: Dict[str, Browser] = {}
+        self.launch_ms: Dict[str, float] = {}
+        self.resources: Dict[Tuple[str, str], Any] = {}
+        self._closers: List[Callable[[], None]] = []
+
+    def start(self) -> "BrowserMatrix":
+        for engine in self.engines:
+            started = time.perf_counter()
+            self.browsers[engine] = getattr(self.playwright, engine).launch(**self.launch_args)
+            self.launch_ms[engine] = (time.perf_counter() - started) * 1000
+        return self
+
+    def __getitem__(self, engine: str) -> Browser:
+        if engine not in self.browsers:
+            raise KeyError(f"браузер {engine} не входит в матрицу ({', '.join(self.engines)})")
+        return self.browsers[engine]
+
+    def resource(self, engine: str, name: str, factory: Callable[[], Any],
+                 close: Optional[Callable[[Any], None]] = None) -> Any:
+        """Объект name для движка engine: создается factory один раз, close вызывается в close()"""
+        key = (engine, name)
+        if key not in self.resources:
+            value = self.resources[key] = factory()
+            if close is not None:
+                self._closers.append(lambda: close(value))
+        return self.resources[key]
+
+    def close(self) -> None:
+        # Пулы контекстов и т.п. закрываются раньше своих браузеров
+        for closer in reversed(self._closers):
+            closer()
+        self._closers = []
+        self.resources = {}
+        for browser in self.browsers.values():
+            try:
+                browser.close()
+            except PlaywrightError:
+                pass  # браузер уже упал или закрыт
+        self.browsers = {}
+
+
+class MatrixResult(NamedTuple):
+    nodeid: str
+    browser: str
+    outcome: str        # passed, failed, skipped
+    duration: float     # setup + call + teardown, с
+
+
+class BrowserSummary(NamedTuple):
+    browser: str
+    tests: int
+    passed: int
+    failed: int
+    skipped: int
+    total_s: float
+    median_s: float
+
+    def describe(self) -> str:
+        mark = "❌" if self.failed else "✅"
+        return (f"{mark} {self.browser:<8} {self.tests:>4} тестов: {self.passed} прошло, {self.failed} упало, "
+                f"{self.skipped} пропущено | {self.total_s:.1f} с всего, медиана {self.median_s:.2f} с")
+
+
+def base_nodeid(nodeid: str, browser: str) -> str:
+    """nodeid без браузера в параметрах: test[chromium] → test, test[chromium-az] → test[az]"""
+    if "[" not in nodeid or not nodeid.endswith("]"):
+        return nodeid
+    base, params = nodeid[:-1].split("[", 1)
+    rest = [part for part in params.split("-") if part != browser]
+    return f"{base}[{'-'.join(rest)}]" if rest else base
+
+
+def summarize(results: Iterable[MatrixResult]) -> List[BrowserSummary]:
+    by_browser: Dict[str, List[MatrixResult]] = {}
+    for result in results:
+        by_browser.setdefault(result.browser, []).append(result)
+    summaries = []
+    for browser, rows in by_browser.items():
+        durations = [row.duration for row in rows if row.outcome != "skipped"]
+        summaries.append(BrowserSummary(
+            browser,
+            len(rows),
+            sum(row.outcome == "passed" for row in rows),
+            sum(row.outcome == "failed" for row in rows),
+            sum(row.outcome == "skipped" for row in rows),
+            sum(durations),
+            statistics.median(durations) if durations else 0.0,
+        ))
+    order = {engine: index for index, engine in enumerate(ENGINES)}
+    return sorted(summaries, key=lambda summary: order.get(summary.browser, len(order)))
+
+
+def widest_gaps(results: Iterable[MatrixResult], top: int = 5) -> List[Dict]:
+    """Тесты с самой большой разницей длительности между браузерами"""
+    durations: Dict[str, Dict[str, float]] = {}
+    for result in results:
+        if result.outcome == "passed":
+            durations.setdefault(base_nodeid(result.nodeid, result.browser), {})[result.browser] = result.duration
+    rows = [{"test": name, "durations": by_browser, "gap": max(by_browser.values()) - min(by_browser.values())}
+            for name, by_browser in durations.items() if len(by_browser) > 1]
+    return sorted(rows, key=lambda row: row["gap"], reverse=True)[:top]
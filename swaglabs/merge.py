@@ -0,0 +1,120 @@
+"""
+merge.py
+Сборка отчетов шардов (--shard i/N) в один отчет:
+
+    python -m swaglabs.merge --out reports/merged \\
+        --junit shard-*/junit.xml \\
+        --json shard-*/report.json \\
+        --steps shard-*/steps/*.jsonl \\
+        --durations shard-*/durations.json
+
+JUnit: все testsuite шардов в одном testsuites с общими счетчиками.
+JSON: списки tests объединяются, числовые счетчики summary складываются.
+JSONL (замеры шагов, метрики страниц): строки склеиваются.
+История длительности: для каждого теста берутся самые свежие замеры среди шардов.
+"""
+
+import argparse
+import json
+import xml.etree.ElementTree as ET
+from pathlib import Path
+from typing import Dict, List, Sequence
+
+from swaglabs.durations import DurationHistory
+
+COUNTERS = ("tests", "failures", "errors", "skipped")
+
+
+def merge_junit(paths: Sequence[Path]) -> ET.ElementTree:
+    merged = ET.Element("testsuites")
+    totals = {counter: 0 for counter in COUNTERS}
+    total_time = 0.0
+    for path in paths:
+        root = ET.parse(path).getroot()
+        suites = [root] if root.tag == "testsuite" else root.findall("testsuite")
+        for suite in suites:
+            suite.set("name", f"{suite.get('name', 'pytest')} ({path.parent.name or path.stem})")
+            for counter in COUNTERS:
+                totals[counter] += int(suite.get(counter, 0))
+            total_time += float(suite.get("time", 0))
+            merged.append(suite)
+    for counter, value in totals.items():
+        merged.set(counter, str(value))
+    merged.set("time", f"{total_time:.3f}")
+    return ET.ElementTree(merged)
+
+
+def merge_json(paths: Sequence[Path]) -> Dict:
+    merged: Dict = {"shards": [str(path) for path in paths], "tests": [], "summary": {}}
+    durations: List[float] = []
+    for path in paths:
+        data = json.loads(path.read_text(encoding="utf-8"))
+        merged["tests"].extend(data.get("tests", []))
+        for key, value in data.get("summary", {}).items():
+            if isinstance(value, (int, float)) and not isinstance(value, bool):
+                merged["summary"][key] = merged["summary"].get(key, 0) + value
+        if isinstance(data.get("duration"), (int, float)):
+            durations.append(data["duration"])
+    if durations:
+        # Шарды идут параллельно: общее время — самый долгий шард
+        merged["duration"] = max(durations)
+    return merged
+
+
+def merge_jsonl(paths: Sequence[Path], out: Path) -> int:
+    lines = 0
+    out.parent.mkdir(parents=True, exist_ok=True)
+    with out.open("w", encoding="utf-8") as fh:
+        for path in paths:
+            for line in path.read_text(encoding="utf-8").splitlines():
+                if line.strip():
+                    fh.write(line + "\n")
+                    lines += 1
+    return lines
+
+
+def merge_durations(paths: Sequence[Path], out: Path) -> DurationHistory:
+    merged = DurationHistory(out)
+    merged.samples.clear()
+    merged.updated.clear()
+    # У всех шардов общая история из кэша, а свежие замеры теста есть только у шарда, который его запускал
+    for path in paths:
+        merged.update_from(DurationHistory(path))
+    merged.save()
+    return merged
+
+
+def main(argv: Sequence[str] = None) -> None:
+    parser = argparse.ArgumentParser(description="Сборка отчетов шардов в один отчет")
+    parser.add_argument("--out", type=Path, default=Path("reports/merged"), help="каталог для общих отчетов")
+    parser.add_argument("--junit", type=Path, nargs="*", default=[], help="junit.xml шардов")
+    parser.add_argument("--json", type=Path, nargs="*", default=[], help="JSON-отчеты шардов")
+    parser.add_argument("--steps", type=Path, nargs="*", default=[], help="JSONL с замерами шагов")
+    parser.add_argument("--perf", type=Path, nargs="*", default=[], help="JSONL с метриками страниц")
+    parser.add_argument("--durations", type=Path, nargs="*", default=[], help="истории длительности шардов")
+    args = parser.parse_args(argv)
+
+    args.out.mkdir(parents=True, exist_ok=True)
+    if args.junit:
+        tree = merge_junit(args.junit)
+        tree.write(args.out / "junit.xml", encoding="utf-8", xml_declaration=True)
+        root = tree.getroot()
+        print(f"✅ JUnit: {len(args.junit)} шардов, тестов {root.get('tests')}, "
+              f"падений {root.get('failures')}, ошибок {root.get('errors')} → {args.out / 'junit.xml'}")
+    if args.json:
+        merged = merge_json(args.json)
+        (args.out / "report.json").write_text(json.dumps(merged, ensure_ascii=False, indent=2), encoding="utf-8")
+        print(f"✅ JSON: тестов {len(merged['tests'])} → {args.out / 'report.json'}")
+    if args.steps:
+        lines = merge_jsonl(args.steps, args.out / "steps.jsonl")
+        print(f"✅ Замеры шагов: {lines} → {args.out / 'steps.jsonl'}")
+    if args.perf:
+        lines = merge_jsonl(args.perf, args.out / "perf.jsonl")
+        print(f"✅ Метрики страниц: {lines} → {args.out / 'perf.jsonl'}")
+    if args.durations:
+        history = merge_durations(args.durations, args.out / "durations.json")
+        print(f"✅ История длительности: {len(history.samples)} тестов → {history.path}")
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,165 @@
+"""
+perf.py
+Метрики производительности страницы (Navigation Timing, paint, long tasks,
+ресурсы) и бюджеты на них.
+
+Бюджеты задаются в pytest.ini, по строке на страницу:
+
+    perf_budgets =
+        inventory.html  fcp=1800 load=3000 long_tasks_ms=200 transfer_kb=1500
+        cart.html       long_tasks_ms=100 requests=20
+
+Saucedemo — SPA, поэтому переход inventory → cart не перезагружает документ.
+Для таких "мягких" переходов метрики навигации и отрисовки не имеют смысла
+(они относятся к первой загрузке) и возвращаются как None, а long tasks
+и ресурсы считаются с момента предыдущего замера в этом документе
+(или с начала его загрузки).
+"""
+
+import warnings
+from typing import Dict, List, Optional
+from urllib.parse import urlsplit
+
+from playwright.sync_api import BrowserContext, Page
+
+# Метрика → единица измерения (для сообщений и отчета)
+METRICS = {
+    "ttfb": "мс",
+    "dom_content_loaded": "мс",
+    "load": "мс",
+    "fp": "мс",
+    "fcp": "мс",
+    "long_tasks": "шт",
+    "long_tasks_ms": "мс",
+    "requests": "шт",
+    "transfer_kb": "КБ",
+}
+
+# Long tasks не попадают в буфер performance, их нужно слушать с начала загрузки
+LONG_TASKS_INIT_JS = """
+(() => {
+    // В контексте из пула скрипт может быть добавлен несколько раз
+    if (window.__swaglabsLongTasks !== undefined) return;
+    const supported = (PerformanceObserver.supportedEntryTypes || []).includes('longtask');
+    window.__swaglabsLongTasks = supported ? [] : null;
+    if (!supported) return;
+    new PerformanceObserver(list => {
+        for (const entry of list.getEntries()) {
+            window.__swaglabsLongTasks.push({ startTime: entry.startTime, duration: entry.duration });
+        }
+    }).observe({ type: 'longtask', buffered: true });
+})();
+"""
+
+PAGE_METRICS_JS = """
+() => {
+    const since = window.__swaglabsMetricsMark || 0;
+    window.__swaglabsMetricsMark = performance.now();
+    const round = value => value == null ? null : Math.round(value * 10) / 10;
+
+    const [nav] = performance.getEntriesByType('navigation');
+    // После pushState запись навигации остается от документа, с которого начали
+    const fresh = since === 0 && nav !== undefined && nav.name === location.href;
+    const paint = {};
+    for (const entry of performance.getEntriesByType('paint')) paint[entry.name] = entry.startTime;
+    const resources = performance.getEntriesByType('resource').filter(entry => entry.startTime >= since);
+    const tasks = window.__swaglabsLongTasks
+        ? window.__swaglabsLongTasks.filter(task => task.startTime >= since)
+        : null;
+
+    return {
+        url: location.href,
+        soft_navigation: !fresh,
+        ttfb: fresh ? round(nav.responseStart - nav.startTime) : null,
+        dom_content_loaded: fresh ? round(nav.domContentLoadedEventEnd - nav.startTime) : null,
+        load: fresh && nav.loadEventEnd ? round(nav.loadEventEnd - nav.startTime) : null,
+        fp: fresh ? round(paint['first-paint']) : null,
+        fcp: fresh ? round(paint['first-contentful-paint']) : null,
+        long_tasks: tasks ? tasks.length : null,
+        long_tasks_ms: tasks ? round(tasks.reduce((sum, task) => sum + task.duration, 0)) : null,
+        requests: resources.length,
+        transfer_kb: round(resources.reduce((sum, entry) => sum + (entry.transferSize || 0), 0) / 1024),
+    };
+}
+"""
+
+
+class PerfBudgetWarning(UserWarning):
+    """Страница превысила бюджет (режим warn)"""
+
+
+def parse_budgets(lines: List[str]) -> Dict[str, Dict[str, float]]:
+    """Разбирает строки "<страница> <метрика>=<порог> ..." из pytest.ini"""
+    budgets: Dict[str, Dict[str, float]] = {}
+    for line in lines:
+        line = line.split("#", 1)[0].strip()
+        if not line:
+            continue
+        name, *limits = line.split()
+        budget = budgets.setdefault(name, {})
+        for limit in limits:
+            metric, sep, value = limit.partition("=")
+            if not sep or metric not in METRICS:
+                raise ValueError(f"perf_budgets: непонятный бюджет {limit!r} для {name} "
+                                 f"(метрики: {', '.join(METRICS)})")
+            try:
+                budget[metric] = float(value)
+            except ValueError:
+                raise ValueError(f"perf_budgets: порог {limit!r} для {name} должен быть числом") from None
+    return budgets
+
+
+def check_budget(metrics: Dict, budget: Dict[str, float]) -> List[str]:
+    """Список превышений; метрики, которые не удалось измерить (None), не проверяются"""
+    violations = []
+    for metric, limit in budget.items():
+        value = metrics.get(metric)
+        if value is not None and value > limit:
+            violations.append(f"{metric}: {value:g} {METRICS[metric]} > {limit:g} {METRICS[metric]}")
+    return violations
+
+
+def page_name(url: str) -> str:
+    """inventory.html, cart.html, ...; корень сайта — index.html"""
+    return urlsplit(url).path.rstrip("/").rsplit("/", 1)[-1] or "index.html"
+
+
+class PageMetrics:
+    """
+    Замеры страниц одного теста.
+
+    Пока сбор выключен (enabled=False), attach() и capture() ничего не делают,
+    поэтому вызовы capture() можно оставлять в тестах.
+    """
+
+    def __init__(self, nodeid: str, budgets: Dict[str, Dict[str, float]], mode: str = "warn",
+                 enabled: bool = True, tags: Optional[Dict] = None):
+        self.nodeid = nodeid
+        self.budgets = budgets
+        self.mode = mode
+        self.enabled = enabled
+        self.tags = dict(tags or {})
+        self.records: List[Dict] = []
+
+    @property
+    def violations(self) -> List[str]:
+        return [f"{record['page']}: {violation}" for record in self.records for violation in record["violations"]]
+
+    def attach(self, context: BrowserContext) -> None:
+        if self.enabled:
+            context.add_init_script(LONG_TASKS_INIT_JS)
+
+    def capture(self, page: Page, name: Optional[str] = None) -> Optional[Dict]:
+        """Снимает метрики текущей страницы и сверяет их с бюджетом"""
+        if not self.enabled:
+            return None
+        # loadEventEnd заполняется только после события load
+        page.wait_for_load_state("load")
+        metrics = page.evaluate(PAGE_METRICS_JS)
+        name = name or page_name(metrics["url"])
+        violations = check_budget(metrics, self.budgets.get(name, {}))
+        record = {"nodeid": self.nodeid, "page": name, **metrics, "violations": violations, **self.tags}
+        self.records.append(record)
+        if violations and self.mode == "warn":
+            warnings.warn(PerfBudgetWarning(f"{name} превышает бюджет: {'; '.join(violations)}"), stacklevel=2)
+        return record
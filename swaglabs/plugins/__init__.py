@@ -0,0 +1,3 @@
+"""
+Плагины pytest для автотестов Swag Labs (подключаются в tests/conftest.py)
+"""
@@ -0,0 +1,258 @@
+"""
+aio.py
+Плагин pytest: async-тесты (async def test_...) выполняются одновременно
+в одном цикле событий на воркер, каждый в своем контексте браузера
+(см. swaglabs.aio). Синхронные тесты идут как обычно.
+
+Async-копии сценариев (tests/*_async.py) повторяют синхронные тесты,
+поэтому по умолчанию не выбираются: включаются --async-suite.
+
+    pytest tests/ --async-suite -k async --async-concurrency 8
+    pytest tests/ --async-suite -k async -n 4      # 4 воркера, в каждом до --async-concurrency тестов
+
+Тест с маркером serial выполняется один в своем воркере: перед ним
+дожидаемся всех запущенных async-тестов, и пока он идет, новые не стартуют.
+В конце печатается сумма длительностей async-тестов рядом с фактическим
+временем их выполнения — это и есть выигрыш от одновременного запуска.
+Вывод print из async-тестов к отчету теста не привязывается (смотрите с -s).
+
+Ограничения. Async-тест выполняется не через фикстуры pytest: ему доступны
+только async_browser, async_context, async_page (swaglabs.aio) и параметры.
+Фикстуры conftest и плагинов — шаги (--step-timings), метрики страниц,
+блокировка ресурсов, HTTP-кэш, auth_session — к нему не применяются (о
+пропущенных autouse-фикстурах предупреждаем при сборе), поэтому его время
+с синхронным тестом напрямую не сравнить. Под xdist отчеты публикуются
+через внутреннее состояние воркера (WorkerInteractor.item_index):
+проверено с pytest-xdist 3.x, с другими версиями прогон останавливается.
+"""
+
+import inspect
+import os
+import queue
+import warnings
+from concurrent.futures import Future
+from importlib import metadata
+from typing import List, Tuple
+
+import pytest
+
+from swaglabs import settings
+from swaglabs.aio import ASYNC_FIXTURES, AsyncBrowserSession, EventLoopThread, Phase, busy_time, run_test
+from swaglabs.seeding import seeded_state
+
+runner_key = pytest.StashKey["ConcurrentRunner"]()
+
+# Версии pytest-xdist, у которых воркер сверяет отчеты по item_index (см. ConcurrentRunner._report)
+XDIST_MAJOR_VERSIONS = (3,)
+
+
+def pytest_addoption(parser):
+    parser.addoption(
+        "--async-suite",
+        action="store_true",
+        default=os.getenv("SWAG_ASYNC_SUITE", "").lower() in ("1", "true", "yes", "on"),
+        help="выполнять и async-копии сценариев (по умолчанию только синхронные тесты)",
+    )
+    parser.addoption(
+        "--async-concurrency",
+        type=int,
+        default=int(os.getenv("SWAG_ASYNC_CONCURRENCY", "4")),
+        help="сколько async-тестов выполнять одновременно в одном воркере (1 — по очереди)",
+    )
+
+
+def pytest_configure(config):
+    config.addinivalue_line(
+        "markers",
+        "serial: async-тест выполняется один, без других async-тестов параллельно",
+    )
+    if config.getoption("--async-concurrency") < 1:
+        raise pytest.UsageError("--async-concurrency: ожидается число от 1")
+    if config.getoption("--async-suite") and (hasattr(config, "workerinput")
+                                              or config.getoption("dist", "no") != "no"):
+        check_xdist_version()
+    if not hasattr(config, "workerinput"):
+        config.pluginmanager.register(AsyncSummary(), "swaglabs-aio-summary")
+
+
+def check_xdist_version() -> None:
+    version = metadata.version("pytest-xdist")
+    major = version.split(".", 1)[0]
+    if not major.isdigit() or int(major) not in XDIST_MAJOR_VERSIONS:
+        raise pytest.UsageError(
+            f"--async-suite с -n: pytest-xdist {version} не проверен (поддерживаются "
+            f"{', '.join(f'{v}.x' for v in XDIST_MAJOR_VERSIONS)}); запустите async-тесты без -n"
+        )
+
+
+def is_async_test(item) -> bool:
+    return isinstance(item, pytest.Function) and inspect.iscoroutinefunction(item.obj)
+
+
+def pytest_collection_modifyitems(config, items):
+    if config.getoption("--async-suite"):
+        _warn_unapplied_fixtures(items)
+        return
+    # Без --async-suite каждый сценарий выполнялся бы дважды
+    deselected = [item for item in items if is_async_test(item)]
+    if deselected:
+        config.hook.pytest_deselected(items=deselected)
+        items[:] = [item for item in items if not is_async_test(item)]
+
+
+def _warn_unapplied_fixtures(items) -> None:
+    """Одно предупреждение о фикстурах, которые async-тесты не получат"""
+    unapplied = set()
+    for item in items:
+        if is_async_test(item):
+            params = item.callspec.params if hasattr(item, "callspec") else {}
+            unapplied.update(name for name in item.fixturenames
+                             if name not in ASYNC_FIXTURES and name not in params
+                             and name not in ("request", "pytestconfig"))
+    if unapplied:
+        warnings.warn(pytest.PytestWarning(
+            "async-тесты выполняются без фикстур pytest, к ним не применяются: " + ", ".join(sorted(unapplied))
+        ))
+
+
+@pytest.hookimpl(tryfirst=True)
+def pytest_runtest_protocol(item, nextitem):
+    if not is_async_test(item):
+        return None
+    runner = item.config.stash.get(runner_key, None)
+    if runner is None:
+        runner = item.config.stash[runner_key] = ConcurrentRunner(item.config)
+    runner.schedule(item)
+    return True
+
+
+@pytest.hookimpl(hookwrapper=True)
+def pytest_runtestloop(session):
+    yield
+    runner = session.config.stash.get(runner_key, None)
+    if runner is not None:
+        try:
+            runner.drain(0)
+        finally:
+            runner.close()
+
+
+def worker_interactor(config):
+    """WorkerInteractor из pytest-xdist, если это воркер"""
+    if not hasattr(config, "workerinput"):
+        return None
+    for plugin in config.pluginmanager.get_plugins():
+        if type(plugin).__name__ == "WorkerInteractor":
+            return plugin
+    return None
+
+
+class ConcurrentRunner:
+    """
+    Отдает async-тесты в цикл событий, пока запущено меньше limit, и
+    публикует их отчеты в основном потоке по мере завершения
+    (pytest_runtest_logstart/logreport/logfinish, как при обычном запуске).
+    """
+
+    def __init__(self, config):
+        self.limit = config.getoption("--async-concurrency")
+        launch_args = {"headless": not config.getoption("--headed")}
+        if config.getoption("--browser-channel"):
+            launch_args["channel"] = config.getoption("--browser-channel")
+        if config.getoption("--slowmo"):
+            launch_args["slow_mo"] = config.getoption("--slowmo")
+        # Для async-тестов браузер один: первый из --browser
+        browser_name = (config.getoption("--browser") or ["chromium"])[0]
+        self.session = AsyncBrowserSession(browser_name, launch_args, settings.CONTEXT_ARGS)
+        self.thread = EventLoopThread()
+        self.done: "queue.Queue[Tuple[pytest.Item, Future]]" = queue.Queue()
+        self.in_flight = 0
+        self.worker = worker_interactor(config)
+
+    def schedule(self, item) -> None:
+        serial = item.get_closest_marker("serial") is not None
+        self.drain(0 if serial else self.limit - 1)
+
+        seeded = item.get_closest_marker("seeded")
+        storage_state = None
+        if seeded is not None:
+            storage_state = seeded_state(settings.BASE_URL, settings.VALID_USERNAME, seeded.kwargs.get("cart", ()))
+        authenticated = seeded is None and item.get_closest_marker("authenticated") is not None
+
+        params = item.callspec.params if hasattr(item, "callspec") else {}
+        future = self.thread.submit(run_test(self.session, item.obj, item._fixtureinfo.argnames, params,
+                                             storage_state, authenticated))
+        future.add_done_callback(lambda finished: self.done.put((item, finished)))
+        self.in_flight += 1
+
+        if serial:
+            self.drain(0)
+        else:
+            while not self.done.empty():
+                self._report(*self.done.get())
+
+    def drain(self, limit: int) -> None:
+        """Публикует завершившиеся тесты, пока выполняется больше limit"""
+        while self.in_flight > limit:
+            self._report(*self.done.get())
+
+    def _report(self, item, future: Future) -> None:
+        self.in_flight -= 1
+        phases: List[Phase] = future.result()
+        if self.worker is None:
+            self._publish(item, phases)
+            return
+        # Воркер xdist сверяет отчет с тестом, который он сейчас выполняет
+        # (внутреннее состояние WorkerInteractor, версия проверена в pytest_configure)
+        if not hasattr(self.worker, "item_index"):
+            raise RuntimeError("pytest-xdist: у WorkerInteractor нет item_index, "
+                               "отчеты async-тестов не опубликовать; запустите их без -n")
+        current = self.worker.item_index
+        self.worker.item_index = item.session.items.index(item)
+        try:
+            self._publish(item, phases)
+        finally:
+            self.worker.item_index = current
+
+    def _publish(self, item, phases: List[Phase]) -> None:
+        ihook = item.ihook
+        ihook.pytest_runtest_logstart(nodeid=item.nodeid, location=item.location)
+        for phase in phases:
+            if phase.when == "teardown":
+                item.user_properties.append(("async_span", (phases[0].start, phase.stop)))
+            excinfo = pytest.ExceptionInfo.from_exception(phase.error) if phase.error is not None else None
+            call = pytest.CallInfo(None, excinfo, start=phase.start, stop=phase.stop, duration=phase.duration,
+                                   when=phase.when, _ispytest=True)
+            ihook.pytest_runtest_logreport(report=ihook.pytest_runtest_makereport(item=item, call=call))
+        ihook.pytest_runtest_logfinish(nodeid=item.nodeid, location=item.location)
+
+    def close(self) -> None:
+        try:
+            self.thread.submit(self.session.close()).result()
+        finally:
+            self.thread.close()
+
+
+class AsyncSummary:
+    """Сумма длительностей async-тестов и фактическое время, когда шел хотя бы один"""
+
+    def __init__(self):
+        self.spans: List[Tuple[float, float]] = []
+
+    def pytest_runtest_logreport(self, report):
+        if report.when != "teardown":
+            return
+        span = dict(report.user_properties).get("async_span")
+        if span is not None:
+            self.spans.append(tuple(span))
+
+    def pytest_terminal_summary(self, terminalreporter, config):
+        if not self.spans:
+            return
+        total = sum(stop - start for start, stop in self.spans)
+        wall = busy_time(self.spans)
+        terminalreporter.write_sep("-", f"async-тесты (до {config.getoption('--async-concurrency')} одновременно на воркер)")
+        terminalreporter.write_line(
+            f"тестов: {len(self.spans)}, сумма длительностей: {total:.1f} с, "
+            f"фактически: {wall:.1f} с, выигрыш: ×{total / wall if wall else 1:.1f}"
+        )
@@ -0,0 +1,132 @@
+"""
+artifacts.py
+Плагин pytest: трассировка каждого теста чанками, на диске остаются
+только артефакты упавших и нестабильных тестов (--failure-artifacts,
+см. swaglabs.artifacts).
+
+    pytest tests/ --failure-artifacts
+    pytest tests/ --failure-artifacts --artifacts-dir shard/artifacts --artifacts-max-mb 200
+
+Артефакты прогона лежат в <artifacts-dir>/<run_id>/<тест>/ (trace.zip
+открывается в playwright show-trace). В конце прогона каталог
+ужимается до --artifacts-max-mb за счет самых старых прогонов.
+"""
+
+import os
+from pathlib import Path
+from typing import Dict, List, Set
+
+import pytest
+
+from swaglabs import settings
+from swaglabs.artifacts import ChunkedTrace, artifact_dir, directory_size, enforce_size_cap
+
+
+def pytest_addoption(parser):
+    parser.addoption(
+        "--failure-artifacts",
+        action="store_true",
+        default=os.getenv("SWAG_FAILURE_ARTIFACTS", "").lower() in ("1", "true", "yes", "on"),
+        help="трассировать каждый тест, сохранять трассу и скриншоты только упавших и нестабильных",
+    )
+    parser.addoption(
+        "--artifacts-dir",
+        default=os.getenv("SWAG_ARTIFACTS_DIR", "reports/artifacts"),
+        help="каталог артефактов (подкаталог на каждый прогон)",
+    )
+    parser.addoption(
+        "--artifacts-max-mb",
+        type=float,
+        default=float(os.getenv("SWAG_ARTIFACTS_MAX_MB", "500")),
+        help="предельный размер каталога артефактов, старые прогоны удаляются",
+    )
+
+
+def pytest_configure(config):
+    if not config.getoption("--failure-artifacts"):
+        return
+    if config.getoption("--tracing", "off") != "off":
+        raise pytest.UsageError("--failure-artifacts и --tracing из pytest-playwright несовместимы: выберите один")
+    if not hasattr(config, "workerinput"):
+        config.pluginmanager.register(ArtifactsReporter(run_dir(config)), "swaglabs-artifacts")
+
+
+def run_dir(config) -> Path:
+    return Path(config.getoption("--artifacts-dir")) / settings.run_id()
+
+
+class FailureArtifacts:
+    """Чанк трассировки теста; решение, сохранять ли его, принимается после теста"""
+
+    def __init__(self, root: Path, nodeid: str):
+        self.root = root
+        self.nodeid = nodeid
+        self.trace = None
+
+    def attach(self, context) -> None:
+        self.trace = ChunkedTrace(context)
+        self.trace.start(self.nodeid)
+
+    def finish(self, keep: bool):
+        if self.trace is None:
+            return None
+        if not keep:
+            self.trace.stop()
+            return None
+        directory = artifact_dir(self.root, self.nodeid)
+        self.trace.stop(directory)
+        return directory
+
+
+@pytest.fixture
+def failure_artifacts(request, pytestconfig):
+    """FailureArtifacts теста или None, если --failure-artifacts выключен"""
+    if not pytestconfig.getoption("--failure-artifacts"):
+        yield None
+        return
+    artifacts = FailureArtifacts(run_dir(pytestconfig), request.node.nodeid)
+    yield artifacts
+    # rep_setup/rep_call выставляет pytest-playwright
+    failed = any(
+        getattr(request.node, f"rep_{when}", None) is not None and getattr(request.node, f"rep_{when}").failed
+        for when in ("setup", "call")
+    )
+    directory = artifacts.finish(keep=failed)
+    if directory is not None:
+        request.node.user_properties.append(("artifacts", str(directory)))
+
+
+class ArtifactsReporter:
+    """Итог по сохраненным артефактам и ограничение размера каталога"""
+
+    def __init__(self, directory: Path):
+        self.directory = directory
+        self.saved: Dict[str, str] = {}
+        self.passed: Set[str] = set()
+        self.evicted: List[Path] = []
+
+    def pytest_runtest_logreport(self, report):
+        if report.when == "call" and report.passed:
+            self.passed.add(report.nodeid)
+        if report.when == "teardown":
+            path = dict(report.user_properties).get("artifacts")
+            if path is not None:
+                self.saved.setdefault(report.nodeid, path)
+
+    def pytest_sessionfinish(self, session):
+        limit = int(session.config.getoption("--artifacts-max-mb") * 1024 * 1024)
+        self.evicted = enforce_size_cap(self.directory.parent, limit, keep=self.directory)
+
+    def pytest_terminal_summary(self, terminalreporter, config):
+        if not self.saved and not self.evicted:
+            return
+        terminalreporter.write_sep("-", "артефакты упавших тестов")
+        for nodeid, path in self.saved.items():
+            # Прошел после повторной попытки — нестабильный
+            status = "нестабильный" if nodeid in self.passed else "упал"
+            terminalreporter.write_line(f"{status}: {nodeid} → {path}")
+        if self.directory.exists():
+            size = directory_size(self.directory) / 1024 / 1024
+            terminalreporter.write_line(f"размер артефактов прогона: {size:.1f} МБ ({self.directory})")
+        if self.evicted:
+            terminalreporter.write_line(f"удалено старых прогонов: {len(self.evicted)}")
@@ -0,0 +1,109 @@
+"""
+http_cache.py
+Плагин pytest: общий HTTP-кэш статики на диске (--http-cache, см.
+swaglabs.http_cache). Каждый тест по-прежнему получает новый контекст:
+cookies и localStorage не переходят между тестами, из кэша отдаются
+только JS, CSS, картинки и шрифты.
+
+    pytest tests/ --http-cache
+    pytest tests/ --http-cache --http-cache-dir .swaglabs/http-cache --http-cache-size 50
+
+Давно не использованное вытесняется, как только запись выводит кэш за
+--http-cache-size, и еще раз в конце прогона. В конце прогона печатается
+доля запросов статики, обслуженных из кэша.
+
+Попадания отдаются через route.fulfill и не проходят эмуляцию сети
+(--throttle): для замеров под медленной сетью кэш лучше не включать.
+"""
+
+import os
+from collections import Counter
+from pathlib import Path
+from typing import Optional
+
+import pytest
+
+from swaglabs.http_cache import AssetStore, HttpCache, hit_rate
+
+store_key = pytest.StashKey[AssetStore]()
+
+
+def pytest_addoption(parser):
+    parser.addoption(
+        "--http-cache",
+        action="store_true",
+        default=os.getenv("SWAG_HTTP_CACHE", "").lower() in ("1", "true", "yes", "on"),
+        help="отдавать статику (JS, CSS, картинки, шрифты) из общего кэша на диске с проверкой ETag",
+    )
+    parser.addoption(
+        "--http-cache-dir",
+        default=os.getenv("SWAG_HTTP_CACHE_DIR", ".swaglabs/http-cache"),
+        help="каталог HTTP-кэша статики",
+    )
+    parser.addoption(
+        "--http-cache-size",
+        type=float,
+        default=float(os.getenv("SWAG_HTTP_CACHE_SIZE", "100")),
+        help="лимит HTTP-кэша, МБ (давно не использованное вытесняется)",
+    )
+
+
+def pytest_configure(config):
+    if not config.getoption("--http-cache"):
+        return
+    config.stash[store_key] = AssetStore(Path(config.getoption("--http-cache-dir")),
+                                         int(config.getoption("--http-cache-size") * 1024 * 1024))
+    if not hasattr(config, "workerinput"):
+        config.pluginmanager.register(HttpCacheReporter(config.stash[store_key]), "swaglabs-http-cache")
+
+
+@pytest.fixture
+def http_cache(request) -> Optional[HttpCache]:
+    """HttpCache теста (None без --http-cache); к контексту его подключает фикстура context"""
+    store = request.config.stash.get(store_key, None)
+    if store is None:
+        yield None
+        return
+    cache = HttpCache(store)
+    evicted = store.evicted
+    yield cache
+    cache.detach()
+    cache.stats["evicted"] += store.evicted - evicted
+    request.node.user_properties.append(("http_cache", cache.summary()))
+
+
+class HttpCacheReporter:
+    """Сводка попаданий в кэш и вытеснение по лимиту; живет только в контроллере"""
+
+    def __init__(self, store: AssetStore):
+        self.store = store
+        self.totals: Counter = Counter()
+        self.tests = 0
+        self.evicted = 0
+
+    def pytest_runtest_logreport(self, report):
+        if report.when != "teardown":
+            return
+        summary = dict(report.user_properties).get("http_cache")
+        if summary:
+            self.totals.update(summary)
+            self.tests += 1
+
+    def pytest_sessionfinish(self, session):
+        # Воркеры к этому моменту остановлены: вытеснение не мешает их записям
+        self.evicted = self.totals["evicted"] + self.store.evict()
+
+    def pytest_terminal_summary(self, terminalreporter):
+        if not self.tests:
+            return
+        totals = self.totals
+        terminalreporter.write_sep("-", f"HTTP-кэш статики ({self.store.root})")
+        terminalreporter.write_line(
+            f"попадания: {hit_rate(totals):.0%} — без сети {totals['hit']}, подтверждено 304 {totals['revalidated']}, "
+            f"загружено {totals['miss']}, не кэшируется {totals['bypass']} ({self.tests} тестов)"
+        )
+        terminalreporter.write_line(
+            f"не загружено повторно: ~{totals['saved_bytes'] / 1024:.1f} КБ, "
+            f"в кэше {self.store.size() / 1024 / 1024:.1f} из {self.store.max_bytes / 1024 / 1024:.0f} МБ, "
+            f"вытеснено записей: {self.evicted}"
+        )
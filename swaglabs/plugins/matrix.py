@@ -0,0 +1,131 @@
+"""
+matrix.py
+Плагин pytest: матрица браузеров в одном прогоне (см. swaglabs.matrix).
+
+    pytest tests/ --browser-matrix chromium,firefox,webkit -n 6
+    pytest tests/ --browser-matrix all --step-timings
+
+Каждый тест с браузером выполняется в каждом движке ([chromium],
+[firefox] в имени теста); воркеры xdist берут пары (тест, браузер) из
+общей очереди. Браузеры всех движков запускаются в воркере один раз,
+при первом тесте, и не перезапускаются при смене движка. В конце
+прогона печатаются результаты и длительности по браузерам, а с
+--step-timings — шаги по браузерам.
+
+Сессия входа (auth_session) и пул контекстов (--context-pool) создаются
+один раз на движок и переживают смену движка (browser_matrix.resource).
+С --browser-server матрицы в воркере нет, и при смене движка они
+пересоздаются.
+
+Async-тесты (swaglabs.plugins.aio) выполняются в первом браузере матрицы.
+Тот же режим включается несколькими --browser.
+"""
+
+import os
+from collections import defaultdict
+from typing import Dict, List, Optional
+
+import pytest
+
+from swaglabs.matrix import BrowserMatrix, MatrixResult, parse_engines, summarize, widest_gaps
+
+GAPS_SHOWN = 5
+
+
+def pytest_addoption(parser):
+    parser.addoption(
+        "--browser-matrix",
+        default=os.getenv("SWAG_BROWSER_MATRIX", ""),
+        help="браузеры через запятую (chromium, firefox, webkit или all): все тесты в каждом браузере в одном прогоне",
+    )
+
+
+@pytest.hookimpl(tryfirst=True)
+def pytest_configure(config):
+    # tryfirst: --browser должен быть заполнен до того, как его прочитают другие плагины
+    value = config.getoption("--browser-matrix")
+    if value:
+        try:
+            engines = parse_engines(value)
+        except ValueError as error:
+            raise pytest.UsageError(f"--browser-matrix: {error}")
+        if config.option.browser and config.option.browser != engines:
+            raise pytest.UsageError("--browser-matrix и --browser задают браузеры по-разному, оставьте одно")
+        config.option.browser = engines
+    if len(config.option.browser or ()) < 2:
+        return
+    # С --browser-server браузеры и так живут на сервере, к нему подключается фикстура browser
+    if not config.getoption("--browser-server"):
+        config.pluginmanager.register(BrowserMatrixFixtures(), "swaglabs-browser-matrix")
+    if not hasattr(config, "workerinput"):
+        config.pluginmanager.register(BrowserMatrixReporter(), "swaglabs-browser-matrix-report")
+
+
+def pytest_collection_modifyitems(config, items):
+    if len(config.option.browser or ()) < 2:
+        return
+    for item in items:
+        callspec = getattr(item, "callspec", None)
+        if callspec is not None and "browser_name" in callspec.params:
+            item.user_properties.append(("browser", callspec.params["browser_name"]))
+
+
+@pytest.fixture(scope="session")
+def browser_matrix() -> Optional[BrowserMatrix]:
+    """Матрица браузеров процесса; None без матрицы (подменяется BrowserMatrixFixtures)"""
+    return None
+
+
+class BrowserMatrixFixtures:
+    """Подменяет browser из pytest-playwright (регистрируется после него)"""
+
+    @pytest.fixture(scope="session")
+    def browser_matrix(self, playwright, browser_type_launch_args, pytestconfig):
+        matrix = BrowserMatrix(playwright, pytestconfig.option.browser, browser_type_launch_args).start()
+        yield matrix
+        matrix.close()
+
+    @pytest.fixture(scope="session")
+    def browser(self, browser_name, browser_matrix):
+        # Пересоздается при смене browser_name, но браузер берется из матрицы уже запущенным
+        return browser_matrix[browser_name]
+
+
+class BrowserMatrixReporter:
+    """Результаты и длительности тестов по браузерам; живет только в контроллере"""
+
+    def __init__(self):
+        self.browsers: Dict[str, str] = {}
+        self.outcomes: Dict[str, str] = {}
+        self.durations: Dict[str, float] = defaultdict(float)
+
+    def pytest_runtest_logreport(self, report):
+        browser = dict(report.user_properties).get("browser")
+        if browser is None:
+            return
+        self.browsers[report.nodeid] = browser
+        self.durations[report.nodeid] += report.duration
+        if report.failed:
+            self.outcomes[report.nodeid] = "failed"
+        elif report.skipped:
+            self.outcomes.setdefault(report.nodeid, "skipped")
+        elif report.when == "call":
+            self.outcomes.setdefault(report.nodeid, "passed")
+
+    def results(self) -> List[MatrixResult]:
+        return [MatrixResult(nodeid, browser, self.outcomes.get(nodeid, "skipped"), self.durations[nodeid])
+                for nodeid, browser in self.browsers.items()]
+
+    def pytest_terminal_summary(self, terminalreporter, config):
+        results = self.results()
+        if not results:
+            return
+        terminalreporter.write_sep("-", "матрица браузеров")
+        for summary in summarize(results):
+            terminalreporter.write_line(summary.describe())
+        gaps = widest_gaps(results, GAPS_SHOWN)
+        if gaps:
+            terminalreporter.write_line("самая большая разница между браузерами:")
+            for row in gaps:
+                cells = ", ".join(f"{browser} {seconds:.2f} с" for browser, seconds in row["durations"].items())
+                terminalreporter.write_line(f"  {row['test']}: {cells}")
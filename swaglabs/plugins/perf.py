@@ -0,0 +1,133 @@
+"""
+perf.py
+Плагин pytest: метрики производительности страниц (swaglabs.perf), бюджеты
+из pytest.ini (perf_budgets) и отчет reports/perf/<run_id>.jsonl.
+
+    pytest tests/ --perf-metrics
+    pytest tests/ --perf-metrics --perf-budget-mode fail
+"""
+
+import json
+import os
+from pathlib import Path
+from typing import Dict, List
+
+import pytest
+
+from swaglabs.perf import METRICS, PageMetrics, parse_budgets
+from swaglabs.settings import run_id
+
+budgets_key = pytest.StashKey[Dict[str, Dict[str, float]]]()
+metrics_key = pytest.StashKey[PageMetrics]()
+
+
+def pytest_addoption(parser):
+    parser.addoption(
+        "--perf-metrics",
+        action="store_true",
+        default=os.getenv("SWAG_PERF_METRICS", "").lower() in ("1", "true", "yes", "on"),
+        help="собирать метрики производительности страниц и сверять их с бюджетами",
+    )
+    parser.addoption(
+        "--perf-budget-mode",
+        choices=("warn", "fail", "off"),
+        default=os.getenv("SWAG_PERF_BUDGET_MODE", "warn"),
+        help="что делать при превышении бюджета: предупреждение, падение теста или ничего",
+    )
+    parser.addoption(
+        "--perf-report-dir",
+        default=os.getenv("SWAG_PERF_REPORT_DIR", "reports/perf"),
+        help="каталог для <run_id>.jsonl с метриками страниц",
+    )
+    parser.addini("perf_budgets", "бюджеты страниц: <страница> <метрика>=<порог> ...", type="linelist", default=[])
+
+
+def _enabled(config) -> bool:
+    return bool(config.getoption("--perf-metrics"))
+
+
+def pytest_configure(config):
+    try:
+        config.stash[budgets_key] = parse_budgets(config.getini("perf_budgets"))
+    except ValueError as error:
+        raise pytest.UsageError(str(error)) from None
+    run_id()
+    if _enabled(config) and not hasattr(config, "workerinput"):
+        path = Path(config.getoption("--perf-report-dir")) / f"{run_id()}.jsonl"
+        config.pluginmanager.register(PerfReporter(path), "swaglabs-perf")
+
+
+@pytest.fixture
+def page_metrics(request) -> PageMetrics:
+    """Замеры страниц теста: page_metrics.capture(page) после перехода на страницу"""
+    config = request.config
+    mode = config.getoption("--perf-budget-mode")
+    browser_name = request.node.callspec.params.get("browser_name") if hasattr(request.node, "callspec") else None
+    collector = PageMetrics(
+        request.node.nodeid,
+        config.stash[budgets_key] if mode != "off" else {},
+        mode,
+        enabled=_enabled(config),
+        tags={"run_id": run_id(), "browser": browser_name},
+    )
+    request.node.stash[metrics_key] = collector
+    yield collector
+    if collector.records:
+        request.node.user_properties.append(("page_metrics", collector.records))
+
+
+@pytest.hookimpl(hookwrapper=True)
+def pytest_runtest_makereport(item, call):
+    outcome = yield
+    report = outcome.get_result()
+    collector = item.stash.get(metrics_key, None)
+    if report.when != "call" or not report.passed or collector is None or collector.mode != "fail":
+        return
+    violations = collector.violations
+    if violations:
+        # Функциональные проверки прошли, поэтому помечаем упавшим сам вызов теста
+        report.outcome = "failed"
+        report.longrepr = "Превышен бюджет производительности:\n  " + "\n  ".join(violations)
+
+
+class PerfReporter:
+    """Пишет метрики в JSONL и печатает сводку по страницам; живет только в контроллере"""
+
+    def __init__(self, path: Path):
+        self.path = path
+        self.records: List[Dict] = []
+
+    def pytest_runtest_logreport(self, report):
+        if report.when != "teardown":
+            return
+        records = dict(report.user_properties).get("page_metrics")
+        if not records:
+            return
+        self.records.extend(records)
+        self.path.parent.mkdir(parents=True, exist_ok=True)
+        with self.path.open("a", encoding="utf-8") as fh:
+            for record in records:
+                fh.write(json.dumps(record, ensure_ascii=False) + "\n")
+
+    def pytest_terminal_summary(self, terminalreporter):
+        if not self.records:
+            return
+        terminalreporter.write_sep("-", f"метрики страниц (замеров: {len(self.records)})")
+        columns = ("fcp", "load", "long_tasks_ms", "requests", "transfer_kb")
+        terminalreporter.write_line(f"{'страница':<28} | " + " | ".join(f"{c:>13}" for c in columns))
+        pages: Dict[str, List[Dict]] = {}
+        for record in self.records:
+            pages.setdefault(record["page"], []).append(record)
+        for name, records in pages.items():
+            cells = []
+            for column in columns:
+                values = [r[column] for r in records if r.get(column) is not None]
+                # Худшее значение: бюджет должен выдерживать каждый замер
+                cells.append(f"{max(values):>10g} {METRICS[column]:<2}" if values else f"{'—':>13}")
+            terminalreporter.write_line(f"{name:<28} | " + " | ".join(cells))
+        violations = [(r["nodeid"], r["page"], v) for r in self.records for v in r["violations"]]
+        if violations:
+            terminalreporter.write_line(f"превышений бюджета: {len(violations)}", red=True)
+            for nodeid, name, violation in violations:
+                terminalreporter.write_line(f"  {nodeid.split('::')[-1]} → {name}: {violation}")
+        terminalreporter.write_line(f"Замеры: {self.path}")
@@ -0,0 +1,131 @@
+"""
+pool.py
+Плагин pytest: пул прогретых контекстов (--context-pool) вместо нового
+контекста на каждый тест, и отчет о времени подготовки контекста и страницы.
+
+    pytest tests/ --context-pool
+    pytest tests/ --context-pool --context-pool-size 2
+"""
+
+import json
+import os
+import statistics
+import time
+from pathlib import Path
+
+import pytest
+
+from swaglabs.pool import ContextPool
+
+startup_key = pytest.StashKey[dict]()
+# Пулы по движку: с матрицей браузеров (--browser-matrix) их несколько
+pools_key = pytest.StashKey[dict]()
+
+
+def pytest_addoption(parser):
+    parser.addoption(
+        "--context-pool",
+        action="store_true",
+        default=os.getenv("SWAG_CONTEXT_POOL", "").lower() in ("1", "true", "yes", "on"),
+        help="переиспользовать прогретые контексты браузера со сбросом состояния между тестами",
+    )
+    parser.addoption("--context-pool-size", type=int, default=1, help="сколько контекстов держать в пуле")
+
+
+def pytest_configure(config):
+    if config.getoption("--context-pool"):
+        config.pluginmanager.register(PooledContextFixtures(), "swaglabs-context-pool")
+
+
+class PooledContextFixtures:
+    """
+    Фикстуры, которые подменяют context из pytest-playwright в режиме пула.
+    Регистрируются после pytest-playwright, поэтому context из tests/conftest.py
+    получает в качестве родителя именно их.
+    """
+
+    @pytest.fixture(scope="session")
+    def context_pool(self, browser, browser_name, browser_context_args, browser_matrix, pytestconfig):
+        def create() -> ContextPool:
+            pool = ContextPool(browser, browser_context_args, pytestconfig.getoption("--context-pool-size"))
+            pool.warm_up()
+            pytestconfig.stash.setdefault(pools_key, {})[browser_name] = pool
+            return pool
+
+        if browser_matrix is not None:
+            # Фикстура пересоздается при смене движка, а пул движка живет до закрытия матрицы
+            yield browser_matrix.resource(browser_name, "context_pool", create, ContextPool.close)
+            return
+        pool = create()
+        yield pool
+        pool.close()
+
+    @pytest.fixture
+    def context(self, context_pool: ContextPool, browser, browser_context_args, resource_blocker, request):
+        marker = request.node.get_closest_marker("browser_context_args")
+        extra = dict(marker.kwargs) if marker else {}
+        storage_state = extra.pop("storage_state", None)
+
+        if extra:
+            # Настройки, которые нельзя поменять у живого контекста: отдельный новый контекст
+            context = browser.new_context(**{**browser_context_args, **extra, "storage_state": storage_state})
+            yield context
+            context.close()
+            return
+
+        if isinstance(storage_state, (str, Path)):
+            storage_state = json.loads(Path(storage_state).read_text(encoding="utf-8"))
+        context = context_pool.acquire(storage_state)
+        yield context
+
+        report = getattr(request.node, "rep_call", None)
+        healthy = report is not None and report.passed
+        resource_blocker.uninstall(context)
+        context_pool.release(context, healthy=healthy)
+
+
+@pytest.hookimpl(hookwrapper=True)
+def pytest_fixture_setup(fixturedef, request):
+    if fixturedef.argname not in ("context", "page"):
+        yield
+        return
+    started = time.perf_counter()
+    yield
+    elapsed = (time.perf_counter() - started) * 1000
+    # context переопределен в нескольких местах, внешний вызов включает внутренние
+    timings = request.node.stash.setdefault(startup_key, {})
+    timings[fixturedef.argname] = max(timings.get(fixturedef.argname, 0.0), elapsed)
+
+
+@pytest.hookimpl(hookwrapper=True)
+def pytest_runtest_setup(item):
+    yield
+    timings = item.stash.get(startup_key, None)
+    if timings:
+        # page создается поверх context, поэтому его время уже включает контекст
+        item.user_properties.append(("startup_ms", round(max(timings.values()), 2)))
+
+
+def pytest_terminal_summary(terminalreporter, config):
+    samples = [
+        dict(report.user_properties)["startup_ms"]
+        for report in terminalreporter.stats.get("", []) + terminalreporter.stats.get("passed", [])
+        if getattr(report, "when", None) == "setup" and "startup_ms" in dict(report.user_properties)
+    ]
+    if not samples:
+        return
+
+    mode = "пул контекстов" if config.getoption("--context-pool") else "новый контекст на тест"
+    terminalreporter.write_sep("-", f"подготовка контекста и страницы ({mode})")
+    p95 = statistics.quantiles(samples, n=20)[-1] if len(samples) >= 2 else samples[0]
+    terminalreporter.write_line(
+        f"тестов: {len(samples)}, среднее: {statistics.mean(samples):.1f} мс, "
+        f"медиана: {statistics.median(samples):.1f} мс, p95: {p95:.1f} мс, сумма: {sum(samples):.0f} мс"
+    )
+    pools = config.stash.get(pools_key, {}).values()
+    if pools:
+        terminalreporter.write_line(
+            f"контекстов создано: {sum(pool.created for pool in pools)}, "
+            f"переиспользовано: {sum(pool.reused for pool in pools)}, "
+            f"заменено после сбоя: {sum(pool.discarded for pool in pools)}"
+        )
@@ -0,0 +1,122 @@
+"""
+profile.py
+Плагин pytest: профилирование вызовов Playwright (--pw-profile,
+см. swaglabs.profiler). В конце прогона печатаются самые дорогие вызовы
+каждого теста и сводные таблицы по вызовам, местам вызова и функциям.
+
+    pytest tests/test_sorting.py --pw-profile
+    pytest tests/test_sorting.py --pw-profile --pw-profile-collapsed reports/profile/sorting.folded
+
+Файл collapsed stacks открывается в speedscope.app или flamegraph.pl.
+Учитываются вызовы синхронного API от setup до teardown теста
+(async-тесты не профилируются).
+"""
+
+import os
+from collections import defaultdict
+from typing import Dict, List
+
+import pytest
+
+from swaglabs.profiler import CallProfile, format_table, function_totals, hotspots, merge_stacks, write_collapsed
+
+profile_key = pytest.StashKey[CallProfile]()
+
+
+def pytest_addoption(parser):
+    parser.addoption(
+        "--pw-profile",
+        action="store_true",
+        default=os.getenv("SWAG_PW_PROFILE", "").lower() in ("1", "true", "yes", "on"),
+        help="профилировать вызовы Playwright: время по вызовам и местам вызова",
+    )
+    parser.addoption(
+        "--pw-profile-top",
+        type=int,
+        default=int(os.getenv("SWAG_PW_PROFILE_TOP", "10")),
+        help="сколько строк в таблицах профиля",
+    )
+    parser.addoption(
+        "--pw-profile-collapsed",
+        default=os.getenv("SWAG_PW_PROFILE_COLLAPSED"),
+        help="файл collapsed stacks для flame graph (время в микросекундах)",
+    )
+
+
+def pytest_configure(config):
+    if not config.getoption("--pw-profile"):
+        return
+    config.pluginmanager.register(ProfileHooks(), "swaglabs-pw-profile-hooks")
+    if not hasattr(config, "workerinput"):
+        config.pluginmanager.register(ProfileReporter(config), "swaglabs-pw-profile")
+
+
+class ProfileHooks:
+    """Профиль включается до фикстур теста и выключается после их teardown"""
+
+    @pytest.hookimpl(hookwrapper=True)
+    def pytest_runtest_setup(self, item):
+        profile = CallProfile(item.config.rootpath)
+        item.stash[profile_key] = profile
+        profile.start()
+        yield
+
+    @pytest.hookimpl(hookwrapper=True)
+    def pytest_runtest_teardown(self, item):
+        yield
+        profile = item.stash.get(profile_key, None)
+        if profile is None:
+            return
+        profile.stop()
+        del item.stash[profile_key]
+        if profile.calls:
+            item.user_properties.append(("pw_profile", profile.to_dict()))
+
+
+class ProfileReporter:
+    """Собирает профили тестов (в том числе с воркеров xdist); живет только в контроллере"""
+
+    def __init__(self, config):
+        self.top = config.getoption("--pw-profile-top")
+        self.collapsed = config.getoption("--pw-profile-collapsed")
+        self.tests: Dict[str, List] = {}
+        self.rows: List = []
+        self.stacks: Dict[str, float] = defaultdict(float)
+
+    def pytest_runtest_logreport(self, report):
+        if report.when != "teardown":
+            return
+        profile = dict(report.user_properties).get("pw_profile")
+        if not profile:
+            return
+        self.tests[report.nodeid] = profile["calls"]
+        self.rows.extend(profile["calls"])
+        merge_stacks(self.stacks, profile["stacks"])
+
+    def pytest_terminal_summary(self, terminalreporter):
+        if not self.rows:
+            return
+        write = terminalreporter.write_line
+        terminalreporter.write_sep("-", f"профиль Playwright: тестов {len(self.tests)}")
+        # Тесты по убыванию времени в Playwright, у каждого — самые дорогие места вызова
+        by_total = sorted(self.tests.items(), key=lambda item: sum(row[3] for row in item[1]), reverse=True)
+        for nodeid, rows in by_total[:self.top]:
+            total = sum(row[3] for row in rows)
+            write(f"{nodeid}: {total * 1000:.0f} мс в Playwright")
+            for stats in hotspots(rows, by="site", top=3):
+                write(f"    {stats.total * 1000:>9.1f} мс ×{stats.calls:<4} {stats.name}")
+
+        suite_total = sum(row[3] for row in self.rows)
+        terminalreporter.write_sep("-", f"горячие вызовы Playwright (всего {suite_total * 1000:.0f} мс)")
+        for line in format_table(hotspots(self.rows, by="call", top=self.top)):
+            write(line)
+        terminalreporter.write_sep("-", "горячие места вызова")
+        for line in format_table(hotspots(self.rows, by="site", top=self.top)):
+            write(line)
+        terminalreporter.write_sep("-", "функции проекта (время вложенных вызовов Playwright)")
+        for frame, total in function_totals(self.stacks, top=self.top):
+            share = total / suite_total * 100 if suite_total else 0
+            write(f"{total * 1000:>10.1f} мс {share:>5.1f}% | {frame}")
+        if self.collapsed:
+            path = write_collapsed(self.stacks, self.collapsed)
+            write(f"Collapsed stacks: {path}")
@@ -0,0 +1,108 @@
+"""
+resources.py
+Плагин pytest: профили блокировки ресурсов (см. swaglabs.blocking)
+и отчет о сэкономленных запросах и байтах по каждому тесту.
+
+    pytest tests/ --resource-profile minimal
+
+    @pytest.mark.resource_profile("minimal")   # профиль для класса/теста
+    @pytest.mark.needs_resources("image")       # тесту нужны картинки
+"""
+
+import os
+from typing import Dict, Optional
+
+import pytest
+
+from swaglabs.blocking import CATEGORIES, DEFAULT_PROFILE, PROFILES, ResourceBlocker, categories_for
+
+SIZES_CACHE_KEY = "swaglabs/resource_sizes"
+known_sizes_key = pytest.StashKey[Dict[str, int]]()
+
+
+def pytest_addoption(parser):
+    parser.addoption(
+        "--resource-profile",
+        choices=sorted(PROFILES),
+        default=os.getenv("SWAG_RESOURCE_PROFILE"),
+        help="профиль блокировки ресурсов для всех тестов: "
+             "full / functional / minimal (по умолчанию — маркер resource_profile или functional)",
+    )
+
+
+def pytest_configure(config):
+    config.addinivalue_line("markers", "resource_profile(name): профиль блокировки ресурсов для теста")
+    config.addinivalue_line(
+        "markers",
+        f"needs_resources(*categories): не блокировать ресурсы ({', '.join(CATEGORIES)})",
+    )
+    cache = getattr(config, "cache", None)
+    config.stash[known_sizes_key] = dict(cache.get(SIZES_CACHE_KEY, {})) if cache else {}
+
+
+def pytest_unconfigure(config):
+    cache = getattr(config, "cache", None)
+    if cache is not None and known_sizes_key in config.stash:
+        cache.set(SIZES_CACHE_KEY, config.stash[known_sizes_key])
+
+
+def profile_for(item) -> str:
+    """Профиль теста: опция командной строки > маркер > профиль по умолчанию"""
+    option = item.config.getoption("--resource-profile")
+    if option:
+        return option
+    marker = item.get_closest_marker("resource_profile")
+    return marker.args[0] if marker else DEFAULT_PROFILE
+
+
+def blocker_for(item) -> ResourceBlocker:
+    allowed = [category for marker in item.iter_markers("needs_resources") for category in marker.args]
+    categories = categories_for(profile_for(item), allowed)
+    return ResourceBlocker(categories, item.config.stash[known_sizes_key])
+
+
+def record_blocking(item, blocker: ResourceBlocker) -> None:
+    """Сохраняет статистику в user_properties (доходит до контроллера и под xdist)"""
+    item.config.stash[known_sizes_key].update(blocker.learned_sizes)
+    item.user_properties.append(("resource_profile", profile_for(item)))
+    item.user_properties.append(("blocked_requests", blocker.blocked_requests))
+    item.user_properties.append(("blocked_bytes", blocker.blocked_bytes))
+    item.user_properties.append(("blocked_unknown_size", blocker.unknown_size))
+
+
+@pytest.fixture
+def resource_blocker(request) -> ResourceBlocker:
+    """Блокировщик ресурсов для теста; статистика попадает в отчет после теста"""
+    blocker = blocker_for(request.node)
+    yield blocker
+    record_blocking(request.node, blocker)
+
+
+def _props(report) -> Optional[Dict]:
+    props = dict(report.user_properties)
+    return props if "blocked_requests" in props else None
+
+
+def pytest_terminal_summary(terminalreporter):
+    rows = []
+    for reports in terminalreporter.stats.values():
+        for report in reports:
+            if getattr(report, "when", None) != "teardown":
+                continue
+            props = _props(report)
+            if props and props["blocked_requests"]:
+                rows.append((report.nodeid, props))
+    if not rows:
+        return
+
+    terminalreporter.write_sep("-", "заблокированные ресурсы")
+    total_requests = total_bytes = 0
+    for nodeid, props in sorted(rows, key=lambda row: row[0]):
+        total_requests += props["blocked_requests"]
+        total_bytes += props["blocked_bytes"]
+        unknown = f", размер неизвестен у {props['blocked_unknown_size']}" if props["blocked_unknown_size"] else ""
+        terminalreporter.write_line(
+            f"{nodeid} [{props['resource_profile']}]: "
+            f"{props['blocked_requests']} запросов, ~{props['blocked_bytes'] / 1024:.1f} КБ{unknown}"
+        )
+    terminalreporter.write_line(f"Итого: {total_requests} запросов, ~{total_bytes / 1024:.1f} КБ")
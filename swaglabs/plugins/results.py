@@ -0,0 +1,201 @@
+"""
+results.py
+Плагин pytest: кэш результатов. Тест, который уже проходил с теми же
+входами (отпечаток: код теста и его фикстур, код проекта, версия
+Playwright, JS-бандлы приложения, pytest.ini и опции прогона — см.
+swaglabs.result_cache), не запускается и попадает в отчет как
+skipped-cached.
+
+    pytest tests/ --result-cache               # только тесты с изменившимися входами
+    pytest tests/ --result-cache --force-run   # все тесты, кэш обновляется
+
+Кэш хранится в .pytest_cache (ключ swaglabs/passed), упавший тест из
+кэша удаляется. Если стенд недоступен и отпечаток приложения не снять,
+запускаются все тесты.
+"""
+
+import os
+import warnings
+from pathlib import Path
+from typing import Dict, Set
+
+import pytest
+
+from swaglabs import settings
+from swaglabs.result_cache import (
+    ModuleSources,
+    ResultCache,
+    app_fingerprint,
+    config_fingerprint,
+    environment_fingerprint,
+    fixture_sources,
+    item_fingerprint,
+    support_fingerprint,
+)
+
+CACHE_KEY = "swaglabs/passed"
+CACHED_REASON = "закэшировано: прошел с теми же входами"
+
+# Опции, которые меняют исход теста, но не его nodeid: тест, прошедший
+# с --perf-budget-mode warn или без --throttle, не считается прошедшим с fail или 3g
+OUTCOME_OPTIONS = (
+    "--offline",
+    "--browser-channel",
+    "--device",
+    "--perf-metrics",
+    "--perf-budget-mode",
+    "--throttle",
+    "--resource-profile",
+    "--adaptive-timeouts",
+    "--timeout-factor",
+    "--timeout-floor",
+    "--timeout-ceiling",
+    "--retries",
+    "--retry-budget",
+    "--shared-page",
+    "--context-pool",
+    "--http-cache",
+    "--async-concurrency",
+    "--soak-iterations",
+    "--soak-sample-every",
+    "--soak-heap-kb",
+    "--soak-listeners",
+    "--soak-nodes",
+    "--soak-latency-ms",
+)
+
+
+def pytest_addoption(parser):
+    parser.addoption(
+        "--result-cache",
+        action="store_true",
+        default=os.getenv("SWAG_RESULT_CACHE", "").lower() in ("1", "true", "yes", "on"),
+        help="не запускать тесты, которые уже проходили с теми же входами (код, Playwright, бандлы приложения)",
+    )
+    parser.addoption(
+        "--force-run",
+        action="store_true",
+        default=False,
+        help="с --result-cache: запустить все тесты и обновить кэш",
+    )
+
+
+@pytest.hookimpl(trylast=True)
+def pytest_configure(config):
+    if not config.getoption("--result-cache") or getattr(config, "cache", None) is None:
+        return
+    # trylast: плагин регистрируется последним, и его pytest_runtest_protocol
+    # вызывается раньше протоколов повторов (retries) и async-тестов (aio)
+    config.pluginmanager.register(ResultCachePlugin(config), "swaglabs-result-cache")
+
+
+def _run_configuration(config) -> str:
+    """Отпечаток pytest.ini и значений OUTCOME_OPTIONS"""
+    inipath = getattr(config, "inipath", None)
+    ini_text = inipath.read_text(encoding="utf-8", errors="replace") if inipath and inipath.is_file() else ""
+    options = {}
+    for name in OUTCOME_OPTIONS:
+        try:
+            options[name] = config.getoption(name)
+        except ValueError:
+            continue  # опцию добавляет плагин, которого нет в этом прогоне
+    return config_fingerprint(ini_text, options)
+
+
+def _fingerprints(items, config) -> Dict[str, str]:
+    """nodeid → отпечаток; пустой словарь, если приложение недоступно"""
+    functions = [item for item in items if isinstance(item, pytest.Function)]
+    app = app_fingerprint(settings.BASE_URL)
+    if app is None:
+        warnings.warn(pytest.PytestWarning(
+            f"кэш результатов: {settings.BASE_URL} недоступен, отпечаток приложения не снят — запускаются все тесты"
+        ))
+        return {}
+    root = config.rootpath
+    excluded = {item.path for item in functions} | {path for path in root.rglob("conftest.py")}
+    base = "|".join((app, environment_fingerprint(), _run_configuration(config), support_fingerprint(root, excluded)))
+    modules: Dict[str, ModuleSources] = {}
+    fingerprints = {}
+    for item in functions:
+        module = item.module
+        if module.__name__ not in modules:
+            modules[module.__name__] = ModuleSources(module)
+        fixtures = fixture_sources(item._fixtureinfo.name2fixturedefs, root, item.path)
+        fingerprints[item.nodeid] = item_fingerprint(item.function, modules[module.__name__], fixtures, base)
+    return fingerprints
+
+
+class ResultCachePlugin:
+    def __init__(self, config):
+        self.config = config
+        self.force = config.getoption("--force-run")
+        self.cache = ResultCache(config.cache.get(CACHE_KEY, {}))
+        self.fresh: Set[str] = set()
+        # Итоги тестов этого прогона (на контроллере)
+        self.fingerprints: Dict[str, str] = {}
+        self.passed: Set[str] = set()
+        self.failed: Set[str] = set()
+        self.cached: Set[str] = set()
+
+    @pytest.hookimpl(trylast=True)
+    def pytest_collection_modifyitems(self, session, config, items):
+        fingerprints = _fingerprints(items, config)
+        for item in items:
+            fingerprint = fingerprints.get(item.nodeid)
+            if fingerprint is None:
+                continue
+            item.user_properties.append(("fingerprint", fingerprint))
+            if not self.force and self.cache.is_fresh(item.nodeid, fingerprint):
+                self.fresh.add(item.nodeid)
+
+    @pytest.hookimpl(tryfirst=True)
+    def pytest_runtest_protocol(self, item, nextitem):
+        if item.nodeid not in self.fresh:
+            return None
+        # Без фикстур: браузер и контекст для теста из кэша не нужны
+        ihook = item.ihook
+        ihook.pytest_runtest_logstart(nodeid=item.nodeid, location=item.location)
+        for when, func in (("setup", lambda: pytest.skip(CACHED_REASON)), ("teardown", lambda: None)):
+            call = pytest.CallInfo.from_call(func, when=when)
+            report = ihook.pytest_runtest_makereport(item=item, call=call)
+            report.cached = True
+            ihook.pytest_runtest_logreport(report=report)
+        ihook.pytest_runtest_logfinish(nodeid=item.nodeid, location=item.location)
+        return True
+
+    def pytest_report_teststatus(self, report):
+        if getattr(report, "cached", False) and report.skipped:
+            return "skipped-cached", "c", ("CACHED", {"green": True})
+        return None
+
+    def pytest_runtest_logreport(self, report):
+        if hasattr(self.config, "workerinput"):
+            return
+        fingerprint = dict(report.user_properties).get("fingerprint")
+        if fingerprint is None:
+            return
+        self.fingerprints[report.nodeid] = fingerprint
+        if getattr(report, "cached", False):
+            self.cached.add(report.nodeid)
+        elif report.failed or (report.skipped and report.when != "teardown"):
+            self.failed.add(report.nodeid)
+        elif report.when == "call" and report.passed:
+            self.passed.add(report.nodeid)
+
+    def pytest_sessionfinish(self, session):
+        if hasattr(self.config, "workerinput"):
+            return
+        for nodeid, fingerprint in self.fingerprints.items():
+            if nodeid not in self.cached:
+                self.cache.record(nodeid, fingerprint, nodeid in self.passed and nodeid not in self.failed)
+        self.config.cache.set(CACHE_KEY, self.cache.passed)
+
+    def pytest_terminal_summary(self, terminalreporter, config):
+        if hasattr(config, "workerinput") or not self.fingerprints:
+            return
+        recorded = len(self.passed - self.failed)
+        terminalreporter.write_sep("-", "кэш результатов")
+        terminalreporter.write_line(
+            f"из кэша (входы не изменились): {len(self.cached)}, запущено: {len(self.fingerprints) - len(self.cached)}, "
+            f"записано прошедших: {recorded}, всего в кэше: {len(self.cache.passed)}"
+        )
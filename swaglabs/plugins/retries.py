@@ -0,0 +1,104 @@
+"""
+retries.py
+Плагин pytest: повтор тестов только при временных ошибках (сеть, падение
+браузера, таймаут навигации — см. swaglabs.retries) и в пределах бюджета
+повторов на прогон. Упавшие проверки не повторяются.
+
+    pytest tests/ --retries 2 --retry-budget 5
+
+Неудачные попытки попадают в отчет со статусом RERUN, в конце прогона
+печатается, какие тесты повторялись и из-за чего.
+"""
+
+import os
+from typing import List, Tuple
+
+import pytest
+from _pytest.runner import runtestprotocol
+
+from swaglabs.plugins.aio import is_async_test
+from swaglabs.retries import RetryBudget, transient_reason
+
+
+def pytest_addoption(parser):
+    parser.addoption(
+        "--retries",
+        type=int,
+        default=int(os.getenv("SWAG_RETRIES", "0")),
+        help="сколько раз повторять тест после временной ошибки (0 — не повторять)",
+    )
+    parser.addoption(
+        "--retry-budget",
+        type=int,
+        default=int(os.getenv("SWAG_RETRY_BUDGET", "5")),
+        help="сколько повторов допускается на весь прогон",
+    )
+
+
+def pytest_configure(config):
+    if config.getoption("--retries") <= 0:
+        return
+    workers = config.workerinput["workercount"] if hasattr(config, "workerinput") else 1
+    config.pluginmanager.register(TransientRetries(config, workers), "swaglabs-retries")
+
+
+class TransientRetries:
+    def __init__(self, config, workers: int):
+        self.retries = config.getoption("--retries")
+        self.budget = RetryBudget(config.getoption("--retry-budget"), workers)
+        self.reruns: List[Tuple[str, str]] = []
+        self.exhausted: List[str] = []
+
+    @pytest.hookimpl(hookwrapper=True)
+    def pytest_runtest_makereport(self, item, call):
+        outcome = yield
+        report = outcome.get_result()
+        if report.failed and call.excinfo is not None:
+            report.transient = transient_reason(call.excinfo.value)
+
+    @pytest.hookimpl(tryfirst=True)
+    def pytest_runtest_protocol(self, item, nextitem):
+        if is_async_test(item):
+            return None  # async-тесты выполняет swaglabs.plugins.aio
+        ihook = item.ihook
+        ihook.pytest_runtest_logstart(nodeid=item.nodeid, location=item.location)
+        attempt = 0
+        while True:
+            reports = runtestprotocol(item, nextitem=nextitem, log=False)
+            failed = [report for report in reports if report.failed]
+            retry = (bool(failed) and all(getattr(report, "transient", None) for report in failed)
+                     and attempt < self.retries)
+            if retry and not self.budget.take():
+                retry = False
+                for report in failed:
+                    report.retry_denied = True  # бюджет исчерпан
+            for report in reports:
+                if retry and report.failed:
+                    report.outcome = "rerun"
+                ihook.pytest_runtest_logreport(report=report)
+            if not retry:
+                break
+            attempt += 1
+        ihook.pytest_runtest_logfinish(nodeid=item.nodeid, location=item.location)
+        return True
+
+    def pytest_report_teststatus(self, report):
+        if report.outcome == "rerun":
+            return "rerun", "R", ("RERUN", {"yellow": True})
+        return None
+
+    def pytest_runtest_logreport(self, report):
+        if report.outcome == "rerun":
+            self.reruns.append((report.nodeid, getattr(report, "transient", None) or report.when))
+        elif getattr(report, "retry_denied", False):
+            self.exhausted.append(report.nodeid)
+
+    def pytest_terminal_summary(self, terminalreporter, config):
+        if hasattr(config, "workerinput") or not (self.reruns or self.exhausted):
+            return
+        terminalreporter.write_sep("-", f"повторы при временных ошибках: {len(self.reruns)} "
+                                        f"(бюджет {self.budget.total} на прогон)")
+        for nodeid, reason in self.reruns:
+            terminalreporter.write_line(f"{nodeid}: {reason}")
+        if self.exhausted:
+            terminalreporter.write_line(f"бюджет исчерпан, не повторены: {', '.join(self.exhausted)}")
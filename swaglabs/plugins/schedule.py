@@ -0,0 +1,104 @@
+"""
+schedule.py
+Плагин pytest: история длительности тестов и раздача тестов воркерам
+pytest-xdist "сначала самые длинные" (--duration-schedule).
+
+    pytest tests/ -n 4 --duration-schedule
+    pytest tests/ --duration-schedule --duration-history .swaglabs/durations.json
+
+Без -n плагин только пополняет историю. В конце прогона печатается
+прогноз makespan (по истории) рядом с фактическим.
+"""
+
+import os
+import time
+from collections import defaultdict
+from pathlib import Path
+from typing import Dict, Set
+
+import pytest
+
+from swaglabs.durations import DurationHistory
+
+history_key = pytest.StashKey[DurationHistory]()
+scheduler_key = pytest.StashKey[object]()
+
+
+def pytest_addoption(parser):
+    parser.addoption(
+        "--duration-schedule",
+        action="store_true",
+        default=os.getenv("SWAG_DURATION_SCHEDULE", "").lower() in ("1", "true", "yes", "on"),
+        help="записывать длительность тестов и раздавать их воркерам xdist, начиная с самых длинных",
+    )
+    parser.addoption(
+        "--duration-history",
+        default=os.getenv("SWAG_DURATION_HISTORY", ".swaglabs/durations.json"),
+        help="файл истории длительности тестов (nodeid → замеры)",
+    )
+
+
+def pytest_configure(config):
+    if not config.getoption("--duration-schedule") or hasattr(config, "workerinput"):
+        return
+    history = DurationHistory(Path(config.getoption("--duration-history")))
+    config.stash[history_key] = history
+    config.pluginmanager.register(DurationRecorder(history), "swaglabs-durations")
+
+
+@pytest.hookimpl(optionalhook=True)
+def pytest_xdist_make_scheduler(config, log):
+    history = config.stash.get(history_key, None)
+    if history is None or config.getoption("dist") != "load":
+        return None
+    from swaglabs.scheduling import DurationScheduling
+
+    scheduler = DurationScheduling(config, log, history)
+    config.stash[scheduler_key] = scheduler
+    return scheduler
+
+
+class DurationRecorder:
+    """Собирает длительности в контроллере и обновляет историю в конце сессии"""
+
+    def __init__(self, history: DurationHistory):
+        self.history = history
+        self.durations: Dict[str, float] = defaultdict(float)
+        self.skipped: Set[str] = set()
+        self.workers: Dict[str, float] = defaultdict(float)
+        self.started = time.perf_counter()
+        self.wall = 0.0
+
+    def pytest_sessionstart(self, session):
+        self.started = time.perf_counter()
+
+    def pytest_runtest_logreport(self, report):
+        # setup + call + teardown: фикстуры вроде page тоже занимают воркер
+        self.durations[report.nodeid] += report.duration
+        if report.skipped:
+            self.skipped.add(report.nodeid)
+        node = getattr(report, "node", None)
+        self.workers[node.gateway.id if node is not None else "main"] += report.duration
+
+    def pytest_sessionfinish(self, session):
+        self.wall = time.perf_counter() - self.started
+        measured = {nodeid: seconds for nodeid, seconds in self.durations.items() if nodeid not in self.skipped}
+        for nodeid, seconds in measured.items():
+            self.history.add(nodeid, seconds)
+        if measured:
+            self.history.save()
+
+    def pytest_terminal_summary(self, terminalreporter, config):
+        if not self.workers:
+            return
+        terminalreporter.write_sep("-", f"длительность тестов (история: {self.history.path})")
+        busiest, actual = max(self.workers.items(), key=lambda item: item[1])
+        scheduler = config.stash.get(scheduler_key, None)
+        if scheduler is not None:
+            terminalreporter.write_line(
+                f"makespan: прогноз {scheduler.predicted_makespan:.1f} с, факт {actual:.1f} с "
+                f"(самый загруженный воркер {busiest}), общее время {self.wall:.1f} с"
+            )
+        terminalreporter.write_line(
+            "загрузка воркеров: " + ", ".join(f"{worker} {seconds:.1f} с" for worker, seconds in sorted(self.workers.items()))
+        )
@@ -0,0 +1,127 @@
+"""
+server.py
+Плагин pytest: долгоживущий сервер браузера вместо запуска браузера
+в каждом прогоне (--browser-server, см. swaglabs.browser_server).
+
+    pytest tests/test_sorting.py::TestProductSorting::test_all_sorting_options --browser-server
+    python -m swaglabs.browser_server stop
+
+Первый прогон запускает сервер, следующие подключаются к нему по WebSocket.
+Сервер останавливается сам через --browser-server-idle секунд без прогонов.
+Если подключиться не удалось, браузер запускается обычным способом.
+Время подготовки браузера печатается в конце прогона в любом режиме.
+"""
+
+import os
+import statistics
+import time
+from collections import defaultdict
+from pathlib import Path
+
+import pytest
+from playwright.sync_api import Error as PlaywrightError
+
+from swaglabs.browser_server import IDLE_TIMEOUT, STATE_DIR, ensure_server, lease, state_path
+
+mode_key = pytest.StashKey[str]()
+startup_key = pytest.StashKey[float]()
+
+LAUNCH = "запуск браузера"
+CONNECT = "подключение к серверу"
+START_AND_CONNECT = "запуск сервера и подключение"
+
+
+def pytest_addoption(parser):
+    parser.addoption(
+        "--browser-server",
+        action="store_true",
+        default=os.getenv("SWAG_BROWSER_SERVER", "").lower() in ("1", "true", "yes", "on"),
+        help="подключаться к долгоживущему серверу браузера (запускается при первом прогоне)",
+    )
+    parser.addoption(
+        "--browser-server-idle",
+        type=float,
+        default=float(os.getenv("SWAG_BROWSER_SERVER_IDLE", IDLE_TIMEOUT)),
+        help="через сколько секунд без прогонов сервер браузера останавливается",
+    )
+    parser.addoption(
+        "--browser-server-dir",
+        default=os.getenv("SWAG_BROWSER_SERVER_DIR", str(STATE_DIR)),
+        help="каталог файлов состояния сервера браузера",
+    )
+
+
+def pytest_configure(config):
+    if config.getoption("--browser-server"):
+        config.pluginmanager.register(BrowserServerFixtures(), "swaglabs-browser-server")
+    if not hasattr(config, "workerinput"):
+        config.pluginmanager.register(BrowserStartupReporter(), "swaglabs-browser-startup")
+
+
+class BrowserServerFixtures:
+    """Подменяет browser из pytest-playwright (регистрируется после него)"""
+
+    @pytest.fixture(scope="session")
+    def browser(self, browser_type, browser_type_launch_args, launch_browser, pytestconfig):
+        path = state_path(Path(pytestconfig.getoption("--browser-server-dir")), browser_type.name,
+                          browser_type_launch_args)
+        with lease(path):
+            browser = None
+            try:
+                server, started = ensure_server(path.parent, browser_type.name, browser_type_launch_args,
+                                                pytestconfig.getoption("--browser-server-idle"))
+                browser = browser_type.connect(server.ws_endpoint)
+                pytestconfig.stash[mode_key] = START_AND_CONNECT if started else CONNECT
+            except (RuntimeError, OSError, PlaywrightError) as error:
+                print(f"\n⚠️ Сервер браузера недоступен, обычный запуск: {error}")
+            if browser is None:
+                browser = launch_browser()
+                pytestconfig.stash[mode_key] = LAUNCH
+            yield browser
+            # У подключенного браузера close() только отключается от сервера
+            browser.close()
+
+
+@pytest.hookimpl(hookwrapper=True)
+def pytest_fixture_setup(fixturedef, request):
+    if fixturedef.argname != "browser":
+        yield
+        return
+    started = time.perf_counter()
+    yield
+    config = request.config
+    config.stash[startup_key] = (time.perf_counter() - started) * 1000
+    config.stash.setdefault(mode_key, LAUNCH)
+
+
+@pytest.hookimpl(hookwrapper=True)
+def pytest_runtest_setup(item):
+    yield
+    # Браузер один на процесс: время его подготовки попадает в отчет первого теста
+    startup = item.config.stash.get(startup_key, None)
+    if startup is not None:
+        del item.config.stash[startup_key]
+        item.user_properties.append(("browser_startup_ms", round(startup, 1)))
+        item.user_properties.append(("browser_mode", item.config.stash[mode_key]))
+
+
+class BrowserStartupReporter:
+    def __init__(self):
+        self.samples = defaultdict(list)
+
+    def pytest_runtest_logreport(self, report):
+        if report.when != "setup":
+            return
+        properties = dict(report.user_properties)
+        if "browser_startup_ms" in properties:
+            self.samples[properties["browser_mode"]].append(properties["browser_startup_ms"])
+
+    def pytest_terminal_summary(self, terminalreporter, config):
+        if not self.samples:
+            return
+        terminalreporter.write_sep("-", "подготовка браузера")
+        for mode, samples in self.samples.items():
+            terminalreporter.write_line(
+                f"{mode}: {len(samples)} раз, среднее {statistics.mean(samples):.0f} мс, "
+                f"максимум {max(samples):.0f} мс"
+            )
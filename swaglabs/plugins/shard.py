@@ -0,0 +1,86 @@
+"""
+shard.py
+Плагин pytest: детерминированное деление тестов между машинами CI (--shard i/N).
+
+Тесты делятся LPT-распределением по истории длительности
+(--duration-history, см. swaglabs.durations), поэтому шарды получаются
+примерно равными по времени. При одинаковом файле истории и одинаковом наборе
+тестов деление одинаково на всех машинах. Отчеты шардов потом собираются
+командой python -m swaglabs.merge.
+
+    pytest tests/ --shard 1/3 --duration-history ci-cache/durations.json
+"""
+
+import os
+from pathlib import Path
+from typing import Optional, Tuple
+
+import pytest
+
+from swaglabs.durations import DurationHistory, lpt_assign
+
+shard_key = pytest.StashKey[Tuple[int, int]]()
+estimate_key = pytest.StashKey[Tuple[float, float]]()
+
+
+def parse_shard(value: str) -> Tuple[int, int]:
+    """'2/4' → (2, 4); номер шарда с единицы"""
+    try:
+        index, total = (int(part) for part in value.split("/"))
+    except ValueError:
+        raise pytest.UsageError(f"--shard: ожидается i/N, получено {value!r}") from None
+    if total < 1 or not 1 <= index <= total:
+        raise pytest.UsageError(f"--shard: номер шарда должен быть от 1 до N, получено {value!r}")
+    return index, total
+
+
+def pytest_addoption(parser):
+    parser.addoption(
+        "--shard",
+        default=os.getenv("SWAG_SHARD"),
+        help="запустить только часть i из N (например 2/4), деление по истории длительности",
+    )
+
+
+def pytest_configure(config):
+    value: Optional[str] = config.getoption("--shard")
+    if value:
+        config.stash[shard_key] = parse_shard(value)
+
+
+# trylast: делим то, что осталось после -k/-m и прочих фильтров
+@pytest.hookimpl(trylast=True)
+def pytest_collection_modifyitems(config, items):
+    shard = config.stash.get(shard_key, None)
+    if shard is None or not items:
+        return
+    index, total = shard
+
+    history = DurationHistory(Path(config.getoption("--duration-history")))
+    nodeids = [item.nodeid for item in items]
+    estimates = history.estimates(nodeids)
+    groups, loads = lpt_assign(nodeids, estimates, total)
+    selected = set(groups[index - 1])
+
+    config.stash[estimate_key] = (loads[index - 1], max(loads))
+    deselected = [item for item in items if item.nodeid not in selected]
+    if deselected:
+        config.hook.pytest_deselected(items=deselected)
+        items[:] = [item for item in items if item.nodeid in selected]
+
+
+def pytest_report_header(config):
+    shard = config.stash.get(shard_key, None)
+    if shard is not None:
+        return f"шард: {shard[0]}/{shard[1]}, история длительности: {config.getoption('--duration-history')}"
+
+
+def pytest_terminal_summary(terminalreporter, config):
+    estimate = config.stash.get(estimate_key, None)
+    if estimate is None:
+        return
+    index, total = config.stash[shard_key]
+    own, slowest = estimate
+    terminalreporter.write_line(
+        f"шард {index}/{total}: оценка {own:.1f} с (самый долгий шард по оценке: {slowest:.1f} с)"
+    )
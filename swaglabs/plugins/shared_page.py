@@ -0,0 +1,107 @@
+"""
+shared_page.py
+Плагин pytest: одна авторизованная страница на класс для тестов
+с маркером read_only (--shared-page, см. swaglabs.shared_page).
+
+    pytest tests/test_sorting.py --shared-page
+
+    @pytest.mark.read_only   # тесты класса только читают каталог и меняют сортировку
+
+Общая страница живет в своем контексте, поэтому фикстуры, которые
+настраивают контекст теста (context в tests/conftest.py: шаги,
+метрики, трассировка), для таких тестов не создаются. Остальные тесты
+получают обычную страницу.
+"""
+
+import os
+from collections import Counter
+
+import pytest
+
+from swaglabs.auth import merge_context_args
+from swaglabs.plugins.resources import blocker_for
+from swaglabs.shared_page import SharedPage
+
+
+def pytest_addoption(parser):
+    parser.addoption(
+        "--shared-page",
+        action="store_true",
+        default=os.getenv("SWAG_SHARED_PAGE", "").lower() in ("1", "true", "yes", "on"),
+        help="одна страница на класс для тестов с маркером read_only (сброс состояния между тестами)",
+    )
+
+
+def pytest_configure(config):
+    config.addinivalue_line(
+        "markers",
+        "read_only: тест только читает каталог и меняет сортировку, с --shared-page страница общая на класс",
+    )
+    if config.getoption("--shared-page"):
+        config.pluginmanager.register(SharedPageFixtures(), "swaglabs-shared-page")
+        if not hasattr(config, "workerinput"):
+            config.pluginmanager.register(SharedPageReporter(), "swaglabs-shared-page-report")
+
+
+def _shared(item) -> bool:
+    return item.get_closest_marker("read_only") is not None and item.cls is not None
+
+
+class SharedPageFixtures:
+    """Подменяет page из pytest-playwright (регистрируется после него)"""
+
+    @pytest.fixture(scope="class")
+    def shared_page(self, request, browser, browser_context_args, auth_session):
+        blocker = blocker_for(request.node)
+
+        def new_context():
+            kwargs = merge_context_args(None, auth_session.storage_state())
+            context = browser.new_context(**{**browser_context_args, **kwargs})
+            blocker.install(context)
+            return context
+
+        shared = SharedPage(new_context, auth_session.open_inventory, auth_session.inventory_url)
+        yield shared
+        shared.close()
+
+    @pytest.fixture
+    def page(self, request):
+        if not _shared(request.node):
+            yield request.getfixturevalue("context").new_page()
+            return
+        shared = request.getfixturevalue("shared_page")
+        opened, replaced = shared.opened, len(shared.replaced)
+        page = shared.acquire()
+        request.node.user_properties.append(("shared_page", "новая" if shared.opened > opened else "общая"))
+        for reason in shared.replaced[replaced:]:
+            request.node.user_properties.append(("shared_page_replaced", reason))
+        yield page
+        # rep_call выставляет pytest-playwright
+        report = getattr(request.node, "rep_call", None)
+        shared.release(healthy=report is not None and report.passed)
+
+
+class SharedPageReporter:
+    def __init__(self):
+        self.modes = Counter()
+        self.replaced = Counter()
+
+    def pytest_runtest_logreport(self, report):
+        if report.when != "setup":
+            return
+        for name, value in report.user_properties:
+            if name == "shared_page":
+                self.modes[value] += 1
+            elif name == "shared_page_replaced":
+                self.replaced[value] += 1
+
+    def pytest_terminal_summary(self, terminalreporter):
+        if not self.modes:
+            return
+        terminalreporter.write_sep("-", "общая страница (read_only)")
+        terminalreporter.write_line(
+            f"тестов: {sum(self.modes.values())}, на общей странице: {self.modes['общая']}, "
+            f"открыто страниц: {self.modes['новая']}"
+        )
+        for reason, times in self.replaced.most_common():
+            terminalreporter.write_line(f"замена страницы ×{times}: {reason}")
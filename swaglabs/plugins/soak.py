@@ -0,0 +1,82 @@
+"""
+soak.py
+Плагин pytest: soak-режим (тесты с маркером soak, см. swaglabs.soak).
+Без --soak-iterations такие тесты пропускаются.
+
+    pytest tests/ -m soak --soak-iterations 2000 --soak-sample-every 50
+    pytest tests/ -m soak --soak-iterations 5000 --soak-heap-kb 1 --soak-latency-ms 0.02
+
+Пороги — допустимый рост на итерацию по линейному тренду. Ряды замеров
+сохраняются в <soak-dir>/<run_id>/<тест>.csv.
+"""
+
+import os
+from pathlib import Path
+
+import pytest
+
+from swaglabs import settings
+from swaglabs.soak import LIMITS, SoakSettings
+
+
+def pytest_addoption(parser):
+    parser.addoption(
+        "--soak-iterations",
+        type=int,
+        default=int(os.getenv("SWAG_SOAK_ITERATIONS", "0")),
+        help="сколько раз повторять сценарий в soak-тестах (0 — soak-тесты пропускаются)",
+    )
+    parser.addoption(
+        "--soak-sample-every",
+        type=int,
+        default=int(os.getenv("SWAG_SOAK_SAMPLE_EVERY", "50")),
+        help="замер метрик каждые N итераций",
+    )
+    parser.addoption("--soak-heap-kb", type=float,
+                     default=float(os.getenv("SWAG_SOAK_HEAP_KB", LIMITS["heap_kb"])),
+                     help="допустимый рост JS-кучи на итерацию, КБ")
+    parser.addoption("--soak-nodes", type=float,
+                     default=float(os.getenv("SWAG_SOAK_NODES", LIMITS["nodes"])),
+                     help="допустимый рост числа DOM-узлов на итерацию")
+    parser.addoption("--soak-listeners", type=float,
+                     default=float(os.getenv("SWAG_SOAK_LISTENERS", LIMITS["listeners"])),
+                     help="допустимый рост числа обработчиков событий на итерацию")
+    parser.addoption("--soak-latency-ms", type=float,
+                     default=float(os.getenv("SWAG_SOAK_LATENCY_MS", LIMITS["iteration_ms"])),
+                     help="допустимый рост времени итерации на итерацию, мс")
+    parser.addoption(
+        "--soak-dir",
+        default=os.getenv("SWAG_SOAK_DIR", "reports/soak"),
+        help="каталог рядов замеров soak-тестов",
+    )
+
+
+def pytest_configure(config):
+    config.addinivalue_line("markers", "soak: долгий прогон сценария с контролем роста памяти (--soak-iterations)")
+
+
+def pytest_collection_modifyitems(config, items):
+    if config.getoption("--soak-iterations") > 0:
+        return
+    skip = pytest.mark.skip(reason="soak-тест: включается --soak-iterations N")
+    for item in items:
+        if item.get_closest_marker("soak") is not None:
+            item.add_marker(skip)
+
+
+@pytest.fixture
+def soak_settings(pytestconfig, browser_name) -> SoakSettings:
+    """Параметры soak-прогона из командной строки"""
+    if browser_name != "chromium":
+        pytest.skip(f"soak-метрики снимаются через CDP, только в Chromium (сейчас {browser_name})")
+    return SoakSettings(
+        iterations=pytestconfig.getoption("--soak-iterations"),
+        sample_every=pytestconfig.getoption("--soak-sample-every"),
+        limits={
+            "heap_kb": pytestconfig.getoption("--soak-heap-kb"),
+            "nodes": pytestconfig.getoption("--soak-nodes"),
+            "listeners": pytestconfig.getoption("--soak-listeners"),
+            "iteration_ms": pytestconfig.getoption("--soak-latency-ms"),
+        },
+        directory=Path(pytestconfig.getoption("--soak-dir")) / settings.run_id(),
+    )
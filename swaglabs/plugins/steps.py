@@ -0,0 +1,117 @@
+"""
+steps.py
+Плагин pytest: запись шагов (swaglabs.steps) в JSONL-файл на каждый прогон
+и таблица самых медленных шагов в конце сессии.
+
+    pytest tests/ --step-timings
+    pytest tests/ --step-timings --step-timings-dir reports/steps
+"""
+
+import json
+import os
+import statistics
+from pathlib import Path
+from typing import Dict, List, Optional
+
+import pytest
+
+from swaglabs.settings import run_id
+from swaglabs.steps import StepRecorder
+
+SLOWEST_STEPS = 10
+
+
+def _enabled(config) -> bool:
+    return bool(config.getoption("--step-timings"))
+
+
+def pytest_addoption(parser):
+    parser.addoption(
+        "--step-timings",
+        action="store_true",
+        default=os.getenv("SWAG_STEP_TIMINGS", "").lower() in ("1", "true", "yes", "on"),
+        help="замерять шаги тестов (время, вызовы Playwright, сетевые запросы)",
+    )
+    parser.addoption(
+        "--step-timings-dir",
+        default=os.getenv("SWAG_STEP_TIMINGS_DIR", "reports/steps"),
+        help="каталог для <run_id>.jsonl с замерами шагов",
+    )
+
+
+def pytest_configure(config):
+    # Контроллер фиксирует run id до старта воркеров, воркеры наследуют окружение
+    run_id()
+    if _enabled(config) and not hasattr(config, "workerinput"):
+        path = Path(config.getoption("--step-timings-dir")) / f"{run_id()}.jsonl"
+        config.pluginmanager.register(StepTimingsReporter(path), "swaglabs-step-timings")
+
+
+@pytest.fixture
+def step_recorder(request) -> Optional[StepRecorder]:
+    """Активный StepRecorder теста (None, если --step-timings выключен)"""
+    if not _enabled(request.config):
+        yield None
+        return
+
+    browser_name = request.node.callspec.params.get("browser_name") if hasattr(request.node, "callspec") else None
+    recorder = StepRecorder(request.node.nodeid, {"run_id": run_id(), "browser": browser_name})
+    recorder.start()
+    yield recorder
+    recorder.stop()
+    request.node.user_properties.append(("steps", recorder.records))
+
+
+class StepTimingsReporter:
+    """Пишет шаги в JSONL и печатает сводку; живет только в контроллере"""
+
+    def __init__(self, path: Path):
+        self.path = path
+        self.records: List[Dict] = []
+
+    def pytest_runtest_logreport(self, report):
+        if report.when != "teardown":
+            return
+        steps = dict(report.user_properties).get("steps")
+        if not steps:
+            return
+        self.records.extend(steps)
+        self.path.parent.mkdir(parents=True, exist_ok=True)
+        with self.path.open("a", encoding="utf-8") as fh:
+            for record in steps:
+                fh.write(json.dumps(record, ensure_ascii=False) + "\n")
+
+    def pytest_terminal_summary(self, terminalreporter):
+        if not self.records:
+            return
+        slowest = sorted(self.records, key=lambda r: r["duration_ms"], reverse=True)[:SLOWEST_STEPS]
+        terminalreporter.write_sep("-", f"самые медленные шаги (всего шагов: {len(self.records)})")
+        terminalreporter.write_line(f"{'мс':>9} | {'вызовы PW':>9} | {'запросы':>7} | шаг")
+        for record in slowest:
+            test_name = record["nodeid"].split("::")[-1]
+            terminalreporter.write_line(
+                f"{record['duration_ms']:>9.1f} | {record['pw_calls']:>9} | {record['requests']:>7} | "
+                f"{test_name} → {record['step']}"
+            )
+        self._write_comparison(terminalreporter, "throttle", "none", "шаги по профилям эмуляции (медиана, мс)")
+        self._write_comparison(terminalreporter, "browser", "—", "шаги по браузерам (медиана, мс)")
+        terminalreporter.write_line(f"Замеры: {self.path}")
+
+    def _write_comparison(self, terminalreporter, tag: str, default: str, title: str) -> None:
+        """
+        Медиана шагов по значениям тега: профили эмуляции (--throttle),
+        браузеры (--browser-matrix). Таблица печатается, если значений больше одного
+        """
+        values = list(dict.fromkeys(record.get(tag) or default for record in self.records))
+        if len(values) < 2:
+            return
+        durations: Dict[str, Dict[str, List[float]]] = {}
+        for record in self.records:
+            value = record.get(tag) or default
+            durations.setdefault(record["step"], {}).setdefault(value, []).append(record["duration_ms"])
+        terminalreporter.write_sep("-", title)
+        terminalreporter.write_line(" | ".join(f"{value:>9}" for value in values) + " | шаг")
+        for name, by_value in durations.items():
+            cells = [f"{statistics.median(by_value[value]):>9.0f}" if value in by_value else f"{'—':>9}"
+                     for value in values]
+            terminalreporter.write_line(" | ".join(cells) + f" | {name}")
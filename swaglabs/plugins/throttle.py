@@ -0,0 +1,101 @@
+"""
+throttle.py
+Плагин pytest: прогон тестов под эмуляцией медленной сети и процессора
+(см. swaglabs.throttling). Только Chromium: в других браузерах такие
+тесты пропускаются.
+
+    pytest tests/ --throttle 3g --step-timings
+    pytest tests/ --browser chromium --throttle none,slow-4g,3g --step-timings
+
+    @pytest.mark.throttle("slow-4g")   # профиль для класса/теста
+
+Если в --throttle несколько профилей, каждый тест с контекстом
+выполняется под каждым из них ([3g], [slow-4g] в имени теста), а в
+сводке --step-timings шаги сравниваются по профилям.
+
+Статика из HTTP-кэша (--http-cache) отдается через route.fulfill мимо
+сетевой эмуляции CDP: под --throttle попадания в кэш приходят без
+задержки, и замеры получаются оптимистичнее реальных.
+"""
+
+import os
+from typing import List, Optional
+
+import pytest
+
+from swaglabs.throttling import PROFILES, Throttling, parse_profiles
+
+FIXTURE = "throttling"
+
+
+def pytest_addoption(parser):
+    parser.addoption(
+        "--throttle",
+        default=os.getenv("SWAG_THROTTLE", ""),
+        help=f"профили эмуляции через запятую: {', '.join(PROFILES)} "
+             "(несколько профилей — тест выполняется под каждым)",
+    )
+
+
+def pytest_configure(config):
+    config.addinivalue_line("markers", "throttle(name): профиль эмуляции сети/процессора для теста (Chromium)")
+    try:
+        parse_profiles(config.getoption("--throttle"))
+    except ValueError as error:
+        raise pytest.UsageError(str(error))
+
+
+def _option_profiles(config) -> List[str]:
+    return parse_profiles(config.getoption("--throttle"))
+
+
+def pytest_generate_tests(metafunc):
+    if FIXTURE not in metafunc.fixturenames or metafunc.definition.get_closest_marker("throttle"):
+        return
+    profiles = _option_profiles(metafunc.config)
+    if len(profiles) > 1:
+        metafunc.parametrize(FIXTURE, profiles, indirect=True, ids=profiles)
+
+
+def profile_name(item) -> Optional[str]:
+    """Профиль теста: маркер > параметр (несколько профилей в --throttle) > опция"""
+    marker = item.get_closest_marker("throttle")
+    if marker is not None:
+        return marker.args[0]
+    callspec = getattr(item, "callspec", None)
+    if callspec is not None and FIXTURE in callspec.params:
+        return callspec.params[FIXTURE]
+    profiles = _option_profiles(item.config)
+    return profiles[0] if profiles else None
+
+
+@pytest.hookimpl(tryfirst=True)
+def pytest_runtest_setup(item):
+    # До фикстур: браузер и контекст для пропускаемого теста не нужны
+    if FIXTURE not in getattr(item, "fixturenames", ()):
+        return
+    name = profile_name(item)
+    if name is None:
+        return
+    if name not in PROFILES:
+        pytest.fail(f"неизвестный профиль эмуляции {name!r} (есть: {', '.join(PROFILES)})", pytrace=False)
+    callspec = getattr(item, "callspec", None)
+    browser_name = callspec.params.get("browser_name") if callspec is not None else None
+    browser_name = browser_name or item.config.getoption("--browser", None) or "chromium"
+    if isinstance(browser_name, list):
+        browser_name = browser_name[0] if browser_name else "chromium"
+    if browser_name != "chromium":
+        pytest.skip(f"эмуляция {name} работает через CDP, только в Chromium (сейчас {browser_name})")
+
+
+@pytest.fixture
+def throttling(request) -> Optional[Throttling]:
+    """Throttling теста (None без профиля); к контексту его подключает фикстура context"""
+    name = profile_name(request.node)
+    if name is None:
+        yield None
+        return
+    throttle = Throttling(PROFILES[name])
+    request.node.user_properties.append(("throttle", name))
+    yield throttle
+    throttle.detach()
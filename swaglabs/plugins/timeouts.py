@@ -0,0 +1,138 @@
+"""
+timeouts.py
+Плагин pytest: адаптивные таймауты ожиданий и шагов по истории задержек
+(--adaptive-timeouts, см. swaglabs.timeouts).
+
+    pytest tests/ --adaptive-timeouts
+    pytest tests/ --adaptive-timeouts --timeout-factor 4 --timeout-floor 2000
+
+Замеры успешных ожиданий копятся в --timeout-history (по умолчанию
+.swaglabs/latency.json), таймаут = p99 × factor в пределах [floor, ceiling].
+В конце прогона печатаются ожидания, которые ближе всего подошли к таймауту.
+"""
+
+import os
+from pathlib import Path
+from typing import List
+
+import pytest
+
+from swaglabs import timeouts
+from swaglabs.timeouts import (
+    CEILING_MS, FACTOR, FLOOR_MS, HISTORY_PATH, NEAR_TIMEOUT, LatencyHistory, Observation, TimeoutPolicy, summarize,
+)
+
+SHOW_KEYS = 10
+
+
+def pytest_addoption(parser):
+    parser.addoption(
+        "--adaptive-timeouts",
+        action="store_true",
+        default=os.getenv("SWAG_ADAPTIVE_TIMEOUTS", "").lower() in ("1", "true", "yes", "on"),
+        help="таймауты ожиданий и шагов по истории задержек вместо одного общего",
+    )
+    parser.addoption(
+        "--timeout-history",
+        default=os.getenv("SWAG_TIMEOUT_HISTORY", str(HISTORY_PATH)),
+        help="файл истории задержек ожиданий и шагов",
+    )
+    parser.addoption(
+        "--timeout-factor",
+        type=float,
+        default=float(os.getenv("SWAG_TIMEOUT_FACTOR", FACTOR)),
+        help="запас: таймаут = p99 × factor",
+    )
+    parser.addoption(
+        "--timeout-floor",
+        type=float,
+        default=float(os.getenv("SWAG_TIMEOUT_FLOOR", FLOOR_MS)),
+        help="нижняя граница адаптивного таймаута, мс",
+    )
+    parser.addoption(
+        "--timeout-ceiling",
+        type=float,
+        default=float(os.getenv("SWAG_TIMEOUT_CEILING", CEILING_MS)),
+        help="верхняя граница и таймаут без истории, мс",
+    )
+
+
+def pytest_configure(config):
+    if not config.getoption("--adaptive-timeouts"):
+        return
+    policy = TimeoutPolicy(
+        LatencyHistory(Path(config.getoption("--timeout-history"))),
+        factor=config.getoption("--timeout-factor"),
+        floor=config.getoption("--timeout-floor"),
+        ceiling=config.getoption("--timeout-ceiling"),
+    )
+    timeouts.activate(policy)
+    if hasattr(config, "workerinput"):
+        config.pluginmanager.register(WorkerLatency(policy), "swaglabs-latency-worker")
+    else:
+        config.pluginmanager.register(AdaptiveTimeoutsReporter(policy), "swaglabs-adaptive-timeouts")
+
+
+def pytest_unconfigure(config):
+    timeouts.activate(None)
+
+
+@pytest.fixture
+def adaptive_timeouts():
+    """Активная TimeoutPolicy (None, если --adaptive-timeouts выключен)"""
+    policy = timeouts.current_policy()
+    yield policy
+    if policy is not None:
+        policy.detach()
+
+
+class WorkerLatency:
+    """Воркер xdist отдает замеры контроллеру через workeroutput"""
+
+    def __init__(self, policy: TimeoutPolicy):
+        self.policy = policy
+
+    def pytest_sessionfinish(self, session):
+        session.config.workeroutput["latency"] = [list(item) for item in self.policy.observations]
+
+
+class AdaptiveTimeoutsReporter:
+    """Пополняет историю и печатает ожидания, близкие к таймауту; живет только в контроллере"""
+
+    def __init__(self, policy: TimeoutPolicy):
+        self.policy = policy
+        self.observations: List[Observation] = []
+
+    @pytest.hookimpl(optionalhook=True)
+    def pytest_testnodedown(self, node, error):
+        for item in getattr(node, "workeroutput", {}).get("latency", []):
+            self.observations.append(Observation(*item))
+
+    def pytest_sessionfinish(self, session):
+        # Без xdist замеры копятся в политике самого контроллера
+        self.observations.extend(self.policy.observations)
+        history = self.policy.history
+        for observation in self.observations:
+            if observation.ok:
+                history.add(observation.key, observation.elapsed_ms)
+        if self.observations:
+            history.save()
+
+    def pytest_terminal_summary(self, terminalreporter):
+        if not self.observations:
+            return
+        summaries = summarize(self.observations)
+        near = [summary for summary in summaries if summary.failed or summary.headroom >= NEAR_TIMEOUT]
+        learned = sum(1 for summary in summaries if summary.timeout_ms is not None
+                      and summary.timeout_ms < self.policy.ceiling)
+        terminalreporter.write_sep("-", f"адаптивные таймауты (история: {self.policy.history.path})")
+        terminalreporter.write_line(
+            f"ожиданий и шагов: {len(summaries)}, с таймаутом по истории: {learned}, "
+            f"близко к таймауту (≥{NEAR_TIMEOUT:.0%}) или упало: {len(near)}"
+        )
+        terminalreporter.write_line(f"{'p99 мс':>9} | {'таймаут мс':>10} | {'занято':>6} | {'упало':>5} | ожидание")
+        for summary in (near or summaries)[:SHOW_KEYS]:
+            timeout = f"{summary.timeout_ms:.0f}" if summary.timeout_ms is not None else "—"
+            terminalreporter.write_line(
+                f"{summary.p99_ms:>9.0f} | {timeout:>10} | {summary.headroom:>6.0%} | {summary.failed:>5} | {summary.key}"
+            )
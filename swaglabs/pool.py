@@ -0,0 +1,160 @@
+"""
+pool.py
+Пул прогретых контекстов браузера с быстрым сбросом состояния между тестами.
+
+Вместо browser.new_context() на каждый тест контекст живет весь сеанс воркера,
+а между тестами очищается: закрываются вкладки (вместе с ними уходит
+sessionStorage и viewport страниц), удаляются cookies, разрешения
+и localStorage всех origin, которые тест успел посетить. Если после сброса
+контекст не прошел проверку, он закрывается и заменяется новым.
+"""
+
+from typing import Dict, List, Optional, Set
+from urllib.parse import urlsplit
+
+from playwright.sync_api import Browser, BrowserContext, Error, Frame, Page
+
+# Пустая страница, которую отдаем вместо настоящей, чтобы получить доступ
+# к localStorage нужного origin без запроса к серверу
+BLANK_PATH = "/__swaglabs_reset__"
+
+CLEAR_STORAGE_JS = """
+async () => {
+    localStorage.clear();
+    sessionStorage.clear();
+    if (indexedDB.databases) {
+        for (const db of await indexedDB.databases()) indexedDB.deleteDatabase(db.name);
+    }
+}
+"""
+
+SEED_STORAGE_JS = """
+items => { for (const { name, value } of items) localStorage.setItem(name, value); }
+"""
+
+
+def _origin(url: str) -> Optional[str]:
+    parts = urlsplit(url)
+    if parts.scheme not in ("http", "https"):
+        return None
+    return f"{parts.scheme}://{parts.netloc}"
+
+
+class PooledContext:
+    """Контекст из пула и origin, которые в нем посещались"""
+
+    def __init__(self, context: BrowserContext):
+        self.context = context
+        self.origins: Set[str] = set()
+        self.uses = 0
+        context.on("page", self._watch_page)
+
+    def _watch_page(self, page: Page) -> None:
+        page.on("framenavigated", self._remember)
+
+    def _remember(self, frame: Frame) -> None:
+        origin = _origin(frame.url)
+        if origin:
+            self.origins.add(origin)
+
+
+class ContextPool:
+    """
+    Пул контекстов одного воркера.
+
+    acquire() выдает чистый контекст (с применённым storage_state, если он задан),
+    release() сбрасывает его и возвращает в пул, либо закрывает, если тест упал
+    или сброс не удался.
+    """
+
+    def __init__(self, browser: Browser, context_args: Dict, size: int = 1):
+        self.browser = browser
+        self.context_args = context_args
+        self.size = max(1, size)
+        self._idle: List[PooledContext] = []
+        self._busy: Dict[BrowserContext, PooledContext] = {}
+        self.created = 0
+        self.reused = 0
+        self.discarded = 0
+
+    def warm_up(self) -> None:
+        while len(self._idle) < self.size:
+            self._idle.append(self._new())
+
+    def _new(self) -> PooledContext:
+        self.created += 1
+        return PooledContext(self.browser.new_context(**self.context_args))
+
+    def acquire(self, storage_state: Optional[Dict] = None) -> BrowserContext:
+        if self._idle:
+            pooled = self._idle.pop()
+            self.reused += 1
+        else:
+            pooled = self._new()
+        pooled.uses += 1
+        if storage_state:
+            self._apply_state(pooled, storage_state)
+        self._busy[pooled.context] = pooled
+        return pooled.context
+
+    def release(self, context: BrowserContext, healthy: bool = True) -> None:
+        pooled = self._busy.pop(context)
+        if healthy:
+            try:
+                self._reset(pooled)
+                healthy = self._is_clean(pooled)
+            except Error:
+                healthy = False
+        if healthy:
+            self._idle.append(pooled)
+        else:
+            self.discarded += 1
+            self._close(pooled)
+
+    def close(self) -> None:
+        for pooled in self._idle + list(self._busy.values()):
+            self._close(pooled)
+        self._idle.clear()
+        self._busy.clear()
+
+    def _close(self, pooled: PooledContext) -> None:
+        try:
+            pooled.context.close()
+        except Error:
+            pass
+
+    def _reset(self, pooled: PooledContext) -> None:
+        context = pooled.context
+        for page in list(context.pages):
+            page.close()
+        context.clear_cookies()
+        context.clear_permissions()
+        if pooled.origins:
+            self._with_origin_pages(pooled, sorted(pooled.origins), CLEAR_STORAGE_JS)
+        pooled.origins.clear()
+
+    def _is_clean(self, pooled: PooledContext) -> bool:
+        context = pooled.context
+        return not context.pages and not context.cookies()
+
+    def _apply_state(self, pooled: PooledContext, storage_state: Dict) -> None:
+        cookies = storage_state.get("cookies") or []
+        if cookies:
+            pooled.context.add_cookies(cookies)
+        for origin_state in storage_state.get("origins") or []:
+            items = origin_state.get("localStorage") or []
+            if items:
+                self._with_origin_pages(pooled, [origin_state["origin"]], SEED_STORAGE_JS, items)
+
+    def _with_origin_pages(self, pooled: PooledContext, origins: List[str], script: str, arg=None) -> None:
+        """Выполняет script в контексте каждого origin на пустой странице-заглушке"""
+        context = pooled.context
+        page = context.new_page()
+        handler = lambda route: route.fulfill(status=200, content_type="text/html", body="<html></html>")
+        page.route(f"**{BLANK_PATH}", handler)
+        try:
+            for origin in origins:
+                page.goto(origin + BLANK_PATH)
+                page.evaluate(script, arg)
+        finally:
+            page.close()
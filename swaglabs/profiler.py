@@ -0,0 +1,140 @@
+"""
+profiler.py
+Профилировщик вызовов Playwright: на какие вызовы синхронного API
+(Page, Locator, expect и т.д.) уходит время теста и откуда они сделаны.
+
+Вызовы перехватываются через swaglabs.instrument. Для каждого вызова
+по стеку Python находятся кадры кода проекта (тесты, фикстуры, swaglabs):
+ближайший из них — место вызова (файл:строка функция), вся цепочка —
+стек для flame graph в формате collapsed stacks (flamegraph.pl, speedscope).
+Вызовы, вложенные в другой перехваченный вызов, не учитываются повторно.
+"""
+
+import os
+import sys
+from collections import defaultdict
+from pathlib import Path
+from typing import Dict, Iterable, List, NamedTuple, Optional, Tuple
+
+from swaglabs import instrument
+
+_INSTRUMENT_FILE = os.path.normcase(os.path.abspath(instrument.__file__))
+_OWN_FILE = os.path.normcase(os.path.abspath(__file__))
+
+
+class CallStats(NamedTuple):
+    name: str           # "Locator.evaluate_all" или место вызова
+    calls: int
+    total: float        # секунды
+    max: float
+
+
+def _project_frame(filename: str, root: str) -> bool:
+    path = os.path.normcase(os.path.abspath(filename))
+    return (path.startswith(root) and path not in (_INSTRUMENT_FILE, _OWN_FILE)
+            and "site-packages" not in path)
+
+
+class CallProfile:
+    """Замеры вызовов Playwright одного теста"""
+
+    def __init__(self, root: Path):
+        self.root = os.path.normcase(os.path.abspath(root)) + os.sep
+        # (вызов, место вызова) -> [число вызовов, сумма, максимум]
+        self.calls: Dict[Tuple[str, str], List[float]] = {}
+        # "test_x.py:test_y;catalog.py:snapshot_catalog;Locator.evaluate_all" -> секунды
+        self.stacks: Dict[str, float] = defaultdict(float)
+
+    def start(self) -> None:
+        instrument.subscribe(self._on_call)
+
+    def stop(self) -> None:
+        instrument.unsubscribe(self._on_call)
+
+    def _on_call(self, name: str, elapsed: float) -> None:
+        # Слушатель вызывается из wrapper в instrument, выше по стеку — вызывающий код
+        frames = []
+        wrappers = 0
+        frame = sys._getframe(1)
+        while frame is not None:
+            code = frame.f_code
+            if code.co_name == "wrapper" and os.path.normcase(os.path.abspath(code.co_filename)) == _INSTRUMENT_FILE:
+                wrappers += 1
+            elif _project_frame(code.co_filename, self.root):
+                frames.append(frame)
+            elif frames:
+                break  # дальше pytest/pluggy
+            frame = frame.f_back
+        if wrappers > 1:
+            return  # вложенный вызов: время уже учтено во внешнем
+
+        if frames:
+            inner = frames[0]
+            relative = os.path.relpath(inner.f_code.co_filename, self.root).replace(os.sep, "/")
+            site = f"{relative}:{inner.f_lineno} {inner.f_code.co_name}"
+        else:
+            site = "?"
+        stats = self.calls.setdefault((name, site), [0, 0.0, 0.0])
+        stats[0] += 1
+        stats[1] += elapsed
+        stats[2] = max(stats[2], elapsed)
+
+        chain = [f"{Path(f.f_code.co_filename).name}:{f.f_code.co_name}" for f in reversed(frames)]
+        self.stacks[";".join(chain + [name])] += elapsed
+
+    def to_dict(self) -> Dict:
+        """Сериализуемый вид для user_properties (воркеры xdist → контроллер)"""
+        return {
+            "calls": [[name, site, int(n), round(total, 6), round(longest, 6)]
+                      for (name, site), (n, total, longest) in self.calls.items()],
+            "stacks": {stack: round(total, 6) for stack, total in self.stacks.items()},
+        }
+
+
+def hotspots(rows: Iterable[List], by: str = "call", top: Optional[int] = None) -> List[CallStats]:
+    """Свертка строк to_dict()["calls"] по вызову (by="call") или месту вызова (by="site")"""
+    grouped: Dict[str, List[float]] = {}
+    for name, site, calls, total, longest in rows:
+        key = name if by == "call" else f"{site} → {name}"
+        stats = grouped.setdefault(key, [0, 0.0, 0.0])
+        stats[0] += calls
+        stats[1] += total
+        stats[2] = max(stats[2], longest)
+    result = sorted((CallStats(key, int(n), total, longest) for key, (n, total, longest) in grouped.items()),
+                    key=lambda stats: stats.total, reverse=True)
+    return result[:top] if top else result
+
+
+def function_totals(stacks: Dict[str, float], top: Optional[int] = None) -> List[Tuple[str, float]]:
+    """Время вызовов Playwright по функциям проекта, включая вложенные функции"""
+    totals: Dict[str, float] = defaultdict(float)
+    for stack, total in stacks.items():
+        # Рекурсия не должна учитываться дважды
+        for frame in set(stack.split(";")[:-1]):
+            totals[frame] += total
+    result = sorted(totals.items(), key=lambda item: item[1], reverse=True)
+    return result[:top] if top else result
+
+
+def merge_stacks(target: Dict[str, float], stacks: Dict[str, float]) -> None:
+    for stack, total in stacks.items():
+        target[stack] = target.get(stack, 0.0) + total
+
+
+def format_table(rows: Iterable[CallStats]) -> List[str]:
+    lines = [f"{'всего мс':>10} | {'вызовы':>6} | {'макс мс':>9} | вызов"]
+    for stats in rows:
+        lines.append(f"{stats.total * 1000:>10.1f} | {stats.calls:>6} | {stats.max * 1000:>9.1f} | {stats.name}")
+    return lines
+
+
+def write_collapsed(stacks: Dict[str, float], path: Path) -> Path:
+    """Collapsed stacks: "кадр;кадр;вызов <микросекунды>" на строку"""
+    path = Path(path)
+    path.parent.mkdir(parents=True, exist_ok=True)
+    with path.open("w", encoding="utf-8") as fh:
+        for stack, total in sorted(stacks.items()):
+            micros = round(total * 1_000_000)
+            if micros > 0:
+                fh.write(f"{stack} {micros}\n")
+    return path
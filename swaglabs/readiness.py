@@ -0,0 +1,172 @@
+"""
+readiness.py
+Ожидания готовности страниц Swag Labs по событиям в DOM вместо
+wait_for_load_state("networkidle"), который всегда ждет минимум 500 мс тишины
+в сети и ничего не знает о клиентской перерисовке (select_option).
+"""
+
+import re
+from contextlib import contextmanager
+from typing import Iterator, Optional, Pattern, Union
+
+from playwright.async_api import Page as AsyncPage
+from playwright.sync_api import Page
+
+from swaglabs.timeouts import adaptive
+
+UrlPattern = Union[str, Pattern[str]]
+
+# Выбрана сортировка option и сетка не пуста; порядок товаров проверяют сами тесты
+SORT_SELECTED_JS = """
+option => {
+    const select = document.querySelector(".product_sort_container");
+    return !!select && select.value === option && !!document.querySelector(".inventory_item");
+}
+"""
+
+# URL совпал и заголовок страницы (span.title) отрисован
+PAGE_READY_JS = """
+([source, flags, title]) => {
+    if (!new RegExp(source, flags).test(location.href)) return false;
+    const el = document.querySelector("span.title");
+    if (!el || !el.offsetParent) return false;
+    return title === null || el.textContent.trim() === title;
+}
+"""
+
+# Бейдж корзины показывает count (для 0 бейджа быть не должно)
+CART_BADGE_JS = """
+count => {
+    const badge = document.querySelector(".shopping_cart_badge");
+    if (count === 0) return !badge || !badge.offsetParent;
+    return !!badge && badge.textContent.trim() === String(count);
+}
+"""
+
+# Страница входа: URL совпал и форма отрисована
+LOGIN_READY_JS = """
+url => location.href === url
+    && !!document.querySelector("#login-button")
+    && !!document.querySelector("#user-name")
+"""
+
+# MutationObserver на .inventory_list: считает перестройки сетки
+OBSERVE_INVENTORY_JS = """
+() => {
+    const list = document.querySelector(".inventory_list");
+    if (window.__inventoryObserver) window.__inventoryObserver.disconnect();
+    window.__inventoryMutations = 0;
+    if (!list) return false;
+    window.__inventoryObserver = new MutationObserver(() => { window.__inventoryMutations += 1; });
+    window.__inventoryObserver.observe(list, { childList: true, subtree: true, characterData: true });
+    return true;
+}
+"""
+
+INVENTORY_MUTATED_JS = "() => (window.__inventoryMutations || 0) > 0"
+
+
+def _regex_source(url: UrlPattern) -> tuple:
+    if isinstance(url, str):
+        return re.escape(url), ""
+    flags = "i" if url.flags & re.IGNORECASE else ""
+    return url.pattern, flags
+
+
+def _page_key(url: UrlPattern, title: Optional[str]) -> str:
+    # Свой таймаут на каждую страницу: inventory и checkout грузятся по-разному
+    source = url if isinstance(url, str) else url.pattern
+    return f"wait_for_page {title or source}"
+
+
+def wait_for_sort_applied(page: Page, option: str, timeout: Optional[float] = None) -> None:
+    """Ждет, пока в .product_sort_container будет выбран option (az/za/lohi/hilo), а в сетке — товары"""
+    with adaptive("wait_for_sort_applied", timeout) as timeout:
+        page.wait_for_function(SORT_SELECTED_JS, arg=option, timeout=timeout)
+
+
+def wait_for_page(page: Page, url: UrlPattern, title: Optional[str] = None,
+                  timeout: Optional[float] = None) -> None:
+    """Ждет, пока URL совпадет с url и отрисуется span.title (с текстом title, если задан)"""
+    source, flags = _regex_source(url)
+    with adaptive(_page_key(url, title), timeout) as timeout:
+        page.wait_for_function(PAGE_READY_JS, arg=[source, flags, title], timeout=timeout)
+
+
+def wait_for_cart_badge(page: Page, count: int, timeout: Optional[float] = None) -> None:
+    """Ждет, пока счетчик корзины станет равен count"""
+    with adaptive("wait_for_cart_badge", timeout) as timeout:
+        page.wait_for_function(CART_BADGE_JS, arg=count, timeout=timeout)
+
+
+def wait_for_login_page(page: Page, url: str, timeout: Optional[float] = None) -> None:
+    """Ждет редиректа на страницу входа url и появления формы авторизации"""
+    with adaptive("wait_for_login_page", timeout) as timeout:
+        page.wait_for_function(LOGIN_READY_JS, arg=url, timeout=timeout)
+
+
+# Те же ожидания для асинхронного API (async-тесты, swaglabs.aio)
+
+async def wait_for_sort_applied_async(page: AsyncPage, option: str, timeout: Optional[float] = None) -> None:
+    with adaptive("wait_for_sort_applied", timeout) as timeout:
+        await page.wait_for_function(SORT_SELECTED_JS, arg=option, timeout=timeout)
+
+
+async def select_sort_async(page: AsyncPage, option: str, timeout: Optional[float] = None) -> None:
+    sort_dropdown = page.locator(".product_sort_container")
+    reorder = await sort_dropdown.input_value() != option
+    if reorder:
+        await page.evaluate(OBSERVE_INVENTORY_JS)
+    await sort_dropdown.select_option(option)
+    if reorder:
+        with adaptive("inventory_reordered", timeout) as reorder_timeout:
+            await page.wait_for_function(INVENTORY_MUTATED_JS, timeout=reorder_timeout)
+    await wait_for_sort_applied_async(page, option, timeout)
+
+
+async def wait_for_page_async(page: AsyncPage, url: UrlPattern, title: Optional[str] = None,
+                              timeout: Optional[float] = None) -> None:
+    source, flags = _regex_source(url)
+    with adaptive(_page_key(url, title), timeout) as timeout:
+        await page.wait_for_function(PAGE_READY_JS, arg=[source, flags, title], timeout=timeout)
+
+
+async def wait_for_cart_badge_async(page: AsyncPage, count: int, timeout: Optional[float] = None) -> None:
+    with adaptive("wait_for_cart_badge", timeout) as timeout:
+        await page.wait_for_function(CART_BADGE_JS, arg=count, timeout=timeout)
+
+
+async def wait_for_login_page_async(page: AsyncPage, url: str, timeout: Optional[float] = None) -> None:
+    with adaptive("wait_for_login_page", timeout) as timeout:
+        await page.wait_for_function(LOGIN_READY_JS, arg=url, timeout=timeout)
+
+
+@contextmanager
+def inventory_reordered(page: Page, timeout: Optional[float] = None) -> Iterator[None]:
+    """
+    Ставит MutationObserver на .inventory_list до действия и после блока
+    ждет, что сетка перестроилась:
+
+        with inventory_reordered(page):
+            sort_dropdown.select_option("za")
+    """
+    page.evaluate(OBSERVE_INVENTORY_JS)
+    yield
+    with adaptive("inventory_reordered", timeout) as timeout:
+        page.wait_for_function(INVENTORY_MUTATED_JS, timeout=timeout)
+
+
+def select_sort(page: Page, option: str, timeout: Optional[float] = None) -> None:
+    """
+    Выбирает сортировку option и ждет ее применения: сетка перестроилась
+    (inventory_reordered) и селект показывает option. Если option уже
+    выбран, перестройки не будет — ждем только селект. Порядок товаров
+    проверяют тесты.
+    """
+    sort_dropdown = page.locator(".product_sort_container")
+    if sort_dropdown.input_value() == option:
+        sort_dropdown.select_option(option)
+    else:
+        with inventory_reordered(page, timeout):
+            sort_dropdown.select_option(option)
+    wait_for_sort_applied(page, option, timeout)
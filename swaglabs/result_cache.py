@@ -0,0 +1,151 @@
+"""
+result_cache.py
+Отпечатки тестов для кэша результатов (pytest --result-cache).
+
+Отпечаток теста складывается из:
+  - исходника тестовой функции и ее модуля без других тестов
+    (хелперы, константы, маркеры класса);
+  - исходников фикстур проекта, которые тест использует (conftest.py,
+    фикстуры классов и плагинов swaglabs);
+  - кода проекта, загруженного к моменту сбора (пакет swaglabs);
+  - окружения: версии Playwright (она же фиксирует сборки браузеров) и Python;
+  - настроек прогона: pytest.ini (бюджеты perf_budgets и т.п.) и опций,
+    которые меняют исход теста, не меняя его nodeid (--perf-budget-mode,
+    один профиль --throttle, --retries, ...);
+  - отпечатка приложения: хэша JS-бандлов страницы BASE_URL.
+
+Тест, который уже проходил с тем же отпечатком, можно не запускать.
+"""
+
+import hashlib
+import inspect
+import os
+import platform
+import re
+import sys
+import urllib.request
+from importlib import metadata
+from pathlib import Path
+from typing import Dict, Iterable, List, Mapping, Optional
+from urllib.parse import urljoin
+
+SCRIPT_SRC = re.compile(r"<script[^>]+src=[\"']([^\"']+)[\"']", re.IGNORECASE)
+FETCH_TIMEOUT = 5
+
+
+def _sha(*parts: str) -> str:
+    digest = hashlib.sha256()
+    for part in parts:
+        digest.update(part.encode("utf-8", "surrogatepass"))
+        digest.update(b"\0")
+    return digest.hexdigest()[:16]
+
+
+def _fetch(url: str) -> bytes:
+    with urllib.request.urlopen(url, timeout=FETCH_TIMEOUT) as response:
+        return response.read()
+
+
+def app_fingerprint(base_url: str) -> Optional[str]:
+    """
+    Хэш JS-бандлов главной страницы (у SPA код приложения — это бандлы;
+    без бандлов — хэш самой страницы). None, если стенд недоступен
+    """
+    try:
+        html = _fetch(base_url).decode("utf-8", "replace")
+        scripts = [urljoin(base_url, src) for src in SCRIPT_SRC.findall(html)]
+        bodies = [hashlib.sha256(_fetch(src)).hexdigest() for src in scripts]
+    except (OSError, ValueError):
+        return None
+    return _sha(*bodies) if bodies else _sha(html)
+
+
+def environment_fingerprint() -> str:
+    try:
+        playwright_version = metadata.version("playwright")
+    except metadata.PackageNotFoundError:
+        playwright_version = "?"
+    return _sha(f"playwright={playwright_version}", f"python={platform.python_version()}")
+
+
+def config_fingerprint(ini_text: str, options: Mapping[str, object]) -> str:
+    """Содержимое ini-файла и значения опций, от которых зависит исход тестов"""
+    return _sha(ini_text, *(f"{name}={value!r}" for name, value in sorted(options.items())))
+
+
+def _within(path: Optional[str], root: Path) -> bool:
+    if not path:
+        return False
+    resolved = os.path.normcase(os.path.abspath(path))
+    return resolved.startswith(os.path.normcase(str(root)) + os.sep) and "site-packages" not in resolved
+
+
+def support_fingerprint(root: Path, exclude: Iterable[Path] = ()) -> str:
+    """Загруженные модули проекта (кроме тестов и conftest: их код учитывается точечно)"""
+    skipped = {os.path.normcase(os.path.abspath(path)) for path in exclude}
+    files = sorted({
+        os.path.normcase(os.path.abspath(module.__file__))
+        for module in list(sys.modules.values())
+        if _within(getattr(module, "__file__", None), root)
+    } - skipped)
+    return _sha(*(f"{path}:{Path(path).read_text(encoding='utf-8', errors='replace')}" for path in files
+                  if Path(path).is_file()))
+
+
+def _source(obj) -> str:
+    try:
+        return inspect.getsource(inspect.unwrap(obj))
+    except (OSError, TypeError):
+        return ""
+
+
+class ModuleSources:
+    """Исходник тестового модуля и исходники его тестов (для вырезания чужих тестов)"""
+
+    def __init__(self, module):
+        self.text = _source(module)
+        self.tests: Dict[str, str] = {}
+        for owner in [module] + [value for value in vars(module).values() if inspect.isclass(value)]:
+            for name, value in vars(owner).items():
+                if name.startswith("test") and callable(value):
+                    self.tests[f"{getattr(owner, '__qualname__', '')}.{name}"] = _source(value)
+
+    def without_other_tests(self, own: str) -> str:
+        text = self.text
+        for source in self.tests.values():
+            if source and source != own:
+                text = text.replace(source, "")
+        return text
+
+
+def fixture_sources(name2fixturedefs: Dict[str, List], root: Path, test_file: Path) -> List[str]:
+    """Исходники фикстур проекта, кроме определенных в самом тестовом модуле"""
+    sources = []
+    for name in sorted(name2fixturedefs):
+        for fixturedef in name2fixturedefs[name]:
+            func = getattr(fixturedef, "func", None)
+            path = inspect.getsourcefile(inspect.unwrap(func)) if func is not None else None
+            if _within(path, root) and Path(path).resolve() != test_file.resolve():
+                sources.append(f"{name}:{_source(func)}")
+    return sources
+
+
+def item_fingerprint(function, module_sources: ModuleSources, fixtures: List[str], base: str) -> str:
+    own = _source(function)
+    return _sha(base, own, module_sources.without_other_tests(own), *fixtures)
+
+
+class ResultCache:
+    """nodeid → отпечаток последнего успешного прохождения"""
+
+    def __init__(self, passed: Optional[Dict[str, str]] = None):
+        self.passed: Dict[str, str] = dict(passed or {})
+
+    def is_fresh(self, nodeid: str, fingerprint: str) -> bool:
+        return self.passed.get(nodeid) == fingerprint
+
+    def record(self, nodeid: str, fingerprint: Optional[str], passed: bool) -> None:
+        if passed and fingerprint:
+            self.passed[nodeid] = fingerprint
+        else:
+            self.passed.pop(nodeid, None)
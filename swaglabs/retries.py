@@ -0,0 +1,50 @@
+"""
+retries.py
+Какие ошибки считаются временными (сеть, падение браузера, таймаут
+навигации) и бюджет повторов на прогон. Упавшие проверки (AssertionError)
+и таймауты ожиданий не повторяются никогда: это регрессии, а не помехи.
+"""
+
+import math
+import re
+from typing import Optional
+
+from playwright.sync_api import Error as PlaywrightError
+
+TRANSIENT_ERRORS = re.compile(
+    "|".join([
+        r"net::ERR_(CONNECTION_\w+|NETWORK_\w+|INTERNET_DISCONNECTED|NAME_NOT_RESOLVED|TIMED_OUT|"
+        r"ADDRESS_UNREACHABLE|EMPTY_RESPONSE|SOCKET_NOT_CONNECTED)",
+        r"NS_ERROR_(NET_\w+|CONNECTION_REFUSED|UNKNOWN_HOST)",
+        r"Target (page, context or browser has been closed|crashed)",
+        r"Browser has been closed|Connection closed|Page crashed",
+        r"ECONNRESET|ECONNREFUSED|socket hang up",
+        # Таймаут навигации — обычно медленная сеть до стенда, таймаут ожидания элемента — нет
+        r"\b(page|frame)\.(goto|reload|go_back|go_forward): Timeout",
+    ]),
+    re.IGNORECASE,
+)
+
+
+def transient_reason(error: BaseException) -> Optional[str]:
+    """Первая строка сообщения, если ошибка временная, иначе None"""
+    if not isinstance(error, PlaywrightError):
+        return None
+    message = str(error)
+    if TRANSIENT_ERRORS.search(message) is None:
+        return None
+    return message.strip().splitlines()[0] if message.strip() else type(error).__name__
+
+
+class RetryBudget:
+    """Повторы на прогон; воркеры xdist делят бюджет поровну"""
+
+    def __init__(self, total: int, workers: int = 1):
+        self.total = total
+        self.remaining = math.ceil(total / max(1, workers)) if total > 0 else 0
+
+    def take(self) -> bool:
+        if self.remaining <= 0:
+            return False
+        self.remaining -= 1
+        return True
@@ -0,0 +1,50 @@
+"""
+scheduling.py
+Планировщик pytest-xdist: тесты раздаются воркерам по одному, начиная
+с самых длинных по истории (swaglabs.durations). Освободившийся воркер
+берет следующий самый длинный тест, поэтому длинные сценарии не скапливаются
+на одном воркере, а короткие добирают хвост в конце.
+
+Модуль импортирует xdist, поэтому подключается только из плагина
+swaglabs.plugins.schedule, когда pytest-xdist установлен.
+"""
+
+from xdist.scheduler import LoadScheduling
+
+from swaglabs.durations import DurationHistory, longest_first, lpt_assign
+
+
+class DurationScheduling(LoadScheduling):
+    def __init__(self, config, log=None, history: DurationHistory = None):
+        super().__init__(config, log)
+        self.history = history
+        self.predicted_makespan = 0.0
+
+    def schedule(self) -> None:
+        # Повторный вызов (добавился воркер) — как в LoadScheduling
+        if self.collection is not None:
+            super().schedule()
+            return
+        if not self._check_nodes_have_same_collection():
+            self.log("**Different tests collected, aborting run**")
+            return
+
+        self.collection = next(iter(self.node2collection.values()))
+        if not self.collection:
+            return
+
+        estimates = self.history.estimates(self.collection)
+        index = {nodeid: position for position, nodeid in enumerate(self.collection)}
+        self.pending[:] = [index[nodeid] for nodeid in longest_first(self.collection, estimates)]
+        _, loads = lpt_assign(self.collection, estimates, len(self.nodes))
+        self.predicted_makespan = max(loads)
+
+        # По одному тесту за раз: воркер держит текущий и следующий
+        self.maxschedchunk = 1
+        for _ in range(2):
+            for node in self.nodes:
+                self._send_tests(node, 1)
+
+        if not self.pending:
+            for node in self.nodes:
+                node.shutdown()
@@ -0,0 +1,42 @@
+"""
+seeding.py
+Засеивание состояния Swag Labs без прохода через UI: сессия пользователя
+(cookie session-username) и корзина (localStorage cart-contents) сразу
+попадают в storage_state нового контекста.
+
+Так тест может начинаться прямо на cart.html или checkout-step-one.html,
+а через UI проходить только те шаги, которые он проверяет.
+"""
+
+import json
+import time
+from typing import Dict, Iterable
+from urllib.parse import urlsplit
+
+SESSION_COOKIE = "session-username"
+CART_KEY = "cart-contents"
+# Столько живет cookie, которую ставит сам сайт при входе
+SESSION_MAX_AGE = 600
+
+
+def seeded_state(base_url: str, username: str, cart: Iterable[int] = ()) -> Dict:
+    """storage_state с сессией username и товарами cart (id в порядке добавления)"""
+    parts = urlsplit(base_url)
+    cookie = {
+        "name": SESSION_COOKIE,
+        "value": username,
+        "domain": parts.hostname,
+        "path": "/",
+        "expires": int(time.time()) + SESSION_MAX_AGE,
+        "httpOnly": False,
+        "secure": parts.scheme == "https",
+        "sameSite": "Lax",
+    }
+    cart = list(cart)
+    origins = []
+    if cart:
+        origins.append({
+            "origin": f"{parts.scheme}://{parts.netloc}",
+            "localStorage": [{"name": CART_KEY, "value": json.dumps(cart, separators=(",", ":"))}],
+        })
+    return {"cookies": [cookie], "origins": origins}
@@ -0,0 +1,40 @@
+"""
+settings.py
+Общие настройки тестов: адрес стенда и учетные данные
+"""
+
+import os
+import time
+
+# Адрес стенда можно переопределить переменной окружения (см. .env в README)
+BASE_URL = os.getenv("BASE_URL", "https://www.saucedemo.com").rstrip("/") + "/"
+VALID_USERNAME = "standard_user"
+VALID_PASSWORD = "secret_sauce"
+
+# Офлайн-режим: тесты идут в локальный стенд swaglabs.standin вместо saucedemo.com
+OFFLINE = os.getenv("SWAG_OFFLINE", "").lower() in ("1", "true", "yes", "on")
+STAND_IN_CATALOG_SIZE = int(os.getenv("SWAG_CATALOG_SIZE", "6"))
+
+# Настройки контекста браузера: общие для pytest-playwright (tests/conftest.py)
+# и асинхронных тестов (swaglabs.aio)
+CONTEXT_ARGS = {
+    "viewport": {"width": 1920, "height": 1080},
+    "locale": "ru-RU",  # Локализация
+    "timezone_id": "Europe/Moscow",  # Часовой пояс
+    # Запросы из service worker обходят route-обработчики профилей блокировки
+    "service_workers": "block",
+}
+
+
+def run_id() -> str:
+    """
+    Идентификатор прогона для отчетов в reports/: задается в контроллере
+    при первом обращении и через окружение наследуется воркерами xdist
+    """
+    return os.environ.setdefault("SWAG_RUN_ID", time.strftime("%Y%m%d-%H%M%S") + f"-{os.getpid()}")
+
+
+def use_base_url(url: str) -> None:
+    """Переключает BASE_URL (вызывается до импорта тестовых модулей)"""
+    global BASE_URL
+    BASE_URL = url.rstrip("/") + "/"
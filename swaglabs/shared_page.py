@@ -0,0 +1,122 @@
+"""
+shared_page.py
+Одна авторизованная страница на класс тестов, которые только читают
+каталог и меняют сортировку (маркер read_only, pytest --shared-page).
+
+Между тестами страница сбрасывается, как правило, без навигации: сортировка
+возвращается к az, ключ сортировки удаляется из localStorage, URL
+сверяется с inventory.html. Перед выдачей следующему тесту один
+evaluate проверяет инварианты (страница товаров, сортировка az, пустая
+корзина, закрытое меню). Если проверка не прошла или предыдущий тест
+упал, страница с контекстом закрывается и открывается новая.
+"""
+
+import re
+import weakref
+from typing import Callable, List, Optional
+
+from playwright.sync_api import BrowserContext, Page
+from playwright.sync_api import Error as PlaywrightError
+
+from swaglabs.readiness import select_sort, wait_for_page
+
+SORT_KEY = "inventory-sort"
+DEFAULT_SORT = "az"
+INVENTORY_PAGE = re.compile(r".*inventory\.html")
+
+# Список нарушенных инвариантов (пустой — страницу можно отдавать тесту)
+INVARIANTS_JS = """
+([sortKey, defaultSort]) => {
+    const problems = [];
+    if (!/inventory\\.html/.test(location.pathname)) problems.push(`URL ${location.pathname}`);
+    const title = document.querySelector("span.title");
+    if (!title || title.textContent.trim() !== "Products") problems.push("нет заголовка Products");
+    const select = document.querySelector(".product_sort_container");
+    if (!select || select.value !== defaultSort) problems.push(`сортировка ${select ? select.value : "—"}`);
+    if (localStorage.getItem(sortKey) !== null) problems.push("сортировка в localStorage");
+    if (!document.querySelectorAll(".inventory_item").length) problems.push("пустая сетка товаров");
+    if (document.querySelector(".shopping_cart_badge")) problems.push("корзина не пуста");
+    const menu = document.querySelector(".bm-menu-wrap");
+    if (menu && menu.getAttribute("aria-hidden") === "false") problems.push("открыто меню");
+    return problems;
+}
+"""
+
+CLEAR_SORT_JS = "key => localStorage.removeItem(key)"
+
+# Страницы, которые сейчас раздаются как общие (см. is_shared)
+_shared = weakref.WeakSet()
+
+
+def is_shared(page: Page) -> bool:
+    """Общая страница уже открыта на inventory.html, повторно открывать ее не нужно"""
+    return page in _shared
+
+
+class SharedPage:
+    """
+    Общая страница класса. open_page(page) открывает свежую страницу
+    на inventory_url (с логином, если сессия истекла).
+    """
+
+    def __init__(self, new_context: Callable[[], BrowserContext], open_page: Callable[[Page], None],
+                 inventory_url: str):
+        self.new_context = new_context
+        self.open_page = open_page
+        self.inventory_url = inventory_url
+        self.context: Optional[BrowserContext] = None
+        self.page: Optional[Page] = None
+        self.reused = 0
+        self.opened = 0
+        self.replaced: List[str] = []
+
+    def _open(self) -> Page:
+        self.context = self.new_context()
+        self.page = self.context.new_page()
+        self.open_page(self.page)
+        self.opened += 1
+        _shared.add(self.page)
+        return self.page
+
+    def reset(self) -> None:
+        page = self.page
+        if not INVENTORY_PAGE.match(page.url):
+            page.goto(self.inventory_url)
+            wait_for_page(page, INVENTORY_PAGE, "Products")
+        sort_dropdown = page.locator(".product_sort_container")
+        if sort_dropdown.input_value() != DEFAULT_SORT:
+            select_sort(page, DEFAULT_SORT)
+        page.evaluate(CLEAR_SORT_JS, SORT_KEY)
+
+    def problems(self) -> List[str]:
+        return self.page.evaluate(INVARIANTS_JS, [SORT_KEY, DEFAULT_SORT])
+
+    def acquire(self) -> Page:
+        """Страница для следующего теста: сброшенная общая или новая"""
+        if self.page is None or self.page.is_closed():
+            return self._open()
+        try:
+            self.reset()
+            problems = self.problems()
+        except PlaywrightError as error:
+            problems = [str(error).splitlines()[0]]
+        if problems:
+            self.replaced.append(", ".join(problems))
+            self.close()
+            return self._open()
+        self.reused += 1
+        return self.page
+
+    def release(self, healthy: bool) -> None:
+        """После упавшего теста состояние страницы неизвестно: следующему тесту — новая"""
+        if not healthy:
+            self.close()
+
+    def close(self) -> None:
+        if self.context is not None:
+            try:
+                self.context.close()
+            except PlaywrightError:
+                pass
+        self.context = None
+        self.page = None
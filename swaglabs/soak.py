@@ -0,0 +1,157 @@
+"""
+soak.py
+Soak-режим: сценарий (по умолчанию цикл корзины swaglabs.flows.CART_CYCLE)
+повторяется тысячи раз на одной странице, каждые sample_every итераций
+снимаются размер JS-кучи, число DOM-узлов и обработчиков событий
+(CDP Performance.getMetrics после принудительной сборки мусора) и время
+итерации. По рядам строится линейный тренд (рост на итерацию); прогон
+падает, если рост больше порога. Ряды сохраняются в CSV для графиков.
+
+Только Chromium (CDP). Первые WARMUP_SHARE замеров в тренд не входят:
+прогрев JIT и кэшей дает рост, который потом не продолжается.
+"""
+
+import csv
+import statistics
+import time
+from pathlib import Path
+from typing import Callable, Dict, List, NamedTuple, Optional, Sequence, Tuple
+
+from playwright.sync_api import Page
+
+from swaglabs.flows import CART_CYCLE, FlowStep, run_step
+
+WARMUP_SHARE = 0.1
+
+# Метрика ряда → допустимый рост на итерацию по умолчанию
+LIMITS = {
+    "heap_kb": 2.0,         # 1000 итераций — +2 МБ кучи
+    "nodes": 0.05,          # 1000 итераций — +50 DOM-узлов
+    "listeners": 0.05,
+    "iteration_ms": 0.05,   # 1000 итераций — +50 мс на итерацию
+}
+
+UNITS = {"heap_kb": "КБ", "nodes": "узлов", "listeners": "обработчиков", "iteration_ms": "мс"}
+
+
+class SoakSettings(NamedTuple):
+    iterations: int
+    sample_every: int
+    limits: Dict[str, float]
+    directory: Path
+
+
+class SoakSample(NamedTuple):
+    iteration: int
+    elapsed_s: float
+    heap_kb: float
+    nodes: float
+    listeners: float
+    documents: float
+    iteration_ms: float                 # медиана итераций с прошлого замера
+    step_ms: Dict[str, float]           # медианы шагов с прошлого замера
+
+
+class Trend(NamedTuple):
+    metric: str
+    slope: float        # рост на итерацию
+    limit: float
+
+    @property
+    def exceeded(self) -> bool:
+        return self.slope > self.limit
+
+    def describe(self) -> str:
+        unit = UNITS.get(self.metric, "")
+        mark = "❌" if self.exceeded else "✅"
+        return (f"{mark} {self.metric}: {self.slope * 1000:+.1f} {unit} на 1000 итераций "
+                f"(порог {self.limit * 1000:.1f})")
+
+
+def linear_slope(xs: Sequence[float], ys: Sequence[float]) -> float:
+    """Наклон прямой по методу наименьших квадратов"""
+    if len(xs) < 2:
+        return 0.0
+    mean_x = statistics.fmean(xs)
+    mean_y = statistics.fmean(ys)
+    spread = sum((x - mean_x) ** 2 for x in xs)
+    if spread == 0:
+        return 0.0
+    return sum((x - mean_x) * (y - mean_y) for x, y in zip(xs, ys)) / spread
+
+
+def trends(samples: Sequence[SoakSample], limits: Optional[Dict[str, float]] = None) -> List[Trend]:
+    """Тренды по всем метрикам LIMITS без замеров прогрева"""
+    limits = {**LIMITS, **(limits or {})}
+    skip = int(len(samples) * WARMUP_SHARE)
+    measured = samples[skip:] if len(samples) - skip >= 2 else samples
+    xs = [sample.iteration for sample in measured]
+    return [Trend(metric, linear_slope(xs, [getattr(sample, metric) for sample in measured]), limit)
+            for metric, limit in limits.items()]
+
+
+def save_series(samples: Sequence[SoakSample], path: Path) -> Path:
+    """CSV: итерация, время, метрики и медианы шагов (по столбцу на шаг)"""
+    path = Path(path)
+    path.parent.mkdir(parents=True, exist_ok=True)
+    steps = list(dict.fromkeys(name for sample in samples for name in sample.step_ms))
+    with path.open("w", encoding="utf-8", newline="") as fh:
+        writer = csv.writer(fh)
+        writer.writerow(list(SoakSample._fields[:-1]) + [f"step_ms:{name}" for name in steps])
+        for sample in samples:
+            writer.writerow([round(value, 3) if isinstance(value, float) else value for value in sample[:-1]]
+                            + [round(sample.step_ms.get(name, 0.0), 3) for name in steps])
+    return path
+
+
+class SoakRun:
+    """Повторяет сценарий на странице и снимает метрики каждые sample_every итераций"""
+
+    def __init__(self, page: Page, flow: Tuple[FlowStep, ...] = CART_CYCLE, sample_every: int = 50,
+                 base_url: Optional[str] = None):
+        self.page = page
+        self.flow = flow
+        self.sample_every = max(1, sample_every)
+        self.base_url = base_url
+        self.samples: List[SoakSample] = []
+        self._cdp = page.context.new_cdp_session(page)
+        self._cdp.send("Performance.enable")
+
+    def metrics(self) -> Dict[str, float]:
+        """Метрики страницы после сборки мусора (иначе куча "пилит" от мусора между GC)"""
+        self._cdp.send("HeapProfiler.collectGarbage")
+        return {item["name"]: item["value"] for item in self._cdp.send("Performance.getMetrics")["metrics"]}
+
+    def _sample(self, iteration: int, started: float, iterations: List[float],
+                steps: Dict[str, List[float]]) -> SoakSample:
+        metrics = self.metrics()
+        sample = SoakSample(
+            iteration,
+            time.perf_counter() - started,
+            metrics.get("JSHeapUsedSize", 0.0) / 1024,
+            metrics.get("Nodes", 0.0),
+            metrics.get("JSEventListeners", 0.0),
+            metrics.get("Documents", 0.0),
+            statistics.median(iterations) if iterations else 0.0,
+            {name: statistics.median(values) for name, values in steps.items()},
+        )
+        self.samples.append(sample)
+        return sample
+
+    def run(self, iterations: int, on_sample: Optional[Callable[[SoakSample], None]] = None) -> List[SoakSample]:
+        started = time.perf_counter()
+        window: List[float] = []
+        steps: Dict[str, List[float]] = {}
+        for iteration in range(1, iterations + 1):
+            iteration_started = time.perf_counter()
+            for flow_step in self.flow:
+                step_started = time.perf_counter()
+                run_step(self.page, flow_step, base_url=self.base_url)
+                steps.setdefault(flow_step.name, []).append((time.perf_counter() - step_started) * 1000)
+            window.append((time.perf_counter() - iteration_started) * 1000)
+            if iteration % self.sample_every == 0 or iteration == iterations:
+                sample = self._sample(iteration, started, window, steps)
+                window, steps = [], {}
+                if on_sample is not None:
+                    on_sample(sample)
+        return self.samples
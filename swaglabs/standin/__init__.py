@@ -0,0 +1,165 @@
+"""
+standin
+Локальный стенд Swag Labs для офлайн-запуска тестов.
+
+Встроенный HTTP-сервер (в отдельном потоке текущего процесса) отдает
+страницы логина, товаров, корзины и оформления заказа с той же разметкой,
+что и saucedemo.com, для селекторов, которые используют тесты.
+
+    with StandIn(catalog_size=1000) as stand_in:
+        page.goto(stand_in.url)
+"""
+
+import hashlib
+import json
+import threading
+from http.server import BaseHTTPRequestHandler, ThreadingHTTPServer
+from pathlib import Path
+from typing import Dict, Optional
+
+from swaglabs.standin.products import SWAG_LABS_PRODUCTS, build_catalog
+
+STATIC_DIR = Path(__file__).parent / "static"
+
+PAGES = {
+    "/",
+    "/index.html",
+    "/inventory.html",
+    "/inventory-item.html",
+    "/cart.html",
+    "/checkout-step-one.html",
+    "/checkout-step-two.html",
+    "/checkout-complete.html",
+}
+
+SHELL_HTML = """<!DOCTYPE html>
+<html lang="en">
+<head>
+<meta charset="utf-8">
+<meta name="viewport" content="width=device-width, initial-scale=1">
+<title>Swag Labs</title>
+<link rel="stylesheet" href="/static/app.css">
+<script src="/static/catalog.js"></script>
+<script defer src="/static/app.js"></script>
+</head>
+<body><div id="root"></div></body>
+</html>
+"""
+
+IMAGE_SVG = """<svg xmlns="http://www.w3.org/2000/svg" width="96" height="96" viewBox="0 0 96 96">
+<rect width="96" height="96" rx="8" fill="hsl({hue}, 55%, 70%)"/>
+<text x="48" y="56" font-size="20" text-anchor="middle" fill="#132322">#{item_id}</text>
+</svg>
+"""
+
+
+class _Asset:
+    def __init__(self, body: bytes, content_type: str, cache_control: str):
+        self.body = body
+        self.content_type = content_type
+        self.cache_control = cache_control
+        self.etag = '"' + hashlib.sha1(body).hexdigest()[:16] + '"'
+
+
+class StandIn:
+    """Локальный стенд Swag Labs на 127.0.0.1 (порт по умолчанию выбирается ОС)"""
+
+    def __init__(self, host: str = "127.0.0.1", port: int = 0,
+                 catalog_size: int = len(SWAG_LABS_PRODUCTS)):
+        self.host = host
+        self.port = port
+        self.catalog = build_catalog(catalog_size)
+        self._assets = self._build_assets()
+        self._server: Optional[ThreadingHTTPServer] = None
+        self._thread: Optional[threading.Thread] = None
+
+    @property
+    def url(self) -> str:
+        """Адрес страницы входа (аналог https://www.saucedemo.com/)"""
+        if self._server is None:
+            raise RuntimeError("Стенд не запущен")
+        host, port = self._server.server_address[:2]
+        return f"http://{host}:{port}/"
+
+    def start(self) -> "StandIn":
+        assets = self._assets
+
+        class Handler(_StandInHandler):
+            pass
+
+        Handler.assets = assets
+        self._server = ThreadingHTTPServer((self.host, self.port), Handler)
+        self._server.daemon_threads = True
+        self._thread = threading.Thread(target=self._server.serve_forever, name="swaglabs-stand-in", daemon=True)
+        self._thread.start()
+        return self
+
+    def stop(self) -> None:
+        if self._server is not None:
+            self._server.shutdown()
+            self._server.server_close()
+            self._server = None
+
+    def __enter__(self) -> "StandIn":
+        return self.start()
+
+    def __exit__(self, *exc_info) -> None:
+        self.stop()
+
+    def _build_assets(self) -> Dict[str, _Asset]:
+        static = "public, max-age=0, must-revalidate"
+        assets = {
+            "/static/app.js": _Asset((STATIC_DIR / "app.js").read_bytes(), "application/javascript; charset=utf-8", static),
+            "/static/app.css": _Asset((STATIC_DIR / "app.css").read_bytes(), "text/css; charset=utf-8", static),
+            "/static/catalog.js": _Asset(
+                ("window.SWAG_CATALOG = " + json.dumps(self.catalog) + ";\n").encode(),
+                "application/javascript; charset=utf-8",
+                static,
+            ),
+        }
+        shell = _Asset(SHELL_HTML.encode(), "text/html; charset=utf-8", "no-cache")
+        for page in PAGES:
+            assets[page] = shell
+        for product in self.catalog:
+            svg = IMAGE_SVG.format(hue=product["id"] * 47 % 360, item_id=product["id"])
+            assets[f"/static/img/{product['id']}.svg"] = _Asset(svg.encode(), "image/svg+xml", static)
+        return assets
+
+
+class _StandInHandler(BaseHTTPRequestHandler):
+    assets: Dict[str, _Asset] = {}
+    protocol_version = "HTTP/1.1"
+
+    def do_GET(self) -> None:
+        asset = self._resolve()
+        if asset is None:
+            self._send(404, b"Not Found", "text/plain; charset=utf-8", {})
+            return
+
+        headers = {"Cache-Control": asset.cache_control, "ETag": asset.etag}
+        if self.headers.get("If-None-Match") == asset.etag:
+            self._send(304, b"", asset.content_type, headers)
+            return
+        self._send(200, asset.body, asset.content_type, headers)
+
+    def do_HEAD(self) -> None:
+        self.do_GET()
+
+    def _resolve(self) -> Optional[_Asset]:
+        path = self.path.split("?", 1)[0].split("#", 1)[0]
+        return self.assets.get(path)
+
+    def _send(self, status: int, body: bytes, content_type: str, headers: Dict[str, str]) -> None:
+        self.send_response(status)
+        self.send_header("Content-Type", content_type)
+        if status != 304:
+            self.send_header("Content-Length", str(len(body)))
+        for name, value in headers.items():
+            self.send_header(name, value)
+        self.end_headers()
+        if self.command != "HEAD" and status != 304:
+            self.wfile.write(body)
+
+    def log_message(self, format: str, *args) -> None:
+        # Стенд работает внутри pytest: не засоряем вывод логами запросов
+        pass
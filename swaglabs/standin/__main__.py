@@ -0,0 +1,31 @@
+"""
+Запуск локального стенда вручную:
+
+    python -m swaglabs.standin --port 8000 --catalog-size 1000
+"""
+
+import argparse
+import time
+
+from swaglabs.standin import StandIn
+from swaglabs.standin.products import SWAG_LABS_PRODUCTS
+
+
+def main() -> None:
+    parser = argparse.ArgumentParser(description="Локальный стенд Swag Labs")
+    parser.add_argument("--host", default="127.0.0.1")
+    parser.add_argument("--port", type=int, default=8000)
+    parser.add_argument("--catalog-size", type=int, default=len(SWAG_LABS_PRODUCTS))
+    args = parser.parse_args()
+
+    with StandIn(args.host, args.port, args.catalog_size) as stand_in:
+        print(f"🧪 Стенд Swag Labs: {stand_in.url} (товаров: {len(stand_in.catalog)})")
+        try:
+            while True:
+                time.sleep(3600)
+        except KeyboardInterrupt:
+            pass
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,457 @@
+/*
+ * Локальный стенд Swag Labs: клиентская часть.
+ * Повторяет разметку и поведение saucedemo.com для селекторов, которые
+ * используют тесты: сессия в cookie session-username, корзина в
+ * localStorage (cart-contents), сортировка перерисовывает сетку без навигации.
+ */
+(function () {
+    "use strict";
+
+    var CATALOG = window.SWAG_CATALOG || [];
+    var USERS = [
+        "standard_user",
+        "locked_out_user",
+        "problem_user",
+        "performance_glitch_user",
+        "error_user",
+        "visual_user"
+    ];
+    var PASSWORD = "secret_sauce";
+    var SESSION_COOKIE = "session-username";
+    var SESSION_MAX_AGE = 600;
+    var CART_KEY = "cart-contents";
+    var SORT_KEY = "inventory-sort";
+    var ERROR_KEY = "login-error";
+    var SORT_OPTIONS = [
+        ["az", "Name (A to Z)"],
+        ["za", "Name (Z to A)"],
+        ["lohi", "Price (low to high)"],
+        ["hilo", "Price (high to low)"]
+    ];
+
+    var PRODUCTS = {};
+    CATALOG.forEach(function (product) { PRODUCTS[product.id] = product; });
+
+    function esc(value) {
+        return String(value)
+            .replace(/&/g, "&amp;")
+            .replace(/</g, "&lt;")
+            .replace(/>/g, "&gt;")
+            .replace(/"/g, "&quot;");
+    }
+
+    function slug(name) {
+        return name.toLowerCase().replace(/\s+/g, "-");
+    }
+
+    function price(value) {
+        return "$" + value.toFixed(2);
+    }
+
+    function go(path) {
+        window.location.href = path;
+    }
+
+    // ===== Сессия и состояние =====
+
+    function currentUser() {
+        var match = document.cookie.match(/(?:^|;\s*)session-username=([^;]*)/);
+        return match ? decodeURIComponent(match[1]) : null;
+    }
+
+    function startSession(username) {
+        document.cookie = SESSION_COOKIE + "=" + encodeURIComponent(username) +
+            "; path=/; max-age=" + SESSION_MAX_AGE;
+    }
+
+    function endSession() {
+        document.cookie = SESSION_COOKIE + "=; path=/; max-age=0";
+    }
+
+    function readCart() {
+        try {
+            var ids = JSON.parse(window.localStorage.getItem(CART_KEY) || "[]");
+            return Array.isArray(ids) ? ids.filter(function (id) { return id in PRODUCTS; }) : [];
+        } catch (e) {
+            return [];
+        }
+    }
+
+    function writeCart(ids) {
+        if (ids.length) {
+            window.localStorage.setItem(CART_KEY, JSON.stringify(ids));
+        } else {
+            window.localStorage.removeItem(CART_KEY);
+        }
+    }
+
+    function toggleCart(id) {
+        var cart = readCart();
+        var index = cart.indexOf(id);
+        if (index === -1) {
+            cart.push(id);
+        } else {
+            cart.splice(index, 1);
+        }
+        writeCart(cart);
+        renderBadge();
+        return index === -1;
+    }
+
+    function readSort() {
+        var value = window.localStorage.getItem(SORT_KEY);
+        return SORT_OPTIONS.some(function (o) { return o[0] === value; }) ? value : "az";
+    }
+
+    // ===== Общие части страниц =====
+
+    function cartButton(product, inCart, size) {
+        var key = slug(product.name);
+        return inCart
+            ? '<button class="btn btn_secondary ' + size + ' btn_inventory" data-test="remove-' + esc(key) +
+                '" id="remove-' + esc(key) + '" name="remove-' + esc(key) + '" data-id="' + product.id + '">Remove</button>'
+            : '<button class="btn btn_primary ' + size + ' btn_inventory" data-test="add-to-cart-' + esc(key) +
+                '" id="add-to-cart-' + esc(key) + '" name="add-to-cart-' + esc(key) + '" data-id="' + product.id + '">Add to cart</button>';
+    }
+
+    function header(title, secondary) {
+        return '' +
+            '<div id="page_wrapper" class="page_wrapper"><div id="contents_wrapper">' +
+            '<div class="primary_header" data-test="primary-header">' +
+            '<div id="menu_button_container"><div class="bm-burger-button">' +
+            '<button type="button" id="react-burger-menu-btn">Open Menu</button></div>' +
+            '<div class="bm-menu-wrap" aria-hidden="true" hidden><div class="bm-menu"><nav class="bm-item-list">' +
+            '<a id="inventory_sidebar_link" class="bm-item menu-item" href="/inventory.html" data-test="inventory-sidebar-link">All Items</a>' +
+            '<a id="about_sidebar_link" class="bm-item menu-item" href="https://saucelabs.com/" data-test="about-sidebar-link">About</a>' +
+            '<a id="logout_sidebar_link" class="bm-item menu-item" href="#" data-test="logout-sidebar-link">Logout</a>' +
+            '<a id="reset_sidebar_link" class="bm-item menu-item" href="#" data-test="reset-sidebar-link">Reset App State</a>' +
+            '</nav></div><div class="bm-cross-button"><button type="button" id="react-burger-cross-btn">Close Menu</button></div></div>' +
+            '</div>' +
+            '<div class="header_label"><div class="app_logo">Swag Labs</div></div>' +
+            '<div id="shopping_cart_container" class="shopping_cart_container">' +
+            '<a class="shopping_cart_link" href="/cart.html" data-test="shopping-cart-link"></a></div>' +
+            '</div>' +
+            '<div class="header_secondary_container" data-test="secondary-header">' +
+            '<span class="title" data-test="title">' + esc(title) + '</span>' + (secondary || "") +
+            '</div>';
+    }
+
+    function footer() {
+        return '</div><footer class="footer" data-test="footer"><div class="footer_copy">' +
+            '© 2026 Sauce Labs. All Rights Reserved. Local stand-in.</div></footer></div>';
+    }
+
+    function renderBadge() {
+        var link = document.querySelector(".shopping_cart_link");
+        if (!link) return;
+        var count = readCart().length;
+        link.innerHTML = count
+            ? '<span class="shopping_cart_badge" data-test="shopping-cart-badge">' + count + '</span>'
+            : "";
+    }
+
+    function bindHeader(root) {
+        var wrap = root.querySelector(".bm-menu-wrap");
+        root.querySelector("#react-burger-menu-btn").addEventListener("click", function () {
+            wrap.hidden = false;
+            wrap.setAttribute("aria-hidden", "false");
+        });
+        root.querySelector("#react-burger-cross-btn").addEventListener("click", function () {
+            wrap.hidden = true;
+            wrap.setAttribute("aria-hidden", "true");
+        });
+        root.querySelector("#logout_sidebar_link").addEventListener("click", function (event) {
+            event.preventDefault();
+            endSession();
+            go("/");
+        });
+        root.querySelector("#reset_sidebar_link").addEventListener("click", function (event) {
+            event.preventDefault();
+            writeCart([]);
+            renderBadge();
+        });
+        renderBadge();
+    }
+
+    function cartItem(product, withButton) {
+        return '' +
+            '<div class="cart_item" data-test="inventory-item" data-id="' + product.id + '">' +
+            '<div class="cart_quantity" data-test="item-quantity">1</div>' +
+            '<div class="cart_item_label">' +
+            '<a href="/inventory-item.html?id=' + product.id + '" id="item_' + product.id + '_title_link">' +
+            '<div class="inventory_item_name" data-test="inventory-item-name">' + esc(product.name) + '</div></a>' +
+            '<div class="inventory_item_desc" data-test="inventory-item-desc">' + esc(product.desc) + '</div>' +
+            '<div class="item_pricebar"><div class="inventory_item_price" data-test="inventory-item-price">' +
+            price(product.price) + '</div>' + (withButton ? cartButton(product, true, "btn_small cart_button") : "") +
+            '</div></div></div>';
+    }
+
+    // ===== Страницы =====
+
+    function renderLogin(root) {
+        root.innerHTML = '' +
+            '<div class="login_container"><div class="login_logo">Swag Labs</div>' +
+            '<div class="login_wrapper"><div class="login_wrapper-inner"><div id="login_button_container" class="form_column">' +
+            '<div class="login-box"><form novalidate>' +
+            '<div class="form_group"><input class="input_error form_input" placeholder="Username" type="text" ' +
+            'data-test="username" id="user-name" name="user-name" autocorrect="off" autocapitalize="none"></div>' +
+            '<div class="form_group"><input class="input_error form_input" placeholder="Password" type="password" ' +
+            'data-test="password" id="password" name="password" autocorrect="off" autocapitalize="none"></div>' +
+            '<div class="error-message-container"></div>' +
+            '<input type="submit" class="submit-button btn_action" data-test="login-button" id="login-button" ' +
+            'name="login-button" value="Login">' +
+            '</form></div></div></div></div></div>';
+
+        var container = root.querySelector(".error-message-container");
+
+        function showError(message) {
+            container.classList.add("error");
+            container.innerHTML = '<h3 data-test="error"><button class="error-button" type="button">×</button>' +
+                esc(message) + '</h3>';
+            container.querySelector(".error-button").addEventListener("click", function () {
+                container.classList.remove("error");
+                container.innerHTML = "";
+            });
+        }
+
+        var pending = window.sessionStorage.getItem(ERROR_KEY);
+        if (pending) {
+            window.sessionStorage.removeItem(ERROR_KEY);
+            showError(pending);
+        }
+
+        root.querySelector("form").addEventListener("submit", function (event) {
+            event.preventDefault();
+            var username = root.querySelector("#user-name").value;
+            var password = root.querySelector("#password").value;
+
+            if (!username) return showError("Epic sadface: Username is required");
+            if (!password) return showError("Epic sadface: Password is required");
+            if (USERS.indexOf(username) === -1 || password !== PASSWORD) {
+                return showError("Epic sadface: Username and password do not match any user in this service");
+            }
+            if (username === "locked_out_user") {
+                return showError("Epic sadface: Sorry, this user has been locked out.");
+            }
+            startSession(username);
+            go("/inventory.html");
+        });
+    }
+
+    function sortProducts(products, option) {
+        var byName = function (a, b) {
+            var x = a.name.toLowerCase(), y = b.name.toLowerCase();
+            return x < y ? -1 : x > y ? 1 : 0;
+        };
+        var sorted = products.slice();
+        switch (option) {
+            case "za": sorted.sort(function (a, b) { return byName(b, a); }); break;
+            case "lohi": sorted.sort(function (a, b) { return a.price - b.price || byName(a, b); }); break;
+            case "hilo": sorted.sort(function (a, b) { return b.price - a.price || byName(a, b); }); break;
+            default: sorted.sort(byName);
+        }
+        return sorted;
+    }
+
+    function renderInventory(root) {
+        var options = SORT_OPTIONS.map(function (o) {
+            return '<option value="' + o[0] + '">' + esc(o[1]) + '</option>';
+        }).join("");
+        var sortControl = '<div class="right_component"><span class="select_container">' +
+            '<span class="active_option" data-test="active-option"></span>' +
+            '<select class="product_sort_container" data-test="product-sort-container">' + options + '</select>' +
+            '</span></div>';
+
+        root.innerHTML = header("Products", sortControl) +
+            '<div id="inventory_container" class="inventory_container">' +
+            '<div class="inventory_list" data-test="inventory-list"></div></div>' + footer();
+        bindHeader(root);
+
+        var list = root.querySelector(".inventory_list");
+        var select = root.querySelector(".product_sort_container");
+        var active = root.querySelector(".active_option");
+
+        function renderItems() {
+            var cart = readCart();
+            active.textContent = select.options[select.selectedIndex].text;
+            list.innerHTML = sortProducts(CATALOG, select.value).map(function (product) {
+                return '' +
+                    '<div class="inventory_item" data-test="inventory-item">' +
+                    '<div class="inventory_item_img"><a href="/inventory-item.html?id=' + product.id + '" id="item_' + product.id + '_img_link">' +
+                    '<img alt="' + esc(product.name) + '" class="inventory_item_img" src="/static/img/' + product.id + '.svg"></a></div>' +
+                    '<div class="inventory_item_description" data-test="inventory-item-description">' +
+                    '<div class="inventory_item_label">' +
+                    '<a href="/inventory-item.html?id=' + product.id + '" id="item_' + product.id + '_title_link">' +
+                    '<div class="inventory_item_name" data-test="inventory-item-name">' + esc(product.name) + '</div></a>' +
+                    '<div class="inventory_item_desc" data-test="inventory-item-desc">' + esc(product.desc) + '</div></div>' +
+                    '<div class="pricebar"><div class="inventory_item_price" data-test="inventory-item-price">' +
+                    price(product.price) + '</div>' + cartButton(product, cart.indexOf(product.id) !== -1, "btn_small") +
+                    '</div></div></div>';
+            }).join("");
+        }
+
+        select.value = readSort();
+        renderItems();
+
+        select.addEventListener("change", function () {
+            window.localStorage.setItem(SORT_KEY, select.value);
+            renderItems();
+        });
+
+        list.addEventListener("click", function (event) {
+            var button = event.target.closest("button[data-id]");
+            if (!button) return;
+            var product = PRODUCTS[Number(button.getAttribute("data-id"))];
+            var added = toggleCart(product.id);
+            button.outerHTML = cartButton(product, added, "btn_small");
+        });
+    }
+
+    function renderItem(root) {
+        var id = Number(new URLSearchParams(window.location.search).get("id"));
+        var product = PRODUCTS[id];
+        root.innerHTML = header("", '<button class="btn btn_secondary back btn_large inventory_details_back_button" ' +
+            'id="back-to-products" data-test="back-to-products">Back to products</button>') +
+            '<div class="inventory_details"><div class="inventory_details_container">' +
+            (product
+                ? '<img class="inventory_details_img" alt="' + esc(product.name) + '" src="/static/img/' + product.id + '.svg">' +
+                  '<div class="inventory_details_desc_container">' +
+                  '<div class="inventory_details_name large_size" data-test="inventory-item-name">' + esc(product.name) + '</div>' +
+                  '<div class="inventory_details_desc large_size" data-test="inventory-item-desc">' + esc(product.desc) + '</div>' +
+                  '<div class="inventory_details_price" data-test="inventory-item-price">' + price(product.price) + '</div>' +
+                  cartButton(product, readCart().indexOf(product.id) !== -1, "btn_small btn_inventory") + '</div>'
+                : '<div class="inventory_details_name large_size">ITEM NOT FOUND</div>') +
+            '</div></div>' + footer();
+        bindHeader(root);
+
+        root.querySelector("#back-to-products").addEventListener("click", function () { go("/inventory.html"); });
+        var details = root.querySelector(".inventory_details_desc_container");
+        if (details) {
+            details.addEventListener("click", function (event) {
+                var button = event.target.closest("button[data-id]");
+                if (!button) return;
+                var added = toggleCart(product.id);
+                button.outerHTML = cartButton(product, added, "btn_small btn_inventory");
+            });
+        }
+    }
+
+    function renderCart(root) {
+        root.innerHTML = header("Your Cart") +
+            '<div id="cart_contents_container" class="cart_contents_container"><div>' +
+            '<div class="cart_list" data-test="cart-list">' +
+            '<div class="cart_quantity_label" data-test="cart-quantity-label">QTY</div>' +
+            '<div class="cart_desc_label" data-test="cart-desc-label">Description</div>' +
+            readCart().map(function (id) { return cartItem(PRODUCTS[id], true); }).join("") +
+            '</div><div class="cart_footer">' +
+            '<button class="btn btn_secondary back btn_medium" data-test="continue-shopping" id="continue-shopping" name="continue-shopping">Continue Shopping</button>' +
+            '<button class="btn btn_action btn_medium checkout_button" data-test="checkout" id="checkout" name="checkout">Checkout</button>' +
+            '</div></div></div>' + footer();
+        bindHeader(root);
+
+        root.querySelector(".cart_list").addEventListener("click", function (event) {
+            var button = event.target.closest("button[data-id]");
+            if (!button) return;
+            toggleCart(Number(button.getAttribute("data-id")));
+            button.closest(".cart_item").remove();
+        });
+        root.querySelector("#continue-shopping").addEventListener("click", function () { go("/inventory.html"); });
+        root.querySelector("#checkout").addEventListener("click", function () { go("/checkout-step-one.html"); });
+    }
+
+    function renderCheckoutInfo(root) {
+        root.innerHTML = header("Checkout: Your Information") +
+            '<div id="checkout_info_container" class="checkout_info_container"><div class="checkout_info_wrapper">' +
+            '<form novalidate><div class="checkout_info">' +
+            '<div class="form_group"><input class="input_error form_input" placeholder="First Name" type="text" data-test="firstName" id="first-name" name="firstName"></div>' +
+            '<div class="form_group"><input class="input_error form_input" placeholder="Last Name" type="text" data-test="lastName" id="last-name" name="lastName"></div>' +
+            '<div class="form_group"><input class="input_error form_input" placeholder="Zip/Postal Code" type="text" data-test="postalCode" id="postal-code" name="postalCode"></div>' +
+            '<div class="error-message-container"></div></div>' +
+            '<div class="checkout_buttons">' +
+            '<button class="btn btn_secondary back btn_medium cart_cancel_link" data-test="cancel" id="cancel" name="cancel" type="button">Cancel</button>' +
+            '<input type="submit" class="submit-button btn btn_primary cart_button btn_action" data-test="continue" id="continue" name="continue" value="Continue">' +
+            '</div></form></div></div>' + footer();
+        bindHeader(root);
+
+        var container = root.querySelector(".error-message-container");
+        root.querySelector("#cancel").addEventListener("click", function () { go("/cart.html"); });
+        root.querySelector("form").addEventListener("submit", function (event) {
+            event.preventDefault();
+            var fields = [["#first-name", "First Name"], ["#last-name", "Last Name"], ["#postal-code", "Postal Code"]];
+            for (var i = 0; i < fields.length; i++) {
+                if (!root.querySelector(fields[i][0]).value) {
+                    container.classList.add("error");
+                    container.innerHTML = '<h3 data-test="error">Error: ' + fields[i][1] + ' is required</h3>';
+                    return;
+                }
+            }
+            go("/checkout-step-two.html");
+        });
+    }
+
+    function renderCheckoutOverview(root) {
+        var products = readCart().map(function (id) { return PRODUCTS[id]; });
+        var subtotal = products.reduce(function (sum, p) { return sum + p.price; }, 0);
+        var tax = Math.round(subtotal * 8) / 100;
+        root.innerHTML = header("Checkout: Overview") +
+            '<div id="checkout_summary_container" class="checkout_summary_container"><div>' +
+            '<div class="cart_list" data-test="cart-list">' +
+            '<div class="cart_quantity_label">QTY</div><div class="cart_desc_label">Description</div>' +
+            products.map(function (p) { return cartItem(p, false); }).join("") +
+            '</div><div class="summary_info">' +
+            '<div class="summary_info_label" data-test="payment-info-label">Payment Information:</div>' +
+            '<div class="summary_value_label" data-test="payment-info-value">SauceCard #31337</div>' +
+            '<div class="summary_info_label" data-test="shipping-info-label">Shipping Information:</div>' +
+            '<div class="summary_value_label" data-test="shipping-info-value">Free Pony Express Delivery!</div>' +
+            '<div class="summary_info_label" data-test="total-info-label">Price Total</div>' +
+            '<div class="summary_subtotal_label" data-test="subtotal-label">Item total: ' + price(subtotal) + '</div>' +
+            '<div class="summary_tax_label" data-test="tax-label">Tax: ' + price(tax) + '</div>' +
+            '<div class="summary_info_label summary_total_label" data-test="total-label">Total: ' + price(subtotal + tax) + '</div>' +
+            '<div class="cart_footer">' +
+            '<button class="btn btn_secondary back btn_medium cart_cancel_link" data-test="cancel" id="cancel" name="cancel">Cancel</button>' +
+            '<button class="btn btn_action btn_medium cart_button" data-test="finish" id="finish" name="finish">Finish</button>' +
+            '</div></div></div></div>' + footer();
+        bindHeader(root);
+
+        root.querySelector("#cancel").addEventListener("click", function () { go("/inventory.html"); });
+        root.querySelector("#finish").addEventListener("click", function () {
+            writeCart([]);
+            go("/checkout-complete.html");
+        });
+    }
+
+    function renderCheckoutComplete(root) {
+        root.innerHTML = header("Checkout: Complete!") +
+            '<div id="checkout_complete_container" class="checkout_complete_container" data-test="checkout-complete-container">' +
+            '<h2 class="complete-header" data-test="complete-header">Thank you for your order!</h2>' +
+            '<div class="complete-text" data-test="complete-text">Your order has been dispatched, and will arrive just as fast as the pony can get there!</div>' +
+            '<button class="btn btn_primary btn_small" data-test="back-to-products" id="back-to-products" name="back-to-products">Back Home</button>' +
+            '</div>' + footer();
+        bindHeader(root);
+
+        root.querySelector("#back-to-products").addEventListener("click", function () { go("/inventory.html"); });
+    }
+
+    var PAGES = {
+        "/": renderLogin,
+        "/index.html": renderLogin,
+        "/inventory.html": renderInventory,
+        "/inventory-item.html": renderItem,
+        "/cart.html": renderCart,
+        "/checkout-step-one.html": renderCheckoutInfo,
+        "/checkout-step-two.html": renderCheckoutOverview,
+        "/checkout-complete.html": renderCheckoutComplete
+    };
+
+    var path = window.location.pathname;
+    var render = PAGES[path] || renderLogin;
+    var root = document.getElementById("root");
+
+    if (render !== renderLogin && !currentUser()) {
+        window.sessionStorage.setItem(ERROR_KEY,
+            "Epic sadface: You can only access '" + path + "' when you are logged in.");
+        window.location.replace("/");
+        return;
+    }
+    render(root);
+})();
@@ -0,0 +1,130 @@
+"""
+steps.py
+Шаги теста с замером времени:
+
+    with step("Шаг 1: Ввод логина"):
+        ...
+
+    @step("Добавление товара в корзину")
+    def add_to_cart(page): ...
+
+Для каждого шага записывается время (time.perf_counter), число вызовов
+Playwright и число сетевых запросов. Пока запись выключена (нет активного
+StepRecorder), шаг только печатает отметку "✓ <название>".
+"""
+
+import functools
+import time
+from typing import Dict, List, Optional
+
+from playwright.sync_api import BrowserContext, Request
+
+from swaglabs import instrument, timeouts
+
+_current: Optional["StepRecorder"] = None
+
+
+class StepRecorder:
+    """Собирает замеры шагов одного теста"""
+
+    def __init__(self, nodeid: str, tags: Optional[Dict] = None):
+        self.nodeid = nodeid
+        self.tags = dict(tags or {})
+        self.records: List[Dict] = []
+        self.calls = 0
+        self.requests = 0
+        self.depth = 0
+        self._context: Optional[BrowserContext] = None
+        self._started = time.perf_counter()
+
+    def _on_call(self, name: str, elapsed: float) -> None:
+        self.calls += 1
+
+    def _on_request(self, request: Request) -> None:
+        self.requests += 1
+
+    def attach(self, context: BrowserContext) -> None:
+        """Считать сетевые запросы этого контекста"""
+        self._context = context
+        context.on("request", self._on_request)
+
+    def start(self) -> None:
+        global _current
+        _current = self
+        self._started = time.perf_counter()
+        instrument.subscribe(self._on_call)
+
+    def stop(self) -> None:
+        global _current
+        instrument.unsubscribe(self._on_call)
+        if self._context is not None:
+            self._context.remove_listener("request", self._on_request)
+            self._context = None
+        if _current is self:
+            _current = None
+
+    def add(self, name: str, started: float, duration: float, calls: int, requests: int, status: str) -> None:
+        self.records.append({
+            "nodeid": self.nodeid,
+            "step": name,
+            "index": len(self.records),
+            "depth": self.depth,
+            "offset_ms": round((started - self._started) * 1000, 2),
+            "duration_ms": round(duration * 1000, 2),
+            "pw_calls": calls,
+            "requests": requests,
+            "status": status,
+            **self.tags,
+        })
+
+
+def current_recorder() -> Optional[StepRecorder]:
+    return _current
+
+
+class Step:
+    """Контекстный менеджер и декоратор шага (см. step)"""
+
+    def __init__(self, name: str):
+        self.name = name
+        self._recorder: Optional[StepRecorder] = None
+
+    def __enter__(self) -> "Step":
+        # Таймаут вызовов внутри шага по его истории (--adaptive-timeouts)
+        self._timeout = timeouts.step_timeout(self.name)
+        self._timeout.__enter__()
+        recorder = self._recorder = _current
+        if recorder is not None:
+            self._snapshot = (time.perf_counter(), recorder.calls, recorder.requests)
+            recorder.depth += 1
+        return self
+
+    def __exit__(self, exc_type, exc, tb) -> bool:
+        recorder = self._recorder
+        if recorder is not None:
+            started, calls, requests = self._snapshot
+            recorder.depth -= 1
+            recorder.add(
+                self.name,
+                started,
+                time.perf_counter() - started,
+                recorder.calls - calls,
+                recorder.requests - requests,
+                "passed" if exc_type is None else "failed",
+            )
+        self._timeout.__exit__(exc_type, exc, tb)
+        if exc_type is None:
+            print(f"✓ {self.name}")
+        return False
+
+    def __call__(self, func):
+        @functools.wraps(func)
+        def wrapper(*args, **kwargs):
+            with Step(self.name):
+                return func(*args, **kwargs)
+        return wrapper
+
+
+def step(name: str) -> Step:
+    """Логический шаг теста: with step("..."): ... или @step("...")"""
+    return Step(name)
@@ -0,0 +1,102 @@
+"""
+throttling.py
+Профили эмуляции медленной сети и слабого процессора через CDP
+(Network.emulateNetworkConditions, Emulation.setCPUThrottlingRate).
+Работает только в Chromium.
+
+Параметры сети — пресеты DevTools/Lighthouse (задержка и пропускная
+способность уже с поправочными коэффициентами). Профиль применяется к
+каждой странице контекста, в том числе к открытым позже (событие page).
+"""
+
+from typing import Dict, List, NamedTuple, Optional, Sequence, Tuple
+
+from playwright.sync_api import BrowserContext, CDPSession, Page
+from playwright.sync_api import Error as PlaywrightError
+
+
+class ThrottleProfile(NamedTuple):
+    name: str
+    description: str
+    latency_ms: float = 0
+    download_kbps: Optional[float] = None   # None — без ограничения
+    upload_kbps: Optional[float] = None
+    cpu_rate: float = 1
+
+    def commands(self) -> List[Tuple[str, Dict]]:
+        """CDP-команды, включающие профиль на странице"""
+        def throughput(kbps: Optional[float]) -> float:
+            return kbps * 1000 / 8 if kbps else -1  # CDP ждет байты в секунду, -1 — без ограничения
+
+        return [
+            ("Network.enable", {}),
+            ("Network.emulateNetworkConditions", {
+                "offline": False,
+                "latency": self.latency_ms,
+                "downloadThroughput": throughput(self.download_kbps),
+                "uploadThroughput": throughput(self.upload_kbps),
+            }),
+            ("Emulation.setCPUThrottlingRate", {"rate": self.cpu_rate}),
+        ]
+
+
+PROFILES: Dict[str, ThrottleProfile] = {
+    profile.name: profile for profile in (
+        ThrottleProfile("none", "без ограничений"),
+        ThrottleProfile("3g", "медленный 3G: 2000 мс, 400/400 кбит/с", 2000, 400, 400),
+        ThrottleProfile("slow-4g", "медленный 4G: 562 мс, 1440/675 кбит/с", 562.5, 1440, 675),
+        ThrottleProfile("cpu-4x", "процессор в 4 раза медленнее", cpu_rate=4),
+        ThrottleProfile("mobile", "медленный 4G и процессор в 4 раза медленнее", 562.5, 1440, 675, 4),
+    )
+}
+
+# Профиль "none" возвращает страницу в исходное состояние
+RESET = PROFILES["none"]
+
+
+def parse_profiles(value: str) -> List[str]:
+    """'3g, slow-4g' → ['3g', 'slow-4g']; ValueError для неизвестных профилей"""
+    names = [name.strip() for name in value.split(",") if name.strip()]
+    unknown = [name for name in names if name not in PROFILES]
+    if unknown:
+        raise ValueError(f"неизвестные профили эмуляции: {', '.join(unknown)} (есть: {', '.join(PROFILES)})")
+    return list(dict.fromkeys(names))
+
+
+class Throttling:
+    """Профиль эмуляции на страницах одного контекста"""
+
+    def __init__(self, profile: ThrottleProfile):
+        self.profile = profile
+        self._context: Optional[BrowserContext] = None
+        self._sessions: List[Tuple[Page, CDPSession]] = []
+
+    def attach(self, context: BrowserContext) -> None:
+        self._context = context
+        for page in context.pages:
+            self._apply(page)
+        context.on("page", self._apply)
+
+    def _apply(self, page: Page) -> None:
+        session = page.context.new_cdp_session(page)
+        self._sessions.append((page, session))
+        self._send(session, self.profile.commands())
+
+    @staticmethod
+    def _send(session: CDPSession, commands: Sequence[Tuple[str, Dict]]) -> None:
+        for method, params in commands:
+            session.send(method, params)
+
+    def detach(self) -> None:
+        """Снимает эмуляцию: контекст может вернуться в пул (--context-pool)"""
+        if self._context is not None:
+            self._context.remove_listener("page", self._apply)
+            self._context = None
+        for page, session in self._sessions:
+            try:
+                if not page.is_closed():
+                    self._send(session, RESET.commands())
+                session.detach()
+            except PlaywrightError:
+                pass  # страница или браузер уже закрыты
+        self._sessions = []
@@ -0,0 +1,209 @@
+"""
+timeouts.py
+Адаптивные таймауты по истории задержек: вместо одного TIMEOUT=30000
+на все случаи каждое ожидание (readiness, expect_all) и каждый шаг
+(with step(...)) получает таймаут p99 × factor из своих прошлых замеров,
+ограниченный снизу floor и сверху ceiling.
+
+Пока замеров меньше MIN_SAMPLES, действует ceiling. Без активной
+политики (pytest без --adaptive-timeouts) ожидания получают переданный
+или стандартный таймаут, как раньше.
+
+    with adaptive("wait_for_sort_applied", timeout) as timeout:
+        page.wait_for_function(..., timeout=timeout)
+"""
+
+import json
+import math
+import time
+from contextlib import contextmanager
+from pathlib import Path
+from typing import Dict, Iterator, List, NamedTuple, Optional, Sequence
+
+from playwright.sync_api import BrowserContext
+
+HISTORY_PATH = Path(".swaglabs/latency.json")
+# Сколько последних успешных замеров хранить на ожидание
+KEEP_SAMPLES = 50
+# С какого числа замеров таймаут считается по истории
+MIN_SAMPLES = 5
+QUANTILE = 0.99
+FACTOR = 3.0
+FLOOR_MS = 1000.0
+CEILING_MS = 30000.0
+# Ожидание заняло больше этой доли таймаута — "близко к таймауту"
+NEAR_TIMEOUT = 0.5
+
+
+def quantile(values: Sequence[float], q: float) -> float:
+    """Квантиль по ближайшему рангу (на малых выборках p99 — это максимум)"""
+    ordered = sorted(values)
+    return ordered[max(0, math.ceil(q * len(ordered)) - 1)]
+
+
+class Observation(NamedTuple):
+    key: str
+    elapsed_ms: float
+    timeout_ms: Optional[float]
+    ok: bool
+
+
+class LatencyHistory:
+    """Замеры ожиданий и шагов (ключ → последние длительности в мс)"""
+
+    def __init__(self, path: Path):
+        self.path = Path(path)
+        self.samples: Dict[str, List[float]] = {}
+        if self.path.exists():
+            data = json.loads(self.path.read_text(encoding="utf-8"))
+            self.samples = {key: list(values) for key, values in data.get("latency", {}).items()}
+
+    def add(self, key: str, elapsed_ms: float) -> None:
+        values = self.samples.setdefault(key, [])
+        values.append(round(elapsed_ms, 1))
+        del values[:-KEEP_SAMPLES]
+
+    def save(self) -> None:
+        self.path.parent.mkdir(parents=True, exist_ok=True)
+        data = {"version": 1, "latency": dict(sorted(self.samples.items()))}
+        self.path.write_text(json.dumps(data, ensure_ascii=False, indent=1), encoding="utf-8")
+
+
+class TimeoutPolicy:
+    """Таймауты из истории и замеры текущего прогона"""
+
+    def __init__(self, history: LatencyHistory, factor: float = FACTOR, floor: float = FLOOR_MS,
+                 ceiling: float = CEILING_MS, min_samples: int = MIN_SAMPLES):
+        self.history = history
+        self.factor = factor
+        self.floor = floor
+        self.ceiling = ceiling
+        self.min_samples = min_samples
+        self.observations: List[Observation] = []
+        self._context: Optional[BrowserContext] = None
+        self._step_timeouts: List[float] = []
+        # Профиль эмуляции текущего теста (--throttle): своя история на профиль
+        self.variant: Optional[str] = None
+
+    def _key(self, key: str) -> str:
+        return f"{key} [{self.variant}]" if self.variant and self.variant != "none" else key
+
+    def timeout_for(self, key: str) -> float:
+        values = self.history.samples.get(self._key(key), [])
+        if len(values) < self.min_samples:
+            return self.ceiling
+        return min(self.ceiling, max(self.floor, quantile(values, QUANTILE) * self.factor))
+
+    def observe(self, key: str, elapsed_ms: float, timeout_ms: Optional[float], ok: bool) -> None:
+        self.observations.append(Observation(self._key(key), round(elapsed_ms, 1), timeout_ms, ok))
+
+    def attach(self, context: BrowserContext, variant: Optional[str] = None) -> None:
+        """Контекст теста: шаги меняют его таймаут по умолчанию"""
+        self._context = context
+        self._step_timeouts = []
+        self.variant = variant
+        context.set_default_timeout(self.ceiling)
+
+    def detach(self) -> None:
+        self._context = None
+        self._step_timeouts = []
+        self.variant = None
+
+    @contextmanager
+    def step(self, name: str) -> Iterator[None]:
+        """Таймаут по умолчанию для вызовов внутри шага — по истории всего шага"""
+        context = self._context
+        if context is None:
+            yield
+            return
+        timeout = self.timeout_for(step_key(name))
+        self._step_timeouts.append(timeout)
+        context.set_default_timeout(timeout)
+        try:
+            with _measure(self, step_key(name), timeout):
+                yield
+        finally:
+            self._step_timeouts.pop()
+            context.set_default_timeout(self._step_timeouts[-1] if self._step_timeouts else self.ceiling)
+
+
+def step_key(name: str) -> str:
+    return f"шаг: {name}"
+
+
+@contextmanager
+def _measure(policy: TimeoutPolicy, key: str, timeout: Optional[float]) -> Iterator[None]:
+    started = time.perf_counter()
+    ok = False
+    try:
+        yield
+        ok = True
+    finally:
+        policy.observe(key, (time.perf_counter() - started) * 1000, timeout, ok)
+
+
+_policy: Optional[TimeoutPolicy] = None
+
+
+def activate(policy: Optional[TimeoutPolicy]) -> None:
+    global _policy
+    _policy = policy
+
+
+def current_policy() -> Optional[TimeoutPolicy]:
+    return _policy
+
+
+@contextmanager
+def adaptive(key: str, timeout: Optional[float] = None, default: Optional[float] = None) -> Iterator[Optional[float]]:
+    """
+    Таймаут ожидания key в мс: явный timeout, иначе по истории
+    (или default, если политика не активна)
+    """
+    policy = _policy
+    if policy is None:
+        yield timeout if timeout is not None else default
+        return
+    effective = timeout if timeout is not None else policy.timeout_for(key)
+    with _measure(policy, key, effective):
+        yield effective
+
+
+@contextmanager
+def step_timeout(name: str) -> Iterator[None]:
+    """Таймаут шага (см. TimeoutPolicy.step); без политики ничего не делает"""
+    policy = _policy
+    if policy is None:
+        yield
+        return
+    with policy.step(name):
+        yield
+
+
+class KeySummary(NamedTuple):
+    key: str
+    count: int
+    p99_ms: float
+    timeout_ms: Optional[float]
+    headroom: float     # максимальная доля таймаута, занятая ожиданием
+    failed: int
+
+
+def summarize(observations: Sequence[Observation]) -> List[KeySummary]:
+    """Сводка по ключам: самые близкие к таймауту — первыми"""
+    grouped: Dict[str, List[Observation]] = {}
+    for observation in observations:
+        grouped.setdefault(observation.key, []).append(observation)
+    result = []
+    for key, items in grouped.items():
+        ratios = [item.elapsed_ms / item.timeout_ms for item in items if item.timeout_ms]
+        timeouts = [item.timeout_ms for item in items if item.timeout_ms]
+        result.append(KeySummary(
+            key,
+            len(items),
+            quantile([item.elapsed_ms for item in items], QUANTILE),
+            min(timeouts) if timeouts else None,
+            max(ratios) if ratios else 0.0,
+            sum(1 for item in items if not item.ok),
+        ))
+    return sorted(result, key=lambda summary: (-summary.failed, -summary.headroom, summary.key))
@@ -1,11 +1,184 @@
+import re
+
 import pytest
-from playwright.sync_api import Page, BrowserContext
+from playwright.sync_api import Page, BrowserContext, expect
+
+from swaglabs import settings
+from swaglabs.auth import AuthSession, merge_context_args
+from swaglabs.readiness import wait_for_cart_badge
+from swaglabs.seeding import seeded_state
+from swaglabs.shared_page import is_shared
+from swaglabs.standin import StandIn
+from swaglabs.steps import step
+
+pytest_plugins = [
+    "swaglabs.plugins.resources",
+    "swaglabs.plugins.pool",
+    "swaglabs.plugins.steps",
+    "swaglabs.plugins.perf",
+    "swaglabs.plugins.schedule",
+    "swaglabs.plugins.shard",
+    "swaglabs.plugins.aio",
+    "swaglabs.plugins.server",
+    "swaglabs.plugins.artifacts",
+    "swaglabs.plugins.profile",
+    "swaglabs.plugins.timeouts",
+    "swaglabs.plugins.retries",
+    "swaglabs.plugins.throttle",
+    "swaglabs.plugins.soak",
+    "swaglabs.plugins.shared_page",
+    "swaglabs.plugins.results",
+    "swaglabs.plugins.matrix",
+    "swaglabs.plugins.http_cache",
+]
+
+stand_in_key = pytest.StashKey[StandIn]()
+
+
+def pytest_addoption(parser):
+    parser.addoption(
+        "--offline",
+        action="store_true",
+        default=settings.OFFLINE,
+        help="запускать тесты против локального стенда Swag Labs (или SWAG_OFFLINE=1)",
+    )
+
+
+def pytest_configure(config):
+    config.addinivalue_line(
+        "markers",
+        "authenticated: тест получает контекст с сохраненной сессией standard_user",
+    )
+    config.addinivalue_line(
+        "markers",
+        "seeded(cart=(), start='inventory.html'): сессия standard_user и корзина "
+        "засеиваются в контекст без UI, seeded_page открывает страницу start",
+    )
+
+    # Стенд поднимается до импорта тестовых модулей, поэтому
+    # BASE_URL в классах тестов уже указывает на него
+    if config.getoption("--offline"):
+        stand_in = StandIn(catalog_size=settings.STAND_IN_CATALOG_SIZE).start()
+        settings.use_base_url(stand_in.url)
+        config.stash[stand_in_key] = stand_in
+
+
+def pytest_unconfigure(config):
+    stand_in = config.stash.get(stand_in_key, None)
+    if stand_in is not None:
+        stand_in.stop()
+
 
 @pytest.fixture(scope="session")
 def browser_context_args(browser_context_args):
-    return {
-        **browser_context_args,
-        "viewport": {"width": 1920, "height": 1080},
-        "locale": "ru-RU",  # Локализация
-        "timezone_id": "Europe/Moscow",  # Часовой пояс
-    }
\ No newline at end of file
+    return {**browser_context_args, **settings.CONTEXT_ARGS}
+
+
+@pytest.fixture
+def context(context: BrowserContext, resource_blocker, step_recorder, page_metrics,
+            failure_artifacts, adaptive_timeouts, throttling, http_cache) -> BrowserContext:
+    """
+    Контекст pytest-playwright с профилем блокировки ресурсов (--resource-profile),
+    подсчетом сетевых запросов по шагам (--step-timings),
+    сбором long tasks для метрик страниц (--perf-metrics),
+    чанком трассировки теста (--failure-artifacts),
+    таймаутами шагов по истории (--adaptive-timeouts),
+    эмуляцией медленной сети и процессора (--throttle, маркер throttle)
+    и общим кэшем статики (--http-cache)
+    """
+    if http_cache is not None:
+        # До блокировщика: route, поставленный позже, срабатывает первым,
+        # и заблокированные ресурсы не попадают в кэш
+        http_cache.attach(context)
+    resource_blocker.install(context)
+    profile = throttling.profile.name if throttling is not None else None
+    if step_recorder is not None:
+        step_recorder.attach(context)
+        # Шаги под разными профилями сравниваются в сводке --step-timings
+        step_recorder.tags["throttle"] = profile
+    page_metrics.attach(context)
+    if failure_artifacts is not None:
+        # failure_artifacts запрошен после context: его teardown идет раньше закрытия контекста
+        failure_artifacts.attach(context)
+    if adaptive_timeouts is not None:
+        # Под эмуляцией своя история задержек: медленная сеть не раздувает обычные таймауты
+        adaptive_timeouts.attach(context, variant=profile)
+    if throttling is not None:
+        throttling.attach(context)
+    return context
+
+
+@pytest.fixture(scope="session")
+def auth_session(browser, browser_name, browser_context_args, browser_matrix, tmp_path_factory) -> AuthSession:
+    """Сессия standard_user: логин через UI один раз на воркер"""
+    # basetemp у каждого xdist-воркера свой, поэтому файлы не пересекаются
+    state_path = tmp_path_factory.getbasetemp() / "storage_state.json"
+
+    def create() -> AuthSession:
+        return AuthSession(
+            browser,
+            browser_context_args,
+            state_path,
+            settings.BASE_URL,
+            settings.VALID_USERNAME,
+            settings.VALID_PASSWORD,
+        )
+
+    if browser_matrix is None:
+        return create()
+    # В матрице фикстура пересоздается при смене движка, сессия движка остается прежней
+    return browser_matrix.resource(browser_name, "auth_session", create)
+
+
+@pytest.fixture(autouse=True)
+def _authenticated_context_args(request):
+    """
+    Для тестов с маркерами authenticated и seeded подставляет storage_state
+    в маркер browser_context_args, который читает фикстура context
+    из pytest-playwright. Выполняется раньше, чем создается context.
+    """
+    seeded = request.node.get_closest_marker("seeded")
+    if seeded is not None:
+        # Сессия и корзина без логина через UI
+        storage_state = seeded_state(settings.BASE_URL, settings.VALID_USERNAME, seeded.kwargs.get("cart", ()))
+    elif request.node.get_closest_marker("authenticated") is not None:
+        storage_state = request.getfixturevalue("auth_session").storage_state()
+    else:
+        return
+
+    existing = request.node.get_closest_marker("browser_context_args")
+    kwargs = merge_context_args(existing.kwargs if existing else None, storage_state)
+    request.node.add_marker(pytest.mark.browser_context_args(**kwargs), append=False)
+
+
+@pytest.fixture
+def authenticated_page(page: Page, auth_session: AuthSession, page_metrics) -> Page:
+    """Страница в авторизованном контексте, открытая на inventory.html"""
+    if is_shared(page):
+        return page  # общая страница класса уже сброшена на inventory.html (--shared-page)
+    with step("Каталог: открытие inventory.html"):
+        auth_session.open_inventory(page)
+    # Полная загрузка документа inventory.html: после логина на saucedemo.com переход
+    # клиентский, поэтому fcp/load из бюджета inventory.html проверяются здесь
+    page_metrics.capture(page)
+    return page
+
+
+@pytest.fixture
+def seeded_page(page: Page, request) -> Page:
+    """
+    Страница в контексте с засеянным состоянием (маркер seeded),
+    открытая сразу на странице start
+    """
+    marker = request.node.get_closest_marker("seeded")
+    if marker is None:
+        pytest.fail("seeded_page используется только вместе с маркером seeded")
+    start = marker.kwargs.get("start", "inventory.html")
+    cart = marker.kwargs.get("cart", ())
+
+    page.goto(settings.BASE_URL + start)
+    # Сайт не принял засеянную сессию и вернул на страницу входа
+    expect(page).to_have_url(re.compile(".*" + re.escape(start)))
+    if cart:
+        wait_for_cart_badge(page, len(cart))
+    return page
@@ -0,0 +1,56 @@
+"""
+test_aio.py
+Проверки выполнения async-тестов (swaglabs.aio) без браузера
+"""
+
+import asyncio
+
+import pytest
+
+from swaglabs.aio import busy_time, run_test
+from swaglabs.plugins import aio as aio_plugin
+
+
+def test_busy_time_merges_overlapping_spans():
+    assert busy_time([(0, 2), (1, 3), (5, 6)]) == 4
+    assert busy_time([]) == 0
+
+
+def test_run_test_phases_and_params():
+    seen = {}
+
+    async def passing(first_ui_step):
+        seen["step"] = first_ui_step
+
+    phases = asyncio.run(run_test(None, passing, ["first_ui_step"], {"first_ui_step": 3}))
+    assert [phase.when for phase in phases] == ["setup", "call", "teardown"]
+    assert all(phase.error is None for phase in phases)
+    assert seen == {"step": 3}
+
+
+def test_run_test_keeps_errors():
+    async def failing():
+        pytest.fail("упал")
+
+    setup, call, teardown = asyncio.run(run_test(None, failing, []))
+    assert isinstance(call.error, pytest.fail.Exception)
+    assert setup.error is None and teardown.error is None
+
+
+def test_unknown_fixture_fails_setup():
+    async def needs_sync_page(page):
+        pass
+
+    phases = asyncio.run(run_test(None, needs_sync_page, ["page"]))
+    assert [phase.when for phase in phases] == ["setup", "teardown"]
+    assert "page" in str(phases[0].error)
+
+
+@pytest.mark.parametrize("version, supported", [("3.8.0", True), ("2.5.0", False), ("4.0.0", False)])
+def test_xdist_version_guard(monkeypatch, version, supported):
+    monkeypatch.setattr(aio_plugin.metadata, "version", lambda name: version)
+    if supported:
+        aio_plugin.check_xdist_version()
+    else:
+        with pytest.raises(pytest.UsageError, match=version):
+            aio_plugin.check_xdist_version()
@@ -0,0 +1,30 @@
+"""
+test_artifacts.py
+Проверки каталога артефактов упавших тестов (swaglabs.artifacts) без браузера
+"""
+
+import os
+
+from swaglabs.artifacts import artifact_dir, enforce_size_cap
+
+
+def test_artifact_dir_is_safe_and_unique_per_attempt(tmp_path):
+    first = artifact_dir(tmp_path, "tests/test_sorting.py::TestProductSorting::test_sort[chromium]")
+    assert first.name == "tests_test_sorting.py_TestProductSorting_test_sort_chromium"
+    first.mkdir()
+    assert artifact_dir(tmp_path, "tests/test_sorting.py::TestProductSorting::test_sort[chromium]").name.endswith("-2")
+
+
+def test_size_cap_evicts_oldest_runs_but_keeps_current(tmp_path):
+    for age, name in enumerate(["current", "newer", "oldest"]):
+        run = tmp_path / name
+        run.mkdir()
+        (run / "trace.zip").write_bytes(b"x" * 1000)
+        os.utime(run, (1000 - age * 100, 1000 - age * 100))
+
+    removed = enforce_size_cap(tmp_path, 2500, keep=tmp_path / "current")
+    assert [run.name for run in removed] == ["oldest"]
+
+    removed = enforce_size_cap(tmp_path, 0, keep=tmp_path / "current")
+    assert [run.name for run in removed] == ["newer"]
+    assert (tmp_path / "current").exists()
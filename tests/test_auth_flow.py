@@ -2,13 +2,18 @@ import re
 import pytest
 from playwright.sync_api import Page, expect
 
+from swaglabs import settings
+from swaglabs.checks import expect_all, hidden, text, visible
+from swaglabs.readiness import wait_for_login_page, wait_for_page
+from swaglabs.steps import step
+
 class TestAuthFlow:
     """Тест-кейс TC-AUTH-001: Проверка успешной авторизации и деавторизации"""
     
     # Константы с данными для теста
-    BASE_URL = "https://www.saucedemo.com/"
-    VALID_USERNAME = "standard_user"
-    VALID_PASSWORD = "secret_sauce"
+    BASE_URL = settings.BASE_URL  # saucedemo.com или локальный стенд (--offline)
+    VALID_USERNAME = settings.VALID_USERNAME
+    VALID_PASSWORD = settings.VALID_PASSWORD
     
     @pytest.fixture(autouse=True)
     def setup(self, page: Page):
@@ -24,96 +29,91 @@ class TestAuthFlow:
         
         # Постусловие: Закрытие браузера выполняется автоматически через фикстуру pytest-playwright
     
-    def test_successful_login_logout(self, page: Page):
+    def test_successful_login_logout(self, page: Page, page_metrics):
         """TC-AUTH-001: Проверка успешной авторизации и деавторизации"""
         
-        # ===== ШАГ 1: Ввод логина =====
-        # Находим поле ввода логина по ID и вводим валидный логин
-        username_field = page.locator("#user-name")
-        username_field.fill(self.VALID_USERNAME)
-        
-        # Проверяем, что логин отображается в поле ввода
-        expect(username_field).to_have_value(self.VALID_USERNAME)
-        print("✓ Шаг 1: Логин успешно введен")
-        
-        # ===== ШАГ 2: Ввод пароля =====
-        # Находим поле ввода пароля по ID и вводим валидный пароль
-        password_field = page.locator("#password")
-        password_field.fill(self.VALID_PASSWORD)
-        
-        # Проверяем, что пароль скрыт (тип input должен быть "password")
-        expect(password_field).to_have_attribute("type", "password")
-        print("✓ Шаг 2: Пароль успешно введен (символы скрыты)")
-        
-        # ===== ШАГ 3: Нажатие кнопки Login =====
-        # Находим кнопку входа по ID и кликаем
-        login_button = page.locator("#login-button")
-        login_button.click()
-        
-        # Ожидаем обработки запроса и переадресации
-        page.wait_for_load_state("networkidle")
-        
-        # Проверка 3.1: URL изменился (ушли со страницы логина)
-        expect(page).not_to_have_url(self.BASE_URL)
-        
-        # Проверка 3.2: Находимся на главной странице после входа
-        expect(page).to_have_url(re.compile(r".*inventory\.html"))
-        
-        # Проверка 3.3: Отображается приветствие/уникальный элемент
-        # На сайте Swag Labs после входа отображается заголовок "Products"
-        products_title = page.locator("span.title")
-        expect(products_title).to_be_visible()
-        expect(products_title).to_have_text("Products")
-        
-        # Проверка 3.4: Форма входа не отображается
-        expect(page.locator("#login-button")).not_to_be_visible()
-        
-        # Дополнительная проверка: отображается меню пользователя (бургер-меню)
-        menu_button = page.locator("#react-burger-menu-btn")
-        expect(menu_button).to_be_visible()
-        
-        print("✓ Шаг 3: Авторизация успешна - пользователь на главной странице")
-        
-        # ===== ШАГ 4: Открытие меню пользователя =====
-        # Кликаем на бургер-меню (элемент профиля пользователя)
-        menu_button.click()
-        
-        # Ожидаем появления выпадающего меню
-        menu_container = page.locator(".bm-menu-wrap")
-        expect(menu_container).to_be_visible()
-        
-        # Проверяем, что меню содержит нужные пункты
-        # В Swag Labs меню содержит пункт "Logout"
-        logout_menu_item = page.locator("#logout_sidebar_link")
-        expect(logout_menu_item).to_be_visible()
-        expect(logout_menu_item).to_have_text("Logout")
-        
-        # Также проверяем наличие других пунктов меню
-        expect(page.locator("#inventory_sidebar_link")).to_be_visible()  # All Items
-        expect(page.locator("#about_sidebar_link")).to_be_visible()      # About
-        
-        print("✓ Шаг 4: Меню пользователя успешно открыто")
-        
-        # ===== ШАГ 5: Выход из системы =====
-        # Кликаем на пункт "Logout"
-        logout_menu_item.click()
-        
-        # Ожидаем переадресации на страницу авторизации
-        page.wait_for_load_state("networkidle")
-        
-        # Проверка 5.1: Произошла переадресация на страницу авторизации
-        expect(page).to_have_url(self.BASE_URL)
-        
-        # Проверка 5.2: Форма авторизации снова отображается
-        expect(page.locator("#login-button")).to_be_visible()
-        expect(page.locator("#user-name")).to_be_visible()
-        expect(page.locator("#password")).to_be_visible()
-        
-        # Проверка 5.3: Элементы личного кабинета не отображаются
-        expect(page.locator("#react-burger-menu-btn")).not_to_be_visible()
-        expect(products_title).not_to_be_visible()
-        
-        print("✓ Шаг 5: Деавторизация успешна - пользователь на странице входа")
+        with step("Шаг 1: Логин успешно введен"):
+            # ===== ШАГ 1: Ввод логина =====
+            # Находим поле ввода логина по ID и вводим валидный логин
+            username_field = page.locator("#user-name")
+            username_field.fill(self.VALID_USERNAME)
+        
+            # Проверяем, что логин отображается в поле ввода
+            expect(username_field).to_have_value(self.VALID_USERNAME)
+        
+        with step("Шаг 2: Пароль успешно введен (символы скрыты)"):
+            # ===== ШАГ 2: Ввод пароля =====
+            # Находим поле ввода пароля по ID и вводим валидный пароль
+            password_field = page.locator("#password")
+            password_field.fill(self.VALID_PASSWORD)
+        
+            # Проверяем, что пароль скрыт (тип input должен быть "password")
+            expect(password_field).to_have_attribute("type", "password")
+        
+        with step("Шаг 3: Авторизация успешна - пользователь на главной странице"):
+            # ===== ШАГ 3: Нажатие кнопки Login =====
+            # Находим кнопку входа по ID и кликаем
+            login_button = page.locator("#login-button")
+            login_button.click()
+        
+            # Ожидаем переадресации и отрисовки заголовка страницы товаров
+            wait_for_page(page, re.compile(r".*inventory\.html"), "Products")
+        
+            # Проверка 3.1: URL изменился (ушли со страницы логина)
+            expect(page).not_to_have_url(self.BASE_URL)
+        
+            # Проверка 3.2: Находимся на главной странице после входа
+            expect(page).to_have_url(re.compile(r".*inventory\.html"))
+            # На saucedemo.com переход после логина клиентский: fcp/load не измеряются,
+            # проверяются long tasks и ресурсы (fcp inventory.html — в authenticated_page)
+            page_metrics.capture(page)
+        
+            # Проверки 3.3–3.5 одним запросом к браузеру:
+            # заголовок "Products" отображается, формы входа нет, есть бургер-меню
+            expect_all(page, [
+                visible("span.title"),
+                text("span.title", "Products"),
+                hidden("#login-button"),
+                visible("#react-burger-menu-btn"),
+            ])
+            menu_button = page.locator("#react-burger-menu-btn")
+        
+        with step("Шаг 4: Меню пользователя успешно открыто"):
+            # ===== ШАГ 4: Открытие меню пользователя =====
+            # Кликаем на бургер-меню (элемент профиля пользователя)
+            menu_button.click()
+        
+            # Ожидаем появления выпадающего меню и проверяем его пункты:
+            # "Logout", а также "All Items" и "About"
+            expect_all(page, [
+                visible(".bm-menu-wrap"),
+                visible("#logout_sidebar_link"),
+                text("#logout_sidebar_link", "Logout"),
+                visible("#inventory_sidebar_link"),
+                visible("#about_sidebar_link"),
+            ])
+            logout_menu_item = page.locator("#logout_sidebar_link")
+        
+        with step("Шаг 5: Деавторизация успешна - пользователь на странице входа"):
+            # ===== ШАГ 5: Выход из системы =====
+            # Кликаем на пункт "Logout"
+            logout_menu_item.click()
+        
+            # Ожидаем переадресации на страницу авторизации и отрисовки формы входа
+            wait_for_login_page(page, self.BASE_URL)
+        
+            # Проверка 5.1: Произошла переадресация на страницу авторизации
+            expect(page).to_have_url(self.BASE_URL)
+        
+            # Проверка 5.2: Форма авторизации снова отображается
+            # Проверка 5.3: Элементы личного кабинета не отображаются
+            expect_all(page, [
+                visible("#login-button"),
+                visible("#user-name"),
+                visible("#password"),
+                hidden("#react-burger-menu-btn"),
+                hidden("span.title"),
+            ])
         
         print("\n✅ Тест TC-AUTH-001 пройден успешно!")
         print("   Авторизация и деавторизация работают корректно.")
@@ -147,6 +147,8 @@ if __name__ == "__main__":
     
     # Или альтернативный запуск без pytest:
     from playwright.sync_api import sync_playwright
+
+    from swaglabs.perf import PageMetrics
     
     def manual_test():
         with sync_playwright() as p:
@@ -167,7 +169,7 @@ if __name__ == "__main__":
             # Создаем экземпляр теста и выполняем
             test = TestAuthFlow()
             test.setup(page)
-            test.test_successful_login_logout(page)
+            test.test_successful_login_logout(page, PageMetrics("manual_test", {}, enabled=False))
             
             browser.close()
     
@@ -0,0 +1,88 @@
+"""
+test_auth_flow_async.py
+TestAuthFlow на асинхронном API: тесты выполняются одновременно,
+каждый в своем контексте (swaglabs.plugins.aio, --async-concurrency)
+"""
+
+import re
+
+from playwright.async_api import Page, expect
+
+from swaglabs import settings
+from swaglabs.checks import expect_all_async, hidden, text, visible
+from swaglabs.readiness import wait_for_login_page_async, wait_for_page_async
+
+
+class TestAuthFlowAsync:
+    """TC-AUTH-001 и проверка невалидных данных (async-версия TestAuthFlow)"""
+
+    BASE_URL = settings.BASE_URL
+    VALID_USERNAME = settings.VALID_USERNAME
+    VALID_PASSWORD = settings.VALID_PASSWORD
+
+    async def open_login_page(self, page: Page):
+        """Предусловие: открыта страница авторизации"""
+        await page.goto(self.BASE_URL)
+        await expect(page).to_have_title("Swag Labs")
+        await expect(page.locator("div.login_logo")).to_be_visible()
+
+    async def test_successful_login_logout(self, async_page: Page):
+        """TC-AUTH-001: Проверка успешной авторизации и деавторизации"""
+        page = async_page
+        await self.open_login_page(page)
+
+        # Шаг 1: Ввод логина
+        username_field = page.locator("#user-name")
+        await username_field.fill(self.VALID_USERNAME)
+        await expect(username_field).to_have_value(self.VALID_USERNAME)
+
+        # Шаг 2: Ввод пароля (символы скрыты)
+        password_field = page.locator("#password")
+        await password_field.fill(self.VALID_PASSWORD)
+        await expect(password_field).to_have_attribute("type", "password")
+
+        # Шаг 3: Вход — пользователь на странице товаров
+        await page.locator("#login-button").click()
+        await wait_for_page_async(page, re.compile(r".*inventory\.html"), "Products")
+        await expect(page).to_have_url(re.compile(r".*inventory\.html"))
+        await expect_all_async(page, [
+            visible("span.title"),
+            text("span.title", "Products"),
+            hidden("#login-button"),
+            visible("#react-burger-menu-btn"),
+        ])
+
+        # Шаг 4: Меню пользователя открыто
+        await page.locator("#react-burger-menu-btn").click()
+        await expect_all_async(page, [
+            visible(".bm-menu-wrap"),
+            visible("#logout_sidebar_link"),
+            text("#logout_sidebar_link", "Logout"),
+            visible("#inventory_sidebar_link"),
+            visible("#about_sidebar_link"),
+        ])
+
+        # Шаг 5: Выход — снова страница входа
+        await page.locator("#logout_sidebar_link").click()
+        await wait_for_login_page_async(page, self.BASE_URL)
+        await expect(page).to_have_url(self.BASE_URL)
+        await expect_all_async(page, [
+            visible("#login-button"),
+            visible("#user-name"),
+            visible("#password"),
+            hidden("#react-burger-menu-btn"),
+            hidden("span.title"),
+        ])
+
+    async def test_login_with_invalid_credentials(self, async_page: Page):
+        """Дополнительный тест: Проверка авторизации с невалидными данными"""
+        page = async_page
+        await self.open_login_page(page)
+
+        await page.locator("#user-name").fill("invalid_user")
+        await page.locator("#password").fill("wrong_password")
+        await page.locator("#login-button").click()
+
+        error_message = page.locator("h3[data-test='error']")
+        await expect(error_message).to_be_visible()
+        await expect(error_message).to_contain_text("Username and password do not match")
@@ -0,0 +1,56 @@
+"""
+test_benchmark.py
+Проверки статистики бенчмарков и сравнения с базовой линией (без браузера)
+"""
+
+import random
+
+import pytest
+
+from benchmarks.bench_flows import main
+from swaglabs.benchmark import compare, load_baseline, mann_whitney_greater, save_baseline, stats
+
+
+def noisy(center, n=30, seed=1):
+    rng = random.Random(seed)
+    return [center * (1 + rng.uniform(-0.03, 0.03)) for _ in range(n)]
+
+
+def test_stats_median_iqr_p95():
+    summary = stats([float(value) for value in range(1, 101)])
+    assert summary.median == 50.5
+    assert summary.iqr == pytest.approx(49.5)
+    assert summary.p95 == 95.0
+    assert stats([7.0]) == (1, 7.0, 0.0, 7.0, 7.0, 7.0)
+
+
+def test_mann_whitney_separates_shifted_samples():
+    assert mann_whitney_greater([10.0, 11.0, 12.0, 13.0, 14.0] * 3, [1.0, 2.0, 3.0, 4.0, 5.0] * 3) < 0.001
+    assert mann_whitney_greater([1.0, 2.0, 3.0] * 5, [10.0, 11.0, 12.0] * 5) > 0.99
+    assert mann_whitney_greater([5.0] * 10, [5.0] * 10) == 1.0
+
+
+def test_compare_flags_only_significant_and_large_regressions():
+    baseline = {"checkout": noisy(1000), "checkout / Шаг 1": noisy(2.0), "auth": noisy(500)}
+    current = {"checkout": noisy(1200, seed=2), "checkout / Шаг 1": noisy(2.5, seed=2), "auth": noisy(400, seed=2)}
+    rows = {row.key: row for row in compare(baseline, current)}
+    assert rows["checkout"].regressed
+    assert rows["checkout"].change == pytest.approx(0.2, abs=0.03)
+    # +25%, но меньше 1 мс: не регрессия
+    assert not rows["checkout / Шаг 1"].regressed
+    assert rows["auth"].improved and not rows["auth"].regressed
+
+
+def test_same_distribution_is_not_a_regression():
+    rows = compare({"sorting": noisy(300, seed=3)}, {"sorting": noisy(300, seed=4)})
+    assert not rows[0].regressed
+
+
+def test_compare_command_exit_code(tmp_path, capsys):
+    baseline = save_baseline(tmp_path / "baseline.json", {"cart": noisy(800)}, {"browser": "chromium"})
+    same = save_baseline(tmp_path / "same.json", {"cart": noisy(800, seed=5)})
+    slower = save_baseline(tmp_path / "slower.json", {"cart": noisy(1000, seed=6)})
+    assert load_baseline(baseline)["cart"][0] == pytest.approx(noisy(800)[0], abs=0.001)
+    assert main(["compare", str(baseline), str(same)]) == 0
+    assert main(["compare", str(baseline), str(slower)]) == 1
+    assert "Регрессии: 1" in capsys.readouterr().out
@@ -0,0 +1,38 @@
+"""
+test_blocking.py
+Проверки профилей блокировки ресурсов (без браузера)
+"""
+
+import pytest
+
+from swaglabs.blocking import CATEGORIES, categories_for
+
+
+@pytest.mark.parametrize("url, category", [
+    ("https://www.saucedemo.com/static/media/sauce-backpack-1200x1500.0a0b85a3.jpg", "image"),
+    ("http://127.0.0.1:8000/static/img/4.svg?v=1", "image"),
+    ("https://www.saucedemo.com/static/media/DMSans-Regular.woff2", "font"),
+    ("https://events.backtrace.io/api/unique-events/submit?universe=UNIVERSE", "analytics"),
+    ("https://www.google-analytics.com/g/collect?v=2", "analytics"),
+])
+def test_url_matches_category(url, category):
+    assert CATEGORIES[category].search(url)
+
+
+@pytest.mark.parametrize("url", [
+    "https://www.saucedemo.com/inventory.html",
+    "https://www.saucedemo.com/static/js/main.018d2d1e.js",
+    "https://www.saucedemo.com/static/css/main.f1a4b9e1.css",
+])
+def test_page_resources_are_never_blocked(url):
+    assert not any(pattern.search(url) for pattern in CATEGORIES.values())
+
+
+def test_profiles_and_opt_in():
+    assert categories_for("full") == ()
+    assert categories_for("functional") == ("analytics",)
+    assert categories_for("minimal", allowed=["image"]) == ("font", "media", "analytics")
+    with pytest.raises(ValueError):
+        categories_for("turbo")
+    with pytest.raises(ValueError):
+        categories_for("minimal", allowed=["scripts"])
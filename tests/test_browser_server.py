@@ -0,0 +1,41 @@
+"""
+test_browser_server.py
+Проверки файлов состояния сервера браузера (swaglabs.browser_server) без браузера
+"""
+
+import json
+import subprocess
+import sys
+
+from swaglabs.browser_server import _busy, _to_camel, lease, read_state, state_path
+
+
+def test_state_path_depends_on_launch_args(tmp_path):
+    headless = state_path(tmp_path, "chromium", {"headless": True})
+    assert headless == state_path(tmp_path, "chromium", {"headless": True})
+    assert headless != state_path(tmp_path, "chromium", {"headless": False})
+    assert headless.name.startswith("chromium-")
+
+
+def test_launch_args_go_to_config_in_camel_case():
+    assert _to_camel("slow_mo") == "slowMo"
+    assert _to_camel("headless") == "headless"
+
+
+def test_state_of_dead_server_is_removed(tmp_path):
+    finished = subprocess.Popen([sys.executable, "-c", "pass"])
+    finished.wait()
+    path = tmp_path / "chromium-dead.json"
+    path.write_text(json.dumps({
+        "ws_endpoint": "ws://127.0.0.1:1/x", "pid": finished.pid,
+        "browser": "chromium", "launch_args": {}, "started": 0,
+    }), encoding="utf-8")
+    assert read_state(path) is None
+    assert not path.exists()
+
+
+def test_lease_keeps_server_busy(tmp_path):
+    path = tmp_path / "chromium-x.json"
+    with lease(path):
+        assert _busy(path)
+    assert not _busy(path)
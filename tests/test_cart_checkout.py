@@ -5,29 +5,30 @@ test_cart_checkout.py
 
 import re
 import pytest  # ← ВАЖНО!
-import random
-import string
 from playwright.sync_api import Page, expect
 from datetime import datetime
 
+from swaglabs import settings
+from swaglabs.checks import count, expect_all, hidden, text, visible
+from swaglabs.flows import CART_CYCLE, CHECKOUT_FLOW, random_customer, run_step, seed_for
+from swaglabs.soak import SoakRun, save_series, trends
+from swaglabs.steps import step
 
+
+@pytest.mark.authenticated
+@pytest.mark.resource_profile("minimal")  # картинки, шрифты и телеметрия проверкам не нужны
 class TestCartAndCheckout:
     """Тесты для проверки корзины и оформления заказа"""
     
-    BASE_URL = "https://www.saucedemo.com/"
-    VALID_USERNAME = "standard_user"
-    VALID_PASSWORD = "secret_sauce"
+    BASE_URL = settings.BASE_URL  # saucedemo.com или локальный стенд (--offline)
+    VALID_USERNAME = settings.VALID_USERNAME
+    VALID_PASSWORD = settings.VALID_PASSWORD
     
     @pytest.fixture(autouse=True)
-    def setup(self, page: Page):
-        """Предусловия: авторизация"""
-        page.goto(self.BASE_URL)
-        page.locator("#user-name").fill(self.VALID_USERNAME)
-        page.locator("#password").fill(self.VALID_PASSWORD)
-        page.locator("#login-button").click()
-        
+    def setup(self, authenticated_page: Page):
+        """Предусловия: авторизация (сохраненная сессия, логин через UI один раз на воркер)"""
+        page = authenticated_page
         expect(page).to_have_url(re.compile(r".*inventory\.html"))
-        expect(page.locator("span.title")).to_have_text("Products")
         
         print(f"\n✅ Авторизация: {self.VALID_USERNAME}")
         yield
@@ -48,9 +49,7 @@ class TestCartAndCheckout:
         print(f"✅ Добавили товар: {product_name}")
         
         # Шаг 2: Проверяем счетчик
-        cart_badge = page.locator(".shopping_cart_badge")
-        expect(cart_badge).to_be_visible()
-        expect(cart_badge).to_have_text("1")
+        expect_all(page, [visible(".shopping_cart_badge"), text(".shopping_cart_badge", "1")])
         print("✅ Счетчик корзины: 1")
         
         # Шаг 3: Переходим в корзину
@@ -60,16 +59,14 @@ class TestCartAndCheckout:
         print("✅ Перешли в корзину")
         
         # Шаг 4: Проверяем товар в корзине
-        cart_items = page.locator(".cart_item").all()
-        assert len(cart_items) == 1
+        expect_all(page, [count(".cart_item", 1), text(".cart_item .inventory_item_name", product_name)])
         print("✅ Товар в корзине")
         
         # Шаг 5: Удаляем товар
-        remove_button = cart_items[0].locator("button:has-text('Remove')")
+        remove_button = page.locator(".cart_item").first.locator("button:has-text('Remove')")
         remove_button.click()
         
-        expect(page.locator(".cart_item")).not_to_be_visible()
-        expect(cart_badge).not_to_be_visible()
+        expect_all(page, [hidden(".cart_item"), hidden(".shopping_cart_badge")])
         print("✅ Товар удален")
         
         # Шаг 6: Возвращаемся
@@ -80,63 +77,61 @@ class TestCartAndCheckout:
         
         print("🎉 Тест 1 пройден!")
     
-    def test_add_products_and_checkout(self, page: Page):
+    def test_add_products_and_checkout(self, page: Page, page_metrics):
         """TC-CHECKOUT-001: Добавление товаров и оформление заказа"""
         print("\n🧪 Тест 2: Оформление заказа")
         
-        # Шаг 1: Добавляем 2 товара
-        products = page.locator(".inventory_item").all()
-        assert len(products) >= 2
-        
-        for i in range(2):
-            product = products[i]
-            name = product.locator(".inventory_item_name").text_content().strip()
-            product.locator("button:has-text('Add to cart')").click()
-            print(f"✅ Добавили товар {i+1}: {name}")
-        
-        # Шаг 2: Проверяем счетчик
-        cart_badge = page.locator(".shopping_cart_badge")
-        expect(cart_badge).to_have_text("2")
-        print("✅ В корзине 2 товара")
-        
-        # Шаг 3: Переходим в корзину
-        page.locator(".shopping_cart_link").click()
-        expect(page).to_have_url(re.compile(r".*cart\.html"))
-        print("✅ Перешли в корзину")
-        
-        # Шаг 4: Начинаем оформление
-        page.locator("#checkout").click()
-        expect(page).to_have_url(re.compile(r".*checkout-step-one\.html"))
-        print("✅ Перешли к оформлению")
-        
-        # Шаг 5: Заполняем форму
-        first_name = "Иван" + str(random.randint(1, 100))
-        last_name = "Иванов" + str(random.randint(1, 100))
-        zip_code = ''.join(random.choices(string.digits, k=6))
+        # Шаги общие со сценарием нагрузки (swaglabs.load), см. swaglabs/flows.py
+        customer = random_customer()
+        print(f"📝 Данные: {customer['first_name']} {customer['last_name']}, индекс: {customer['zip_code']}")
         
-        page.locator("#first-name").fill(first_name)
-        page.locator("#last-name").fill(last_name)
-        page.locator("#postal-code").fill(zip_code)
+        for flow_step in CHECKOUT_FLOW:
+            with step(flow_step.name):
+                run_step(page, flow_step, customer)
+                if flow_step.navigates:
+                    page_metrics.capture(page)
         
-        print(f"📝 Данные: {first_name} {last_name}, индекс: {zip_code}")
-        
-        # Шаг 6: Продолжаем
-        page.locator("#continue").click()
-        expect(page).to_have_url(re.compile(r".*checkout-step-two\.html"))
-        print("✅ Перешли к обзору заказа")
-        
-        # Шаг 7: Завершаем заказ
-        page.locator("#finish").click()
-        expect(page).to_have_url(re.compile(r".*checkout-complete\.html"))
-        print("✅ Заказ оформлен")
-        
-        # Шаг 8: Проверяем подтверждение
-        expect(page.locator(".complete-header")).to_have_text("Thank you for your order!")
-        print("✅ Подтверждение получено")
-        
-        # Шаг 9: Возвращаемся
-        page.locator("#back-to-products").click()
-        expect(page).to_have_url(re.compile(r".*inventory\.html"))
-        print("✅ Вернулись на главную")
-        
-        print("🎉 Тест 2 пройден!")
\ No newline at end of file
+        print("🎉 Тест 2 пройден!")
+    
+    @pytest.mark.soak
+    def test_cart_cycle_soak(self, page: Page, soak_settings, request):
+        """TC-CART-SOAK: Цикл добавления и удаления товара тысячи раз без роста памяти и задержек"""
+        print(f"\n🧪 Soak: {soak_settings.iterations} циклов корзины, замер каждые {soak_settings.sample_every}")
+        
+        soak = SoakRun(page, CART_CYCLE, soak_settings.sample_every)
+        samples = soak.run(
+            soak_settings.iterations,
+            on_sample=lambda s: print(f"  {s.iteration:>6}: куча {s.heap_kb / 1024:.1f} МБ, узлов {s.nodes:.0f}, "
+                                      f"обработчиков {s.listeners:.0f}, итерация {s.iteration_ms:.0f} мс"),
+        )
+        
+        series = save_series(samples, soak_settings.directory / f"{request.node.name}.csv")
+        print(f"📈 Ряды замеров: {series}")
+        
+        result = trends(samples, soak_settings.limits)
+        for trend in result:
+            print(trend.describe())
+        exceeded = [trend.describe() for trend in result if trend.exceeded]
+        assert not exceeded, "Рост за порогом:\n" + "\n".join(exceeded)
+
+
+def seeded_from(first_ui_step: int):
+    """Вариант сценария: шаги до first_ui_step засеиваются, остальные идут через UI"""
+    return pytest.param(
+        first_ui_step,
+        marks=pytest.mark.seeded(**seed_for(CHECKOUT_FLOW, first_ui_step)),
+        id=CHECKOUT_FLOW[first_ui_step].page.replace(".html", ""),
+    )
+
+
+@pytest.mark.resource_profile("minimal")
+class TestSeededCheckout:
+    """Оформление заказа с засеянной сессией и корзиной (без логина и кликов "Add to cart")"""
+    
+    @pytest.mark.parametrize("first_ui_step", [seeded_from(3), seeded_from(4), seeded_from(6)])
+    def test_checkout_from_seeded_state(self, seeded_page: Page, first_ui_step: int):
+        """TC-CHECKOUT-002: Оформление заказа, начиная с засеянного состояния"""
+        customer = random_customer()
+        for flow_step in CHECKOUT_FLOW[first_ui_step:]:
+            with step(flow_step.name):
+                run_step(seeded_page, flow_step, customer)
@@ -0,0 +1,79 @@
+"""
+test_cart_checkout_async.py
+TestCartAndCheckout и TestSeededCheckout на асинхронном API: тесты
+выполняются одновременно, каждый в своем контексте (swaglabs.plugins.aio)
+"""
+
+import re
+
+import pytest
+from playwright.async_api import Page, expect
+
+from swaglabs import settings
+from swaglabs.checks import count, expect_all_async, hidden, text, visible
+from swaglabs.flows import CHECKOUT_FLOW, OPEN_INVENTORY, random_customer, run_step_async, seed_for
+
+
+@pytest.mark.authenticated
+class TestCartAndCheckoutAsync:
+    """Корзина и оформление заказа (async-версия TestCartAndCheckout)"""
+
+    BASE_URL = settings.BASE_URL
+
+    async def test_add_and_remove_product_from_cart(self, async_page: Page):
+        """TC-CART-001: Добавление и удаление товара из корзины"""
+        page = async_page
+        await run_step_async(page, OPEN_INVENTORY, base_url=self.BASE_URL)
+
+        # Шаг 1: Добавляем первый товар
+        first_product = page.locator(".inventory_item").first
+        product_name = (await first_product.locator(".inventory_item_name").text_content()).strip()
+        await first_product.locator("button:has-text('Add to cart')").click()
+
+        # Шаг 2: Счетчик корзины
+        await expect_all_async(page, [visible(".shopping_cart_badge"), text(".shopping_cart_badge", "1")])
+
+        # Шаги 3–4: Товар в корзине
+        await page.locator(".shopping_cart_link").click()
+        await expect(page).to_have_url(re.compile(r".*cart\.html"))
+        await expect_all_async(page, [count(".cart_item", 1), text(".cart_item .inventory_item_name", product_name)])
+
+        # Шаг 5: Удаляем товар
+        await page.locator(".cart_item").first.locator("button:has-text('Remove')").click()
+        await expect_all_async(page, [hidden(".cart_item"), hidden(".shopping_cart_badge")])
+
+        # Шаг 6: Возвращаемся
+        await page.locator("#continue-shopping").click()
+        await expect(page).to_have_url(re.compile(r".*inventory\.html"))
+
+    async def test_add_products_and_checkout(self, async_page: Page):
+        """TC-CHECKOUT-001: Добавление товаров и оформление заказа"""
+        customer = random_customer()
+        await run_step_async(async_page, OPEN_INVENTORY, base_url=self.BASE_URL)
+        for flow_step in CHECKOUT_FLOW:
+            await run_step_async(async_page, flow_step, customer)
+
+
+def seeded_from(first_ui_step: int):
+    """Вариант сценария: шаги до first_ui_step засеиваются, остальные идут через UI"""
+    return pytest.param(
+        first_ui_step,
+        marks=pytest.mark.seeded(**seed_for(CHECKOUT_FLOW, first_ui_step)),
+        id=CHECKOUT_FLOW[first_ui_step].page.replace(".html", ""),
+    )
+
+
+class TestSeededCheckoutAsync:
+    """Оформление заказа с засеянной сессией и корзиной (async-версия TestSeededCheckout)"""
+
+    @pytest.mark.parametrize("first_ui_step", [seeded_from(3), seeded_from(4), seeded_from(6)])
+    async def test_checkout_from_seeded_state(self, async_page: Page, first_ui_step: int):
+        """TC-CHECKOUT-002: Оформление заказа, начиная с засеянного состояния"""
+        start = CHECKOUT_FLOW[first_ui_step].page
+        await async_page.goto(settings.BASE_URL + start)
+        # Сайт не принял засеянную сессию и вернул на страницу входа
+        await expect(async_page).to_have_url(re.compile(".*" + re.escape(start)))
+
+        customer = random_customer()
+        for flow_step in CHECKOUT_FLOW[first_ui_step:]:
+            await run_step_async(async_page, flow_step, customer)
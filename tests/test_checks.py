@@ -0,0 +1,25 @@
+"""
+test_checks.py
+Проверки пакетных проверок (swaglabs.checks) без браузера
+"""
+
+from swaglabs.checks import Check, attribute, count, hidden, text, visible
+
+
+def test_factories_build_checks():
+    assert visible("#login-button") == Check("visible", "#login-button")
+    assert hidden(".cart_item") == Check("hidden", ".cart_item")
+    assert text("span.title", "Products") == Check("text", "span.title", "Products")
+    assert attribute("#password", "type", "password") == Check("attribute", "#password", "password", "type")
+    assert count(".cart_item", 1).expected == 1
+
+
+def test_describe():
+    assert visible("#login-button").describe() == "#login-button: visible"
+    assert text("span.title", "Products").describe() == "span.title: text = 'Products'"
+    assert attribute("#password", "type", "password").describe() == "#password: attribute type = 'password'"
+
+
+def test_checks_are_json_serializable():
+    # в браузер уходят словари: ключи совпадают с тем, что читает CHECKS_JS
+    assert count(".cart_item", 2)._asdict() == {"kind": "count", "selector": ".cart_item", "expected": 2, "name": None}
@@ -0,0 +1,48 @@
+"""
+test_durations.py
+Проверки истории длительности и LPT-распределения (без браузера)
+"""
+
+from swaglabs.durations import DEFAULT_ESTIMATE, KEEP_SAMPLES, DurationHistory, longest_first, lpt_assign
+
+
+def test_history_roundtrip_and_median(tmp_path):
+    path = tmp_path / "durations.json"
+    history = DurationHistory(path)
+    for seconds in (1.0, 9.0, 2.0):
+        history.add("a", seconds)
+    for seconds in range(KEEP_SAMPLES + 3):
+        history.add("b", float(seconds))
+    history.save()
+
+    reloaded = DurationHistory(path)
+    assert reloaded.samples["a"] == [1.0, 9.0, 2.0]
+    assert len(reloaded.samples["b"]) == KEEP_SAMPLES
+    assert reloaded.estimates(["a"]) == {"a": 2.0}
+
+
+def test_new_tests_get_default_estimate(tmp_path):
+    history = DurationHistory(tmp_path / "missing.json")
+    assert history.estimates(["new"]) == {"new": DEFAULT_ESTIMATE}
+    history.add("known_fast", 1.0)
+    history.add("known_slow", 3.0)
+    assert history.estimates(["new"])["new"] == 2.0
+
+
+def test_lpt_spreads_long_tests():
+    estimates = {"login": 30.0, "sort_all": 25.0, "checkout": 20.0, "a": 5.0, "b": 5.0, "c": 5.0}
+    nodeids = list(estimates)
+    groups, loads = lpt_assign(nodeids, estimates, 3)
+
+    assert sorted(max(group, key=estimates.get) for group in groups) == ["checkout", "login", "sort_all"]
+    assert max(loads) == 30.0
+    assert sorted(sum(groups, [])) == sorted(nodeids)
+
+
+def test_order_is_stable_for_equal_estimates():
+    estimates = {"b": 1.0, "a": 1.0, "c": 2.0}
+    assert longest_first(["b", "a", "c"], estimates) == ["c", "a", "b"]
+    # Состав групп не зависит от порядка сбора тестов
+    first, _ = lpt_assign(["b", "a", "c"], estimates, 2)
+    second, _ = lpt_assign(["c", "a", "b"], estimates, 2)
+    assert [set(group) for group in first] == [set(group) for group in second]
@@ -0,0 +1,159 @@
+"""
+test_http_cache.py
+Проверки HTTP-кэша статики: хранилище, вытеснение LRU, проверка ETag
+на локальном стенде (без браузера, route — заглушка поверх urllib)
+"""
+
+import os
+import time
+import urllib.error
+import urllib.request
+
+import pytest
+
+from swaglabs.http_cache import AssetStore, CachedResponse, HttpCache, cacheable, hit_rate
+from swaglabs.standin import StandIn
+
+STATIC = {"content-type": "text/css", "cache-control": "public, max-age=0, must-revalidate", "etag": '"v1"'}
+
+
+class FakeResponse:
+    def __init__(self, status, headers, body):
+        self.status = status
+        self.headers = {name.lower(): value for name, value in headers.items()}
+        self._body = body
+
+    def body(self):
+        return self._body
+
+
+class FakeRequest:
+    def __init__(self, url):
+        self.url = url
+        self.method = "GET"
+        self.headers = {"accept": "*/*"}
+
+
+class FakeRoute:
+    """route.fetch идет на стенд через urllib, fulfill запоминает ответ"""
+
+    def __init__(self, url):
+        self.request = FakeRequest(url)
+        self.fetched_with = None
+        self.fulfilled = None
+
+    def fetch(self, headers=None):
+        self.fetched_with = headers or {}
+        request = urllib.request.Request(self.request.url, headers=self.fetched_with)
+        try:
+            with urllib.request.urlopen(request) as response:
+                return FakeResponse(response.status, dict(response.headers), response.read())
+        except urllib.error.HTTPError as error:
+            return FakeResponse(error.code, dict(error.headers), b"")
+
+    def fulfill(self, response=None, status=None, headers=None, body=None):
+        self.fulfilled = {"status": status or response.status, "body": body if body is not None else response.body()}
+
+
+@pytest.fixture(scope="module")
+def stand_in():
+    with StandIn(catalog_size=6) as server:
+        yield server
+
+
+class TestAssetStore:
+    def test_same_content_is_stored_once(self, tmp_path):
+        store = AssetStore(tmp_path, max_bytes=1024)
+        first = store.put("http://a/app.css?v=1", STATIC, b"body")
+        second = store.put("http://a/app.css?v=2", STATIC, b"body")
+        assert first.digest == second.digest
+        assert len(list(store.objects.iterdir())) == 1
+        entry, body = store.get("http://a/app.css?v=2")
+        assert body == b"body"
+        assert entry.etag == '"v1"'
+        assert store.get("http://a/other.css") is None
+
+    def test_cors_headers_are_kept(self, tmp_path):
+        store = AssetStore(tmp_path, max_bytes=1024)
+        headers = {**STATIC, "access-control-allow-origin": "*", "access-control-expose-headers": "etag",
+                   "timing-allow-origin": "*", "x-served-by": "cache-fra1"}
+        entry = store.put("http://cdn/font.woff2", headers, b"font")
+        assert entry.headers["access-control-allow-origin"] == "*"
+        assert entry.headers["access-control-expose-headers"] == "etag"
+        assert entry.headers["timing-allow-origin"] == "*"
+        assert "x-served-by" not in entry.headers
+
+    def test_least_recently_used_entries_are_evicted_over_limit(self, tmp_path):
+        store = AssetStore(tmp_path, max_bytes=1024)
+        for index, url in enumerate(("http://a/1.js", "http://a/2.js", "http://a/3.js")):
+            store.put(url, STATIC, bytes([index]) * 5)
+            past = time.time() - 100 + index
+            os.utime(store._entry_path(url), (past, past))
+        store.get("http://a/1.js")  # использован последним
+        store.max_bytes = 10
+        assert store.evict() == 1
+        assert store.get("http://a/2.js") is None
+        assert store.get("http://a/1.js") is not None
+        assert store.get("http://a/3.js") is not None
+        assert store.size() == 10
+
+    def test_put_over_limit_evicts_right_away(self, tmp_path):
+        store = AssetStore(tmp_path, max_bytes=10)
+        for index, url in enumerate(("http://a/1.js", "http://a/2.js")):
+            store.put(url, STATIC, bytes([index]) * 5)
+            past = time.time() - 100 + index
+            os.utime(store._entry_path(url), (past, past))
+        assert store.evicted == 0
+        store.put("http://a/3.js", STATIC, b"\x02" * 5)
+        assert store.evicted == 1
+        assert store.get("http://a/1.js") is None
+        assert store.get("http://a/3.js") is not None
+        assert store.size() == 10
+
+
+class TestCacheable:
+    @pytest.mark.parametrize("request_headers, response_headers, expected", [
+        ({}, STATIC, True),
+        ({}, {**STATIC, "set-cookie": "session-username=standard_user"}, False),
+        ({"authorization": "Basic x"}, STATIC, False),
+        ({}, {**STATIC, "cache-control": "private, max-age=60"}, False),
+        ({}, {"content-type": "text/css"}, False),
+        ({}, {**STATIC, "vary": "Accept-Encoding"}, True),
+        ({}, {**STATIC, "vary": "Accept-Encoding, Cookie"}, False),
+        ({}, {**STATIC, "vary": "*"}, False),
+    ])
+    def test_only_shared_validatable_responses(self, request_headers, response_headers, expected):
+        assert cacheable("GET", 200, request_headers, response_headers) is expected
+
+    def test_freshness_follows_max_age(self):
+        entry = CachedResponse("http://a/app.js", "d", 1, {"cache-control": "max-age=60"}, stored_at=1000.0)
+        assert entry.is_fresh(now=1030.0)
+        assert not entry.is_fresh(now=1061.0)
+        assert not entry._replace(headers=STATIC).is_fresh(now=1000.0)
+
+
+class TestHttpCacheOnStandIn:
+    def test_second_request_is_revalidated_by_etag(self, stand_in, tmp_path):
+        url = stand_in.url + "static/app.css"
+        cache = HttpCache(AssetStore(tmp_path, max_bytes=1024 * 1024))
+
+        first = FakeRoute(url)
+        cache._handle(first)
+        second = FakeRoute(url)
+        cache._handle(second)
+
+        assert second.fetched_with["if-none-match"].startswith('"')
+        assert second.fulfilled["status"] == 200
+        assert second.fulfilled["body"] == first.fulfilled["body"]
+        summary = cache.summary()
+        assert (summary["miss"], summary["revalidated"], summary["evicted"]) == (1, 1, 0)
+        assert summary["saved_bytes"] == len(first.fulfilled["body"])
+        assert hit_rate(summary) == 0.5
+
+    def test_missing_asset_is_not_stored(self, stand_in, tmp_path):
+        cache = HttpCache(AssetStore(tmp_path, max_bytes=1024 * 1024))
+        route = FakeRoute(stand_in.url + "static/missing.js")
+        cache._handle(route)
+        assert route.fulfilled["status"] == 404
+        assert cache.summary()["bypass"] == 1
+        assert not (tmp_path / "entries").exists()
@@ -0,0 +1,36 @@
+"""
+test_load.py
+Проверки расчетов нагрузочного режима и общих шагов сценария (без браузера)
+"""
+
+from swaglabs.flows import CHECKOUT_FLOW, OPEN_INVENTORY
+from swaglabs.load import SCENARIO, LoadResult, percentile
+
+
+def test_percentile_nearest_rank():
+    values = [float(v) for v in range(1, 101)]
+    assert percentile(values, 50) == 50
+    assert percentile(values, 95) == 95
+    assert percentile(values, 99) == 99
+    assert percentile([7.0], 99) == 7.0
+
+
+def test_summary_covers_every_step():
+    result = LoadResult()
+    result.latencies[OPEN_INVENTORY.name].extend([10.0, 20.0, 30.0])
+    result.errors[CHECKOUT_FLOW[2].name] += 1
+    result.checkouts = 3
+    result.elapsed = 2.0
+
+    summary = result.summary()
+    assert summary["checkouts_per_s"] == 1.5
+    assert list(summary["steps"]) == [flow_step.name for flow_step in SCENARIO]
+    assert summary["steps"][OPEN_INVENTORY.name]["p50_ms"] == 20.0
+    assert summary["steps"][CHECKOUT_FLOW[2].name] == {
+        "count": 0, "errors": 1, "p50_ms": None, "p95_ms": None, "p99_ms": None,
+    }
+
+
+def test_checkout_flow_metrics_after_page_changes():
+    navigating = [flow_step.name for flow_step in CHECKOUT_FLOW if flow_step.navigates]
+    assert len(navigating) == 5  # cart, checkout-step-one/two/complete, inventory
@@ -0,0 +1,66 @@
+"""
+test_matrix.py
+Проверки сводки матрицы браузеров (без браузера)
+"""
+
+import pytest
+
+from swaglabs.matrix import BrowserMatrix, MatrixResult, base_nodeid, parse_engines, summarize, widest_gaps
+
+
+def test_parse_engines():
+    assert parse_engines("firefox, chromium,firefox") == ["firefox", "chromium"]
+    assert parse_engines("all") == ["chromium", "firefox", "webkit"]
+    with pytest.raises(ValueError, match="edge"):
+        parse_engines("chromium,edge")
+
+
+@pytest.mark.parametrize("nodeid, expected", [
+    ("t.py::T::test_a[chromium]", "t.py::T::test_a"),
+    ("t.py::T::test_a[chromium-slow-4g]", "t.py::T::test_a[slow-4g]"),
+    ("t.py::T::test_a[standard_user-chromium]", "t.py::T::test_a[standard_user]"),
+    ("t.py::T::test_a", "t.py::T::test_a"),
+])
+def test_base_nodeid_drops_browser(nodeid, expected):
+    assert base_nodeid(nodeid, "chromium") == expected
+
+
+RESULTS = [
+    MatrixResult("t.py::test_a[chromium]", "chromium", "passed", 1.0),
+    MatrixResult("t.py::test_b[chromium]", "chromium", "passed", 3.0),
+    MatrixResult("t.py::test_a[webkit]", "webkit", "passed", 4.0),
+    MatrixResult("t.py::test_b[webkit]", "webkit", "failed", 2.0),
+    MatrixResult("t.py::test_a[firefox]", "firefox", "skipped", 0.0),
+]
+
+
+def test_summary_is_grouped_by_browser_in_engine_order():
+    summaries = summarize(RESULTS)
+    assert [summary.browser for summary in summaries] == ["chromium", "firefox", "webkit"]
+    chromium, firefox, webkit = summaries
+    assert (chromium.tests, chromium.passed, chromium.total_s, chromium.median_s) == (2, 2, 4.0, 2.0)
+    assert (firefox.skipped, firefox.total_s) == (1, 0.0)
+    assert webkit.failed == 1
+    assert webkit.describe().startswith("❌ webkit")
+
+
+def test_widest_gaps_compare_passed_runs_of_same_test():
+    gaps = widest_gaps(RESULTS)
+    assert gaps == [{"test": "t.py::test_a", "durations": {"chromium": 1.0, "webkit": 4.0}, "gap": 3.0}]
+
+
+def test_resources_are_created_once_per_engine_and_closed_with_matrix():
+    matrix = BrowserMatrix(None, ["chromium", "firefox"])
+    created, closed = [], []
+
+    def create(engine):
+        created.append(engine)
+        return {"engine": engine}
+
+    for engine in ("chromium", "firefox", "chromium", "firefox"):
+        pool = matrix.resource(engine, "context_pool", lambda: create(engine), closed.append)
+        assert pool["engine"] == engine
+    assert created == ["chromium", "firefox"]
+    matrix.close()
+    assert closed == [{"engine": "firefox"}, {"engine": "chromium"}]
+    assert matrix.resources == {}
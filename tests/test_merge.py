@@ -0,0 +1,64 @@
+"""
+test_merge.py
+Проверки деления на шарды и сборки отчетов шардов (без браузера)
+"""
+
+import json
+
+import pytest
+
+from swaglabs.durations import DurationHistory
+from swaglabs.merge import merge_durations, merge_json, merge_junit
+from swaglabs.plugins.shard import parse_shard
+
+JUNIT = """<?xml version="1.0" encoding="utf-8"?>
+<testsuites><testsuite name="pytest" errors="{errors}" failures="{failures}" skipped="0" tests="{tests}" time="{time}">
+<testcase classname="tests.test_x" name="{name}" time="{time}"/>
+</testsuite></testsuites>"""
+
+
+def test_parse_shard():
+    assert parse_shard("2/4") == (2, 4)
+    for bad in ("0/4", "5/4", "2", "a/b"):
+        with pytest.raises(pytest.UsageError):
+            parse_shard(bad)
+
+
+def test_merge_junit_sums_counters(tmp_path):
+    paths = []
+    for shard, (tests, failures, errors, time) in enumerate([(3, 1, 0, 2.5), (2, 0, 1, 4.0)], start=1):
+        path = tmp_path / f"shard-{shard}" / "junit.xml"
+        path.parent.mkdir()
+        path.write_text(JUNIT.format(tests=tests, failures=failures, errors=errors, time=time, name=f"t{shard}"))
+        paths.append(path)
+
+    root = merge_junit(paths).getroot()
+    assert (root.get("tests"), root.get("failures"), root.get("errors"), root.get("time")) == ("5", "1", "1", "6.500")
+    assert [suite.get("name") for suite in root] == ["pytest (shard-1)", "pytest (shard-2)"]
+    assert len(root.findall("testsuite/testcase")) == 2
+
+
+def test_merge_json_and_durations(tmp_path):
+    first, second = tmp_path / "1.json", tmp_path / "2.json"
+    first.write_text(json.dumps({"tests": [{"nodeid": "a"}], "summary": {"passed": 1, "total": 1}, "duration": 10}))
+    second.write_text(json.dumps({"tests": [{"nodeid": "b"}], "summary": {"failed": 1, "total": 1}, "duration": 12}))
+    merged = merge_json([first, second])
+    assert [test["nodeid"] for test in merged["tests"]] == ["a", "b"]
+    assert merged["summary"] == {"passed": 1, "failed": 1, "total": 2}
+    assert merged["duration"] == 12
+
+
+def test_merge_durations_takes_fresh_samples_from_each_shard(tmp_path):
+    # Общая история из кэша, каждый шард дописал замеры только своих тестов
+    cache = {"version": 1, "tests": {"a": [1.0], "b": [2.0]}, "updated": {"a": 100.0, "b": 100.0}}
+    histories = []
+    for index, ran in enumerate(("a", "b")):
+        path = tmp_path / f"shard-{index}.json"
+        path.write_text(json.dumps(cache))
+        history = DurationHistory(path)
+        history.add(ran, 5.0)
+        history.save()
+        histories.append(path)
+
+    merged = DurationHistory(merge_durations(histories, tmp_path / "merged.json").path)
+    assert merged.samples == {"a": [1.0, 5.0], "b": [2.0, 5.0]}
@@ -0,0 +1,71 @@
+"""
+test_perf.py
+Проверки разбора и сверки бюджетов производительности (без браузера)
+"""
+
+import pytest
+
+from swaglabs.perf import PageMetrics, PerfBudgetWarning, check_budget, page_name, parse_budgets
+
+
+class FakePage:
+    """page.evaluate(PAGE_METRICS_JS) возвращает заданные метрики"""
+
+    def __init__(self, metrics):
+        self.metrics = metrics
+
+    def wait_for_load_state(self, state):
+        pass
+
+    def evaluate(self, script):
+        return dict(self.metrics)
+
+
+def test_parse_budgets():
+    budgets = parse_budgets([
+        "inventory.html  fcp=1800 load=3000  # первая загрузка",
+        "",
+        "cart.html requests=20",
+        "cart.html long_tasks_ms=100.5",
+    ])
+    assert budgets == {
+        "inventory.html": {"fcp": 1800.0, "load": 3000.0},
+        "cart.html": {"requests": 20.0, "long_tasks_ms": 100.5},
+    }
+
+
+@pytest.mark.parametrize("line", ["inventory.html fcp", "inventory.html tti=100", "inventory.html fcp=fast"])
+def test_parse_budgets_rejects_bad_lines(line):
+    with pytest.raises(ValueError, match="perf_budgets"):
+        parse_budgets([line])
+
+
+def test_check_budget_skips_unmeasured_metrics():
+    metrics = {"fcp": 2100.0, "load": None, "requests": 12}
+    budget = {"fcp": 1800, "load": 3000, "requests": 20}
+    assert check_budget(metrics, budget) == ["fcp: 2100 мс > 1800 мс"]
+
+
+def test_fcp_budget_is_violated_on_full_page_load():
+    metrics = PageMetrics("t.py::test_a", {"inventory.html": {"fcp": 1800, "load": 3000}}, mode="warn")
+    loaded = {"url": "http://stand/inventory.html", "soft_navigation": False, "fcp": 2400.0, "load": 2900.0}
+    with pytest.warns(PerfBudgetWarning, match="fcp: 2400"):
+        record = metrics.capture(FakePage(loaded))
+    assert record["violations"] == ["fcp: 2400 мс > 1800 мс"]
+    assert metrics.violations == ["inventory.html: fcp: 2400 мс > 1800 мс"]
+
+
+def test_soft_navigation_has_no_fcp_to_check():
+    metrics = PageMetrics("t.py::test_a", {"cart.html": {"fcp": 1800, "requests": 30}}, mode="warn")
+    record = metrics.capture(FakePage({"url": "http://stand/cart.html", "soft_navigation": True,
+                                       "fcp": None, "requests": 3}))
+    assert record["violations"] == []
+
+
+@pytest.mark.parametrize("url, name", [
+    ("https://www.saucedemo.com/inventory.html", "inventory.html"),
+    ("http://127.0.0.1:8000/checkout-step-one.html?x=1", "checkout-step-one.html"),
+    ("https://www.saucedemo.com/", "index.html"),
+])
+def test_page_name(url, name):
+    assert page_name(url) == name
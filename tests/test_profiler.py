@@ -0,0 +1,70 @@
+"""
+test_profiler.py
+Проверки профилировщика вызовов Playwright (без браузера)
+"""
+
+from pathlib import Path
+
+import pytest
+from playwright.sync_api import Locator
+
+from swaglabs.profiler import CallProfile, function_totals, hotspots, write_collapsed
+
+ROOT = Path(__file__).resolve().parent.parent
+
+
+def read_catalog():
+    # Перехваченный метод на объекте без браузера падает, но вызов все равно учитывается
+    with pytest.raises(AttributeError):
+        Locator.count(object())
+
+
+def test_profile_records_call_site_and_stack():
+    profile = CallProfile(ROOT)
+    profile.start()
+    try:
+        read_catalog()
+        read_catalog()
+    finally:
+        profile.stop()
+
+    (name, site), (calls, total, longest) = next(iter(profile.calls.items()))
+    assert name == "Locator.count"
+    assert site.startswith("tests/test_profiler.py:") and site.endswith(" read_catalog")
+    assert calls == 2 and longest <= total
+    stack = next(iter(profile.stacks))
+    assert stack.endswith("test_profiler.py:test_profile_records_call_site_and_stack;"
+                          "test_profiler.py:read_catalog;Locator.count")
+    assert profile.to_dict()["calls"][0][:3] == ["Locator.count", site, 2]
+
+
+def test_hotspots_group_by_call_and_site():
+    rows = [
+        ["Locator.evaluate_all", "tests/test_sorting.py:39 extract_product_data", 3, 0.6, 0.3],
+        ["Locator.evaluate_all", "swaglabs/readiness.py:20 wait_for_sort_applied", 2, 0.2, 0.1],
+        ["Page.goto", "tests/conftest.py:90 authenticated_page", 1, 0.5, 0.5],
+    ]
+    by_call = hotspots(rows, by="call")
+    assert [(s.name, s.calls, round(s.total, 3), s.max) for s in by_call] == [
+        ("Locator.evaluate_all", 5, 0.8, 0.3),
+        ("Page.goto", 1, 0.5, 0.5),
+    ]
+    assert hotspots(rows, by="site", top=1)[0].name == \
+        "tests/test_sorting.py:39 extract_product_data → Locator.evaluate_all"
+
+
+def test_function_totals_include_nested_calls_once():
+    stacks = {
+        "test_sorting.py:test_za;test_sorting.py:extract_product_data;catalog.py:snapshot_catalog;Locator.evaluate_all": 0.6,
+        "test_sorting.py:test_za;Locator.select_option": 0.1,
+        "f.py:walk;f.py:walk;Page.goto": 0.2,
+    }
+    totals = dict(function_totals(stacks))
+    assert totals["test_sorting.py:test_za"] == pytest.approx(0.7)
+    assert totals["test_sorting.py:extract_product_data"] == pytest.approx(0.6)
+    assert totals["f.py:walk"] == pytest.approx(0.2)
+
+
+def test_write_collapsed_uses_microseconds(tmp_path):
+    path = write_collapsed({"a.py:f;Page.goto": 0.0125, "a.py:f;Page.title": 0.0000001}, tmp_path / "p.folded")
+    assert path.read_text(encoding="utf-8") == "a.py:f;Page.goto 12500\n"
@@ -0,0 +1,115 @@
+"""
+test_result_cache.py
+Проверки отпечатков кэша результатов (без браузера)
+"""
+
+import importlib.util
+import textwrap
+
+import pytest
+
+from swaglabs.result_cache import ModuleSources, ResultCache, app_fingerprint, config_fingerprint, item_fingerprint
+from swaglabs.standin import StandIn
+
+MODULE = '''
+LIMIT = {limit}
+
+
+def helper():
+    return LIMIT
+
+
+def test_first():
+    assert helper() == {first}
+
+
+class TestGroup:
+    def test_second(self):
+        assert helper() > 0
+'''
+
+
+def load_module(tmp_path, name="sample_tests", limit=3, first=3):
+    path = tmp_path / f"{name}.py"
+    path.write_text(textwrap.dedent(MODULE.format(limit=limit, first=first)), encoding="utf-8")
+    spec = importlib.util.spec_from_file_location(f"{name}_{limit}_{first}", path)
+    module = importlib.util.module_from_spec(spec)
+    spec.loader.exec_module(module)
+    return module
+
+
+def fingerprints(module):
+    sources = ModuleSources(module)
+    return (item_fingerprint(module.test_first, sources, [], "base"),
+            item_fingerprint(module.TestGroup.test_second, sources, [], "base"))
+
+
+class TestFingerprints:
+    def test_other_tests_are_cut_from_module_source(self, tmp_path):
+        module = load_module(tmp_path)
+        sources = ModuleSources(module)
+        own = sources.tests[".test_first"]
+        text = sources.without_other_tests(own)
+        assert "def test_first" in text
+        assert "def test_second" not in text
+        assert "def helper" in text
+
+    def test_change_in_one_test_keeps_other_fingerprints(self, tmp_path):
+        (tmp_path / "a").mkdir()
+        (tmp_path / "b").mkdir()
+        first, second = fingerprints(load_module(tmp_path / "a"))
+        changed_first, changed_second = fingerprints(load_module(tmp_path / "b", first=4))
+        assert changed_first != first
+        assert changed_second == second
+
+    def test_change_in_helpers_changes_all_fingerprints(self, tmp_path):
+        (tmp_path / "a").mkdir()
+        (tmp_path / "b").mkdir()
+        before = fingerprints(load_module(tmp_path / "a"))
+        after = fingerprints(load_module(tmp_path / "b", limit=5))
+        assert all(old != new for old, new in zip(before, after))
+
+    def test_fixtures_and_environment_are_part_of_fingerprint(self, tmp_path):
+        module = load_module(tmp_path)
+        sources = ModuleSources(module)
+        plain = item_fingerprint(module.test_first, sources, [], "base")
+        assert item_fingerprint(module.test_first, sources, ["page:def page(): ..."], "base") != plain
+        assert item_fingerprint(module.test_first, sources, [], "playwright=2") != plain
+
+
+class TestAppFingerprint:
+    def test_stand_in_bundle_is_stable(self):
+        with StandIn(catalog_size=6) as server:
+            first = app_fingerprint(server.url)
+            assert first is not None
+            assert app_fingerprint(server.url) == first
+
+    def test_unreachable_app_has_no_fingerprint(self):
+        with StandIn(catalog_size=6) as server:
+            url = server.url
+        assert app_fingerprint(url) is None
+
+
+class TestResultCache:
+    def test_only_passed_tests_with_same_fingerprint_are_fresh(self):
+        cache = ResultCache()
+        cache.record("t::a", "f1", passed=True)
+        cache.record("t::b", "f1", passed=False)
+        assert cache.is_fresh("t::a", "f1")
+        assert not cache.is_fresh("t::a", "f2")
+        assert not cache.is_fresh("t::b", "f1")
+
+    @pytest.mark.parametrize("fingerprint, passed", [("f2", False), (None, True)])
+    def test_failure_or_missing_fingerprint_drops_entry(self, fingerprint, passed):
+        cache = ResultCache({"t::a": "f1"})
+        cache.record("t::a", fingerprint, passed=passed)
+        assert cache.passed == {}
+
+
+def test_config_fingerprint_follows_ini_and_outcome_options():
+    ini = "[pytest]\nperf_budgets =\n    inventory.html fcp=1800\n"
+    warn = config_fingerprint(ini, {"--perf-budget-mode": "warn", "--throttle": ""})
+    assert warn == config_fingerprint(ini, {"--throttle": "", "--perf-budget-mode": "warn"})
+    assert warn != config_fingerprint(ini, {"--perf-budget-mode": "fail", "--throttle": ""})
+    assert warn != config_fingerprint(ini, {"--perf-budget-mode": "warn", "--throttle": "3g"})
+    assert warn != config_fingerprint(ini.replace("1800", "1500"), {"--perf-budget-mode": "warn", "--throttle": ""})
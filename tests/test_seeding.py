@@ -0,0 +1,44 @@
+"""
+test_seeding.py
+Проверки засеянного storage_state и точек старта сценария (без браузера)
+"""
+
+import json
+
+import pytest
+
+from swaglabs.flows import CHECKOUT_CART, CHECKOUT_FLOW, seed_for
+from swaglabs.seeding import CART_KEY, SESSION_COOKIE, seeded_state
+from swaglabs.standin.products import build_catalog
+
+
+def test_seeded_state_has_session_and_cart():
+    state = seeded_state("https://www.saucedemo.com/", "standard_user", [4, 0])
+    [cookie] = state["cookies"]
+    assert (cookie["name"], cookie["value"], cookie["domain"]) == (SESSION_COOKIE, "standard_user", "www.saucedemo.com")
+    assert cookie["secure"] is True
+    [origin] = state["origins"]
+    assert origin["origin"] == "https://www.saucedemo.com"
+    assert origin["localStorage"] == [{"name": CART_KEY, "value": "[4,0]"}]
+
+
+def test_seeded_state_without_cart_on_stand_in():
+    state = seeded_state("http://127.0.0.1:8123/", "standard_user")
+    assert state["cookies"][0]["domain"] == "127.0.0.1"
+    assert state["cookies"][0]["secure"] is False
+    assert state["origins"] == []
+
+
+def test_seed_for_checkout_steps():
+    assert seed_for(CHECKOUT_FLOW, 0) == {"start": "inventory.html", "cart": ()}
+    assert seed_for(CHECKOUT_FLOW, 3) == {"start": "cart.html", "cart": CHECKOUT_CART}
+    assert seed_for(CHECKOUT_FLOW, 4) == {"start": "checkout-step-one.html", "cart": CHECKOUT_CART}
+    # После Finish корзина пуста
+    assert seed_for(CHECKOUT_FLOW, 7)["cart"] == ()
+    assert json.loads(seeded_state("http://x/", "u", CHECKOUT_CART)["origins"][0]["localStorage"][0]["value"]) == [4, 0]
+
+
+@pytest.mark.parametrize("catalog_size", [6, 1000])
+def test_checkout_cart_is_first_two_products_a_to_z(catalog_size):
+    catalog = sorted(build_catalog(catalog_size), key=lambda product: product["name"].lower())
+    assert CHECKOUT_CART == tuple(product["id"] for product in catalog[:2])
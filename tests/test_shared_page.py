@@ -0,0 +1,88 @@
+"""
+test_shared_page.py
+Проверки сброса и замены общей страницы (без браузера, на заглушках)
+"""
+
+from swaglabs.shared_page import SharedPage, is_shared
+
+
+class FakeLocator:
+    def __init__(self, page):
+        self.page = page
+
+    def input_value(self):
+        return self.page.sort
+
+    def select_option(self, value):
+        self.page.sort = value
+
+
+class FakePage:
+    def __init__(self):
+        self.url = "http://stand/inventory.html"
+        self.sort = "az"
+        self.problems = []
+        self.closed = False
+
+    def is_closed(self):
+        return self.closed
+
+    def locator(self, selector):
+        return FakeLocator(self)
+
+    def wait_for_function(self, *args, **kwargs):
+        pass
+
+    def evaluate(self, script, arg=None):
+        return list(self.problems) if "problems" in script else None
+
+
+class FakeContext:
+    def __init__(self):
+        self.pages = []
+
+    def new_page(self):
+        self.pages.append(FakePage())
+        return self.pages[-1]
+
+    def close(self):
+        for page in self.pages:
+            page.closed = True
+
+
+def make_shared():
+    contexts = []
+
+    def new_context():
+        contexts.append(FakeContext())
+        return contexts[-1]
+
+    return SharedPage(new_context, lambda page: None, "http://stand/inventory.html"), contexts
+
+
+def test_page_is_reused_after_sort_reset():
+    shared, contexts = make_shared()
+    first = shared.acquire()
+    assert is_shared(first)
+    first.sort = "hilo"
+    assert shared.acquire() is first
+    assert first.sort == "az"
+    assert (shared.opened, shared.reused, len(contexts)) == (1, 1, 1)
+
+
+def test_broken_invariant_replaces_page():
+    shared, contexts = make_shared()
+    first = shared.acquire()
+    first.problems = ["корзина не пуста"]
+    second = shared.acquire()
+    assert second is not first and first.closed
+    assert shared.replaced == ["корзина не пуста"]
+    assert len(contexts) == 2
+
+
+def test_failed_test_gets_no_shared_page():
+    shared, _ = make_shared()
+    first = shared.acquire()
+    shared.release(healthy=False)
+    assert first.closed
+    assert shared.acquire() is not first
@@ -0,0 +1,45 @@
+"""
+test_soak.py
+Проверки трендов и рядов soak-режима (без браузера)
+"""
+
+import csv
+
+import pytest
+
+from swaglabs.soak import SoakSample, linear_slope, save_series, trends
+
+
+def sample(iteration, heap_kb, iteration_ms=100.0, nodes=500.0):
+    return SoakSample(iteration, iteration / 10, heap_kb, nodes, 40.0, 1.0, iteration_ms, {"Добавили товар": 20.0})
+
+
+def test_linear_slope():
+    assert linear_slope([0, 1, 2, 3], [1, 3, 5, 7]) == pytest.approx(2)
+    assert linear_slope([5], [1]) == 0
+    assert linear_slope([1, 1], [1, 5]) == 0
+
+
+def test_leak_exceeds_heap_limit_but_flat_metrics_pass():
+    # Куча растет на 5 КБ за итерацию, остальное стоит на месте
+    samples = [sample(i, 10_000 + 5 * i) for i in range(50, 1050, 50)]
+    result = {trend.metric: trend for trend in trends(samples, {"heap_kb": 2.0})}
+    assert result["heap_kb"].slope == pytest.approx(5)
+    assert result["heap_kb"].exceeded
+    assert not result["nodes"].exceeded and not result["iteration_ms"].exceeded
+    assert "❌ heap_kb" in result["heap_kb"].describe()
+
+
+def test_warmup_samples_are_ignored():
+    # Скачок на первом замере (прогрев) не должен выглядеть как утечка
+    samples = [sample(50, 1_000.0)] + [sample(i, 20_000.0) for i in range(100, 1050, 50)]
+    heap = next(trend for trend in trends(samples) if trend.metric == "heap_kb")
+    assert heap.slope == pytest.approx(0)
+
+
+def test_series_csv_has_step_columns(tmp_path):
+    path = save_series([sample(50, 100.0), sample(100, 101.5)], tmp_path / "soak" / "series.csv")
+    rows = list(csv.reader(path.open(encoding="utf-8")))
+    assert rows[0][:3] == ["iteration", "elapsed_s", "heap_kb"]
+    assert rows[0][-1] == "step_ms:Добавили товар"
+    assert rows[2][0] == "100" and rows[2][2] == "101.5"
@@ -1,81 +1,66 @@
 import re
 import pytest
 from playwright.sync_api import Page, expect
-from typing import List, Tuple
+from typing import List, Sequence
 import locale
 
+from swaglabs import settings
+from swaglabs.catalog import Product, snapshot_catalog
+from swaglabs.readiness import select_sort, wait_for_page
+from swaglabs.steps import step
+
+@pytest.mark.authenticated
+@pytest.mark.resource_profile("minimal")  # картинки, шрифты и телеметрия проверкам не нужны
+@pytest.mark.read_only  # с --shared-page одна страница на весь класс
 class TestProductSorting:
     """Тесты для проверки сортировки товаров в Swag Labs"""
     
-    BASE_URL = "https://www.saucedemo.com/"
-    VALID_USERNAME = "standard_user"
-    VALID_PASSWORD = "secret_sauce"
+    BASE_URL = settings.BASE_URL  # saucedemo.com или локальный стенд (--offline)
+    VALID_USERNAME = settings.VALID_USERNAME
+    VALID_PASSWORD = settings.VALID_PASSWORD
     
     @pytest.fixture(autouse=True)
-    def setup(self, page: Page):
+    def setup(self, authenticated_page: Page):
         """Предусловие: авторизация и переход на страницу товаров"""
-        # Авторизация
-        page.goto(self.BASE_URL)
-        page.locator("#user-name").fill(self.VALID_USERNAME)
-        page.locator("#password").fill(self.VALID_PASSWORD)
-        page.locator("#login-button").click()
+        # Авторизация: контекст уже содержит сохраненную сессию,
+        # authenticated_page открывает inventory.html (и логинится заново, если сессия истекла)
+        page = authenticated_page
         
         # Проверка успешной авторизации
         expect(page).to_have_url(re.compile(r".*inventory\.html"))
-        expect(page.locator("span.title")).to_have_text("Products")
         
         yield
         
-    def extract_product_data(self, page: Page) -> List[Tuple[str, float]]:
+    def extract_product_data(self, page: Page) -> List[Product]:
         """
         Извлекает данные о товарах со страницы
-        Возвращает список кортежей (название, цена)
+        Возвращает список Product (название, цена, id товара, в корзине ли товар).
+        Весь каталог читается одним evaluate_all, а не 2N+1 вызовами text_content
         """
-        products = []
-        
-        # Находим все элементы товаров
-        product_elements = page.locator(".inventory_item").all()
-        
-        for product in product_elements:
-            # Извлекаем название товара
-            name_element = product.locator(".inventory_item_name")
-            product_name = name_element.text_content().strip()
-            
-            # Извлекаем цену товара
-            price_element = product.locator(".inventory_item_price")
-            price_text = price_element.text_content().strip()
-            
-            # Конвертируем цену в число (убираем $)
-            try:
-                price = float(price_text.replace("$", ""))
-            except ValueError:
-                price = 0.0
-            
-            products.append((product_name, price))
-        
-        return products
+        return snapshot_catalog(page)
     
     def test_sort_by_name_a_to_z(self, page: Page):
         """TC-SORT-001: Проверка сортировки по имени от A до Z (по умолчанию)"""
         print("\n=== Тест сортировки A → Z ===")
         
-        # 1. Получаем текущий порядок товаров (по умолчанию должен быть A-Z)
-        initial_products = self.extract_product_data(page)
-        print(f"Найдено товаров: {len(initial_products)}")
+        with step("Шаг 1: Сортировка A → Z выбрана по умолчанию"):
+            sort_dropdown = page.locator(".product_sort_container")
+            expect(sort_dropdown).to_have_value("az")
         
-        # 2. Проверяем, что сортировка по умолчанию выбрана
-        sort_dropdown = page.locator(".product_sort_container")
-        expect(sort_dropdown).to_have_value("az")
+        with step("Шаг 2: Получили товары"):
+            # Текущий порядок товаров (по умолчанию должен быть A-Z)
+            initial_products = self.extract_product_data(page)
+            print(f"Найдено товаров: {len(initial_products)}")
         
-        # 3. Проверяем, что названия отсортированы от A до Z
-        product_names = [name for name, _ in initial_products]
-        sorted_names = sorted(product_names, key=lambda x: x.lower())
+        with step("Шаг 3: Названия отсортированы от A до Z"):
+            product_names = [product.name for product in initial_products]
+            sorted_names = sorted(product_names, key=lambda x: x.lower())
         
-        assert product_names == sorted_names, f"Ожидалась сортировка A-Z, но порядок отличается"
+            assert product_names == sorted_names, f"Ожидалась сортировка A-Z, но порядок отличается"
         
-        # 4. Выводим информацию для наглядности
+        # Выводим информацию для наглядности
         print("Товары в порядке A-Z:")
-        for i, (name, price) in enumerate(initial_products, 1):
+        for i, (name, price, *_) in enumerate(initial_products, 1):
             print(f"  {i:2}. {name:<30} ${price:.2f}")
         
         print("✅ Сортировка по имени от A до Z работает корректно")
@@ -84,28 +69,26 @@ class TestProductSorting:
         """TC-SORT-002: Проверка сортировки по имени от Z до A"""
         print("\n=== Тест сортировки Z → A ===")
         
-        # 1. Выбираем сортировку "Name (Z to A)"
-        sort_dropdown = page.locator(".product_sort_container")
-        sort_dropdown.select_option("za")
-        
-        # Ждем обновления страницы
-        page.wait_for_load_state("networkidle")
+        with step("Шаг 1: Выбрали сортировку Z → A"):
+            # Выбираем "Name (Z to A)" и ждем перестройки сетки; порядок проверяем ниже
+            sort_dropdown = page.locator(".product_sort_container")
+            select_sort(page, "za")
         
-        # 2. Получаем товары после сортировки
-        sorted_products = self.extract_product_data(page)
+            # Проверяем, что сортировка применена в выпадающем списке
+            expect(sort_dropdown).to_have_value("za")
         
-        # 3. Проверяем, что сортировка применена в выпадающем списке
-        expect(sort_dropdown).to_have_value("za")
+        with step("Шаг 2: Получили товары после сортировки"):
+            sorted_products = self.extract_product_data(page)
         
-        # 4. Проверяем, что названия отсортированы от Z до A
-        product_names = [name for name, _ in sorted_products]
-        reverse_sorted_names = sorted(product_names, key=lambda x: x.lower(), reverse=True)
+        with step("Шаг 3: Названия отсортированы от Z до A"):
+            product_names = [product.name for product in sorted_products]
+            reverse_sorted_names = sorted(product_names, key=lambda x: x.lower(), reverse=True)
         
-        assert product_names == reverse_sorted_names, f"Ожидалась сортировка Z-A, но порядок отличается"
+            assert product_names == reverse_sorted_names, f"Ожидалась сортировка Z-A, но порядок отличается"
         
-        # 5. Выводим информацию для наглядности
+        # Выводим информацию для наглядности
         print("Товары в порядке Z-A:")
-        for i, (name, price) in enumerate(sorted_products, 1):
+        for i, (name, price, *_) in enumerate(sorted_products, 1):
             print(f"  {i:2}. {name:<30} ${price:.2f}")
         
         print("✅ Сортировка по имени от Z до A работает корректно")
@@ -114,30 +97,28 @@ class TestProductSorting:
         """TC-SORT-003: Проверка сортировки по цене от низкой к высокой"""
         print("\n=== Тест сортировки по цене (low → high) ===")
         
-        # 1. Выбираем сортировку "Price (low to high)"
-        sort_dropdown = page.locator(".product_sort_container")
-        sort_dropdown.select_option("lohi")
-        
-        # Ждем обновления страницы
-        page.wait_for_load_state("networkidle")
+        with step("Шаг 1: Выбрали сортировку по возрастанию цены"):
+            # Выбираем "Price (low to high)" и ждем перестройки сетки; порядок проверяем ниже
+            sort_dropdown = page.locator(".product_sort_container")
+            select_sort(page, "lohi")
         
-        # 2. Получаем товары после сортировки
-        sorted_products = self.extract_product_data(page)
+            # Проверяем, что сортировка применена
+            expect(sort_dropdown).to_have_value("lohi")
         
-        # 3. Проверяем, что сортировка применена
-        expect(sort_dropdown).to_have_value("lohi")
+        with step("Шаг 2: Получили товары после сортировки"):
+            sorted_products = self.extract_product_data(page)
         
-        # 4. Проверяем, что цены отсортированы по возрастанию
-        product_prices = [price for _, price in sorted_products]
+        with step("Шаг 3: Цены отсортированы по возрастанию"):
+            product_prices = [product.price for product in sorted_products]
         
-        # Проверяем, что каждая следующая цена больше или равна предыдущей
-        for i in range(len(product_prices) - 1):
-            assert product_prices[i] <= product_prices[i + 1], \
-                f"Нарушена сортировка по возрастанию: {product_prices[i]} > {product_prices[i + 1]}"
+            # Проверяем, что каждая следующая цена больше или равна предыдущей
+            for i in range(len(product_prices) - 1):
+                assert product_prices[i] <= product_prices[i + 1], \
+                    f"Нарушена сортировка по возрастанию: {product_prices[i]} > {product_prices[i + 1]}"
         
-        # 5. Выводим информацию для наглядности
+        # Выводим информацию для наглядности
         print("Товары по возрастанию цены:")
-        for i, (name, price) in enumerate(sorted_products, 1):
+        for i, (name, price, *_) in enumerate(sorted_products, 1):
             print(f"  {i:2}. ${price:6.2f} - {name}")
         
         print("✅ Сортировка по цене от низкой к высокой работает корректно")
@@ -146,36 +127,34 @@ class TestProductSorting:
         """TC-SORT-004: Проверка сортировки по цене от высокой к низкой"""
         print("\n=== Тест сортировки по цене (high → low) ===")
         
-        # 1. Выбираем сортировку "Price (high to low)"
-        sort_dropdown = page.locator(".product_sort_container")
-        sort_dropdown.select_option("hilo")
-        
-        # Ждем обновления страницы
-        page.wait_for_load_state("networkidle")
+        with step("Шаг 1: Выбрали сортировку по убыванию цены"):
+            # Выбираем "Price (high to low)" и ждем перестройки сетки; порядок проверяем ниже
+            sort_dropdown = page.locator(".product_sort_container")
+            select_sort(page, "hilo")
         
-        # 2. Получаем товары после сортировки
-        sorted_products = self.extract_product_data(page)
+            # Проверяем, что сортировка применена
+            expect(sort_dropdown).to_have_value("hilo")
         
-        # 3. Проверяем, что сортировка применена
-        expect(sort_dropdown).to_have_value("hilo")
+        with step("Шаг 2: Получили товары после сортировки"):
+            sorted_products = self.extract_product_data(page)
         
-        # 4. Проверяем, что цены отсортированы по убыванию
-        product_prices = [price for _, price in sorted_products]
+        with step("Шаг 3: Цены отсортированы по убыванию"):
+            product_prices = [product.price for product in sorted_products]
         
-        # Проверяем, что каждая следующая цена меньше или равна предыдущей
-        for i in range(len(product_prices) - 1):
-            assert product_prices[i] >= product_prices[i + 1], \
-                f"Нарушена сортировка по убыванию: {product_prices[i]} < {product_prices[i + 1]}"
+            # Проверяем, что каждая следующая цена меньше или равна предыдущей
+            for i in range(len(product_prices) - 1):
+                assert product_prices[i] >= product_prices[i + 1], \
+                    f"Нарушена сортировка по убыванию: {product_prices[i]} < {product_prices[i + 1]}"
         
-        # 5. Выводим информацию для наглядности
+        # Выводим информацию для наглядности
         print("Товары по убыванию цены:")
-        for i, (name, price) in enumerate(sorted_products, 1):
+        for i, (name, price, *_) in enumerate(sorted_products, 1):
             print(f"  {i:2}. ${price:6.2f} - {name}")
         
         print("✅ Сортировка по цене от высокой к низкой работает корректно")
     
     def test_all_sorting_options(self, page: Page):
-        """TC-SORT-005: Комплексная проверка всех вариантов сортировки""" # pytest test_sorting.py::TestProductSorting::test_all_sorting_options -v
+        """TC-SORT-005: Комплексная проверка всех вариантов сортировки""" # pytest tests/test_sorting.py::TestProductSorting::test_all_sorting_options -v --browser-server
         print("\n=== Комплексный тест всех вариантов сортировки ===")
         
         sort_options = [
@@ -190,50 +169,47 @@ class TestProductSorting:
         for option_value, option_text, description in sort_options:
             print(f"\nТестируем сортировку: {description}")
             
-            # Выбираем опцию сортировки
-            sort_dropdown = page.locator(".product_sort_container")
-            sort_dropdown.select_option(option_value)
-            
-            # Ждем обновления
-            page.wait_for_load_state("networkidle")
+            with step(f"Сортировка {description}"):
+                # Выбираем опцию сортировки
+                sort_dropdown = page.locator(".product_sort_container")
+                # Ждем перестройки сетки; порядок проверяем ниже
+                select_sort(page, option_value)
             
-            # Проверяем, что опция выбрана
-            expect(sort_dropdown).to_have_value(option_value)
+                # Проверяем, что опция выбрана
+                expect(sort_dropdown).to_have_value(option_value)
             
-            # Получаем текущий порядок товаров
-            current_products = self.extract_product_data(page)
+                # Получаем текущий порядок товаров
+                current_products = self.extract_product_data(page)
             
-            # Проверяем, что порядок изменился (кроме первого раза)
-            if previous_order is not None:
-                assert current_products != previous_order, \
-                    f"Порядок товаров не изменился при выборе '{description}'"
+                # Проверяем, что порядок изменился (кроме первого раза)
+                if previous_order is not None:
+                    assert current_products != previous_order, \
+                        f"Порядок товаров не изменился при выборе '{description}'"
             
-            previous_order = current_products
+                previous_order = current_products
             
-            # Дополнительные проверки в зависимости от типа сортировки
-            if option_value in ["az", "za"]:
-                # Проверка сортировки по имени
-                names = [name for name, _ in current_products]
-                if option_value == "az":
-                    expected_names = sorted(names, key=lambda x: x.lower())
-                else:  # "za"
-                    expected_names = sorted(names, key=lambda x: x.lower(), reverse=True)
+                # Дополнительные проверки в зависимости от типа сортировки
+                if option_value in ["az", "za"]:
+                    # Проверка сортировки по имени
+                    names = [product.name for product in current_products]
+                    if option_value == "az":
+                        expected_names = sorted(names, key=lambda x: x.lower())
+                    else:  # "za"
+                        expected_names = sorted(names, key=lambda x: x.lower(), reverse=True)
                 
-                assert names == expected_names, \
-                    f"Некорректная сортировка по имени для '{description}'"
-            
-            elif option_value in ["lohi", "hilo"]:
-                # Проверка сортировки по цене
-                prices = [price for _, price in current_products]
-                for i in range(len(prices) - 1):
-                    if option_value == "lohi":
-                        assert prices[i] <= prices[i + 1], \
-                            f"Нарушена сортировка по возрастанию цены"
-                    else:  # "hilo"
-                        assert prices[i] >= prices[i + 1], \
-                            f"Нарушена сортировка по убыванию цены"
+                    assert names == expected_names, \
+                        f"Некорректная сортировка по имени для '{description}'"
             
-            print(f"  ✅ {description} - ОК")
+                elif option_value in ["lohi", "hilo"]:
+                    # Проверка сортировки по цене
+                    prices = [product.price for product in current_products]
+                    for i in range(len(prices) - 1):
+                        if option_value == "lohi":
+                            assert prices[i] <= prices[i + 1], \
+                                f"Нарушена сортировка по возрастанию цены"
+                        else:  # "hilo"
+                            assert prices[i] >= prices[i + 1], \
+                                f"Нарушена сортировка по убыванию цены"
         
         print("\n✅ Все варианты сортировки работают корректно!")
     
@@ -241,27 +217,24 @@ class TestProductSorting:
         """TC-SORT-006: Проверка сохранения выбранной сортировки при перезагрузке"""
         print("\n=== Тест сохранения сортировки ===")
         
-        # 1. Выбираем сортировку "Price (high to low)"
-        sort_dropdown = page.locator(".product_sort_container")
-        sort_dropdown.select_option("hilo")
-        page.wait_for_load_state("networkidle")
+        with step("Шаг 1: Выбрали сортировку по убыванию цены"):
+            sort_dropdown = page.locator(".product_sort_container")
+            select_sort(page, "hilo")
         
-        # 2. Запоминаем порядок товаров
-        products_before_reload = self.extract_product_data(page)
+            # Запоминаем порядок товаров
+            products_before_reload = self.extract_product_data(page)
         
-        # 3. Обновляем страницу
-        page.reload()
-        page.wait_for_load_state("networkidle")
+        with step("Шаг 2: Перезагрузили страницу"):
+            page.reload()
+            wait_for_page(page, re.compile(r".*inventory\.html"), "Products")
         
-        # 4. Проверяем, что сортировка сохранилась
-        expect(sort_dropdown).to_have_value("hilo")
+        with step("Шаг 3: Сортировка и порядок товаров сохранились"):
+            expect(sort_dropdown).to_have_value("hilo")
         
-        # 5. Получаем товары после перезагрузки
-        products_after_reload = self.extract_product_data(page)
+            products_after_reload = self.extract_product_data(page)
         
-        # 6. Проверяем, что порядок товаров не изменился
-        assert products_before_reload == products_after_reload, \
-            "Порядок товаров изменился после перезагрузки страницы"
+            assert products_before_reload == products_after_reload, \
+                "Порядок товаров изменился после перезагрузки страницы"
         
         print("✅ Выбранная сортировка сохраняется при перезагрузке страницы")
     
@@ -269,31 +242,30 @@ class TestProductSorting:
         """TC-SORT-007: Проверка сортировки с товарами, содержащими спецсимволы"""
         print("\n=== Тест сортировки со спецсимволами ===")
         
-        # 1. Проверяем сортировку A-Z
-        sort_dropdown = page.locator(".product_sort_container")
-        sort_dropdown.select_option("az")
-        page.wait_for_load_state("networkidle")
+        with step("Шаг 1: Выбрали сортировку A → Z"):
+            select_sort(page, "az")
         
-        products = self.extract_product_data(page)
-        names = [name for name, _ in products]
+        with step("Шаг 2: Получили товары"):
+            products = self.extract_product_data(page)
+            names = [product.name for product in products]
         
-        # 2. Проверяем, что сортировка работает корректно
-        # (игнорируя регистр и обрабатывая спецсимволы)
-        sorted_names = sorted(names, key=lambda x: x.lower())
-        
-        # 3. Выводим товары для проверки
+        # Выводим товары для проверки
         print("Товары (включая спецсимволы):")
         for i, name in enumerate(names, 1):
             has_special = any(not c.isalnum() and c != ' ' for c in name)
             special_mark = " ✨" if has_special else ""
             print(f"  {i:2}. {name}{special_mark}")
         
-        assert names == sorted_names, "Сортировка A-Z работает некорректно со спецсимволами"
+        with step("Шаг 3: Названия со спецсимволами отсортированы от A до Z"):
+            # Сортировка без учета регистра, спецсимволы сравниваются как есть
+            sorted_names = sorted(names, key=lambda x: x.lower())
+        
+            assert names == sorted_names, "Сортировка A-Z работает некорректно со спецсимволами"
         
         print("✅ Сортировка корректно обрабатывает товары со спецсимволами")
 
 # Дополнительные утилиты для тестов
-def verify_sorting_order(elements: List[Tuple[str, float]], sort_type: str) -> bool:
+def verify_sorting_order(elements: Sequence[Product], sort_type: str) -> bool:
     """
     Проверяет правильность сортировки элементов
     sort_type: 'name_asc', 'name_desc', 'price_asc', 'price_desc'
@@ -302,32 +274,37 @@ def verify_sorting_order(elements: List[Tuple[str, float]], sort_type: str) -> b
         return True
     
     if sort_type == 'name_asc':
-        names = [name.lower() for name, _ in elements]
+        names = [product.name.lower() for product in elements]
         return all(names[i] <= names[i + 1] for i in range(len(names) - 1))
     
     elif sort_type == 'name_desc':
-        names = [name.lower() for name, _ in elements]
+        names = [product.name.lower() for product in elements]
         return all(names[i] >= names[i + 1] for i in range(len(names) - 1))
     
     elif sort_type == 'price_asc':
-        prices = [price for _, price in elements]
+        prices = [product.price for product in elements]
         return all(prices[i] <= prices[i + 1] for i in range(len(prices) - 1))
     
     elif sort_type == 'price_desc':
-        prices = [price for _, price in elements]
+        prices = [product.price for product in elements]
         return all(prices[i] >= prices[i + 1] for i in range(len(prices) - 1))
     
     return False
 
 # Для запуска тестов напрямую
 if __name__ == "__main__":
+    from pathlib import Path
     from playwright.sync_api import sync_playwright
+    from swaglabs.artifacts import ChunkedTrace, artifact_dir
     
     def run_tests():
         with sync_playwright() as p:
             browser = p.chromium.launch(headless=False)
             context = browser.new_context(viewport={'width': 1920, 'height': 1080})
             page = context.new_page()
+            # Трассировка чанками: на диск пишутся только упавшие тесты
+            trace = ChunkedTrace(context)
+            artifacts_root = Path("reports/artifacts/manual")
             
             try:
                 test = TestProductSorting()
@@ -353,6 +330,7 @@ if __name__ == "__main__":
                 failed = 0
                 
                 for test_name, test_func in tests_to_run:
+                    trace.start(test_name)
                     try:
                         print(f"\n{'='*60}")
                         print(f"Тест: {test_name}")
@@ -360,12 +338,15 @@ if __name__ == "__main__":
                         test_func(page)
                         print(f"✅ {test_name} - ПРОЙДЕН")
                         passed += 1
+                        trace.stop()
                     except Exception as e:
                         print(f"❌ {test_name} - ПРОВАЛЕН")
                         print(f"   Ошибка: {str(e)}")
                         failed += 1
-                        # Делаем скриншот при падении теста
-                        page.screenshot(path=f"error_{test_name.replace(' ', '_')}.png")
+                        # Трасса и скриншот упавшего теста
+                        directory = artifact_dir(artifacts_root, test_name)
+                        trace.stop(directory)
+                        print(f"   Артефакты: {directory}")
                 
                 print(f"\n{'='*60}")
                 print(f"РЕЗУЛЬТАТЫ:")
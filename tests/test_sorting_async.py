@@ -0,0 +1,88 @@
+"""
+test_sorting_async.py
+TestProductSorting на асинхронном API: тесты выполняются одновременно,
+каждый в своем контексте (swaglabs.plugins.aio)
+"""
+
+import re
+
+import pytest
+from playwright.async_api import Page, expect
+
+from swaglabs import settings
+from swaglabs.catalog import snapshot_catalog_async
+from swaglabs.flows import OPEN_INVENTORY, run_step_async
+from swaglabs.readiness import select_sort_async, wait_for_page_async
+
+SORT_KEYS = {
+    "az": (lambda product: product.name.lower(), False),
+    "za": (lambda product: product.name.lower(), True),
+    "lohi": (lambda product: product.price, False),
+    "hilo": (lambda product: product.price, True),
+}
+
+
+@pytest.mark.authenticated
+class TestProductSortingAsync:
+    """Сортировка товаров (async-версия TestProductSorting)"""
+
+    BASE_URL = settings.BASE_URL
+
+    async def open_inventory(self, page: Page):
+        """Предусловие: авторизованный пользователь на странице товаров"""
+        await run_step_async(page, OPEN_INVENTORY, base_url=self.BASE_URL)
+
+    async def select_sort(self, page: Page, option: str):
+        sort_dropdown = page.locator(".product_sort_container")
+        await select_sort_async(page, option)
+        await expect(sort_dropdown).to_have_value(option)
+
+    async def assert_sorted(self, page: Page, option: str):
+        products = await snapshot_catalog_async(page)
+        key, reverse = SORT_KEYS[option]
+        assert products == sorted(products, key=key, reverse=reverse), f"Некорректная сортировка {option}"
+        return products
+
+    async def test_sort_by_name_a_to_z(self, async_page: Page):
+        """TC-SORT-001: Сортировка по имени от A до Z (по умолчанию)"""
+        await self.open_inventory(async_page)
+        await expect(async_page.locator(".product_sort_container")).to_have_value("az")
+        await self.assert_sorted(async_page, "az")
+
+    @pytest.mark.parametrize("option", ["za", "lohi", "hilo"])
+    async def test_sort_option(self, async_page: Page, option: str):
+        """TC-SORT-002..004: Сортировка Z→A и по цене в обе стороны"""
+        await self.open_inventory(async_page)
+        await self.select_sort(async_page, option)
+        await self.assert_sorted(async_page, option)
+
+    async def test_all_sorting_options(self, async_page: Page):
+        """TC-SORT-005: Комплексная проверка всех вариантов сортировки"""
+        await self.open_inventory(async_page)
+        previous_order = None
+        for option in ("az", "za", "lohi", "hilo"):
+            await self.select_sort(async_page, option)
+            current_order = await self.assert_sorted(async_page, option)
+            if previous_order is not None:
+                assert current_order != previous_order, f"Порядок товаров не изменился при выборе {option}"
+            previous_order = current_order
+
+    async def test_sorting_persistence(self, async_page: Page):
+        """TC-SORT-006: Выбранная сортировка сохраняется при перезагрузке"""
+        await self.open_inventory(async_page)
+        await self.select_sort(async_page, "hilo")
+        before_reload = await snapshot_catalog_async(async_page)
+
+        await async_page.reload()
+        await wait_for_page_async(async_page, re.compile(r".*inventory\.html"), "Products")
+        await expect(async_page.locator(".product_sort_container")).to_have_value("hilo")
+        assert await snapshot_catalog_async(async_page) == before_reload, \
+            "Порядок товаров изменился после перезагрузки страницы"
+
+    async def test_sorting_with_special_characters(self, async_page: Page):
+        """TC-SORT-007: Сортировка A→Z товаров со спецсимволами в названии"""
+        await self.open_inventory(async_page)
+        await self.select_sort(async_page, "az")
+        names = [product.name for product in await snapshot_catalog_async(async_page)]
+        assert names == sorted(names, key=lambda name: name.lower()), \
+            "Сортировка A-Z работает некорректно со спецсимволами"
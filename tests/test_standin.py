@@ -0,0 +1,63 @@
+"""
+test_standin.py
+Проверки локального стенда Swag Labs на уровне HTTP (без браузера)
+"""
+
+import json
+import urllib.error
+import urllib.request
+
+import pytest
+
+from swaglabs.standin import PAGES, StandIn
+from swaglabs.standin.products import SWAG_LABS_PRODUCTS, build_catalog
+
+
+@pytest.fixture(scope="module")
+def stand_in():
+    with StandIn(catalog_size=50) as server:
+        yield server
+
+
+def fetch(url, headers=None):
+    request = urllib.request.Request(url, headers=headers or {})
+    try:
+        with urllib.request.urlopen(request) as response:
+            return response.status, dict(response.headers), response.read()
+    except urllib.error.HTTPError as error:
+        return error.code, dict(error.headers), b""
+
+
+class TestStandIn:
+    """Тесты для локального стенда, который используется в офлайн-режиме"""
+
+    @pytest.mark.parametrize("path", sorted(PAGES))
+    def test_pages_served_with_app_shell(self, stand_in, path):
+        status, headers, body = fetch(stand_in.url + path.lstrip("/"))
+        assert status == 200
+        assert headers["Content-Type"].startswith("text/html")
+        assert b"<title>Swag Labs</title>" in body
+        assert b"/static/app.js" in body
+
+    def test_catalog_has_requested_size(self, stand_in):
+        status, _, body = fetch(stand_in.url + "static/catalog.js")
+        assert status == 200
+        catalog = json.loads(body.decode().split("=", 1)[1].strip().rstrip(";"))
+        assert len(catalog) == 50
+        assert [p["name"] for p in catalog[:6]] == [p["name"] for p in SWAG_LABS_PRODUCTS]
+
+    def test_unknown_path_is_404(self, stand_in):
+        status, _, _ = fetch(stand_in.url + "missing.html")
+        assert status == 404
+
+    def test_static_assets_revalidate_by_etag(self, stand_in):
+        status, headers, _ = fetch(stand_in.url + "static/app.css")
+        assert status == 200
+        status, _, body = fetch(stand_in.url + "static/app.css", {"If-None-Match": headers["ETag"]})
+        assert status == 304
+        assert body == b""
+
+
+def test_build_catalog_is_deterministic():
+    assert build_catalog(1000) == build_catalog(1000)
+    assert len({p["id"] for p in build_catalog(1000)}) == 1000
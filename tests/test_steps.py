@@ -0,0 +1,67 @@
+"""
+test_steps.py
+Проверки записи шагов и перехвата вызовов Playwright (без браузера)
+"""
+
+import pytest
+from playwright.sync_api import Locator
+
+from swaglabs import instrument
+from swaglabs.steps import StepRecorder, current_recorder, step
+
+
+def test_step_without_recorder_only_prints(capsys):
+    with step("Шаг 1: Ввод логина"):
+        pass
+    assert capsys.readouterr().out == "✓ Шаг 1: Ввод логина\n"
+
+
+def test_recorder_collects_nested_and_failed_steps():
+    recorder = StepRecorder("tests/test_x.py::test_y", {"browser": "chromium"})
+    recorder.start()
+    try:
+        assert current_recorder() is recorder
+        with step("внешний"):
+            with step("внутренний"):
+                pass
+        with pytest.raises(AssertionError):
+            with step("упавший"):
+                assert False
+    finally:
+        recorder.stop()
+
+    assert current_recorder() is None
+    assert [(r["step"], r["depth"], r["status"]) for r in recorder.records] == [
+        ("внутренний", 1, "passed"),
+        ("внешний", 0, "passed"),
+        ("упавший", 0, "failed"),
+    ]
+    assert all(r["browser"] == "chromium" for r in recorder.records)
+
+
+def test_decorated_function_is_a_step():
+    @step("добавление в корзину")
+    def add_to_cart():
+        return 42
+
+    recorder = StepRecorder("node")
+    recorder.start()
+    try:
+        assert add_to_cart() == 42
+    finally:
+        recorder.stop()
+    assert [r["step"] for r in recorder.records] == ["добавление в корзину"]
+
+
+def test_instrument_patches_only_while_subscribed():
+    original = Locator.click
+    listener = lambda name, elapsed: None
+    instrument.subscribe(listener)
+    try:
+        assert Locator.click is not original
+        assert Locator.click.__wrapped__ is original
+        # Построители локаторов не перехватываются
+        assert not hasattr(Locator.locator, "__wrapped__")
+    finally:
+        instrument.unsubscribe(listener)
+    assert Locator.click is original
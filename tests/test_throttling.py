@@ -0,0 +1,33 @@
+"""
+test_throttling.py
+Проверки профилей эмуляции сети и процессора (без браузера)
+"""
+
+import pytest
+
+from swaglabs.throttling import PROFILES, RESET, parse_profiles
+
+
+def test_parse_profiles_keeps_order_and_rejects_unknown():
+    assert parse_profiles(" 3g, slow-4g,3g ") == ["3g", "slow-4g"]
+    assert parse_profiles("") == []
+    with pytest.raises(ValueError, match="edge"):
+        parse_profiles("3g,edge")
+
+
+def test_network_profile_commands_use_bytes_per_second():
+    commands = dict(PROFILES["3g"].commands())
+    assert commands["Network.emulateNetworkConditions"] == {
+        "offline": False,
+        "latency": 2000,
+        "downloadThroughput": 50000.0,
+        "uploadThroughput": 50000.0,
+    }
+    assert commands["Emulation.setCPUThrottlingRate"] == {"rate": 1}
+
+
+def test_cpu_profile_leaves_network_unlimited():
+    commands = dict(PROFILES["cpu-4x"].commands())
+    assert commands["Network.emulateNetworkConditions"]["downloadThroughput"] == -1
+    assert commands["Emulation.setCPUThrottlingRate"] == {"rate": 4}
+    assert dict(RESET.commands())["Network.emulateNetworkConditions"]["latency"] == 0
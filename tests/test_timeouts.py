@@ -0,0 +1,94 @@
+"""
+test_timeouts.py
+Проверки адаптивных таймаутов и классификации временных ошибок (без браузера)
+"""
+
+import pytest
+from playwright.sync_api import Error as PlaywrightError
+from playwright.sync_api import TimeoutError as PlaywrightTimeoutError
+
+from swaglabs import timeouts
+from swaglabs.retries import RetryBudget, transient_reason
+from swaglabs.timeouts import KEEP_SAMPLES, LatencyHistory, Observation, TimeoutPolicy, adaptive, quantile, summarize
+
+
+@pytest.fixture
+def policy(tmp_path):
+    policy = TimeoutPolicy(LatencyHistory(tmp_path / "latency.json"), factor=3, floor=1000, ceiling=30000)
+    timeouts.activate(policy)
+    yield policy
+    timeouts.activate(None)
+
+
+def test_timeout_is_p99_times_factor_within_bounds(policy):
+    history = policy.history
+    assert policy.timeout_for("wait") == 30000  # мало замеров — потолок
+    for elapsed in (100, 120, 110, 900, 130):
+        history.add("wait", elapsed)
+    assert policy.timeout_for("wait") == 2700
+    for elapsed in (10, 12, 11, 9, 10):
+        history.add("fast", elapsed)
+    assert policy.timeout_for("fast") == 1000
+    for elapsed in (20000,) * 5:
+        history.add("slow", elapsed)
+    assert policy.timeout_for("slow") == 30000
+
+
+def test_history_keeps_last_samples(tmp_path):
+    history = LatencyHistory(tmp_path / "latency.json")
+    for elapsed in range(KEEP_SAMPLES + 5):
+        history.add("wait", float(elapsed))
+    history.save()
+    reloaded = LatencyHistory(tmp_path / "latency.json")
+    assert len(reloaded.samples["wait"]) == KEEP_SAMPLES
+    assert reloaded.samples["wait"][-1] == KEEP_SAMPLES + 4
+
+
+def test_adaptive_without_policy_keeps_given_timeout():
+    with adaptive("wait", None, 5000) as timeout:
+        assert timeout == 5000
+    with adaptive("wait", 250) as timeout:
+        assert timeout == 250
+
+
+def test_adaptive_records_successes_and_failures(policy):
+    with adaptive("wait") as timeout:
+        assert timeout == 30000
+    with pytest.raises(PlaywrightTimeoutError):
+        with adaptive("wait", 100):
+            raise PlaywrightTimeoutError("Timeout 100ms exceeded")
+    assert [(o.key, o.timeout_ms, o.ok) for o in policy.observations] == [
+        ("wait", 30000, True),
+        ("wait", 100, False),
+    ]
+
+
+def test_summary_puts_near_timeout_first():
+    summaries = summarize([
+        Observation("fast", 10, 1000, True),
+        Observation("close", 800, 1000, True),
+        Observation("broken", 1000, 1000, False),
+    ])
+    assert [(s.key, s.headroom, s.failed) for s in summaries] == [
+        ("broken", 1.0, 1),
+        ("close", 0.8, 0),
+        ("fast", 0.01, 0),
+    ]
+    assert quantile([1, 2, 3, 4], 0.5) == 2
+
+
+@pytest.mark.parametrize("error, transient", [
+    (PlaywrightError("Page.goto: net::ERR_CONNECTION_RESET at https://www.saucedemo.com/"), True),
+    (PlaywrightError("Target page, context or browser has been closed"), True),
+    (PlaywrightTimeoutError("Page.goto: Timeout 30000ms exceeded."), True),
+    (PlaywrightTimeoutError("Locator.click: Timeout 30000ms exceeded."), False),
+    (AssertionError("Некорректная сортировка za"), False),
+])
+def test_only_known_transient_errors_are_retried(error, transient):
+    assert (transient_reason(error) is not None) is transient
+
+
+def test_retry_budget_is_split_between_workers():
+    budget = RetryBudget(5, workers=2)
+    assert [budget.take() for _ in range(4)] == [True, True, True, False]
+    assert RetryBudget(0).take() is False